@@ -0,0 +1,43 @@
+"""daily deal rollups for reporting
+
+Revision ID: 20251018_deal_rollups
+Revises: 20251018_io_job_progress
+Create Date: 2025-10-18
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251018_deal_rollups"
+down_revision = "20251018_io_job_progress"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "deal_daily_rollups",
+        sa.Column("org_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.String(10), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("deal_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("price_sum", sa.Float(), nullable=False, server_default=sa.text("0")),
+        sa.Column("price_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.PrimaryKeyConstraint("org_id", "day", "status"),
+    )
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("through_day", sa.String(10), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), server_default=sa.text("NOW()")),
+    )
+    # rollups are filled by the first catch-up (services/deal_rollups.catch_up)
+    op.create_index("ix_deals_org_created_at", "deals", ["org_id", "created_at"])
+
+
+def downgrade():
+    op.drop_index("ix_deals_org_created_at", table_name="deals")
+    op.drop_table("rollup_watermarks")
+    op.drop_table("deal_daily_rollups")
@@ -0,0 +1,39 @@
+"""add executor progress columns to import_jobs / export_jobs
+
+Revision ID: 20251018_io_job_progress
+Revises: 20250920_add_system_metadata
+Create Date: 2025-10-18
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251018_io_job_progress"
+down_revision = "20250920_add_system_metadata"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("import_jobs", sa.Column("started_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("import_jobs", sa.Column("processed_rows", sa.Integer(), nullable=True, server_default=sa.text("0")))
+    op.add_column("import_jobs", sa.Column("bytes_total", sa.BigInteger(), nullable=True))
+    op.add_column("import_jobs", sa.Column("bytes_done", sa.BigInteger(), nullable=True, server_default=sa.text("0")))
+    op.add_column("import_jobs", sa.Column("rows_per_sec", sa.Float(), nullable=True))
+    op.add_column("import_jobs", sa.Column("eta_seconds", sa.Float(), nullable=True))
+
+    # started_at already exists on export_jobs (20250919_add_progress_cols)
+    op.add_column("export_jobs", sa.Column("total_rows", sa.Integer(), nullable=True))
+    op.add_column("export_jobs", sa.Column("processed_rows", sa.Integer(), nullable=True, server_default=sa.text("0")))
+    op.add_column("export_jobs", sa.Column("bytes_done", sa.BigInteger(), nullable=True, server_default=sa.text("0")))
+    op.add_column("export_jobs", sa.Column("rows_per_sec", sa.Float(), nullable=True))
+    op.add_column("export_jobs", sa.Column("eta_seconds", sa.Float(), nullable=True))
+
+
+def downgrade():
+    for col in ["eta_seconds", "rows_per_sec", "bytes_done", "processed_rows", "total_rows"]:
+        op.drop_column("export_jobs", col)
+    for col in ["eta_seconds", "rows_per_sec", "bytes_done", "bytes_total", "processed_rows", "started_at"]:
+        op.drop_column("import_jobs", col)
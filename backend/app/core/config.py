@@ -26,6 +26,13 @@ class Settings(BaseSettings):
 
     # --- Webhooks / Email ---
     WEBHOOK_URLS_CSV: str | None = None  # "https://example.com/hook1,https://example.com/hook2"
+    WEBHOOK_OUTBOX_PATH: str | None = None  # sqlite outbox; defaults to data/webhooks/outbox.sqlite3
+    WEBHOOK_CONCURRENCY_PER_TARGET: int = 4
+    WEBHOOK_BATCH_SIZE: int = 1  # >1 posts {"events": [...]} batches
+    WEBHOOK_MAX_ATTEMPTS: int = 8
+    WEBHOOK_TIMEOUT_SECONDS: float = 5.0
+    WEBHOOK_BACKOFF_BASE_SECONDS: float = 1.0
+    WEBHOOK_BACKOFF_MAX_SECONDS: float = 300.0
     EMAIL_PROVIDER: str | None = "stub"  # "stub" | "sendgrid"
     SENDGRID_API_KEY: str | None = None
     EMAIL_FROM: str | None = "noreply@valhalla.local"
@@ -1,6 +1,6 @@
 from ..core.events import bus
 from ..services.mailer import send_email
-from ..services.webhooks import send_webhook
+from ..services.webhooks import _get_targets, get_dispatcher, send_webhook, shutdown_dispatcher
 
 
 def _on_any(event: str, payload: dict):
@@ -21,3 +21,19 @@ def attach_event_handlers():
         "buyer.created",
     ]:
         bus.subscribe(ev, _on_any)
+
+
+def start_webhooks():
+    """Start the webhook dispatcher so deliveries left from a previous run are retried."""
+    if _get_targets():
+        get_dispatcher()
+
+
+def stop_webhooks():
+    shutdown_dispatcher()
+
+
+def stop_recent_searches():
+    from ..services.recent_searches import shutdown_buffer
+
+    shutdown_buffer()
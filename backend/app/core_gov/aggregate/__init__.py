@@ -0,0 +1,2 @@
+"""Aggregation helpers: concurrent, cached fan-out for multi-section read views."""
+from .fanout import Section, invalidate, run_sections  # noqa: F401
@@ -0,0 +1,135 @@
+"""Concurrent section fan-out with per-section timeouts and short-TTL memoization.
+
+Views like the one-screen dashboard or the brief are a handful of independent
+reads. ``run_sections`` runs them on a shared thread pool so the view costs
+roughly its slowest section instead of the sum, and gives each section its own
+deadline so one slow store cannot hold the whole response hostage.
+
+Each section result is memoized for ``ttl`` seconds under a key that includes a
+signature of its ``deps``: data file paths (stat mtime/size) or callables
+returning a version token, e.g. a SegmentedJsonStore's ``version``. A write to
+any dependency changes the signature, so the next call recomputes right away
+instead of serving a stale value until the TTL runs out. Cached values are
+shared between callers and must be treated as read-only.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+_POOL = ThreadPoolExecutor(max_workers=int(os.getenv("CORE_AGG_WORKERS", "8")), thread_name_prefix="core-agg")
+_LOCK = threading.Lock()
+_CACHE: dict[str, tuple[tuple[Any, ...], float, Any]] = {}
+_INFLIGHT: dict[str, tuple[tuple[Any, ...], Future]] = {}
+
+
+@dataclass
+class Section:
+    name: str
+    fn: Callable[[], Any]
+    timeout: float = 2.0
+    ttl: float = 5.0
+    deps: tuple = ()
+    default: Any = None
+    on_error: Callable[[BaseException], Any] | None = None
+    key: str | None = None  # cache key; defaults to name (include arguments when fn has them)
+
+    def fallback(self, exc: BaseException) -> Any:
+        return self.on_error(exc) if self.on_error is not None else self.default
+
+
+def _dep_sig(deps: Iterable[Any]) -> tuple[Any, ...]:
+    out: list[Any] = []
+    for d in deps:
+        if callable(d):
+            try:
+                out.append(d())
+            except Exception:
+                out.append(None)
+            continue
+        try:
+            st = os.stat(d)
+            out.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append(None)
+    return tuple(out)
+
+
+def invalidate(prefix: str = "") -> int:
+    """Drop memoized sections whose key starts with ``prefix`` (all by default)."""
+    with _LOCK:
+        keys = [k for k in _CACHE if k.startswith(prefix)]
+        for k in keys:
+            del _CACHE[k]
+        return len(keys)
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[Any, float]:
+    t0 = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - t0) * 1000.0
+
+
+def _submit(key: str, sig: tuple[Any, ...], s: Section) -> Future:
+    """One computation per (key, deps signature) at a time; concurrent callers share it."""
+    with _LOCK:
+        cur = _INFLIGHT.get(key)
+        if cur is not None and cur[0] == sig:
+            return cur[1]
+        fut = _POOL.submit(_timed, s.fn)
+        _INFLIGHT[key] = (sig, fut)
+
+    def _done(f: Future) -> None:
+        with _LOCK:
+            if _INFLIGHT.get(key, (None, None))[1] is f:
+                del _INFLIGHT[key]
+            if s.ttl > 0 and not f.cancelled() and f.exception() is None:
+                _CACHE[key] = (sig, time.monotonic(), f.result()[0])  # late results still warm the cache
+
+    fut.add_done_callback(_done)
+    return fut
+
+
+def run_sections(sections: Iterable[Section], use_cache: bool = True) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Run every section concurrently.
+
+    Returns ``(results, timings)``: results maps section name to its value (or its
+    fallback on error/timeout); timings maps name to ``{"ms", "status"}`` where status
+    is ok | cached | timeout | error.
+    """
+    t0 = time.perf_counter()
+    results: dict[str, Any] = {}
+    timings: dict[str, dict[str, Any]] = {}
+    pending: list[tuple[Section, Future]] = []
+    now = time.monotonic()
+    for s in sections:
+        key = s.key or s.name
+        sig = _dep_sig(s.deps)
+        if use_cache and s.ttl > 0:
+            with _LOCK:
+                hit = _CACHE.get(key)
+            if hit is not None and hit[0] == sig and now - hit[1] < s.ttl:
+                results[s.name] = hit[2]
+                timings[s.name] = {"ms": 0.0, "status": "cached"}
+                continue
+        pending.append((s, _submit(key, sig, s) if use_cache else _POOL.submit(_timed, s.fn)))
+
+    for s, fut in pending:
+        remaining = s.timeout - (time.perf_counter() - t0)
+        try:
+            value, ms = fut.result(timeout=max(0.0, remaining))
+            results[s.name] = value
+            timings[s.name] = {"ms": round(ms, 3), "status": "ok"}
+        except FutureTimeout as e:
+            results[s.name] = s.fallback(e)
+            timings[s.name] = {"ms": round((time.perf_counter() - t0) * 1000.0, 3), "status": "timeout"}
+        except Exception as e:
+            results[s.name] = s.fallback(e)
+            timings[s.name] = {"ms": round((time.perf_counter() - t0) * 1000.0, 3), "status": "error", "error": f"{type(e).__name__}: {e}"}
+    timings["_total"] = {"ms": round((time.perf_counter() - t0) * 1000.0, 3), "status": "ok"}
+    return results, timings
@@ -0,0 +1,48 @@
+"""
+P-AUDIT-3: One-shot converter from the legacy audit_log.json array to JSONL segments.
+
+Run directly (``python -m backend.app.core_gov.audit_log.migrate``) or let the
+store call it on first use. The legacy file is renamed to
+``audit_log.json.migrated`` afterwards, so the conversion happens once.
+"""
+import json
+import os
+from typing import Any, Dict, Optional
+
+from ..storage.event_log import SegmentedEventLog
+
+
+def convert_legacy(src: str, log: SegmentedEventLog, batch_size: int = 5000) -> Dict[str, Any]:
+    """
+    Append every event of a legacy JSON array file to ``log`` in timestamp order.
+
+    Returns:
+        {"converted": <int>, "source": <path>, "archived_to": <path or None>}
+    """
+    if not os.path.exists(src):
+        return {"converted": 0, "source": src, "archived_to": None}
+    try:
+        with open(src, "r", encoding="utf-8") as f:
+            events = json.load(f)
+    except ValueError:
+        events = []
+    if not isinstance(events, list):
+        events = []
+    events = [e for e in events if isinstance(e, dict)]
+    events.sort(key=lambda e: str(e.get("timestamp") or ""))
+    for i in range(0, len(events), batch_size):
+        log.append_many(events[i:i + batch_size])
+    log.flush()
+    archived = src + ".migrated"
+    os.replace(src, archived)
+    return {"converted": len(events), "source": src, "archived_to": archived}
+
+
+def main(src: Optional[str] = None) -> Dict[str, Any]:
+    from . import store
+
+    return convert_legacy(src or store.AUDIT_FILE, SegmentedEventLog(store.AUDIT_DIR))
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(), indent=2))
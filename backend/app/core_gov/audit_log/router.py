@@ -2,10 +2,11 @@
 P-AUDIT-1: Audit log API router.
 
 POST /core/audit - Log an event
-GET /core/audit - List audit events
+GET /core/audit - List audit events (optionally by time window / event type)
+GET /core/audit/stats - Segment and event-type counts
 """
 from fastapi import APIRouter, Query
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 from . import store
 
@@ -33,14 +34,28 @@ async def log_event(event: AuditEvent) -> Dict[str, Any]:
 
 
 @router.get("/audit", response_model=List[Dict[str, Any]])
-async def list_audit_events(limit: int = Query(100, ge=1, le=1000)) -> List[Dict[str, Any]]:
+async def list_audit_events(
+    limit: int = Query(100, ge=1, le=1000),
+    start: Optional[str] = Query(None, description="ISO timestamp, inclusive"),
+    end: Optional[str] = Query(None, description="ISO timestamp, inclusive"),
+    event_type: Optional[str] = None,
+) -> List[Dict[str, Any]]:
     """
     List audit events.
     
     Args:
         limit: Maximum number of events (default 100, max 1000)
+        start: Only events at or after this time
+        end: Only events at or before this time
+        event_type: Only events of this type
     
     Returns:
-        List of audit events
+        List of audit events (most recent first)
     """
-    return store.list_events(limit=limit)
+    return store.list_events(limit=limit, start=start, end=end, event_type=event_type)
+
+
+@router.get("/audit/stats", response_model=Dict[str, Any])
+async def audit_stats() -> Dict[str, Any]:
+    """Segment and per-event-type counts for the audit log."""
+    return store.stats()
@@ -1,69 +1,86 @@
 """
 P-AUDIT-1: Audit log store for event persistence.
 
-Handles appending and listing audit events.
+Handles appending and listing audit events. Events live in rotated,
+append-only JSONL segments (see storage.event_log); each append writes one
+line instead of rewriting the whole history, and listing by time window or
+event type only opens the segments whose sidecar index can match.
 """
-import json
 import os
+import threading
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-AUDIT_FILE = "backend/data/audit_log.json"
+from ..storage.event_log import SegmentedEventLog
 
+AUDIT_DIR = os.path.join("backend", "data", "audit_log")
+AUDIT_FILE = "backend/data/audit_log.json"  # legacy single-array file, converted on first use
 
-def _ensure_file() -> None:
-    """Ensure audit log file exists."""
-    os.makedirs(os.path.dirname(AUDIT_FILE), exist_ok=True)
-    if not os.path.exists(AUDIT_FILE):
-        with open(AUDIT_FILE, "w") as f:
-            json.dump([], f)
+_LOG: Optional[SegmentedEventLog] = None
+_LOG_LOCK = threading.Lock()
+
+
+def _log() -> SegmentedEventLog:
+    """Open the segment log (and fold in a legacy audit_log.json once)."""
+    global _LOG
+    with _LOG_LOCK:
+        if _LOG is None or str(_LOG.directory) != AUDIT_DIR:
+            if _LOG is not None:
+                _LOG.close()
+            _LOG = SegmentedEventLog(AUDIT_DIR)
+            if os.path.exists(AUDIT_FILE):
+                from .migrate import convert_legacy
+                convert_legacy(AUDIT_FILE, _LOG)
+        return _LOG
 
 
 def append(event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Append an event to the audit log.
-    
+
     Args:
         event_type: Type of event (e.g., 'system_boot', 'user_action')
         payload: Event payload dict
-    
+
     Returns:
         Event dict with timestamp and ID
     """
-    _ensure_file()
-    
+    now = datetime.utcnow()
     event = {
-        "id": int(datetime.utcnow().timestamp() * 1000),
+        "id": int(now.timestamp() * 1000),
         "event_type": event_type,
         "payload": payload,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": now.isoformat()
     }
-    
-    with open(AUDIT_FILE, "r") as f:
-        events = json.load(f)
-    
-    events.append(event)
-    
-    with open(AUDIT_FILE, "w") as f:
-        json.dump(events, f, indent=2)
-    
-    return event
-
-
-def list_events(limit: int = 100) -> List[Dict[str, Any]]:
+    return _log().append(event)
+
+
+def list_events(
+    limit: int = 100,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    event_type: Optional[str] = None,
+) -> List[Dict[str, Any]]:
     """
     List audit events.
-    
+
     Args:
         limit: Maximum number of events to return
-    
+        start: Only events at or after this ISO timestamp
+        end: Only events at or before this ISO timestamp
+        event_type: Only events of this type
+
     Returns:
         List of events (most recent first)
     """
-    _ensure_file()
-    
-    with open(AUDIT_FILE, "r") as f:
-        events = json.load(f)
-    
-    # Return most recent first
-    return sorted(events, key=lambda e: e["timestamp"], reverse=True)[:limit]
+    return _log().query(start=start, end=end, event_type=event_type, limit=limit)
+
+
+def stats() -> Dict[str, Any]:
+    """Segment count, event totals and per-type counts."""
+    return _log().stats()
+
+
+def flush() -> None:
+    """Force pending appends to disk (normally batched)."""
+    _log().flush()
@@ -6,9 +6,44 @@ Builds a brief containing:
 - bills_upcoming (next 7 days)
 - followups_open (open followups)
 - cash_plan (current cash position)
+
+The sources are read concurrently (see aggregate.fanout) and memoized for a few
+seconds; a write to the system config, the obligations, followups or house
+budget store invalidates the sections that read it right away.
 """
+import os
 from typing import Dict, Any
 
+from ..aggregate import Section, run_sections
+from ..system_config.store import CONFIG_FILE
+from ..budget_obligations.store import PATH as BILLS_PATH
+from ..house_budget.store import PATH as HOUSE_BUDGET_PATH
+
+# followups/store.py imports through the ``app.`` root, so its path is mirrored here
+FOLLOWUPS_PATH = os.path.join("data", "followups.json")
+
+
+def _mode() -> str:
+    from backend.app.core_gov.system_config.store import get as config_get
+    config = config_get()
+    return config.get("soft_launch", False) and "soft_launch" or "budget"
+
+
+def _bills_upcoming() -> list:
+    from backend.app.core_gov.budget_obligations.service import followups
+    bills = followups(days_bills=7)
+    return bills.get("items", [])[:5]
+
+
+def _followups_open() -> list:
+    from backend.app.core_gov.followups.service import list_open
+    return list_open()[:5]
+
+
+def _cash_plan() -> dict:
+    from backend.app.core_gov.house_budget.service import cash_plan_for_period
+    return cash_plan_for_period(days=7)
+
 
 def build() -> Dict[str, Any]:
     """
@@ -21,45 +56,22 @@ def build() -> Dict[str, Any]:
             - followups_open (list)
             - cash_plan (dict)
             - timestamp (str)
+            - timings (dict): per-section ms and status
     """
     from datetime import datetime
     
-    result = {
-        "mode": "unknown",
-        "bills_upcoming": [],
-        "followups_open": [],
-        "cash_plan": {},
-        "timestamp": datetime.utcnow().isoformat()
-    }
-    
-    # Get mode from system config
-    try:
-        from backend.app.core_gov.system_config.store import get as config_get
-        config = config_get()
-        result["mode"] = config.get("soft_launch", False) and "soft_launch" or "budget"
-    except Exception:
-        result["mode"] = "unknown"
+    results, timings = run_sections([
+        Section("mode", _mode, deps=(CONFIG_FILE,), default="unknown", key="brief.mode"),
+        Section("bills_upcoming", _bills_upcoming, deps=(BILLS_PATH,), default=[], key="brief.bills_upcoming"),
+        Section("followups_open", _followups_open, deps=(FOLLOWUPS_PATH,), default=[], key="brief.followups_open"),
+        Section("cash_plan", _cash_plan, deps=(HOUSE_BUDGET_PATH, BILLS_PATH), default={}, key="brief.cash_plan"),
+    ])
     
-    # Get upcoming bills
-    try:
-        from backend.app.core_gov.budget_obligations.service import followups
-        bills = followups(days_bills=7)
-        result["bills_upcoming"] = bills.get("items", [])[:5]
-    except Exception:
-        result["bills_upcoming"] = []
-    
-    # Get open followups
-    try:
-        from backend.app.core_gov.followups.service import list_open
-        result["followups_open"] = list_open()[:5]
-    except Exception:
-        result["followups_open"] = []
-    
-    # Get cash plan
-    try:
-        from backend.app.core_gov.house_budget.service import cash_plan_for_period
-        result["cash_plan"] = cash_plan_for_period(days=7)
-    except Exception:
-        result["cash_plan"] = {}
-    
-    return result
+    return {
+        "mode": results["mode"],
+        "bills_upcoming": results["bills_upcoming"],
+        "followups_open": results["followups_open"],
+        "cash_plan": results["cash_plan"],
+        "timestamp": datetime.utcnow().isoformat(),
+        "timings": timings,
+    }
@@ -3,21 +3,24 @@ from __future__ import annotations
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List
 
+from ..recurrence import Rule, make_rule, merge
+
 def _parse_date(s: str) -> date:
     if not s:
         return date.today()
     return datetime.strptime(s, "%Y-%m-%d").date()
 
-def _next_month(d: date, months: int) -> date:
-    y = d.year
-    m = d.month + months
-    while m > 12:
-        y += 1
-        m -= 12
-    while m < 1:
-        y -= 1
-        m += 12
-    return date(y, m, min(d.day, 28))
+def obligation_rule(o: Dict[str, Any]) -> Rule:
+    """Safe days (<=28); weekly due_day is the weekday (0=Mon); custom_months counts due_months from the current month."""
+    cadence = o.get("cadence") or "monthly"
+    due_day = int(o.get("due_day") or 1)
+    return make_rule(
+        cadence,
+        day_of_month=due_day,
+        interval=int(o.get("due_months") or 1) if cadence == "custom_months" else 1,
+        day_of_week=due_day if cadence == "weekly" else None,
+        max_day=28,
+    )
 
 def project(days_ahead: int = 45, from_date: str = "") -> Dict[str, Any]:
     warnings: List[str] = []
@@ -31,40 +34,16 @@ def project(days_ahead: int = 45, from_date: str = "") -> Dict[str, Any]:
         return {"items": [], "warnings": [f"budget_obligations unavailable: {type(e).__name__}: {e}"]}
 
     items = []
-    for o in obs:
-        cadence = o.get("cadence")
-        due_day = int(o.get("due_day") or 1)
-        due_months = int(o.get("due_months") or 1)
-        amt = float(o.get("amount") or 0.0)
-
-        anchor = start
-        if cadence in ("monthly","quarterly","yearly","custom_months"):
-            anchor = date(start.year, start.month, min(max(1, due_day), 28))
-            if anchor < start:
-                anchor = _next_month(anchor, due_months if cadence != "monthly" else 1)
-        elif cadence == "weekly":
-            target = due_day
-            delta = (target - anchor.weekday()) % 7
-            anchor = anchor + timedelta(days=delta)
-
-        cur = anchor
-        while cur <= end:
-            if cur >= start:
-                items.append({
-                    "date": cur.isoformat(),
-                    "obligation_id": o.get("id",""),
-                    "name": o.get("name",""),
-                    "amount": amt,
-                    "pay_to": o.get("pay_to",""),
-                    "category": o.get("category",""),
-                    "autopay_status": o.get("autopay_status","unknown"),
-                })
-            if cadence == "weekly":
-                cur = cur + timedelta(days=7)
-            elif cadence == "monthly":
-                cur = _next_month(cur, 1)
-            else:
-                cur = _next_month(cur, due_months)
+    for d, o in merge(((o, obligation_rule(o)) for o in obs), start, end):
+        items.append({
+            "date": d.isoformat(),
+            "obligation_id": o.get("id",""),
+            "name": o.get("name",""),
+            "amount": float(o.get("amount") or 0.0),
+            "pay_to": o.get("pay_to",""),
+            "category": o.get("category",""),
+            "autopay_status": o.get("autopay_status","unknown"),
+        })
 
     items.sort(key=lambda x: x["date"])
     return {"from": start.isoformat(), "to": end.isoformat(), "items": items, "warnings": warnings}
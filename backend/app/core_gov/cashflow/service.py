@@ -1,6 +1,8 @@
 from __future__ import annotations
 from datetime import date, timedelta
 from typing import Any, Dict, List
+from ..bills.due import bill_rule
+from ..recurrence import make_rule, merge
 
 def forecast(days: int = 30) -> Dict[str, Any]:
     days = max(7, min(180, int(days or 30)))
@@ -30,21 +32,17 @@ def forecast(days: int = 30) -> Dict[str, Any]:
     for b in bills:
         dd = int(b.get("due_day") or 1)
         amt = float(b.get("amount") or 0.0)
-        rows.append({"type":"bill", "name": b.get("name"), "amount": amt, "currency": b.get("currency","CAD"), "day_of_month": dd})
+        row = {"type":"bill", "name": b.get("name"), "amount": amt, "currency": b.get("currency","CAD"), "day_of_month": dd}
+        rows.append((row, bill_rule(b)))
 
     for s in subs:
         dd = int(s.get("renewal_day") or 1)
         amt = float(s.get("amount") or 0.0)
-        rows.append({"type":"subscription", "name": s.get("name"), "amount": amt, "currency": s.get("currency","CAD"), "day_of_month": dd})
-
-    # Expand into specific dates for next N days
-    schedule = []
-    for i in range(days + 1):
-        d = start + timedelta(days=i)
-        dom = d.day
-        for r in rows:
-            if int(r.get("day_of_month") or 0) == dom:
-                schedule.append({"date": d.isoformat(), **r})
+        row = {"type":"subscription", "name": s.get("name"), "amount": amt, "currency": s.get("currency","CAD"), "day_of_month": dd}
+        rows.append((row, make_rule(s.get("cadence") or "monthly", day_of_month=dd)))
+
+    # Expand into specific dates for next N days (same dates as bills.due / payments)
+    schedule = [{"date": d.isoformat(), **r} for d, r in merge(rows, start, end)]
 
     schedule.sort(key=lambda x: x.get("date",""))
     total = sum(float(x.get("amount") or 0.0) for x in schedule)
@@ -13,9 +13,8 @@ def create_comp(property_id: str, sold_price: float, sold_date: str, address: st
     if not property_id or not sold_price:
         raise ValueError("property_id and sold_price required")
     
-    items = store.list_comps()
     cid = "cmp_" + uuid.uuid4().hex[:12]
-    items.append({
+    store.append_comp({
         "id": cid,
         "property_id": property_id,
         "sold_price": float(sold_price),
@@ -28,7 +27,6 @@ def create_comp(property_id: str, sold_price: float, sold_date: str, address: st
         "notes": notes,
         "created_at": _utcnow_iso(),
     })
-    store.save_comps(items)
     return {"id": cid, "property_id": property_id}
 
 def list_comps_for_property(property_id: str, limit: int = 200) -> List[Dict[str, Any]]:
@@ -1,29 +1,27 @@
 from __future__ import annotations
 
-import json, os
+import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+from ..storage.segment_log import SegmentedJsonStore
+
 DATA_DIR = os.path.join("backend", "data", "comps")
 COMPS_JSON = os.path.join(DATA_DIR, "comps.json")
 
+_LOG = SegmentedJsonStore(COMPS_JSON, key="items")
+
 def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 def _ensure():
-    os.makedirs(DATA_DIR, exist_ok=True)
-    if not os.path.exists(COMPS_JSON):
-        with open(COMPS_JSON, "w", encoding="utf-8") as f:
-            json.dump({"updated_at": _utcnow_iso(), "items": []}, f, indent=2)
+    _LOG.ensure()
 
 def list_comps() -> List[Dict[str, Any]]:
-    _ensure()
-    with open(COMPS_JSON, "r", encoding="utf-8") as f:
-        return json.load(f).get("items", [])
+    return _LOG.list()
 
 def save_comps(items: List[Dict[str, Any]]) -> None:
-    _ensure()
-    tmp = COMPS_JSON + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump({"updated_at": _utcnow_iso(), "items": items}, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, COMPS_JSON)
+    _LOG.replace_all(items)
+
+def append_comp(rec: Dict[str, Any]) -> Dict[str, Any]:
+    return _LOG.append(rec)
@@ -4,16 +4,41 @@ P-DAILYOPS-1: Daily operations service.
 Runs daily operations including:
 - budget_obligations.followups
 - shopping_list.ops (or fallback to followups)
+
+Both steps are independent, so they run concurrently (see aggregate.fanout).
+Nothing is memoized: every call is a fresh run.
 """
 from typing import Dict, Any
 
+from ..aggregate import Section, run_sections
+
+
+def _budget_obligations_followups(days_bills: int) -> Dict[str, Any]:
+    from backend.app.core_gov.budget_obligations.service import followups as budget_obligations_followups
+    return budget_obligations_followups(days_bills=days_bills)
+
+
+def _shopping_list_ops() -> Dict[str, Any]:
+    try:
+        from backend.app.core_gov.shopping_list.service import ops as shopping_list_ops
+        return shopping_list_ops()
+    except (ImportError, AttributeError):
+        # Fallback to followups
+        from backend.app.core_gov.followups.service import list_open
+        return {"items": list_open()}
+
+
+def _error(e: BaseException) -> Dict[str, Any]:
+    return {"error": str(e)}
 
-def run(days_bills: int = 7) -> Dict[str, Any]:
+
+def run(days_bills: int = 7, timeout: float = 30.0) -> Dict[str, Any]:
     """
     Run daily operations.
     
     Args:
         days_bills: Number of days to look ahead for bills (default 7)
+        timeout: Seconds to wait for each step before reporting it as an error
     
     Returns:
         dict with keys:
@@ -21,31 +46,18 @@ def run(days_bills: int = 7) -> Dict[str, Any]:
             - budget_obligations_followups (dict)
             - shopping_list_ops (dict)
             - message (str)
+            - timings (dict): per-step ms and status
     """
-    result = {
+    results, timings = run_sections([
+        Section("budget_obligations_followups", lambda: _budget_obligations_followups(days_bills),
+                timeout=timeout, ttl=0, on_error=_error),
+        Section("shopping_list_ops", _shopping_list_ops, timeout=timeout, ttl=0, on_error=_error),
+    ], use_cache=False)
+    
+    return {
         "success": True,
-        "budget_obligations_followups": {},
-        "shopping_list_ops": {},
-        "message": "Daily operations completed"
+        "budget_obligations_followups": results["budget_obligations_followups"],
+        "shopping_list_ops": results["shopping_list_ops"],
+        "message": "Daily operations completed",
+        "timings": timings,
     }
-    
-    # Safe call: budget_obligations.followups
-    try:
-        from backend.app.core_gov.budget_obligations.service import followups as budget_obligations_followups
-        result["budget_obligations_followups"] = budget_obligations_followups(days_bills=days_bills)
-    except Exception as e:
-        result["budget_obligations_followups"] = {"error": str(e)}
-    
-    # Safe call: shopping_list.ops or fallback to followups
-    try:
-        try:
-            from backend.app.core_gov.shopping_list.service import ops as shopping_list_ops
-            result["shopping_list_ops"] = shopping_list_ops()
-        except (ImportError, AttributeError):
-            # Fallback to followups
-            from backend.app.core_gov.followups.service import list_open
-            result["shopping_list_ops"] = {"items": list_open()}
-    except Exception as e:
-        result["shopping_list_ops"] = {"error": str(e)}
-    
-    return result
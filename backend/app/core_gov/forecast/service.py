@@ -13,9 +13,7 @@ def log_usage(inv_id: str, qty_used: float, used_on: str = "", notes: str = "")
         "notes": notes or "",
         "created_at": store._utcnow(),  # type: ignore
     }
-    ev = store.list_events()
-    ev.append(rec)
-    store.save_events(ev)
+    store.append_event(rec)
     return rec
 
 def burn_rate(inv_id: str, window_days: int = 30) -> Dict[str, Any]:
@@ -1,31 +1,29 @@
 from __future__ import annotations
-import json, os, uuid
+import os, uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+from ..storage.segment_log import SegmentedJsonStore
+
 DATA_DIR = os.path.join("backend", "data", "forecast")
 PATH = os.path.join(DATA_DIR, "usage_events.json")
 
+_LOG = SegmentedJsonStore(PATH, key="events", max_items=200000)
+
 def _utcnow() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 def _ensure():
-    os.makedirs(DATA_DIR, exist_ok=True)
-    if not os.path.exists(PATH):
-        with open(PATH, "w", encoding="utf-8") as f:
-            json.dump({"updated_at": _utcnow(), "events": []}, f, indent=2)
+    _LOG.ensure()
 
 def new_id() -> str:
     return "use_" + uuid.uuid4().hex[:12]
 
 def list_events() -> List[Dict[str, Any]]:
-    _ensure()
-    with open(PATH, "r", encoding="utf-8") as f:
-        return json.load(f).get("events", [])
+    return _LOG.list()
 
 def save_events(events: List[Dict[str, Any]]) -> None:
-    _ensure()
-    tmp = PATH + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump({"updated_at": _utcnow(), "events": events[-200000:]}, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, PATH)
+    _LOG.replace_all(events)
+
+def append_event(rec: Dict[str, Any]) -> Dict[str, Any]:
+    return _LOG.append(rec)
@@ -1,22 +1,46 @@
 """One-screen dashboard - aggregates status, alerts, capital, and summary."""
 from __future__ import annotations
 
+from ..aggregate import Section, run_sections
 from ..health.status import ryg_status
 from ..alerts.router import alerts as alerts_fn
 from ..capital.router import capital_status as capital_status_fn
 from ..visibility.router import system_summary as system_summary_fn
+from ..cone.service import CONE_STATE_PATH
+from ..config.thresholds import THRESHOLDS_PATH
+from ..capital.store import CAPITAL_PATH
+from ..alerts.router import AUDIT_PATH
+from ..health.status import LOG_PATH
+from ..jobs.router import _JOBS
+from ..engines.registry import _ENGINE_REGISTRY
+
+
+def _jobs_version() -> tuple:
+    return tuple(sorted((k, j.status) for k, j in _JOBS.items()))
+
+
+def _engines_version() -> tuple:
+    return tuple(sorted(_ENGINE_REGISTRY))
+
+
+def _error(e: BaseException) -> dict:
+    return {"error": f"{type(e).__name__}: {e}" if str(e) else type(e).__name__}
 
 
 def one_screen_dashboard() -> dict:
-    """Call the underlying functions directly to avoid multiple HTTP requests in UI."""
-    status = ryg_status()
-    alerts = alerts_fn()
-    capital = capital_status_fn()
-    summary = system_summary_fn()
+    """Call the underlying functions directly (concurrently, briefly memoized) to avoid multiple HTTP requests in UI."""
+    cone = (CONE_STATE_PATH,)
+    results, timings = run_sections([
+        Section("status", ryg_status, deps=cone + (THRESHOLDS_PATH, AUDIT_PATH, LOG_PATH, _jobs_version), on_error=_error),
+        Section("alerts", alerts_fn, deps=cone + (AUDIT_PATH, _jobs_version, _engines_version), on_error=_error),
+        Section("capital", capital_status_fn, deps=(CAPITAL_PATH,), on_error=_error),
+        Section("summary", system_summary_fn, deps=cone + (_jobs_version,), on_error=_error),
+    ])
 
     return {
-        "status": status,
-        "alerts": alerts,
-        "capital": capital,
-        "summary": summary,
+        "status": results["status"],
+        "alerts": results["alerts"],
+        "capital": results["capital"],
+        "summary": results["summary"],
+        "timings": timings,
     }
@@ -21,8 +21,7 @@ def chunk_text(source_id: str, text: str, chunk_size: int = 800) -> Dict[str, An
         parts.append(t[i:i+size])
         i += size
 
-    chunks = store.list_chunks()
-    created = 0
+    chunks = []
     for idx, p in enumerate(parts):
         chunks.append({
             "id": store.new_id(),
@@ -31,6 +30,5 @@ def chunk_text(source_id: str, text: str, chunk_size: int = 800) -> Dict[str, An
             "text": p,
             "created_at": _utcnow_iso(),
         })
-        created += 1
-    store.save_chunks(chunks)
+    created = store.append_chunks(chunks)
     return {"created": created, "source_id": source_id, "chunk_size": size}
@@ -1,31 +1,39 @@
 from __future__ import annotations
-import json, os, uuid
+import os, uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+from ..storage.bm25_index import BM25Index
+from ..storage.segment_log import SegmentedJsonStore
+
 DATA_DIR = os.path.join("backend", "data", "know_chunks")
 PATH = os.path.join(DATA_DIR, "chunks.json")
 
+_LOG = SegmentedJsonStore(PATH, key="chunks", max_items=200000)
+INDEX = BM25Index(_LOG, text_field="text", tags_field=None)
+
 def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 def _ensure():
-    os.makedirs(DATA_DIR, exist_ok=True)
-    if not os.path.exists(PATH):
-        with open(PATH, "w", encoding="utf-8") as f:
-            json.dump({"updated_at": _utcnow_iso(), "chunks": []}, f, indent=2)
+    _LOG.ensure()
 
 def new_id() -> str:
     return "chk_" + uuid.uuid4().hex[:12]
 
 def list_chunks() -> List[Dict[str, Any]]:
-    _ensure()
-    with open(PATH, "r", encoding="utf-8") as f:
-        return json.load(f).get("chunks", [])
+    return _LOG.list()
+
+def get_chunk(chunk_id: str) -> Dict[str, Any] | None:
+    return _LOG.get(chunk_id)
 
 def save_chunks(chunks: List[Dict[str, Any]]) -> None:
-    _ensure()
-    tmp = PATH + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump({"updated_at": _utcnow_iso(), "chunks": chunks[-200000:]}, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, PATH)
+    _LOG.replace_all(chunks)
+
+def append_chunks(chunks: List[Dict[str, Any]]) -> int:
+    n = _LOG.append_many(chunks)
+    INDEX.add(chunks)
+    return n
+
+def version():
+    return _LOG.version()
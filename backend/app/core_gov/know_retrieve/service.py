@@ -8,20 +8,21 @@ def search(query: str, limit: int = 8) -> Dict[str, Any]:
 
     try:
         from ..know_chunks import store as cstore
-        chunks = cstore.list_chunks()
+        ranked = cstore.INDEX.search(q, k=max(1, min(50, int(limit or 8))))
     except Exception:
-        chunks = []
+        return {"query": query, "hits": []}
 
     hits: List[Dict[str, Any]] = []
-    for c in chunks:
-        txt = (c.get("text") or "").lower()
-        if q in txt:
-            hits.append({
-                "source_id": c.get("source_id"),
-                "chunk_id": c.get("id"),
-                "idx": c.get("idx"),
-                "snippet": (c.get("text") or "")[:400],
-            })
+    for score, chunk_id in ranked:
+        c = cstore.get_chunk(chunk_id)
+        if not c:
+            continue
+        hits.append({
+            "source_id": c.get("source_id"),
+            "chunk_id": c.get("id"),
+            "idx": c.get("idx"),
+            "snippet": (c.get("text") or "")[:400],
+            "score": round(score, 4),
+        })
 
-    hits = hits[:max(1, min(50, int(limit or 8)))]
     return {"query": query, "hits": hits}
@@ -18,20 +18,18 @@ def ingest_doc(doc_id: str, title: str, text: str, tags: List[str] = None, sourc
     tags = tags or []
     parts = chunk_text(text=text)
 
-    chunks = store.list_chunks()
-    created = 0
-    for idx, p in enumerate(parts):
+    chunks = []
+    for p in parts:
         chunks.append({
             "id": "chk_" + uuid.uuid4().hex[:12],
             "doc_id": doc_id,
             "title": title or "",
             "source": source or "",
             "tags": tags,
-            "chunk_index": idx,
-            "text": p,
+            "chunk_index": p["chunk_index"],
+            "text": p["text"],
             "created_at": _utcnow_iso(),
         })
-        created += 1
 
-    store.save_chunks(chunks)
+    created = store.append_chunks(chunks)
     return {"doc_id": doc_id, "created": created}
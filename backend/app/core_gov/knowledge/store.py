@@ -5,8 +5,15 @@ import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+from ..storage.bm25_index import BM25Index
+from ..storage.segment_log import SegmentedJsonStore
+
 DATA_DIR = os.path.join("backend", "data", "knowledge")
 LINKS_PATH = os.path.join(DATA_DIR, "links.json")
+CHUNKS_PATH = os.path.join(DATA_DIR, "chunks.json")
+
+_CHUNKS = SegmentedJsonStore(CHUNKS_PATH, key="chunks", max_items=200000)
+INDEX = BM25Index(_CHUNKS, text_field="text", tags_field="tags")
 
 
 def _utcnow_iso() -> str:
@@ -32,3 +39,21 @@ def save_links(items: List[Dict[str, Any]]) -> None:
     with open(tmp, "w", encoding="utf-8") as f:
         json.dump({"updated_at": _utcnow_iso(), "items": items}, f, indent=2, ensure_ascii=False)
     os.replace(tmp, LINKS_PATH)
+
+
+def list_chunks() -> List[Dict[str, Any]]:
+    return _CHUNKS.list()
+
+
+def get_chunk(chunk_id: str) -> Dict[str, Any] | None:
+    return _CHUNKS.get(chunk_id)
+
+
+def save_chunks(chunks: List[Dict[str, Any]]) -> None:
+    _CHUNKS.replace_all(chunks)
+
+
+def append_chunks(chunks: List[Dict[str, Any]]) -> int:
+    n = _CHUNKS.append_many(chunks)
+    INDEX.add(chunks)
+    return n
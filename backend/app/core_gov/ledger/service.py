@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import uuid
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from . import store
 
+_FIELDS = ("kind", "date", "amount", "description", "category", "merchant", "account_id", "obligation_id", "receipt_id", "tags", "meta")
+
 def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
-def create(
-    kind: str,                 # income|expense|transfer
-    date: str,                 # YYYY-MM-DD
+def _build(
+    kind: str,
+    date: str,
     amount: float,
     description: str = "",
     category: str = "",
@@ -32,7 +36,7 @@ def create(
     if amt < 0:
         raise ValueError("amount must be >= 0")
 
-    rec = {
+    return {
         "id": "led_" + uuid.uuid4().hex[:12],
         "kind": k,
         "date": date.strip(),
@@ -47,11 +51,87 @@ def create(
         "meta": meta,
         "created_at": _utcnow_iso(),
     }
-    items = store.list_items()
-    items.append(rec)
-    store.save_items(items)
+
+def create(
+    kind: str,                 # income|expense|transfer
+    date: str,                 # YYYY-MM-DD
+    amount: float,
+    description: str = "",
+    category: str = "",
+    merchant: str = "",
+    account_id: str = "",
+    obligation_id: str = "",
+    receipt_id: str = "",
+    tags: List[str] = None,
+    meta: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    rec = _build(kind=kind, date=date, amount=amount, description=description, category=category, merchant=merchant,
+                 account_id=account_id, obligation_id=obligation_id, receipt_id=receipt_id, tags=tags, meta=meta)
+    store.append_item(rec)
     return rec
 
+def dedupe_key(rec: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """(account_id, date, amount, description hash) used to spot re-imported rows."""
+    desc = " ".join(str(rec.get("description") or "").lower().split())
+    return (
+        str(rec.get("account_id") or "").strip(),
+        str(rec.get("date") or "").strip(),
+        "%.2f" % float(rec.get("amount") or 0.0),
+        hashlib.sha1(desc.encode("utf-8")).hexdigest()[:16],
+    )
+
+def create_many(rows: Iterable[Dict[str, Any]], dedupe: bool = False, batch_size: int = 500, keep_items: int = 200) -> Dict[str, Any]:
+    """
+    Bulk create. Rows take the same fields as create(); invalid rows are counted in `failed`
+    (first `keep_items` messages in `errors`) rather than raised.
+    Rows are consumed lazily and written every `batch_size` rows with one store append,
+    so a generator over a large CSV never has to be materialized.
+
+    With dedupe=True a row is skipped while the ledger already holds an unclaimed record with the
+    same dedupe_key(), so re-importing an overlapping statement is idempotent while genuinely
+    repeated rows (two identical coffees on one day) inside a single import are still kept.
+    """
+    batch_size = max(1, int(batch_size or 500))
+    existing: Counter = Counter()
+    if dedupe:
+        existing = Counter(dedupe_key(x) for x in store.list_items())
+
+    created = 0
+    duplicates = 0
+    failed = 0
+    errors: List[str] = []
+    items: List[Dict[str, Any]] = []
+    batch: List[Dict[str, Any]] = []
+
+    def _flush() -> None:
+        nonlocal created
+        if batch:
+            created += store.append_items(batch)
+            batch.clear()
+
+    for idx, row in enumerate(rows):
+        try:
+            rec = _build(**{k: row.get(k) for k in _FIELDS if k in row})
+        except (TypeError, ValueError) as e:
+            failed += 1
+            if len(errors) < keep_items:
+                errors.append(f"row {idx}: {type(e).__name__}: {e}")
+            continue
+        if dedupe:
+            key = dedupe_key(rec)
+            if existing[key] > 0:
+                existing[key] -= 1
+                duplicates += 1
+                continue
+        batch.append(rec)
+        if len(items) < keep_items:
+            items.append(rec)
+        if len(batch) >= batch_size:
+            _flush()
+    _flush()
+
+    return {"created": created, "duplicates": duplicates, "failed": failed, "errors": errors, "items": items}
+
 def list_items(kind: str = "", category: str = "", account_id: str = "", q: str = "", date_from: str = "", date_to: str = "") -> List[Dict[str, Any]]:
     items = store.list_items()
     if kind:
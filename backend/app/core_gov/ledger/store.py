@@ -1,29 +1,34 @@
 from __future__ import annotations
 
-import json, os
+import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+from ..storage.segment_log import SegmentedJsonStore
+
 DATA_DIR = os.path.join("backend", "data", "ledger")
 PATH = os.path.join(DATA_DIR, "items.json")
 
+# Snapshot + append-only segment: create() is an O(1) append, not a rewrite.
+_LOG = SegmentedJsonStore(PATH, key="items")
+
 def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 def _ensure():
-    os.makedirs(DATA_DIR, exist_ok=True)
-    if not os.path.exists(PATH):
-        with open(PATH, "w", encoding="utf-8") as f:
-            json.dump({"updated_at": _utcnow_iso(), "items": []}, f, indent=2)
+    _LOG.ensure()
 
 def list_items() -> List[Dict[str, Any]]:
-    _ensure()
-    with open(PATH, "r", encoding="utf-8") as f:
-        return json.load(f).get("items", [])
+    return _LOG.list()
 
 def save_items(items: List[Dict[str, Any]]) -> None:
-    _ensure()
-    tmp = PATH + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump({"updated_at": _utcnow_iso(), "items": items}, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, PATH)
+    _LOG.replace_all(items)
+
+def append_item(rec: Dict[str, Any]) -> Dict[str, Any]:
+    return _LOG.append(rec)
+
+def append_items(recs: List[Dict[str, Any]]) -> int:
+    return _LOG.append_many(recs)
+
+def version():
+    return _LOG.version()
@@ -38,9 +38,7 @@ def create_item(payload: Dict[str, Any]) -> Dict[str, Any]:
         "created_at": now,
         "updated_at": now,
     }
-    items = store.list_items()
-    items.append(rec)
-    store.save_items(items)
+    store.append_item(rec)
     return rec
 
 
@@ -71,7 +69,7 @@ def patch(item_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
         tgt["meta"] = patch.get("meta") or {}
 
     tgt["updated_at"] = _utcnow_iso()
-    store.save_items(items)
+    store.put_item(tgt)
     return tgt
 
 
@@ -97,11 +95,7 @@ def snapshot(note: str = "") -> Dict[str, Any]:
         },
     }
 
-    snaps = store.list_snaps()
-    snaps.append(rec)
-    if len(snaps) > 240:
-        snaps = snaps[-240:]
-    store.save_snaps(snaps)
+    store.append_snap(rec)  # store keeps the newest 240
     return rec
 
 
@@ -1,52 +1,51 @@
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+from ..storage.segment_log import SegmentedJsonStore
+
 DATA_DIR = os.path.join("backend", "data", "networth")
 ITEMS_PATH = os.path.join(DATA_DIR, "items.json")
 SNAPS_PATH = os.path.join(DATA_DIR, "snapshots.json")
 
+_ITEMS = SegmentedJsonStore(ITEMS_PATH, key="items")
+_SNAPS = SegmentedJsonStore(SNAPS_PATH, key="items", max_items=240)
+
 
 def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
 def _ensure():
-    os.makedirs(DATA_DIR, exist_ok=True)
-    if not os.path.exists(ITEMS_PATH):
-        with open(ITEMS_PATH, "w", encoding="utf-8") as f:
-            json.dump({"updated_at": _utcnow_iso(), "items": []}, f, indent=2)
-    if not os.path.exists(SNAPS_PATH):
-        with open(SNAPS_PATH, "w", encoding="utf-8") as f:
-            json.dump({"updated_at": _utcnow_iso(), "items": []}, f, indent=2)
+    _ITEMS.ensure()
+    _SNAPS.ensure()
 
 
 def list_items() -> List[Dict[str, Any]]:
-    _ensure()
-    with open(ITEMS_PATH, "r", encoding="utf-8") as f:
-        return json.load(f).get("items", [])
+    return _ITEMS.list()
 
 
 def save_items(items: List[Dict[str, Any]]) -> None:
-    _ensure()
-    tmp = ITEMS_PATH + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump({"updated_at": _utcnow_iso(), "items": items}, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, ITEMS_PATH)
+    _ITEMS.replace_all(items)
+
+
+def append_item(rec: Dict[str, Any]) -> Dict[str, Any]:
+    return _ITEMS.append(rec)
+
+
+def put_item(rec: Dict[str, Any]) -> Dict[str, Any]:
+    return _ITEMS.put(rec)
 
 
 def list_snaps() -> List[Dict[str, Any]]:
-    _ensure()
-    with open(SNAPS_PATH, "r", encoding="utf-8") as f:
-        return json.load(f).get("items", [])
+    return _SNAPS.list()
 
 
 def save_snaps(items: List[Dict[str, Any]]) -> None:
-    _ensure()
-    tmp = SNAPS_PATH + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump({"updated_at": _utcnow_iso(), "items": items}, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, SNAPS_PATH)
+    _SNAPS.replace_all(items)
+
+
+def append_snap(rec: Dict[str, Any]) -> Dict[str, Any]:
+    return _SNAPS.append(rec)
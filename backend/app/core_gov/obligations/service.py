@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import uuid
-import calendar
 from datetime import date, datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional
+from dataclasses import replace
 
 from . import store
+from ..recurrence import Rule, make_rule, merge, next_due
 
 
 def _utcnow_iso() -> str:
@@ -31,18 +32,6 @@ def _parse_date(s: str) -> date:
     return date.fromisoformat(s)
 
 
-def _safe_day(year: int, month: int, dom: int) -> int:
-    last = calendar.monthrange(year, month)[1]
-    return max(1, min(int(dom), last))
-
-
-def _add_months(d: date, months: int) -> date:
-    y = d.year + (d.month - 1 + months) // 12
-    m = (d.month - 1 + months) % 12 + 1
-    day = _safe_day(y, m, d.day)
-    return date(y, m, day)
-
-
 def _default_recurrence(frequency: str, due_day: int, tz: str) -> Dict[str, Any]:
     # weekly/biweekly will use day_of_week = Monday by default (0)
     freq = frequency or "monthly"
@@ -291,59 +280,32 @@ def verify_autopay(obligation_id: str, payload: Dict[str, Any]) -> Dict[str, Any
 
 # ========== PACK 2: Recurrence Engine + Upcoming Runs ==========
 
-def _next_due_from_recurrence(o: Dict[str, Any], from_date: date) -> date:
+def _rule_for(o: Dict[str, Any], from_date: date) -> Rule:
     rec = o.get("recurrence") or {}
     freq = rec.get("frequency") or o.get("frequency") or "monthly"
-    interval = int(rec.get("interval") or 1)
-
-    # explicit override
+    rule = make_rule(
+        freq,
+        day_of_month=int(rec.get("day_of_month") or o.get("due_day") or 1),
+        interval=int(rec.get("interval") or 1),
+        day_of_week=int(rec.get("day_of_week") or 0),  # 0=Mon
+        # annual is defined by month in meta if provided, else the window's month (simple v1)
+        month=int((o.get("meta") or {}).get("annual_month") or 0) or None,
+        anchor=rec.get("start_date") or None,
+    )
+
+    # explicit override pins the next occurrence; the cadence continues from it
     if o.get("next_due_date"):
         try:
             nd = _parse_date(o["next_due_date"])
             if nd >= from_date:
-                return nd
+                return replace(rule, anchor=nd, day_of_month=nd.day, day_of_week=nd.weekday(), month=nd.month)
         except Exception:
             pass
+    return rule
 
-    if freq in ("monthly", "quarterly", "annually"):
-        dom = int(rec.get("day_of_month") or o.get("due_day") or 1)
-        base = date(from_date.year, from_date.month, _safe_day(from_date.year, from_date.month, dom))
-        if base < from_date:
-            base = _add_months(base, 1)
-        if freq == "quarterly":
-            # step in 3-month increments
-            while base < from_date:
-                base = _add_months(base, 3 * interval)
-            # ensure next quarter boundary by moving at least 3 months if we already used current month
-            if base < from_date:
-                base = _add_months(base, 3 * interval)
-        if freq == "annually":
-            # move to this year dom (or next)
-            base = date(from_date.year, from_date.month, _safe_day(from_date.year, from_date.month, dom))
-            # annual is defined by month in meta if provided, else use from_date month (simple v1)
-            annual_month = int(o.get("meta", {}).get("annual_month") or from_date.month)
-            base = date(from_date.year, annual_month, _safe_day(from_date.year, annual_month, dom))
-            if base < from_date:
-                base = date(from_date.year + interval, annual_month, _safe_day(from_date.year + interval, annual_month, dom))
-        return base
-
-    if freq in ("weekly", "biweekly"):
-        dow = int(rec.get("day_of_week") or 0)  # 0=Mon
-        # python weekday: Mon=0..Sun=6
-        delta = (dow - from_date.weekday()) % 7
-        base = from_date + timedelta(days=delta)
-        if base < from_date:
-            base = base + timedelta(days=7)
-        if freq == "biweekly":
-            base = base + timedelta(days=14 * (interval - 1))
-        return base
-
-    # fallback monthly
-    dom = int(rec.get("day_of_month") or o.get("due_day") or 1)
-    base = date(from_date.year, from_date.month, _safe_day(from_date.year, from_date.month, dom))
-    if base < from_date:
-        base = _add_months(base, 1)
-    return base
+
+def _next_due_from_recurrence(o: Dict[str, Any], from_date: date) -> date:
+    return next_due(_rule_for(o, from_date), from_date) or from_date
 
 
 def generate_upcoming(start_date: str, end_date: str) -> List[Dict[str, Any]]:
@@ -352,47 +314,24 @@ def generate_upcoming(start_date: str, end_date: str) -> List[Dict[str, Any]]:
     if e < s:
         raise ValueError("end_date must be >= start_date")
 
+    active = [o for o in store.list_obligations() if o.get("status") == "active"]
+    now = _utcnow_iso()
     out: List[Dict[str, Any]] = []
-    for o in store.list_obligations():
-        if o.get("status") != "active":
-            continue
-        due = _next_due_from_recurrence(o, s)
-        # add occurrences until end date (caps to avoid runaway)
-        cap = 120
-        while due <= e and cap > 0:
-            out.append({
-                "id": "run_" + uuid.uuid4().hex[:10],
-                "obligation_id": o["id"],
-                "name": o.get("name") or "",
-                "amount": float(o.get("amount") or 0.0),
-                "currency": o.get("currency") or "CAD",
-                "due_date": due.isoformat(),
-                "priority": o.get("priority") or "A",
-                "pay_from": o.get("pay_from") or "personal",
-                "autopay_enabled": bool((o.get("autopay") or {}).get("enabled", False)),
-                "autopay_verified": bool((o.get("autopay") or {}).get("verified", False)),
-                "status": "scheduled",
-                "created_at": _utcnow_iso(),
-            })
-
-            rec = o.get("recurrence") or {}
-            freq = rec.get("frequency") or o.get("frequency") or "monthly"
-            interval = int(rec.get("interval") or 1)
-
-            if freq == "weekly":
-                due = due + timedelta(days=7 * interval)
-            elif freq == "biweekly":
-                due = due + timedelta(days=14 * interval)
-            elif freq == "monthly":
-                due = _add_months(due, 1 * interval)
-            elif freq == "quarterly":
-                due = _add_months(due, 3 * interval)
-            elif freq == "annually":
-                due = date(due.year + interval, due.month, _safe_day(due.year + interval, due.month, due.day))
-            else:
-                due = _add_months(due, 1)
-
-            cap -= 1
+    for due, o in merge(((o, _rule_for(o, s)) for o in active), s, e):
+        out.append({
+            "id": "run_" + uuid.uuid4().hex[:10],
+            "obligation_id": o["id"],
+            "name": o.get("name") or "",
+            "amount": float(o.get("amount") or 0.0),
+            "currency": o.get("currency") or "CAD",
+            "due_date": due.isoformat(),
+            "priority": o.get("priority") or "A",
+            "pay_from": o.get("pay_from") or "personal",
+            "autopay_enabled": bool((o.get("autopay") or {}).get("enabled", False)),
+            "autopay_verified": bool((o.get("autopay") or {}).get("verified", False)),
+            "status": "scheduled",
+            "created_at": now,
+        })
 
     # sort by due_date then priority
     out.sort(key=lambda x: (x["due_date"], x.get("priority", "A")))
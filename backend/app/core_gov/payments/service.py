@@ -1,18 +1,31 @@
 from __future__ import annotations
 from datetime import date, timedelta
 from typing import Any, Dict, List
-from backend.app.core_gov.due_dates.service import next_due
+from ..recurrence import Rule, expand, make_rule, next_due
+
+def payment_rule(p: Dict[str, Any]) -> Rule:
+    """Safe days (<=28); weekly/biweekly payments keep the weekday they were created on."""
+    cadence = str(p.get("cadence") or "monthly")
+    weekly = make_rule(cadence).freq == "weekly"
+    return make_rule(
+        cadence,
+        day_of_month=int(p.get("due_day") or 1),
+        anchor=p.get("created_at") if weekly else None,
+        max_day=28,
+    )
 
 def compute_next(p: Dict[str, Any], from_date: str = "") -> str:
     if (p.get("next_due_override") or "").strip():
         return str(p.get("next_due_override"))
-    return next_due(
-        cadence=str(p.get("cadence") or "monthly"),
-        due_day=int(p.get("due_day") or 1),
-        from_date=from_date,
-    )
+    try:
+        d0 = date.fromisoformat(from_date) if from_date else date.today()
+    except Exception:
+        d0 = date.today()
+    nd = next_due(payment_rule(p), d0)
+    return nd.isoformat() if nd else ""
 
 def schedule(items: List[Dict[str, Any]], days: int = 30) -> List[Dict[str, Any]]:
+    """Every occurrence in the window; a pinned next_due_override comes first and the cadence resumes after it."""
     days = max(7, min(180, int(days or 30)))
     start = date.today()
     end = start + timedelta(days=days)
@@ -21,14 +34,21 @@ def schedule(items: List[Dict[str, Any]], days: int = 30) -> List[Dict[str, Any]
     for p in items:
         if p.get("status") != "active":
             continue
-        nd = compute_next(p, from_date=start.isoformat())
-        try:
-            d = date.fromisoformat(nd)
-        except Exception:
-            continue
-        if start <= d <= end:
+        dates: List[date] = []
+        first = start
+        override = (p.get("next_due_override") or "").strip()
+        if override:
+            try:
+                od = date.fromisoformat(override)
+            except Exception:
+                continue
+            if start <= od <= end:
+                dates.append(od)
+            first = max(start, od + timedelta(days=1))
+        dates.extend(expand(payment_rule(p), first, end))
+        for d in dates:
             out.append({
-                "date": nd,
+                "date": d.isoformat(),
                 "payment_id": p.get("id"),
                 "name": p.get("name"),
                 "kind": p.get("kind"),
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
-def run_batch(limit: int = 200, threshold: float = 0.92) -> Dict[str, Any]:
+def run_batch(limit: int = 200, threshold: float = 0.92, amount_tolerance: float = 1.0, days_tolerance: int = 5) -> Dict[str, Any]:
+    """
+    Score every new bank txn against one shared candidate index, then link the
+    max-total-score one-to-one assignment (a payment/receipt is never linked twice).
+    """
     warnings: List[str] = []
     accepted = 0
     attempted = 0
@@ -16,15 +20,58 @@ def run_batch(limit: int = 200, threshold: float = 0.92) -> Dict[str, Any]:
     except Exception as e:
         return {"accepted": 0, "attempted": 0, "failures": 0, "warnings": [f"bank unavailable: {type(e).__name__}: {e}"], "items": []}
 
-    from backend.app.core_gov.reconcile.auto_accept import auto_accept  # type: ignore
+    from backend.app.core_gov.reconcile import service as rsvc  # type: ignore
+    from backend.app.core_gov.reconcile import store as rstore  # type: ignore
+    from backend.app.core_gov.reconcile.index import CandidateIndex, assign  # type: ignore
 
-    for t in txns:
+    amount_tolerance = float(amount_tolerance or 1.0)
+    days_tolerance = int(days_tolerance or 5)
+    threshold = float(threshold or 0.92)
+    index = CandidateIndex.load(warnings, bucket_width=amount_tolerance)
+    already = {(x.get("target_type"), x.get("target_id")) for x in rstore.list_links()}
+
+    # one pass: every txn x every in-range candidate
+    cols: Dict[Tuple[str, str], int] = {}
+    col_top: List[Dict[str, Any]] = []
+    edges: List[Tuple[int, int, float]] = []
+    best: Dict[int, Dict[str, Any]] = {}
+    for i, t in enumerate(txns):
+        sugs = rsvc.suggest_for_txn(t, index, amount_tolerance, days_tolerance)
+        if sugs:
+            best[i] = sugs[0]
+        for sg in sugs:
+            key = (sg["target_type"], sg["target_id"])
+            if sg["score"] < threshold or key in already:
+                continue
+            if key not in cols:
+                cols[key] = len(col_top)
+                col_top.append(sg)
+            edges.append((i, cols[key], sg["score"]))
+
+    chosen = assign(edges, len(txns), len(col_top))
+
+    for i, t in enumerate(txns):
         attempted += 1
-        out = auto_accept(bank_txn_id=t.get("id",""), threshold=threshold)
-        details.append(out)
-        if out.get("accepted"):
+        tid = t.get("id","")
+        if i not in chosen:
+            top = best.get(i)
+            if top is None:
+                msg = "no suggestions"
+            elif top["score"] < threshold:
+                msg = f"top score below threshold: {top['score']:.2f} < {threshold:.2f}"
+            else:
+                msg = "candidates already linked or assigned to another txn"
+            details.append({"bank_txn_id": tid, "accepted": False, "warnings": [msg], "top": top or {}, "link": {}})
+            failures += 1
+            continue
+        col, sc = chosen[i]
+        top = col_top[col]
+        try:
+            link = rsvc.link(bank_txn_id=tid, target_type=top.get("target_type"), target_id=top.get("target_id"), note=f"auto-accepted score={sc:.2f}", meta={"auto_accept": {"threshold": threshold, "score": sc, "batch": True}})
+            details.append({"bank_txn_id": tid, "accepted": True, "warnings": [], "top": {**top, "score": sc}, "link": link})
             accepted += 1
-        else:
+        except Exception as e:
+            details.append({"bank_txn_id": tid, "accepted": False, "warnings": [f"link failed: {type(e).__name__}: {e}"], "top": top, "link": {}})
             failures += 1
 
     return {"accepted": accepted, "attempted": attempted, "failures": failures, "warnings": warnings, "items": details[:50]}
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def _parse_date(s: str) -> Optional[date]:
+    try:
+        return date.fromisoformat((s or "").strip())
+    except Exception:
+        return None
+
+
+class _Bucket:
+    __slots__ = ("ords", "dated", "undated")
+
+    def __init__(self) -> None:
+        self.ords: List[int] = []
+        self.dated: List[Dict[str, Any]] = []
+        self.undated: List[Dict[str, Any]] = []
+
+
+class CandidateIndex:
+    """
+    Payments + receipts bucketed by amount, each bucket sorted by date.
+
+    A lookup touches only the buckets overlapping [amount - tol, amount + tol] and, inside each,
+    only the date slice [date - days, date + days] (bisect), instead of scanning every record.
+    Entries are {"target_type", "target_id", "amount", "date", "snapshot"}.
+    """
+
+    def __init__(self, payments: List[Dict[str, Any]], receipts: List[Dict[str, Any]], bucket_width: float = 1.0):
+        self.bucket_width = float(bucket_width) if bucket_width and bucket_width > 0 else 1.0
+        self._buckets: Dict[int, _Bucket] = {}
+        self.size = 0
+        staged: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
+        for target_type, rows, date_key, amount_key in (
+            ("payment", payments, "paid_date", "amount"),
+            ("receipt", receipts, "date", "total"),
+        ):
+            for r in rows or []:
+                amt = float(r.get(amount_key) or 0.0)
+                d = _parse_date(r.get(date_key, ""))
+                e = {"target_type": target_type, "target_id": r.get("id", ""), "amount": amt, "date": d, "snapshot": r}
+                b = self._key(amt)
+                if d is None:
+                    self._buckets.setdefault(b, _Bucket()).undated.append(e)
+                else:
+                    staged.setdefault(b, []).append((d.toordinal(), e))
+                self.size += 1
+        for b, pairs in staged.items():
+            pairs.sort(key=lambda p: p[0])
+            bucket = self._buckets.setdefault(b, _Bucket())
+            bucket.ords = [p[0] for p in pairs]
+            bucket.dated = [p[1] for p in pairs]
+
+    def _key(self, amount: float) -> int:
+        return int(amount // self.bucket_width)
+
+    @classmethod
+    def load(cls, warnings: List[str], bucket_width: float = 1.0) -> "CandidateIndex":
+        """Read budget payments and receipts once (best-effort, like suggest())."""
+        pays: List[Dict[str, Any]] = []
+        rcs: List[Dict[str, Any]] = []
+        try:
+            from backend.app.core_gov.budget import store as bstore  # type: ignore
+            pays = bstore.list_payments()
+        except Exception as e:
+            warnings.append(f"budget_payments unavailable: {type(e).__name__}: {e}")
+        try:
+            from backend.app.core_gov.receipts import service as rsvc  # type: ignore
+            rcs = rsvc.list_items()
+        except Exception as e:
+            warnings.append(f"receipts unavailable: {type(e).__name__}: {e}")
+        return cls(pays, rcs, bucket_width=bucket_width)
+
+    def candidates(self, amount: float, on: Optional[date], amount_tolerance: float, days_tolerance: int) -> Iterator[Dict[str, Any]]:
+        """Entries within the amount tolerance and, when both dates are known, the day window."""
+        lo_amt, hi_amt = amount - amount_tolerance, amount + amount_tolerance
+        for b in range(self._key(lo_amt), self._key(hi_amt) + 1):
+            bucket = self._buckets.get(b)
+            if bucket is None:
+                continue
+            if on is None:
+                dated = bucket.dated
+            else:
+                t = on.toordinal()
+                dated = bucket.dated[bisect_left(bucket.ords, t - days_tolerance):bisect_right(bucket.ords, t + days_tolerance)]
+            for e in dated:
+                if lo_amt <= e["amount"] <= hi_amt:
+                    yield e
+            for e in bucket.undated:
+                if lo_amt <= e["amount"] <= hi_amt:
+                    yield e
+
+
+def score(entry: Dict[str, Any], t_amt: float, t_date: Optional[date], t_desc: str, amount_tolerance: float, days_tolerance: int) -> float:
+    """Same weighting suggest() has always used: payments 0.65/0.35, receipts 0.6/0.3 + vendor boost."""
+    d = entry["date"]
+    if t_date and d:
+        day_score = 1.0 - (min(abs((d - t_date).days), days_tolerance) / float(days_tolerance))
+    else:
+        day_score = 0.4
+    amt_score = 1.0 - (min(abs(entry["amount"] - t_amt), amount_tolerance) / float(amount_tolerance))
+    if entry["target_type"] == "payment":
+        return 0.65 * amt_score + 0.35 * day_score
+    vendor = (entry["snapshot"].get("vendor") or "").lower()
+    desc_boost = 0.15 if (vendor and (vendor in t_desc or t_desc in vendor)) else 0.0
+    return min(1.0, 0.6 * amt_score + 0.3 * day_score + desc_boost)
+
+
+def assign(edges: List[Tuple[int, int, float]], n_rows: int, n_cols: int) -> Dict[int, Tuple[int, float]]:
+    """
+    Max-total-score one-to-one assignment over sparse (row, col, score) edges.
+
+    Edges are split into connected components and each component is solved exactly with the
+    Hungarian method; reconciliation components are tiny (a handful of same-amount txns), so
+    this stays cheap even when the batch is large. Returns {row: (col, score)}.
+    """
+    adj_r: Dict[int, List[Tuple[int, float]]] = {}
+    adj_c: Dict[int, List[int]] = {}
+    for r, c, s in edges:
+        adj_r.setdefault(r, []).append((c, s))
+        adj_c.setdefault(c, []).append(r)
+
+    out: Dict[int, Tuple[int, float]] = {}
+    seen_r: set = set()
+    for start in adj_r:
+        if start in seen_r:
+            continue
+        rows: List[int] = []
+        cols: List[int] = []
+        seen_c: set = set()
+        stack = [start]
+        seen_r.add(start)
+        while stack:
+            r = stack.pop()
+            rows.append(r)
+            for c, _ in adj_r[r]:
+                if c in seen_c:
+                    continue
+                seen_c.add(c)
+                cols.append(c)
+                for r2 in adj_c[c]:
+                    if r2 not in seen_r:
+                        seen_r.add(r2)
+                        stack.append(r2)
+        weights = {(r, c): s for r in rows for c, s in adj_r[r]}
+        for r, c in _hungarian(rows, cols, weights):
+            if (r, c) in weights:
+                out[r] = (c, weights[(r, c)])
+    return out
+
+
+def _hungarian(rows: List[int], cols: List[int], weights: Dict[Tuple[int, int], float]) -> List[Tuple[int, int]]:
+    # Classic O(n^2 m) potentials method on a cost matrix with n <= m; non-edges cost 0 (= unmatched).
+    transpose = len(rows) > len(cols)
+    R, C = (cols, rows) if transpose else (rows, cols)
+    n, m = len(R), len(C)
+
+    def cost(i: int, j: int) -> float:
+        key = (C[j], R[i]) if transpose else (R[i], C[j])
+        return -weights.get(key, 0.0)
+
+    INF = float("inf")
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [INF] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0, delta, j1 = p[j0], INF, 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = cost(i0 - 1, j - 1) - u[i0] - v[j]
+                    if cur < minv[j]:
+                        minv[j], way[j] = cur, j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    pairs = []
+    for j in range(1, m + 1):
+        if p[j]:
+            i = p[j] - 1
+            pairs.append((C[j - 1], R[i]) if transpose else (R[i], C[j - 1]))
+    return pairs
@@ -43,8 +43,8 @@ def auto_accept_link(bank_txn_id: str, threshold: float = 0.92, amount_tolerance
 
 
 @router.post("/batch_run")
-def batch_run(limit: int = 200, threshold: float = 0.92):
-    return batch.run_batch(limit=limit, threshold=threshold)
+def batch_run(limit: int = 200, threshold: float = 0.92, amount_tolerance: float = 1.0, days_tolerance: int = 5):
+    return batch.run_batch(limit=limit, threshold=threshold, amount_tolerance=amount_tolerance, days_tolerance=days_tolerance)
 
 
 @router.get("/payments")
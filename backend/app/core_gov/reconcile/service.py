@@ -5,6 +5,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from . import store
+from .index import CandidateIndex, score
 
 
 def _parse_date(s: str) -> Optional[date]:
@@ -88,7 +89,7 @@ def reconcile(days: int = 30) -> Dict[str, Any]:
     return {"ok": True, "matched": matched, "missing": missing, "due_count": len(due)}
 
 
-def suggest(bank_txn_id: str, max_suggestions: int = 10, amount_tolerance: float = 1.0, days_tolerance: int = 5) -> Dict[str, Any]:
+def suggest(bank_txn_id: str, max_suggestions: int = 10, amount_tolerance: float = 1.0, days_tolerance: int = 5, index: Optional[CandidateIndex] = None) -> Dict[str, Any]:
     warnings: List[str] = []
 
     def _get_txn():
@@ -98,73 +99,39 @@ def suggest(bank_txn_id: str, max_suggestions: int = 10, amount_tolerance: float
     if not txn:
         return {"bank_txn_id": bank_txn_id, "suggestions": [], "warnings": warnings + ["bank txn not found"]}
 
+    amount_tolerance = float(amount_tolerance or 1.0)
+    days_tolerance = int(days_tolerance or 5)
+    if index is None:
+        index = CandidateIndex.load(warnings, bucket_width=amount_tolerance)
+    return {
+        "bank_txn_id": bank_txn_id,
+        "suggestions": suggest_for_txn(txn, index, amount_tolerance, days_tolerance)[: int(max_suggestions or 10)],
+        "warnings": warnings,
+    }
+
+
+def suggest_for_txn(txn: Dict[str, Any], index: CandidateIndex, amount_tolerance: float = 1.0, days_tolerance: int = 5) -> List[Dict[str, Any]]:
+    """Scored candidates for one bank txn via an index range query, best first."""
     t_date = _parse_date(txn.get("date",""))
     t_amt = float(txn.get("amount") or 0.0)
     t_desc = (txn.get("description") or "").lower()
 
     suggestions: List[Dict[str, Any]] = []
-
-    # payments
-    def _payments():
-        from backend.app.core_gov.budget import store as bstore  # type: ignore
-        return bstore.list_payments()
-    pays = _safe(_payments, warnings, "budget_payments") or []
-    for p in pays:
-        pd = _parse_date(p.get("paid_date",""))
-        pa = float(p.get("amount") or 0.0)
-        if _abs(pa - t_amt) > float(amount_tolerance or 1.0):
-            continue
-        if t_date and pd:
-            if _abs((pd - t_date).days) > int(days_tolerance or 5):
-                continue
-            day_score = 1.0 - (min(_abs((pd - t_date).days), int(days_tolerance or 5)) / float(days_tolerance or 5))
-        else:
-            day_score = 0.4
-        amt_score = 1.0 - (min(_abs(pa - t_amt), float(amount_tolerance or 1.0)) / float(amount_tolerance or 1.0))
-        score = 0.65 * amt_score + 0.35 * day_score
+    for e in index.candidates(t_amt, t_date, amount_tolerance, days_tolerance):
+        snap = e["snapshot"]
+        is_payment = e["target_type"] == "payment"
         suggestions.append({
-            "target_type": "payment",
-            "target_id": p.get("id",""),
-            "date": p.get("paid_date",""),
-            "amount": pa,
-            "score": float(score),
-            "reason": "amount+date match vs payment",
-            "snapshot": p,
-        })
-
-    # receipts
-    def _receipts():
-        from backend.app.core_gov.receipts import service as rsvc  # type: ignore
-        return rsvc.list_items()
-    rcs = _safe(_receipts, warnings, "receipts") or []
-    for r in rcs:
-        rd = _parse_date(r.get("date",""))
-        ra = float(r.get("total") or 0.0)
-        if _abs(ra - t_amt) > float(amount_tolerance or 1.0):
-            continue
-        if t_date and rd:
-            if _abs((rd - t_date).days) > int(days_tolerance or 5):
-                continue
-            day_score = 1.0 - (min(_abs((rd - t_date).days), int(days_tolerance or 5)) / float(days_tolerance or 5))
-        else:
-            day_score = 0.4
-        amt_score = 1.0 - (min(_abs(ra - t_amt), float(amount_tolerance or 1.0)) / float(amount_tolerance or 1.0))
-        # vendor/desc boost
-        vendor = (r.get("vendor") or "").lower()
-        desc_boost = 0.15 if (vendor and (vendor in t_desc or t_desc in vendor)) else 0.0
-        score = min(1.0, 0.6 * amt_score + 0.3 * day_score + desc_boost)
-        suggestions.append({
-            "target_type": "receipt",
-            "target_id": r.get("id",""),
-            "date": r.get("date",""),
-            "amount": ra,
-            "score": float(score),
-            "reason": "amount+date match vs receipt (+vendor boost if any)",
-            "snapshot": r,
+            "target_type": e["target_type"],
+            "target_id": e["target_id"],
+            "date": snap.get("paid_date","") if is_payment else snap.get("date",""),
+            "amount": e["amount"],
+            "score": float(score(e, t_amt, t_date, t_desc, amount_tolerance, days_tolerance)),
+            "reason": "amount+date match vs payment" if is_payment else "amount+date match vs receipt (+vendor boost if any)",
+            "snapshot": snap,
         })
 
     suggestions.sort(key=lambda x: float(x.get("score") or 0.0), reverse=True)
-    return {"bank_txn_id": bank_txn_id, "suggestions": suggestions[: int(max_suggestions or 10)], "warnings": warnings}
+    return suggestions
 
 
 def link(bank_txn_id: str, target_type: str, target_id: str, note: str = "", meta: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -185,9 +152,7 @@ def link(bank_txn_id: str, target_type: str, target_id: str, note: str = "", met
         "meta": meta,
         "created_at": _utcnow_iso(),
     }
-    items = store.list_links()
-    items.append(rec)
-    store.save_links(items)
+    store.append_link(rec)
 
     # best-effort: mark bank txn reconciled
     try:
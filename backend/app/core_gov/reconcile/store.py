@@ -1,34 +1,36 @@
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+from ..storage.segment_log import SegmentedJsonStore
+
 DATA_DIR = os.path.join("backend", "data", "reconcile")
 LINKS_PATH = os.path.join(DATA_DIR, "links.json")
 
+_LINKS = SegmentedJsonStore(LINKS_PATH, key="items")
+
 
 def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
 def _ensure():
-    os.makedirs(DATA_DIR, exist_ok=True)
-    if not os.path.exists(LINKS_PATH):
-        with open(LINKS_PATH, "w", encoding="utf-8") as f:
-            json.dump({"updated_at": _utcnow_iso(), "items": []}, f, indent=2)
+    _LINKS.ensure()
 
 
 def list_links() -> List[Dict[str, Any]]:
-    _ensure()
-    with open(LINKS_PATH, "r", encoding="utf-8") as f:
-        return json.load(f).get("items", [])
+    return _LINKS.list()
 
 
 def save_links(items: List[Dict[str, Any]]) -> None:
-    _ensure()
-    tmp = LINKS_PATH + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump({"updated_at": _utcnow_iso(), "items": items}, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, LINKS_PATH)
+    _LINKS.replace_all(items)
+
+
+def append_link(rec: Dict[str, Any]) -> Dict[str, Any]:
+    return _LINKS.append(rec)
+
+
+def version():
+    return _LINKS.version()
@@ -0,0 +1,2 @@
+"""Recurrence engine: compiled cadence rules shared by obligations, bills, payments and forecasts."""
+from .engine import Rule, compile_rule, expand, make_rule, merge, next_due  # noqa: F401
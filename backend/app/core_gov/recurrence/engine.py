@@ -0,0 +1,224 @@
+"""Compiled recurrence rules shared by every module that derives due dates.
+
+Obligations, bills, payments, the cashflow forecast and the budget calendar all
+turn a cadence ("monthly on the 15th", "every 3 months", "weekly on Monday")
+into dates through this module, so they agree on what is due when.
+
+A ``Rule`` is an immutable value, so its fields double as its version: editing
+a record yields a different ``Rule`` and never hits a stale cache entry.
+``compile_rule`` turns a rule into a ``CompiledRule`` that seeks straight to the
+first occurrence on or after any date with month/day arithmetic instead of
+stepping from the anchor. ``expand`` memoizes a rule's occurrences per window,
+and ``merge`` walks many rules' occurrences in date order.
+
+Semantics:
+- Monthly and yearly dates are computed from the month index, never stepped
+  from the previous (clamped) date, so a rule for the 31st gives Jan 31, Feb 28,
+  Mar 31. ``max_day`` clamps further (28 for modules that use "safe" days).
+- A rule without an ``anchor`` is phased from the window start. Its first
+  occurrence is the first matching date on or after ``start``, and interval
+  rules count from the start's month (or from the first matching weekday).
+"""
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+FREQUENCIES = ("once", "daily", "weekly", "monthly", "yearly")
+
+# cadence spelling -> (frequency, interval multiplier)
+_ALIASES = {
+    "once": ("once", 1),
+    "single": ("once", 1),
+    "daily": ("daily", 1),
+    "weekly": ("weekly", 1),
+    "biweekly": ("weekly", 2),
+    "bi-weekly": ("weekly", 2),
+    "monthly": ("monthly", 1),
+    "every_n_months": ("monthly", 1),
+    "custom_months": ("monthly", 1),
+    "quarterly": ("monthly", 3),
+    "yearly": ("yearly", 1),
+    "annually": ("yearly", 1),
+    "annual": ("yearly", 1),
+}
+
+
+@dataclass(frozen=True)
+class Rule:
+    freq: str = "monthly"               # once | daily | weekly | monthly | yearly
+    interval: int = 1                   # in units of freq
+    day_of_month: int = 1               # monthly / yearly
+    day_of_week: Optional[int] = None   # weekly, 0=Mon; None = weekday of the anchor
+    month: Optional[int] = None         # yearly; None = month of the anchor
+    anchor: Optional[date] = None       # phase origin and earliest occurrence; None = window start
+    until: Optional[date] = None        # last possible occurrence
+    max_day: int = 31
+
+
+def _to_date(v: Any) -> Optional[date]:
+    if v is None or v == "":
+        return None
+    if isinstance(v, date):
+        return v
+    try:
+        return date.fromisoformat(str(v)[:10])
+    except ValueError:
+        return None
+
+
+def make_rule(
+    cadence: str = "monthly",
+    day_of_month: int = 1,
+    interval: int = 1,
+    day_of_week: Optional[int] = None,
+    month: Optional[int] = None,
+    anchor: Any = None,
+    until: Any = None,
+    max_day: int = 31,
+) -> Rule:
+    """
+    Normalize a cadence as stored by the modules into a Rule.
+
+    Unknown cadences fall back to monthly. ``interval`` multiplies the cadence
+    (quarterly with interval 2 is every 6 months; every_n_months takes n here).
+    """
+    freq, mult = _ALIASES.get((cadence or "monthly").strip().lower(), ("monthly", 1))
+    return Rule(
+        freq=freq,
+        interval=max(1, int(interval or 1)) * mult,
+        day_of_month=max(1, min(31, int(day_of_month or 1))),
+        day_of_week=None if day_of_week is None else int(day_of_week) % 7,
+        month=max(1, min(12, int(month))) if month else None,
+        anchor=_to_date(anchor),
+        until=_to_date(until),
+        max_day=max(1, min(31, int(max_day or 31))),
+    )
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+class CompiledRule:
+    """A rule reduced to a seek function; use ``compile_rule`` to get one."""
+
+    __slots__ = ("rule", "_months", "_days")
+
+    def __init__(self, rule: Rule):
+        if rule.freq not in FREQUENCIES:
+            raise ValueError(f"unknown frequency: {rule.freq}")
+        self.rule = rule
+        self._months = rule.interval * (12 if rule.freq == "yearly" else 1)
+        self._days = rule.interval * (7 if rule.freq == "weekly" else 1)
+
+    def _month_date(self, mi: int) -> date:
+        y, m0 = divmod(mi, 12)
+        last = calendar.monthrange(y, m0 + 1)[1]
+        return date(y, m0 + 1, min(self.rule.day_of_month, self.rule.max_day, last))
+
+    def _seek(self, d: date) -> Tuple[Optional[date], int]:
+        """First occurrence >= d (with d already >= the anchor) and its step index."""
+        r = self.rule
+        a = r.anchor or d
+        if r.freq == "once":
+            return (a if a >= d else None), 0
+        if r.freq in ("monthly", "yearly"):
+            am = a.year * 12 + ((r.month or a.month) if r.freq == "yearly" else a.month) - 1
+            k = max(0, _ceil_div(d.year * 12 + d.month - 1 - am, self._months))
+            cand = self._month_date(am + k * self._months)
+            if cand < d:
+                k += 1
+            return self._month_date(am + k * self._months), k
+        dow = a.weekday() if r.day_of_week is None or r.freq == "daily" else r.day_of_week
+        base = a + timedelta(days=(dow - a.weekday()) % 7)
+        k = max(0, _ceil_div((d - base).days, self._days))
+        return base + timedelta(days=k * self._days), k
+
+    def first_on_or_after(self, d: date) -> Optional[date]:
+        """Next occurrence on or after ``d`` (None when the rule has ended)."""
+        if self.rule.anchor is not None and d < self.rule.anchor:
+            d = self.rule.anchor
+        cand, _ = self._seek(d)
+        if cand is None or (self.rule.until is not None and cand > self.rule.until):
+            return None
+        return cand
+
+    def occurrences(self, start: date, end: date) -> Iterator[date]:
+        """Occurrences in [start, end], ascending."""
+        r = self.rule
+        if r.until is not None and r.until < end:
+            end = r.until
+        d = start if r.anchor is None or start >= r.anchor else r.anchor
+        if d > end:
+            return
+        cand, k = self._seek(d)
+        if cand is None:
+            return
+        if r.freq == "once":
+            if cand <= end:
+                yield cand
+            return
+        a = r.anchor or d
+        if r.freq in ("monthly", "yearly"):
+            am = a.year * 12 + ((r.month or a.month) if r.freq == "yearly" else a.month) - 1
+            while cand <= end:
+                yield cand
+                k += 1
+                cand = self._month_date(am + k * self._months)
+        else:
+            step = timedelta(days=self._days)
+            while cand <= end:
+                yield cand
+                cand += step
+
+
+@lru_cache(maxsize=16384)
+def compile_rule(rule: Rule) -> CompiledRule:
+    return CompiledRule(rule)
+
+
+@lru_cache(maxsize=65536)
+def expand(rule: Rule, start: date, end: date) -> Tuple[date, ...]:
+    """Memoized occurrences of ``rule`` in [start, end]; the tuple is shared, do not mutate."""
+    if end < start:
+        return ()
+    return tuple(compile_rule(rule).occurrences(start, end))
+
+
+def next_due(rule: Rule, from_date: date) -> Optional[date]:
+    return compile_rule(rule).first_on_or_after(from_date)
+
+
+def merge(entries: Iterable[Tuple[Any, Rule]], start: date, end: date) -> Iterator[Tuple[date, Any]]:
+    """
+    Occurrences of many rules in [start, end] as ``(date, key)`` in date order.
+
+    ``entries`` are ``(key, rule)`` pairs; ties keep the order of ``entries``.
+    Keys need not be comparable or hashable. Expansions are already
+    materialized (and cached), so occurrences are bucketed by day rather than
+    fed through a k-way heap, which is several times cheaper with thousands of rules.
+    """
+    days: dict[date, list[Any]] = {}
+    for key, rule in entries:
+        for d in expand(rule, start, end):
+            bucket = days.get(d)
+            if bucket is None:
+                days[d] = [key]
+            else:
+                bucket.append(key)
+    for d in sorted(days):
+        for key in days[d]:
+            yield d, key
+
+
+def clear_cache() -> None:
+    compile_rule.cache_clear()
+    expand.cache_clear()
+
+
+def cache_info() -> dict[str, Any]:
+    return {"compiled": compile_rule.cache_info()._asdict(), "windows": expand.cache_info()._asdict()}
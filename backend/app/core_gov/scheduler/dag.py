@@ -0,0 +1,180 @@
+"""
+P-SCHED-2: Dependency-aware tick executor.
+
+A tick is a list of ``Step``s, each declaring the stores it reads and writes
+(store names are core_gov package names, e.g. ``"reminders"``). Two steps
+conflict when one writes a store the other reads or writes; a step waits for
+every earlier conflicting step and otherwise runs concurrently with the rest
+on a small thread pool, so a tick costs about its longest chain of conflicting
+steps instead of the sum of all of them.
+
+Before running, a step's inputs are fingerprinted from the versions of the
+stores it reads (plus today's date for ``daily`` steps, whose output depends on
+due-date windows). If the fingerprint matches the one recorded after the
+step's last successful run, nothing it depends on has changed and the step is
+skipped. A store whose version cannot be determined always counts as changed.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DATA_ROOT = os.path.join("backend", "data")
+
+_POOL = ThreadPoolExecutor(max_workers=int(os.getenv("CORE_SCHED_WORKERS", "4")), thread_name_prefix="core-sched")
+
+
+@dataclass
+class Step:
+    name: str
+    fn: Callable[[], Any]
+    reads: Tuple[str, ...] = ()
+    writes: Tuple[str, ...] = ()
+    daily: bool = True  # inputs include today's date
+    skip_unchanged: bool = True
+
+
+def _path_sig(path: str) -> Any:
+    if os.path.isdir(path):
+        out = []
+        for name in sorted(os.listdir(path)):
+            try:
+                st = os.stat(os.path.join(path, name))
+            except OSError:
+                continue
+            out.append((name, st.st_mtime_ns, st.st_size))
+        return out
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def store_version(name: str) -> Any:
+    """
+    Change token for a core_gov store: the store module's ``version()`` when it
+    has one, else a stat signature of its data directory or file. None if unknown.
+    """
+    try:
+        mod = importlib.import_module(f"backend.app.core_gov.{name}.store")
+    except Exception:
+        mod = None
+    if mod is not None and callable(getattr(mod, "version", None)):
+        try:
+            return mod.version()
+        except Exception:
+            return None
+    path = None
+    if mod is not None:
+        path = getattr(mod, "DATA_DIR", None) or getattr(mod, "PATH", None) or getattr(mod, "_PATH", None)
+    path = str(path) if path else os.path.join(DATA_ROOT, name)
+    if not os.path.exists(path):
+        return None
+    return _path_sig(path)
+
+
+def conflicts(a: Step, b: Step) -> bool:
+    return bool(set(a.writes) & (set(b.reads) | set(b.writes)) or set(b.writes) & set(a.reads))
+
+
+def plan(steps: List[Step]) -> Dict[str, List[str]]:
+    """Map each step to the earlier steps it must wait for (declaration order breaks ties)."""
+    return {s.name: [p.name for p in steps[:i] if conflicts(p, s)] for i, s in enumerate(steps)}
+
+
+def fingerprint(step: Step, version: Callable[[str], Any] = store_version) -> Optional[str]:
+    """Digest of the step's input versions, or None when any of them is unknown."""
+    parts: Dict[str, Any] = {}
+    for name in sorted(set(step.reads)):
+        v = version(name)
+        if v is None:
+            return None
+        parts[name] = v
+    if step.daily:
+        parts["_date"] = date.today().isoformat()
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _timed(fn: Callable[[], Any]) -> Tuple[Any, float, Optional[BaseException]]:
+    t0 = time.perf_counter()
+    try:
+        value, err = fn(), None
+    except Exception as e:
+        value, err = None, e
+    return value, (time.perf_counter() - t0) * 1000.0, err
+
+
+def run(
+    steps: List[Step],
+    previous: Optional[Dict[str, Dict[str, Any]]] = None,
+    version: Callable[[str], Any] = store_version,
+    force: bool = False,
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Run a tick's steps.
+
+    ``previous`` is the step stats returned by the last run (persisted by the
+    caller); ``force`` runs every step regardless of its inputs.
+
+    Returns ``(results, stats)``: results maps step name to its return value
+    (steps that were skipped or failed are absent); stats maps name to
+    ``{"status", "ms", "started_at", "inputs", "last_ok"}`` plus ``"error"`` for
+    failed steps, where status is ran | skipped | error.
+    """
+    previous = previous or {}
+    deps = plan(steps)
+    by_name = {s.name: s for s in steps}
+    results: Dict[str, Any] = {}
+    stats: Dict[str, Dict[str, Any]] = {}
+    running: Dict[Future, str] = {}
+    done: set = set()
+    waiting = [s.name for s in steps]
+
+    def _start(s: Step) -> None:
+        prev = previous.get(s.name) or {}
+        key = fingerprint(s, version)
+        if (
+            not force
+            and s.skip_unchanged
+            and key is not None
+            and prev.get("status") in ("ran", "skipped")
+            and prev.get("inputs") == key
+        ):
+            stats[s.name] = {"status": "skipped", "ms": 0.0, "started_at": None, "inputs": key, "last_ok": prev.get("last_ok")}
+            done.add(s.name)
+            return
+        started = datetime.utcnow().isoformat()
+        fut = _POOL.submit(_timed, s.fn)
+        stats[s.name] = {"status": "running", "ms": 0.0, "started_at": started, "inputs": None, "last_ok": prev.get("last_ok")}
+        running[fut] = s.name
+
+    while waiting or running:
+        for name in list(waiting):
+            if all(d in done for d in deps[name]):
+                waiting.remove(name)
+                _start(by_name[name])
+        if not running:
+            continue
+        finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+        for fut in finished:
+            name = running.pop(fut)
+            st = stats[name]
+            value, ms, err = fut.result()
+            st["ms"] = round(ms, 3)
+            if err is None:
+                results[name] = value
+                # fingerprint after the run, so the step's own writes count as seen
+                st.update(status="ran", inputs=fingerprint(by_name[name], version), last_ok=st["started_at"])
+            else:
+                st.update(status="error", error=f"{type(err).__name__}: {err}")
+            done.add(name)
+    return results, {s.name: stats[s.name] for s in steps}
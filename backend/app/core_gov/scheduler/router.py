@@ -2,11 +2,13 @@
 P-SCHED-1: Scheduler API router.
 
 GET /core/scheduler/state - Get scheduler state
+GET /core/scheduler/steps - Per-step stats of the last tick
 POST /core/scheduler/tick - Execute scheduler tick
 """
 from fastapi import APIRouter
 from typing import Dict, Any
 from . import service, store
+from .dag import plan
 
 router = APIRouter(prefix="/core", tags=["scheduler"])
 
@@ -22,12 +24,38 @@ async def get_scheduler_state() -> Dict[str, Any]:
     return store.get_state()
 
 
+@router.get("/scheduler/steps", response_model=Dict[str, Any])
+async def get_scheduler_steps() -> Dict[str, Any]:
+    """
+    Get the tick DAG and what each step did on the last tick.
+
+    Returns:
+        Dict with last_tick_id, last_tick_ms and steps (name -> reads, writes,
+        after, status, ms, error, last_ok)
+    """
+    state = store.get_state()
+    stats = state.get("steps") or {}
+    deps = plan(service.TICK_STEPS)
+    steps = {}
+    for s in service.TICK_STEPS:
+        steps[s.name] = {
+            "reads": list(s.reads),
+            "writes": list(s.writes),
+            "after": deps[s.name],
+            **stats.get(s.name, {"status": None}),
+        }
+    return {"last_tick_id": state.get("last_tick_id"), "last_tick_ms": state.get("last_tick_ms"), "steps": steps}
+
+
 @router.post("/scheduler/tick", response_model=Dict[str, Any])
-async def execute_tick() -> Dict[str, Any]:
+def execute_tick(force: bool = False) -> Dict[str, Any]:
     """
     Execute a scheduler tick (periodic operations).
-    
+
+    Args:
+        force: Run every step even if its inputs are unchanged
+
     Returns:
-        Tick result with tick_id, timestamp, daily_ops_result
+        Tick result with tick_id, timestamp, daily_ops_result, steps
     """
-    return service.tick()
+    return service.tick(force=force)
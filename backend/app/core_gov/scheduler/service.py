@@ -2,18 +2,130 @@
 P-SCHED-1: Scheduler service for periodic operations.
 
 Runs tick() to execute scheduled daily operations.
+
+The tick is declared as a DAG of steps (see TICK_STEPS and dag.py): each step
+names the stores it reads and writes, independent steps run concurrently and
+steps whose inputs are unchanged since their last successful run are skipped.
+Per-step status, duration and errors are persisted in the scheduler state.
 """
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 from . import store
+from .dag import Step, run as run_steps
+
+
+def _daily_ops() -> Dict[str, Any]:
+    from backend.app.core_gov.daily_ops.service import run as daily_ops_run
+    return daily_ops_run()
+
+
+def _payday_followups() -> Any:
+    from backend.app.core_gov.payday.followups import create_income_followups
+    return create_income_followups(days=14)
+
+
+def _calendar_reminders() -> Any:
+    from backend.app.core_gov.house_calendar.reminders import push_to_reminders
+    return push_to_reminders(limit=25)
+
+
+def _legal_hotlist() -> Any:
+    from backend.app.core_gov.scheduler.legal_hotlist import scan_hotlist
+    return scan_hotlist(limit=25)
+
+
+def _bills_reminders() -> Any:
+    from backend.app.core_gov.bills.reminders import push as bills_push  # type: ignore
+    return bills_push(days_ahead=7)
+
+
+def _bills_missed() -> Any:
+    from backend.app.core_gov.bills.pay_log import missed  # type: ignore
+    return missed()
+
+
+def _pipeline_daily() -> Any:
+    from backend.app.core_gov.pipeline.daily import tick as pipe_tick  # type: ignore
+    return pipe_tick(limit=10)
+
+
+def _shopping_needs() -> Any:
+    from backend.app.core_gov.shopping.from_schedule_needs import generate as gen_needs  # type: ignore
+    return gen_needs(within_days=30, limit=50)
+
+
+def _shopping_approvals() -> Any:
+    from backend.app.core_gov.shopping.approvals import request_approvals  # type: ignore
+    return request_approvals(threshold=200.0)
+
+
+def _routines_reminders() -> Any:
+    from backend.app.core_gov.routines.reminders import push as routines_push  # type: ignore
+    return routines_push()
+
+
+def _subscriptions_reminders() -> Any:
+    from backend.app.core_gov.subscriptions.reminders import push as subs_push  # type: ignore
+    return subs_push(days_ahead=7)
 
 
-def tick() -> Dict[str, Any]:
+def _assets_replace() -> Any:
+    from backend.app.core_gov.assets.replace_actions import push_replace_to_shopping  # type: ignore
+    return push_replace_to_shopping(threshold=200.0)
+
+
+def _payments_reminders() -> Any:
+    from backend.app.core_gov.payments.reminders import push as pay_push  # type: ignore
+    return pay_push(days_ahead=5)
+
+
+def _reconcile() -> Any:
+    from backend.app.core_gov.reconcile.service import reconcile  # type: ignore
+    from backend.app.core_gov.reconcile.alerts import push_missing_alerts  # type: ignore
+    rec = reconcile(days=30)
+    if rec.get("ok"):
+        push_missing_alerts(rec.get("missing") or [])
+    return rec
+
+
+def _shield_lite() -> Any:
+    from backend.app.core_gov.shield_lite.auto import check_and_trigger  # type: ignore
+    return check_and_trigger(buffer_min=500.0)
+
+
+# Declaration order is the serial order used between conflicting steps.
+TICK_STEPS: List[Step] = [
+    # always runs: its result is part of the tick response
+    Step("daily_ops", _daily_ops, reads=("followups", "budget_obligations", "shopping_list"), skip_unchanged=False),
+    Step("payday_followups", _payday_followups, reads=("income", "followups"), writes=("followups",)),
+    Step("calendar_reminders", _calendar_reminders, reads=("house_calendar",), writes=("house_reminders",)),
+    Step("legal_hotlist", _legal_hotlist, reads=("deals", "legal_profiles"), writes=("legal_filter", "alerts")),
+    Step("bills_reminders", _bills_reminders, reads=("bills", "reminders"), writes=("reminders",)),
+    Step("bills_missed", _bills_missed, reads=("bills",)),
+    Step("pipeline_daily", _pipeline_daily, reads=("pipeline", "deals", "followups"), writes=("pipeline", "followups", "comms")),
+    Step("shopping_needs", _shopping_needs, reads=("schedule", "shopping"), writes=("shopping",)),
+    Step("shopping_approvals", _shopping_approvals, reads=("shopping", "approvals"), writes=("approvals",)),
+    Step("routines_reminders", _routines_reminders, reads=("routines", "reminders"), writes=("reminders",)),
+    Step("subscriptions_reminders", _subscriptions_reminders, reads=("subscriptions", "reminders"), writes=("reminders",)),
+    Step("assets_replace", _assets_replace, reads=("assets", "shopping", "approvals"), writes=("shopping", "approvals")),
+    Step("payments_reminders", _payments_reminders, reads=("payments", "reminders"), writes=("reminders",)),
+    Step(
+        "reconcile",
+        _reconcile,
+        reads=("bank", "payments", "pay_confirm", "reconcile", "reminders"),
+        writes=("reconcile", "alerts", "reminders"),
+    ),
+    Step("shield_lite", _shield_lite, reads=("budget", "shield_lite"), writes=("shield_lite", "alerts", "reminders")),
+]
+
+
+def tick(force: bool = False) -> Dict[str, Any]:
     """
     Execute scheduled tick operations.
-    
-    Calls daily_ops.run() and updates last tick timestamp.
-    
+
+    Runs TICK_STEPS (daily_ops always; other steps only when their inputs
+    changed, unless force) and updates last tick timestamp and step stats.
+
     Returns:
         dict with keys:
             - success (bool)
@@ -21,10 +133,12 @@ def tick() -> Dict[str, Any]:
             - timestamp (str)
             - daily_ops_result (dict)
             - message (str)
+            - steps (dict): per-step status/ms/error for this tick
+            - duration_ms (float)
     """
     tick_id = str(int(datetime.utcnow().timestamp() * 1000))
     timestamp = datetime.utcnow().isoformat()
-    
+
     result = {
         "success": True,
         "tick_id": tick_id,
@@ -32,122 +146,33 @@ def tick() -> Dict[str, Any]:
         "daily_ops_result": {},
         "message": "Tick complete"
     }
-    
+
     # Update scheduler state
     try:
         store.set_last_tick(timestamp)
     except Exception as e:
         result["message"] = f"State update failed: {str(e)}"
-    
-    # Call daily_ops.run()
-    try:
-        from backend.app.core_gov.daily_ops.service import run as daily_ops_run
-        result["daily_ops_result"] = daily_ops_run()
-    except Exception as e:
-        result["success"] = False
-        result["daily_ops_result"] = {"error": str(e)}
-        result["message"] = "Daily ops failed"
-
-    # Call payday followups
-    try:
-        from backend.app.core_gov.payday.followups import create_income_followups
-        create_income_followups(days=14)
-    except Exception:
-        pass
 
-    # Call calendar to reminders
     try:
-        from backend.app.core_gov.house_calendar.reminders import push_to_reminders
-        push_to_reminders(limit=25)
+        previous = store.get_steps()
     except Exception:
-        pass
-
-    # Call legal hotlist scan
-    try:
-        from backend.app.core_gov.scheduler.legal_hotlist import scan_hotlist
-        scan_hotlist(limit=25)
-    except Exception:
-        pass
-
-    # Call bills reminders push
-    try:
-        from backend.app.core_gov.bills.reminders import push as bills_push  # type: ignore
-        bills_push(days_ahead=7)
-    except Exception:
-        pass
+        previous = {}
 
-    # Call bills missed detector
-    try:
-        from backend.app.core_gov.bills.pay_log import missed  # type: ignore
-        m = missed()
-        if (m.get("missed") or []):
-            pass  # bills missed detected
-    except Exception:
-        pass
+    t0 = datetime.utcnow()
+    results, steps = run_steps(TICK_STEPS, previous=previous, force=force)
+    result["duration_ms"] = round((datetime.utcnow() - t0).total_seconds() * 1000.0, 3)
+    result["steps"] = steps
 
-    # Call pipeline daily tick
-    try:
-        from backend.app.core_gov.pipeline.daily import tick as pipe_tick  # type: ignore
-        pipe_tick(limit=10)
-    except Exception:
-        pass
-
-    # Generate shopping from schedule needs
-    try:
-        from backend.app.core_gov.shopping.from_schedule_needs import generate as gen_needs  # type: ignore
-        gen_needs(within_days=30, limit=50)
-    except Exception:
-        pass
-
-    # Request approvals for big ticket items
-    try:
-        from backend.app.core_gov.shopping.approvals import request_approvals  # type: ignore
-        request_approvals(threshold=200.0)
-    except Exception:
-        pass
-
-    # Push routine reminders
-    try:
-        from backend.app.core_gov.routines.reminders import push as routines_push  # type: ignore
-        routines_push()
-    except Exception:
-        pass
-
-    # Push subscription reminders
-    try:
-        from backend.app.core_gov.subscriptions.reminders import push as subs_push  # type: ignore
-        subs_push(days_ahead=7)
-    except Exception:
-        pass
-
-    # Push replace-to-shopping
-    try:
-        from backend.app.core_gov.assets.replace_actions import push_replace_to_shopping  # type: ignore
-        push_replace_to_shopping(threshold=200.0)
-    except Exception:
-        pass
-
-    # Push payment reminders
-    try:
-        from backend.app.core_gov.payments.reminders import push as pay_push  # type: ignore
-        pay_push(days_ahead=5)
-    except Exception:
-        pass
-
-    # Reconcile payments and push alerts
-    try:
-        from backend.app.core_gov.reconcile.service import reconcile  # type: ignore
-        from backend.app.core_gov.reconcile.alerts import push_missing_alerts  # type: ignore
-        rec = reconcile(days=30)
-        if rec.get("ok"):
-            push_missing_alerts(rec.get("missing") or [])
-    except Exception:
-        pass
+    daily = steps.get("daily_ops") or {}
+    if daily.get("status") == "error":
+        result["success"] = False
+        result["daily_ops_result"] = {"error": daily.get("error")}
+        result["message"] = "Daily ops failed"
+    else:
+        result["daily_ops_result"] = results.get("daily_ops") or {}
 
-    # Auto-check Shield Lite
     try:
-        from backend.app.core_gov.shield_lite.auto import check_and_trigger  # type: ignore
-        check_and_trigger(buffer_min=500.0)
+        store.set_steps(tick_id, steps, result["duration_ms"])
     except Exception:
         pass
 
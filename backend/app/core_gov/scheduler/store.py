@@ -1,7 +1,8 @@
 """
 P-SCHED-1: Scheduler state store.
 
-Manages scheduler state including last tick timestamp.
+Manages scheduler state including last tick timestamp and the per-step
+stats of the last tick (status, duration, error, input fingerprint).
 """
 import json
 import os
@@ -68,3 +69,40 @@ def set_last_tick(ts: str) -> Dict[str, Any]:
         json.dump(state, f, indent=2)
     
     return state
+
+
+def get_steps() -> Dict[str, Dict[str, Any]]:
+    """
+    Get per-step stats from the last tick.
+
+    Returns:
+        Dict of step name -> {status, ms, started_at, inputs, last_ok[, error]}
+    """
+    return get_state().get("steps") or {}
+
+
+def set_steps(tick_id: str, steps: Dict[str, Dict[str, Any]], duration_ms: float) -> Dict[str, Any]:
+    """
+    Record the step stats and total duration of a tick.
+
+    Args:
+        tick_id: Tick that produced the stats
+        steps: Per-step stats from dag.run
+        duration_ms: Wall time of the whole tick
+
+    Returns:
+        Updated state dict
+    """
+    _ensure_file()
+
+    with open(STATE_FILE, "r") as f:
+        state = json.load(f)
+
+    state["last_tick_id"] = tick_id
+    state["last_tick_ms"] = duration_ms
+    state["steps"] = steps
+
+    with open(STATE_FILE, "w") as f:
+        json.dump(state, f, indent=2)
+
+    return state
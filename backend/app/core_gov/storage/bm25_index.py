@@ -0,0 +1,241 @@
+"""Incremental BM25 inverted index over a SegmentedJsonStore collection.
+
+Postings are kept per term as parallel ``array`` columns (doc number, term
+frequency); tag filters are per-tag bitmaps (one byte per doc) and top-k is a
+heap over the accumulated scores, so a query only touches the postings of its
+own terms. The index follows the collection it is attached to: writers call
+``add()`` right after appending, and ``search()`` catches up (or rebuilds) when
+the collection version moved underneath it, e.g. another process wrote.
+
+The index is persisted as a pickle sidecar next to the collection. It is a
+derived cache: deleting it only costs one rebuild on the next query.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import os
+import pickle
+import re
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Iterable
+
+from .segment_log import SegmentedJsonStore
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if len(t) > 1 and t not in _STOPWORDS]
+
+
+class BM25Index:
+    """BM25 (k1/b) search over one text field of a collection, with optional tag filtering."""
+
+    def __init__(
+        self,
+        source: SegmentedJsonStore,
+        text_field: str = "text",
+        tags_field: str | None = "tags",
+        id_field: str = "id",
+        k1: float = 1.5,
+        b: float = 0.75,
+        persist_every: int = 2000,
+    ):
+        self.source = source
+        self.text_field = text_field
+        self.tags_field = tags_field
+        self.id_field = id_field
+        self.k1 = k1
+        self.b = b
+        self.persist_every = max(1, int(persist_every))
+        self._lock = threading.RLock()
+        self._loaded_from: str | None = None
+        self._synced_version: tuple[Any, ...] | None = None
+        self._reset()
+
+    @property
+    def path(self) -> Path:
+        return self.source.path.with_name(self.source.path.name + ".bm25.pkl")
+
+    def _reset(self) -> None:
+        self._ids: list[Any] = []
+        self._docno: dict[Any, int] = {}
+        self._len = array("I")
+        self._alive = bytearray()
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._tags: dict[str, bytearray] = {}
+        self._total_len = 0
+        self._n_alive = 0
+        self._dirty = 0
+
+    # ---- maintenance ----
+
+    def add(self, records: Iterable[dict[str, Any]]) -> int:
+        """Index freshly appended records (call right after writing them to the source)."""
+        with self._lock:
+            self._ensure_loaded()
+            n = sum(1 for r in records if self._add_one(r))
+            if self.source.count() == self._n_alive:
+                self._synced_version = self.source.version()
+            self._maybe_persist(n)
+            return n
+
+    def sync(self) -> None:
+        """Bring the index in line with the source if it changed since the last sync."""
+        with self._lock:
+            self._ensure_loaded()
+            version = self.source.version()
+            if version == self._synced_version:
+                return
+            items = self.source.list()
+            current = {r.get(self.id_field) for r in items}
+            for rec_id, d in list(self._docno.items()):
+                if rec_id not in current:
+                    self._remove(d)
+            added = sum(1 for r in items if r.get(self.id_field) not in self._docno and self._add_one(r))
+            if len(self._ids) > 2 * max(1, self._n_alive) + 1000:
+                self._rebuild(items)
+                added = len(items)
+            self._synced_version = version
+            self._maybe_persist(added or 1)
+
+    def rebuild(self) -> None:
+        with self._lock:
+            self._rebuild(self.source.list())
+            self._synced_version = self.source.version()
+            self.persist()
+
+    def _rebuild(self, items: list[dict[str, Any]]) -> None:
+        self._reset()
+        for r in items:
+            self._add_one(r)
+
+    def _add_one(self, rec: dict[str, Any]) -> bool:
+        rec_id = rec.get(self.id_field)
+        if rec_id is None or rec_id in self._docno:
+            return False
+        d = len(self._ids)
+        self._ids.append(rec_id)
+        self._docno[rec_id] = d
+        toks = tokenize(str(rec.get(self.text_field) or ""))
+        self._len.append(len(toks))
+        self._alive.append(1)
+        self._total_len += len(toks)
+        self._n_alive += 1
+        tf: dict[str, int] = {}
+        for t in toks:
+            tf[t] = tf.get(t, 0) + 1
+        for t, c in tf.items():
+            post = self._postings.get(t)
+            if post is None:
+                post = self._postings[t] = (array("I"), array("H"))
+            post[0].append(d)
+            post[1].append(min(c, 65535))
+        if self.tags_field:
+            for tag in rec.get(self.tags_field) or []:
+                bm = self._tags.get(tag)
+                if bm is None:
+                    bm = self._tags[tag] = bytearray()
+                if len(bm) <= d:
+                    bm.extend(b"\x00" * (d + 1 - len(bm)))
+                bm[d] = 1
+        self._dirty += 1
+        return True
+
+    def _remove(self, d: int) -> None:
+        if self._alive[d]:
+            self._alive[d] = 0
+            self._n_alive -= 1
+            self._total_len -= self._len[d]
+            self._docno.pop(self._ids[d], None)
+            self._dirty += 1
+
+    # ---- query ----
+
+    def search(self, q: str, k: int = 8, tags: Iterable[str] | None = None) -> list[tuple[float, Any]]:
+        """Top-k (score, record id) pairs, best first. All ``tags`` must be present on a hit."""
+        self.sync()
+        with self._lock:
+            terms = list(dict.fromkeys(tokenize(q)))
+            if not terms or not self._n_alive:
+                return []
+            masks = [self._tags.get(t) for t in (tags or []) if t]
+            if any(m is None for m in masks):
+                return []
+            N = self._n_alive
+            avgdl = (self._total_len / N) or 1.0
+            k1, b = self.k1, self.b
+            lens, alive = self._len, self._alive
+            scores: dict[int, float] = {}
+            for t in terms:
+                post = self._postings.get(t)
+                if post is None:
+                    continue
+                docs, tfs = post
+                idf = math.log(1.0 + (N - len(docs) + 0.5) / (len(docs) + 0.5))
+                for d, tf in zip(docs, tfs):
+                    if not alive[d]:
+                        continue
+                    denom = tf + k1 * (1.0 - b + b * lens[d] / avgdl)
+                    scores[d] = scores.get(d, 0.0) + idf * tf * (k1 + 1.0) / denom
+            if masks:
+                scores = {d: s for d, s in scores.items() if all(len(m) > d and m[d] for m in masks)}
+            top = heapq.nlargest(max(1, int(k)), scores.items(), key=lambda x: x[1])
+            return [(s, self._ids[d]) for d, s in top]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"docs": self._n_alive, "terms": len(self._postings), "tags": len(self._tags), "path": str(self.path)}
+
+    # ---- persistence ----
+
+    def persist(self) -> None:
+        with self._lock:
+            state = {
+                "ids": self._ids,
+                "len": self._len,
+                "alive": self._alive,
+                "postings": self._postings,
+                "tags": self._tags,
+                "total_len": self._total_len,
+                "fields": (self.text_field, self.tags_field, self.id_field),
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+            self._dirty = 0
+
+    def _maybe_persist(self, n: int) -> None:
+        if n and self._dirty >= self.persist_every:
+            self.persist()
+
+    def _ensure_loaded(self) -> None:
+        abspath = os.path.abspath(self.path)
+        if self._loaded_from == abspath:
+            return
+        self._reset()
+        self._synced_version = None
+        self._loaded_from = abspath
+        try:
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            return
+        if state.get("fields") != (self.text_field, self.tags_field, self.id_field):
+            return
+        self._ids = state["ids"]
+        self._len = state["len"]
+        self._alive = state["alive"]
+        self._postings = state["postings"]
+        self._tags = state["tags"]
+        self._total_len = state["total_len"]
+        self._docno = {rec_id: d for d, rec_id in enumerate(self._ids) if self._alive[d]}
+        self._n_alive = len(self._docno)
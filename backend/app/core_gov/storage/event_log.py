@@ -0,0 +1,346 @@
+"""Rotated, append-only JSONL event segments with per-segment sidecar indexes.
+
+Events are appended as one JSON line each to the active segment
+(``seg-000001.jsonl``, ``seg-000002.jsonl``, ...). A segment is sealed and a new
+one started when it reaches ``max_events`` / ``max_bytes`` or the UTC day of the
+event changes. Every segment has a small ``seg-NNNNNN.idx.json`` sidecar with
+its count, byte size, min/max timestamp and per-type counts, so a query by time
+window or type opens only the segments whose index can match.
+
+Durability is batched: each append is written through to the OS immediately
+(other readers see it), while fsync happens every ``fsync_every`` events or
+``fsync_interval`` seconds, whichever comes first, and on ``flush()`` / exit.
+The active segment's sidecar is refreshed at the same points; if it lags behind
+the segment (crash, another process appending) it is rebuilt from the file.
+"""
+from __future__ import annotations
+
+import atexit
+import heapq
+import json
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .json_store import write_json_atomic
+
+_SEG_PREFIX = "seg-"
+_SEG_SUFFIX = ".jsonl"
+_IDX_SUFFIX = ".idx.json"
+
+_open_logs: "weakref.WeakSet[SegmentedEventLog]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    for log in list(_open_logs):
+        try:
+            log.flush()
+        except Exception:
+            pass
+
+
+@dataclass
+class SegmentIndex:
+    seq: int
+    count: int = 0
+    bytes: int = 0
+    min_ts: str | None = None
+    max_ts: str | None = None
+    types: dict[str, int] = field(default_factory=dict)
+    sealed: bool = False
+
+    def add(self, ts: str, etype: str, nbytes: int) -> None:
+        self.count += 1
+        self.bytes += nbytes
+        if ts:
+            if self.min_ts is None or ts < self.min_ts:
+                self.min_ts = ts
+            if self.max_ts is None or ts > self.max_ts:
+                self.max_ts = ts
+        self.types[etype] = self.types.get(etype, 0) + 1
+
+    def may_contain(self, start: str | None, end: str | None, event_type: str | None) -> bool:
+        if not self.count:
+            return False
+        if event_type is not None and not self.types.get(event_type):
+            return False
+        if start is not None and self.max_ts is not None and self.max_ts < start:
+            return False
+        if end is not None and self.min_ts is not None and self.min_ts > end:
+            return False
+        return True
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "count": self.count,
+            "bytes": self.bytes,
+            "min_ts": self.min_ts,
+            "max_ts": self.max_ts,
+            "types": self.types,
+            "sealed": self.sealed,
+        }
+
+
+class SegmentedEventLog:
+    """Time-ordered event log split into rotated JSONL segments."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ts_field: str = "timestamp",
+        type_field: str = "event_type",
+        max_events: int = 50000,
+        max_bytes: int = 16 * 1024 * 1024,
+        rotate_daily: bool = True,
+        fsync_every: int = 64,
+        fsync_interval: float = 1.0,
+    ):
+        self.directory = Path(directory)
+        self.ts_field = ts_field
+        self.type_field = type_field
+        self.max_events = max(1, int(max_events))
+        self.max_bytes = max(1, int(max_bytes))
+        self.rotate_daily = rotate_daily
+        self.fsync_every = max(1, int(fsync_every))
+        self.fsync_interval = float(fsync_interval)
+        self._lock = threading.RLock()
+        self._indexes: dict[int, SegmentIndex] = {}
+        self._active: SegmentIndex | None = None
+        self._fh = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        _open_logs.add(self)
+
+    # ---- paths ----
+
+    def _seg_path(self, seq: int) -> Path:
+        return self.directory / f"{_SEG_PREFIX}{seq:06d}{_SEG_SUFFIX}"
+
+    def _idx_path(self, seq: int) -> Path:
+        return self.directory / f"{_SEG_PREFIX}{seq:06d}{_IDX_SUFFIX}"
+
+    def _seqs(self) -> list[int]:
+        out = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return out
+        for n in names:
+            if n.startswith(_SEG_PREFIX) and n.endswith(_SEG_SUFFIX):
+                try:
+                    out.append(int(n[len(_SEG_PREFIX):-len(_SEG_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(out)
+
+    # ---- indexes ----
+
+    def _scan(self, seq: int) -> SegmentIndex:
+        idx = SegmentIndex(seq=seq)
+        for raw, ev in self._read_lines(seq):
+            idx.add(str(ev.get(self.ts_field) or ""), str(ev.get(self.type_field) or ""), len(raw))
+        return idx
+
+    def _index(self, seq: int) -> SegmentIndex:
+        """Sidecar index for a segment, rebuilt when it does not cover the whole file."""
+        try:
+            size = os.path.getsize(self._seg_path(seq))
+        except FileNotFoundError:
+            size = 0
+        cached = self._indexes.get(seq)
+        if cached is not None and cached.bytes == size:
+            return cached
+        idx = None
+        try:
+            raw = json.loads(self._idx_path(seq).read_text(encoding="utf-8"))
+            if int(raw.get("bytes", -1)) == size:
+                idx = SegmentIndex(
+                    seq=seq,
+                    count=int(raw.get("count", 0)),
+                    bytes=size,
+                    min_ts=raw.get("min_ts"),
+                    max_ts=raw.get("max_ts"),
+                    types=dict(raw.get("types") or {}),
+                    sealed=bool(raw.get("sealed")),
+                )
+        except (OSError, ValueError):
+            pass
+        if idx is None:
+            sealed = cached.sealed if cached is not None else False
+            idx = self._scan(seq)
+            idx.sealed = sealed
+            if size:
+                self._write_index(idx)
+        self._indexes[seq] = idx
+        if self._active is not None and self._active.seq == seq:
+            self._active = idx  # another writer appended to our segment; continue from the rescanned state
+        return idx
+
+    def _write_index(self, idx: SegmentIndex) -> None:
+        write_json_atomic(self._idx_path(idx.seq), idx.to_dict())
+
+    # ---- writing ----
+
+    def _open_active(self, day: str | None) -> SegmentIndex:
+        if self._active is not None:
+            a = self._active
+            full = a.count >= self.max_events or a.bytes >= self.max_bytes
+            new_day = self.rotate_daily and day and a.max_ts and a.max_ts[:10] != day
+            if not (full or new_day):
+                return a
+            self._seal()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        seqs = self._seqs()
+        if seqs:
+            last = self._index(seqs[-1])
+            full = last.count >= self.max_events or last.bytes >= self.max_bytes
+            new_day = self.rotate_daily and day and last.max_ts and last.max_ts[:10] != day
+            if last.sealed or full or new_day:
+                if not last.sealed:
+                    last.sealed = True
+                    self._write_index(last)
+                last = SegmentIndex(seq=seqs[-1] + 1)
+        else:
+            last = SegmentIndex(seq=1)
+        self._indexes[last.seq] = last
+        self._active = last
+        self._fh = open(self._seg_path(last.seq), "ab")
+        return last
+
+    def _seal(self) -> None:
+        if self._active is None:
+            return
+        self._sync(force=True)
+        self._fh.close()
+        self._fh = None
+        self._active.sealed = True
+        self._write_index(self._active)
+        self._active = None
+
+    def _sync(self, force: bool = False) -> None:
+        if self._fh is None or not self._unsynced:
+            return
+        if not force and self._unsynced < self.fsync_every and time.monotonic() - self._last_sync < self.fsync_interval:
+            return
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        if self._active is not None:
+            self._write_index(self._active)
+
+    def append(self, event: dict[str, Any]) -> dict[str, Any]:
+        self.append_many([event])
+        return event
+
+    def append_many(self, events: Iterable[dict[str, Any]]) -> int:
+        n = 0
+        with self._lock:
+            for ev in events:
+                ts = str(ev.get(self.ts_field) or "")
+                seg = self._open_active(ts[:10] or None)
+                raw = (json.dumps(ev, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+                self._fh.write(raw)
+                seg.add(ts, str(ev.get(self.type_field) or ""), len(raw))
+                self._unsynced += 1
+                n += 1
+            if self._fh is not None:
+                self._fh.flush()
+            self._sync()
+        return n
+
+    def flush(self) -> None:
+        with self._lock:
+            self._sync(force=True)
+
+    def close(self) -> None:
+        with self._lock:
+            self._sync(force=True)
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            self._active = None
+
+    # ---- reading ----
+
+    def _read_lines(self, seq: int) -> Iterator[tuple[bytes, dict[str, Any]]]:
+        try:
+            with open(self._seg_path(seq), "rb") as f:
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # torn tail from a crashed writer
+                    try:
+                        yield raw, json.loads(raw)
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            return
+
+    def segments(self) -> list[SegmentIndex]:
+        with self._lock:
+            return [self._index(s) for s in self._seqs()]
+
+    def query(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        event_type: str | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Newest-first events with start <= ts <= end (ISO strings), optionally of one type."""
+        limit = max(0, int(limit))
+        if not limit:
+            return []
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+            cands = [i for i in self.segments() if i.may_contain(start, end, event_type)]
+        cands.sort(key=lambda i: (i.max_ts or "", i.seq), reverse=True)
+        top: list[tuple[str, int, dict[str, Any]]] = []
+        order = 0
+        for idx in cands:
+            if len(top) >= limit and (idx.max_ts or "") < top[0][0]:
+                break  # nothing in older segments can beat what we have
+            for _, ev in self._read_lines(idx.seq):
+                ts = str(ev.get(self.ts_field) or "")
+                if start is not None and ts < start:
+                    continue
+                if end is not None and ts > end:
+                    continue
+                if event_type is not None and ev.get(self.type_field) != event_type:
+                    continue
+                order += 1
+                item = (ts, order, ev)
+                if len(top) < limit:
+                    heapq.heappush(top, item)
+                elif item[:2] > top[0][:2]:
+                    heapq.heapreplace(top, item)
+        return [ev for _, _, ev in sorted(top, key=lambda t: t[:2], reverse=True)]
+
+    def count(self, event_type: str | None = None) -> int:
+        segs = self.segments()
+        if event_type is None:
+            return sum(i.count for i in segs)
+        return sum(i.types.get(event_type, 0) for i in segs)
+
+    def stats(self) -> dict[str, Any]:
+        segs = self.segments()
+        types: dict[str, int] = {}
+        for i in segs:
+            for k, v in i.types.items():
+                types[k] = types.get(k, 0) + v
+        return {
+            "segments": len(segs),
+            "events": sum(i.count for i in segs),
+            "bytes": sum(i.bytes for i in segs),
+            "min_ts": min((i.min_ts for i in segs if i.min_ts), default=None),
+            "max_ts": max((i.max_ts for i in segs if i.max_ts), default=None),
+            "types": types,
+            "directory": str(self.directory),
+        }
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 DEFAULT_DATA_DIR = Path("data")
 DEFAULT_DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -20,3 +21,28 @@ def write_json(path: Path, payload: dict[str, Any]) -> None:
     """Write JSON file with automatic directory creation."""
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def write_json_atomic(path: Path, payload: dict[str, Any], indent: int | None = None) -> None:
+    """Write JSON via a temp file + rename so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    separators = None if indent else (",", ":")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=indent, ensure_ascii=False, separators=separators)
+    os.replace(tmp, path)
+
+
+def append_jsonl(path: Path, records: Iterable[dict[str, Any]], fsync: bool = False) -> int:
+    """Append records as JSON lines in a single write; returns bytes written."""
+    data = "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records)
+    if not data:
+        return 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    raw = data.encode("utf-8")
+    with open(path, "ab") as f:
+        f.write(raw)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    return len(raw)
@@ -0,0 +1,290 @@
+"""Append-only segmented JSON collections (snapshot + JSONL write-ahead segment).
+
+A collection is the usual ``{"updated_at": ..., "<key>": [...]}`` snapshot file
+plus a ``<snapshot>.wal.jsonl`` segment next to it. Writes append one line per
+record to the segment (O(1) instead of rewriting the whole file); reads are
+served from an in-process cache that is refreshed by stat()ing both files and
+replaying only the bytes appended since the last read. When the segment grows
+past ``compact_every`` ops it is folded back into a fresh snapshot.
+
+The first line of a segment carries the generation id stamped into the snapshot
+it extends. A snapshot rewritten by anything else (old code, a test deleting the
+file) gets a different/no generation, so a stale segment is ignored rather than
+replayed on top of the wrong base.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from .json_store import append_jsonl, write_json_atomic
+
+WAL_SUFFIX = ".wal.jsonl"
+
+
+def _utcnow_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _sig(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class _State:
+    abspath: str
+    snap_sig: tuple[int, int, int] | None
+    gen: str | None
+    items: list[dict[str, Any]] = field(default_factory=list)
+    index: dict[Any, int] = field(default_factory=dict)
+    updated_at: str = ""
+    wal_ok: bool = False
+    wal_seen: tuple[int, int, int] | None = None
+    wal_ino: int | None = None
+    wal_offset: int = 0
+    wal_ops: int = 0
+
+
+class SegmentedJsonStore:
+    """One JSON collection backed by a snapshot + append-only segment."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        key: str = "items",
+        id_field: str = "id",
+        max_items: int | None = None,
+        compact_every: int = 2000,
+        fsync: bool = False,
+    ):
+        self.path = Path(path)
+        self.key = key
+        self.id_field = id_field
+        self.max_items = max_items
+        self.compact_every = max(1, int(compact_every))
+        self.fsync = fsync
+        self._lock = threading.RLock()
+        self._state: _State | None = None
+
+    @property
+    def wal_path(self) -> Path:
+        return self.path.with_name(self.path.name + WAL_SUFFIX)
+
+    # ---- reads ----
+
+    def list(self) -> list[dict[str, Any]]:
+        """All records, oldest first. Records are shallow copies of the cache."""
+        with self._lock:
+            items = self._refresh().items
+            if self.max_items and len(items) > self.max_items:
+                items = items[-self.max_items:]
+            return [dict(x) for x in items]
+
+    def get(self, rec_id: Any) -> dict[str, Any] | None:
+        with self._lock:
+            st = self._refresh()
+            pos = st.index.get(rec_id)
+            return dict(st.items[pos]) if pos is not None else None
+
+    def count(self) -> int:
+        with self._lock:
+            n = len(self._refresh().items)
+            return min(n, self.max_items) if self.max_items else n
+
+    def version(self) -> tuple[Any, ...]:
+        """Cheap change token: differs whenever the collection has been written."""
+        with self._lock:
+            st = self._refresh()
+            return (st.abspath, st.snap_sig, st.wal_ino, st.wal_offset)
+
+    # ---- writes ----
+
+    def ensure(self) -> None:
+        """Create an empty snapshot if the collection does not exist yet."""
+        with self._lock:
+            if _sig(self.path) is None:
+                self._compact([])
+
+    def append(self, rec: dict[str, Any]) -> dict[str, Any]:
+        self.append_many([rec])
+        return rec
+
+    def append_many(self, recs: Iterable[dict[str, Any]]) -> int:
+        """Append (or upsert by id) records with a single segment write."""
+        ops = [{"op": "put", "rec": r} for r in recs]
+        self._write_ops(ops)
+        return len(ops)
+
+    def put(self, rec: dict[str, Any]) -> dict[str, Any]:
+        """Insert or replace the record with the same id (position is kept)."""
+        self._write_ops([{"op": "put", "rec": rec}])
+        return rec
+
+    def delete(self, rec_id: Any) -> bool:
+        with self._lock:
+            if rec_id not in self._refresh().index:
+                return False
+            self._write_ops([{"op": "del", "id": rec_id}])
+            return True
+
+    def replace_all(self, items: list[dict[str, Any]]) -> None:
+        """Rewrite the snapshot with ``items`` and start a new empty segment."""
+        with self._lock:
+            self._compact(list(items))
+
+    def compact(self) -> None:
+        with self._lock:
+            self._compact(list(self._refresh().items))
+
+    # ---- internals ----
+
+    def _write_ops(self, ops: list[dict[str, Any]]) -> None:
+        if not ops:
+            return
+        with self._lock:
+            self._writable()
+            append_jsonl(self.wal_path, ops, fsync=self.fsync)
+            # Replay from disk rather than applying locally so lines appended
+            # by another process in between are picked up in file order.
+            st = self._refresh()
+            if st.wal_ops >= self.compact_every:
+                self._compact(list(st.items))
+
+    def _writable(self) -> _State:
+        st = self._refresh()
+        if st.gen is None:
+            # Missing or legacy snapshot without a generation: stamp one.
+            return self._compact(list(st.items))
+        if not st.wal_ok:
+            self._reset_wal(st.gen)
+            return self._refresh(force=True)
+        return st
+
+    def _reset_wal(self, gen: str) -> None:
+        wal = self.wal_path
+        wal.parent.mkdir(parents=True, exist_ok=True)
+        tmp = wal.with_name(wal.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"gen": gen, "key": self.key}) + "\n")
+        os.replace(tmp, wal)
+
+    def _compact(self, items: list[dict[str, Any]]) -> _State:
+        if self.max_items and len(items) > self.max_items:
+            items = items[-self.max_items:]
+        gen = uuid.uuid4().hex
+        updated_at = _utcnow_iso()
+        # Snapshot first, then segment: a crash in between leaves a segment
+        # whose generation no longer matches, which is simply ignored.
+        write_json_atomic(self.path, {"updated_at": updated_at, self.key: items, "wal_gen": gen})
+        self._reset_wal(gen)
+        wal_sig = _sig(self.wal_path)
+        st = _State(
+            abspath=os.path.abspath(self.path),
+            snap_sig=_sig(self.path),
+            gen=gen,
+            items=items,
+            updated_at=updated_at,
+            wal_ok=True,
+            wal_ino=wal_sig[0] if wal_sig else None,
+            wal_offset=wal_sig[2] if wal_sig else 0,
+        )
+        self._reindex(st)
+        self._state = st
+        return st
+
+    def _refresh(self, force: bool = False) -> _State:
+        abspath = os.path.abspath(self.path)
+        snap_sig = _sig(self.path)
+        st = self._state
+        if force or st is None or st.abspath != abspath or st.snap_sig != snap_sig:
+            return self._load(abspath, snap_sig)
+        wal_sig = _sig(self.wal_path)
+        if not st.wal_ok:
+            # A segment for this generation may have been started elsewhere.
+            if st.gen and wal_sig is not None and wal_sig != st.wal_seen:
+                return self._load(abspath, snap_sig)
+            return st
+        if wal_sig is None or wal_sig[0] != st.wal_ino or wal_sig[2] < st.wal_offset:
+            return self._load(abspath, snap_sig)
+        if wal_sig[2] > st.wal_offset:
+            self._replay(st)
+        return st
+
+    def _load(self, abspath: str, snap_sig: tuple[int, int, int] | None) -> _State:
+        raw: dict[str, Any] = {}
+        if snap_sig is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    raw = json.load(f) or {}
+            except FileNotFoundError:
+                snap_sig = None
+        items = raw.get(self.key, [])
+        st = _State(
+            abspath=abspath,
+            snap_sig=snap_sig,
+            gen=raw.get("wal_gen"),
+            items=items if isinstance(items, list) else [],
+            updated_at=raw.get("updated_at", ""),
+        )
+        self._reindex(st)
+        if st.gen:
+            st.wal_seen = _sig(self.wal_path)
+            try:
+                with open(self.wal_path, "rb") as f:
+                    header = f.readline()
+                    ino = os.fstat(f.fileno()).st_ino
+            except FileNotFoundError:
+                header, ino = b"", None
+            try:
+                hdr = json.loads(header) if header.endswith(b"\n") else {}
+            except ValueError:
+                hdr = {}
+            if hdr.get("gen") == st.gen:
+                st.wal_ok, st.wal_ino, st.wal_offset = True, ino, len(header)
+                self._replay(st)
+        self._state = st
+        return st
+
+    def _replay(self, st: _State) -> None:
+        with open(self.wal_path, "rb") as f:
+            f.seek(st.wal_offset)
+            chunk = f.read()
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return  # only a partial line so far
+        for line in chunk[: end + 1].splitlines():
+            if line.strip():
+                self._apply(st, json.loads(line))
+        st.wal_offset += end + 1
+
+    def _apply(self, st: _State, op: dict[str, Any]) -> None:
+        st.wal_ops += 1
+        if op.get("op") == "del":
+            pos = st.index.get(op.get("id"))
+            if pos is not None:
+                del st.items[pos]
+                self._reindex(st)
+            return
+        rec = op.get("rec") or {}
+        rec_id = rec.get(self.id_field)
+        pos = st.index.get(rec_id) if rec_id is not None else None
+        if pos is None:
+            st.items.append(rec)
+            if rec_id is not None:
+                st.index[rec_id] = len(st.items) - 1
+        else:
+            st.items[pos] = rec
+
+    def _reindex(self, st: _State) -> None:
+        idf = self.id_field
+        st.index = {x[idf]: i for i, x in enumerate(st.items) if isinstance(x, dict) and x.get(idf) is not None}
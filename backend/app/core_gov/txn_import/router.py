@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import tempfile
 from typing import Any, Dict
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from . import service
 
 router = APIRouter(prefix="/core/txn_import", tags=["core-txn-import"])
@@ -19,6 +21,31 @@ def import_csv(
             desc_col=payload.get("desc_col","description"),
             merchant_col=payload.get("merchant_col","merchant"),
             kind_default=payload.get("kind_default","expense"),
+            dedupe=bool(payload.get("dedupe", False)),
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/csv/stream")
+async def import_csv_stream(
+    request: Request,
+    account_id: str = "",
+    date_col: str = "date",
+    amount_col: str = "amount",
+    desc_col: str = "description",
+    merchant_col: str = "merchant",
+    kind_default: str = "expense",
+    dedupe: bool = True,
+):
+    """Raw text/csv body. Spooled to disk past 8MB so large bank exports never sit in memory."""
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024, mode="w+b") as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        if not spool.tell():
+            raise HTTPException(status_code=400, detail="csv body required")
+        spool.seek(0)
+        lines = (raw.decode("utf-8-sig") for raw in spool)
+        return await run_in_threadpool(
+            service.import_csv_lines, lines, account_id=account_id, date_col=date_col, amount_col=amount_col,
+            desc_col=desc_col, merchant_col=merchant_col, kind_default=kind_default, dedupe=dedupe,
+        )
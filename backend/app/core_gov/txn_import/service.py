@@ -2,30 +2,38 @@ from __future__ import annotations
 
 import csv
 from io import StringIO
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
 
-def import_csv(csv_text: str, account_id: str = "", date_col: str = "date", amount_col: str = "amount", desc_col: str = "description", merchant_col: str = "merchant", kind_default: str = "expense") -> Dict[str, Any]:
+def import_csv(csv_text: str, account_id: str = "", date_col: str = "date", amount_col: str = "amount", desc_col: str = "description", merchant_col: str = "merchant", kind_default: str = "expense", dedupe: bool = False) -> Dict[str, Any]:
     if not (csv_text or "").strip():
         raise ValueError("csv_text required")
-
-    reader = csv.DictReader(StringIO(csv_text))
-    rows = list(reader)
-    if not rows:
-        return {"imported": 0, "warnings": ["no rows parsed"], "items": []}
-
-    warnings: List[str] = []
-    created = 0
-    items = []
-
+    return import_csv_lines(StringIO(csv_text), account_id=account_id, date_col=date_col, amount_col=amount_col, desc_col=desc_col,
+                            merchant_col=merchant_col, kind_default=kind_default, dedupe=dedupe)
+
+def import_csv_lines(lines: Iterable[str], account_id: str = "", date_col: str = "date", amount_col: str = "amount", desc_col: str = "description", merchant_col: str = "merchant", kind_default: str = "expense", dedupe: bool = False, batch_size: int = 500) -> Dict[str, Any]:
+    """
+    Streams rows from any line iterable (StringIO, an open file, a spooled upload) straight into
+    ledger.create_many, which writes one append per `batch_size` rows. Nothing is materialized.
+    """
     try:
         from backend.app.core_gov.ledger import service as lsvc  # type: ignore
     except Exception as e:
         return {"imported": 0, "warnings": [f"ledger unavailable: {type(e).__name__}: {e}"], "items": []}
 
-    for r in rows:
-        try:
-            d = (r.get(date_col) or "").strip()
-            a = float((r.get(amount_col) or "0").strip() or 0.0)
+    warnings: List[str] = []
+    seen = 0
+
+    def _rows() -> Iterator[Dict[str, Any]]:
+        nonlocal seen
+        for r in csv.DictReader(lines):
+            seen += 1
+            try:
+                d = (r.get(date_col) or "").strip()
+                a = float((r.get(amount_col) or "0").strip() or 0.0)
+            except Exception as e:
+                if len(warnings) < 200:
+                    warnings.append(f"row skipped: {type(e).__name__}: {e}")
+                continue
             desc = (r.get(desc_col) or "").strip()
             merch = (r.get(merchant_col) or "").strip()
             kind = kind_default
@@ -33,14 +41,14 @@ def import_csv(csv_text: str, account_id: str = "", date_col: str = "date", amou
                 # common banking exports store expenses as negative
                 kind = "expense"
                 a = abs(a)
-            else:
-                # could be income, leave as default unless user sets
-                kind = kind_default
+            yield {"kind": kind, "date": d, "amount": a, "description": desc, "merchant": merch, "account_id": account_id}
 
-            rec = lsvc.create(kind=kind, date=d, amount=a, description=desc, merchant=merch, account_id=account_id)
-            items.append(rec)
-            created += 1
-        except Exception as e:
-            warnings.append(f"row skipped: {type(e).__name__}: {e}")
+    res = lsvc.create_many(_rows(), dedupe=dedupe, batch_size=batch_size)
+    if not seen:
+        return {"imported": 0, "warnings": ["no rows parsed"], "items": []}
 
-    return {"imported": created, "warnings": warnings[:200], "items": items[:200]}
+    warnings.extend(f"row skipped: {e.split(': ', 1)[-1]}" for e in res["errors"])
+    out = {"imported": res["created"], "warnings": warnings[:200], "items": res["items"][:200]}
+    if dedupe:
+        out["duplicates"] = res["duplicates"]
+    return out
@@ -2,7 +2,7 @@ from sqlalchemy.orm import Session
 
 from ..models.deal import Deal
 from ..schemas.deal import DealCreate
-from ..services import audit
+from ..services import audit, deal_rollups  # noqa: F401  (keeps the reporting rollups current)
 
 
 def create(db: Session, data: DealCreate) -> Deal:
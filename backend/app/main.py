@@ -279,6 +279,25 @@ async def bluegreen_proxy(request, call_next):
 from app.routers import admin_sla
 
 app.include_router(admin_sla.router)
+
+# Webhook outbox dispatcher: drains leftovers at startup, flushes on shutdown
+try:
+    from app.core.startup import start_webhooks, stop_webhooks
+    from app.routers import admin_webhooks
+
+    app.include_router(admin_webhooks.router)
+    app.add_event_handler("startup", start_webhooks)
+    app.add_event_handler("shutdown", stop_webhooks)
+except Exception:
+    pass
+
+# Buffered /search recents: write what is still pending on shutdown
+try:
+    from app.core.startup import stop_recent_searches
+
+    app.add_event_handler("shutdown", stop_recent_searches)
+except Exception:
+    pass
 from app.observability import tenant
 
 
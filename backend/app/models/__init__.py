@@ -2,6 +2,7 @@
 from .alert import AlertEvent, AlertRule, Schedule, SLATimer
 from .buyer import Buyer
 from .deal import Deal
+from .deal_rollup import DealDailyRollup, RollupWatermark
 from .file_asset import FileAsset
 from .lead import Lead
 from .notification import Notification, OutboundEvent, UserNotifPref, WebhookEndpoint
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from ..core.db import Base
@@ -6,6 +6,8 @@ from ..core.db import Base
 
 class Deal(Base):
     __tablename__ = "deals"
+    # live slices of the reporting rollups (services/deal_rollups) range over created_at
+    __table_args__ = (Index("ix_deals_org_created_at", "org_id", "created_at"),)
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, index=True, nullable=False)
     legacy_id = Column(
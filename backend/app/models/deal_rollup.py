@@ -0,0 +1,25 @@
+from sqlalchemy import TIMESTAMP, Column, Float, Integer, String
+from sqlalchemy.sql import func
+
+from ..core.db import Base
+
+
+class DealDailyRollup(Base):
+    """Deals per org, created day (UTC, ``YYYY-MM-DD``) and status; see services/deal_rollups."""
+
+    __tablename__ = "deal_daily_rollups"
+    org_id = Column(Integer, primary_key=True)
+    day = Column(String(10), primary_key=True)
+    status = Column(String, primary_key=True)
+    deal_count = Column(Integer, nullable=False, default=0)
+    price_sum = Column(Float, nullable=False, default=0.0)
+    price_count = Column(Integer, nullable=False, default=0)
+
+
+class RollupWatermark(Base):
+    """Last day (inclusive) a rollup has been built through."""
+
+    __tablename__ = "rollup_watermarks"
+    name = Column(String, primary_key=True)
+    through_day = Column(String(10), nullable=False)
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, TIMESTAMP, Column, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, TIMESTAMP, BigInteger, Column, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.sql import func
 
 from ..core.db import Base
@@ -16,8 +16,15 @@ class ImportJob(Base):
     success_rows = Column(Integer, nullable=True, default=0)
     error_rows = Column(Integer, nullable=True, default=0)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), index=True)
+    started_at = Column(TIMESTAMP(timezone=True), nullable=True)
     finished_at = Column(TIMESTAMP(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
+    # progress, refreshed once per chunk by the executor
+    processed_rows = Column(Integer, nullable=True, default=0)
+    bytes_total = Column(BigInteger, nullable=True)
+    bytes_done = Column(BigInteger, nullable=True, default=0)
+    rows_per_sec = Column(Float, nullable=True)
+    eta_seconds = Column(Float, nullable=True)
 
 
 class ImportRowError(Base):
@@ -39,5 +46,12 @@ class ExportJob(Base):
     out_filename = Column(String, nullable=True)
     file_type = Column(String, nullable=True)  # MIME type for preview
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), index=True)
+    started_at = Column(TIMESTAMP(timezone=True), nullable=True)
     finished_at = Column(TIMESTAMP(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
+    # progress, refreshed once per chunk by the executor
+    total_rows = Column(Integer, nullable=True)
+    processed_rows = Column(Integer, nullable=True, default=0)
+    bytes_done = Column(BigInteger, nullable=True, default=0)
+    rows_per_sec = Column(Float, nullable=True)
+    eta_seconds = Column(Float, nullable=True)
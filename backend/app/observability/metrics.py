@@ -58,6 +58,21 @@ JOB_LAST_SECONDS = Gauge(
     registry=_registry,
 )
 
+# --- Webhook delivery metrics ---
+WEBHOOK_ATTEMPTS = Counter(
+    f"{NS}_webhook_attempts_total",
+    "Webhook delivery attempts",
+    ["target", "outcome"],
+    registry=_registry,
+)
+WEBHOOK_LATENCY = Histogram(
+    f"{NS}_webhook_delivery_seconds",
+    "Seconds from enqueue to successful webhook delivery",
+    ["target"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 15, 60, 300, 1800),
+    registry=_registry,
+)
+
 
 def _normalize_path(scope_path: str) -> str:
     """
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from fastapi import APIRouter
+
+from app.services.webhooks import get_dispatcher
+
+router = APIRouter(prefix="/admin/webhooks", tags=["admin-webhooks"])
+
+
+@router.get("/stats")
+def stats():
+    return get_dispatcher().stats()
+
+
+@router.get("/dead")
+def dead(limit: int = 100):
+    return {"items": get_dispatcher(start=False).outbox.dead(limit)}
+
+
+@router.post("/dead/requeue")
+def requeue(target: Optional[str] = None):
+    d = get_dispatcher()
+    n = d.outbox.requeue_dead(target)
+    d.wake()
+    return {"requeued": n}
@@ -1,9 +1,11 @@
 import os
 
 from backend.security.auth import Principal, require_permissions
+from backend.storage.stream import read_file_range
+from backend.storage.util import parse_range
 from backend.utils.signed_url import verify_signed_url
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 router = APIRouter()
 
@@ -59,8 +61,26 @@ async def download_file(
             metadata={"ip": client_ip, "ua": ua, "bytes": os.path.getsize(file_path)},
         )
     mime, _ = mimetypes.guess_type(str(file_path))
+    size = os.path.getsize(file_path)
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except ValueError:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    if byte_range is not None:
+        start, end = byte_range
+        return StreamingResponse(
+            read_file_range(file_path, start, end),
+            status_code=206,
+            media_type=mime or "application/octet-stream",
+            headers={
+                "Accept-Ranges": "bytes",
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": str(end - start + 1),
+            },
+        )
     return FileResponse(
         file_path,
         media_type=mime or "application/octet-stream",
         filename=os.path.basename(file_path),
+        headers={"Accept-Ranges": "bytes"},
     )
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from ..core.db import get_db
 from ..schemas.io_job import ExportJob, ExportJobCreate, ImportJob, ImportJobCreate, ImportRowError
+from ..services.io_executor import submit_export, submit_import
 from ..services.io_jobs import (
     create_export_job,
     create_import_job,
@@ -26,11 +27,14 @@ def start_import_job(
     job_in: ImportJobCreate, file: UploadFile = File(...), db: Session = Depends(get_db)
 ):
     # Save file
-    upload_path = get_upload_path(file.filename)
+    filename = os.path.basename(file.filename or "") or "upload.csv"
+    upload_path = get_upload_path(filename)
+    os.makedirs(os.path.dirname(upload_path), exist_ok=True)
     with open(upload_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+        shutil.copyfileobj(file.file, buffer, 1 << 20)
+    job_in.src_filename = filename  # the executor reads the file back by this name
     job = create_import_job(db, job_in)
-    # TODO: Trigger background import processing
+    submit_import(job.id)
     return job
 
 
@@ -50,7 +54,7 @@ def get_import_errors(job_id: int, db: Session = Depends(get_db)):
 @router.post("/export", response_model=ExportJob)
 def start_export_job(job_in: ExportJobCreate, db: Session = Depends(get_db)):
     job = create_export_job(db, job_in)
-    # TODO: Trigger background export processing
+    submit_export(job.id)
     return job
 
 
@@ -5,7 +5,15 @@ from app.deps.tenant import get_db, org_membership
 from app.models.deal import Deal
 from app.models.legacy import Legacy
 from app.models.saved_view import RecentSearch, SavedView
-from app.services.query_builder import apply_filters, apply_sort, paginate
+from app.services import recent_searches
+from app.services.query_builder import (
+    apply_filters,
+    apply_sort,
+    count_cached,
+    paginate,
+    paginate_keyset,
+    query_fingerprint,
+)
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
@@ -33,20 +41,25 @@ def search_entity(
     sort = payload.get("sort")
     page = int(payload.get("page", 1))
     size = int(payload.get("size", 25))
+    keyset = "cursor" in payload  # {"cursor": null} asks for the first keyset page
 
     q = db.query(model).filter(model.org_id == ctx["org_id"])
-    q = apply_filters(q, model, filters)
-    q = apply_sort(q, model, sort)
-    total, rows = paginate(q, page=page, size=size)
-
-    rec = RecentSearch(
-        org_id=ctx["org_id"],
-        user_id=user.id,
-        entity=entity,
-        query={"filters": filters, "sort": sort},
-    )
-    db.add(rec)
-    db.commit()
+    try:
+        q = apply_filters(q, model, filters)
+        # totals are cached per (entity, org, normalized filters) for SEARCH_COUNT_TTL_SECONDS
+        count_key = f"{entity}:{ctx['org_id']}:{query_fingerprint(filters)}"
+        if keyset:
+            rows, next_cursor = paginate_keyset(
+                q, model, sort, payload.get("cursor"), size, fingerprint=query_fingerprint(entity, filters, sort)
+            )
+            total = count_cached(q, count_key)
+        else:
+            q = apply_sort(q, model, sort)
+            total, rows = paginate(q, page=page, size=size, count_key=count_key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    recent_searches.record(ctx["org_id"], user.id, entity, {"filters": filters, "sort": sort})
 
     def to_dict(obj):
         if isinstance(obj, Legacy):
@@ -62,7 +75,10 @@ def search_entity(
             }
         return {"id": getattr(obj, "id", None)}
 
-    return {"total": total, "items": [to_dict(r) for r in rows], "page": page, "size": size}
+    items = [to_dict(r) for r in rows]
+    if keyset:
+        return {"total": total, "items": items, "size": size, "next_cursor": next_cursor}
+    return {"total": total, "items": items, "page": page, "size": size}
 
 
 @router.get("/views/{entity}")
@@ -158,6 +174,7 @@ def list_recents(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
+    recent_searches.get_buffer(start=False).flush()  # include this user's buffered searches
     rows = (
         db.query(RecentSearch)
         .filter(
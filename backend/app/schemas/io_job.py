@@ -31,8 +31,14 @@ class ImportJob(ImportJobBase):
     success_rows: Optional[int]
     error_rows: Optional[int]
     created_at: datetime
+    started_at: Optional[datetime] = None
     finished_at: Optional[datetime]
     error_message: Optional[str]
+    processed_rows: Optional[int] = None
+    bytes_total: Optional[int] = None
+    bytes_done: Optional[int] = None
+    rows_per_sec: Optional[float] = None
+    eta_seconds: Optional[float] = None
 
     class Config:
         orm_mode = True
@@ -78,8 +84,14 @@ class ExportJob(ExportJobBase):
     status: str
     out_filename: Optional[str]
     created_at: datetime
+    started_at: Optional[datetime] = None
     finished_at: Optional[datetime]
     error_message: Optional[str]
+    total_rows: Optional[int] = None
+    processed_rows: Optional[int] = None
+    bytes_done: Optional[int] = None
+    rows_per_sec: Optional[float] = None
+    eta_seconds: Optional[float] = None
 
     class Config:
         orm_mode = True
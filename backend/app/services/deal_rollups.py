@@ -0,0 +1,207 @@
+"""
+Daily deal rollups behind services/reporting.
+
+deal_daily_rollups holds, per (org, created day, status), the number of deals
+and the sum/count of their non-null prices. Every day up to the ``deals_daily``
+watermark is complete in the table; later days (normally just today) are read
+live from deals.
+
+- ``catch_up`` rolls the closed days after the watermark up with one GROUP BY
+  and moves the watermark to yesterday. Reporting calls it before reading, so
+  the first dashboard request of a day pays for the previous day only.
+- Flush hooks keep rolled-up days exact when a deal on such a day is inserted,
+  updated (org_id, status, created_at or price) or deleted through the ORM.
+  Bulk ``query.update()``/``delete()`` and raw SQL bypass them; run ``rebuild``
+  after those.
+
+created_at is an ISO-8601 UTC string; its first ten characters are the day.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, func, inspect, literal_column, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.deal import Deal
+from ..models.deal_rollup import DealDailyRollup, RollupWatermark
+
+ROLLUP = "deals_daily"
+_TRACKED = ("org_id", "status", "created_at", "price")
+_rollups = DealDailyRollup.__table__
+_marks = RollupWatermark.__table__
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def next_day(day: str) -> str:
+    return (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+
+
+def day_of(created_at: Any) -> Any:
+    """SQL expression for the ``YYYY-MM-DD`` day of a created_at column."""
+    # literal bounds so GROUP BY matches the select expression on server-side binding drivers
+    return func.substr(created_at, literal_column("1"), literal_column("10"))
+
+
+def watermark(db: Any) -> Optional[str]:
+    """Last rolled-up day, or None before the first catch-up (Session or Connection)."""
+    return db.execute(select(_marks.c.through_day).where(_marks.c.name == ROLLUP)).scalar()
+
+
+def _roll(db: Session, after: Optional[str], through: str) -> None:
+    """Recompute the rollup rows for days in (after, through]."""
+    cond = [Deal.created_at.isnot(None), Deal.created_at < next_day(through)]
+    drop = [_rollups.c.day <= through]
+    if after is not None:
+        cond.append(Deal.created_at >= next_day(after))
+        drop.append(_rollups.c.day > after)
+    db.execute(_rollups.delete().where(*drop))
+    day = day_of(Deal.created_at)
+    src = (
+        select(
+            Deal.org_id,
+            day,
+            Deal.status,
+            func.count(Deal.id),
+            func.coalesce(func.sum(Deal.price), 0.0),
+            func.count(Deal.price),
+        )
+        .where(*cond)
+        .group_by(Deal.org_id, day, Deal.status)
+    )
+    cols = ["org_id", "day", "status", "deal_count", "price_sum", "price_count"]
+    db.execute(_rollups.insert().from_select(cols, src))
+
+
+def _set_watermark(db: Session, current: Optional[str], through: str) -> None:
+    if current is None:
+        db.execute(_marks.insert().values(name=ROLLUP, through_day=through))
+    else:
+        db.execute(_marks.update().where(_marks.c.name == ROLLUP).values(through_day=through))
+
+
+def catch_up(db: Session, today: Optional[date] = None) -> Optional[str]:
+    """Roll every closed day up to yesterday; returns the watermark. Commits when it did work."""
+    through = ((today or _today()) - timedelta(days=1)).isoformat()
+    mark = watermark(db)
+    if mark is not None and mark >= through:
+        return mark
+    try:
+        _roll(db, mark, through)
+        _set_watermark(db, mark, through)
+        db.commit()
+    except IntegrityError:
+        # another worker caught up at the same time; use its result
+        db.rollback()
+        return watermark(db)
+    return through
+
+
+def rebuild(db: Session, today: Optional[date] = None) -> Optional[str]:
+    """Recompute all rollups from deals (after bulk edits that bypassed the flush hooks)."""
+    through = ((today or _today()) - timedelta(days=1)).isoformat()
+    mark = watermark(db)
+    _roll(db, None, through)
+    _set_watermark(db, mark, through)
+    db.commit()
+    return through
+
+
+# ---- write path ----
+
+_Key = Tuple[int, str, str]
+
+
+def _values(obj: Deal, old: bool) -> Tuple[Any, ...]:
+    state = inspect(obj)
+    out = []
+    for a in _TRACKED:
+        hist = state.attrs[a].history
+        if old and hist.deleted:
+            out.append(hist.deleted[0])
+        elif old and hist.added:
+            out.append(None)  # attribute was unset before this change
+        else:
+            out.append(getattr(obj, a))
+    return tuple(out)
+
+
+def _add(deltas: Dict[_Key, List[float]], values: Tuple[Any, ...], sign: int) -> None:
+    org_id, status, created_at, price = values
+    if org_id is None or not created_at:
+        return
+    d = deltas[(org_id, str(created_at)[:10], status)]
+    d[0] += sign
+    if price is not None:
+        d[1] += sign * price
+        d[2] += sign
+
+
+def _changed(obj: Deal) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[a].history.has_changes() for a in _TRACKED)
+
+
+@event.listens_for(Session, "before_flush")
+def _capture_old(session: Session, flush_context: Any, instances: Any) -> None:
+    # old values are read before the flush, while deleted rows can still be loaded
+    olds = []
+    for obj in session.deleted:
+        if isinstance(obj, Deal):
+            olds.append(_values(obj, old=False))
+    changed = []
+    for obj in session.dirty:
+        if isinstance(obj, Deal) and _changed(obj):
+            olds.append(_values(obj, old=True))
+            changed.append(obj)
+    session.info["deal_rollup_pending"] = (olds, changed)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_deltas(session: Session, flush_context: Any) -> None:
+    olds, changed = session.info.pop("deal_rollup_pending", ((), ()))
+    new = [obj for obj in session.new if isinstance(obj, Deal)]
+    if not (olds or new):
+        return
+    deltas: Dict[_Key, List[float]] = defaultdict(lambda: [0, 0.0, 0])
+    for values in olds:
+        _add(deltas, values, -1)
+    for obj in list(changed) + new:
+        _add(deltas, _values(obj, old=False), 1)
+    conn = session.connection()
+    mark = watermark(conn)
+    if mark is None:
+        return
+    for (org_id, day, status), (n, price_sum, price_n) in deltas.items():
+        if day > mark or not (n or price_n or price_sum):
+            continue  # live days are read from deals directly
+        pk = (_rollups.c.org_id == org_id) & (_rollups.c.day == day) & (_rollups.c.status == status)
+        res = conn.execute(
+            _rollups.update()
+            .where(pk)
+            .values(
+                deal_count=_rollups.c.deal_count + n,
+                price_sum=_rollups.c.price_sum + price_sum,
+                price_count=_rollups.c.price_count + price_n,
+            )
+        )
+        if not res.rowcount:
+            conn.execute(
+                _rollups.insert().values(
+                    org_id=org_id, day=day, status=status, deal_count=n, price_sum=price_sum, price_count=price_n
+                )
+            )
+
+
+def _keep_old_value(target: Any, value: Any, oldvalue: Any, initiator: Any) -> None:
+    pass
+
+
+# load the previous value on assignment, so an update after commit() still knows which day/status to decrement
+for _attr in _TRACKED:
+    event.listen(getattr(Deal, _attr), "set", _keep_old_value, active_history=True)
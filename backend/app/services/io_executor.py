@@ -0,0 +1,331 @@
+"""
+Background executor for /io import and export jobs.
+
+Jobs run out of the request path on a process pool (``IO_JOB_EXECUTOR``:
+process | thread | inline) and only the job id crosses the process boundary;
+each worker opens its own session.
+
+Imports stream the uploaded CSV in chunks of ``IO_IMPORT_CHUNK_ROWS``. Valid
+rows of a chunk go in with one bulk insert (``COPY ... FROM STDIN`` on
+PostgreSQL/psycopg2, executemany elsewhere), invalid rows are recorded with one
+insert into import_row_errors, and the job's progress columns are updated in
+the same transaction. If a bulk insert is rejected by the database, that chunk
+is retried row by row under savepoints so only the offending rows fail.
+
+Exports stream the query through a server-side cursor (``stream_results`` /
+``yield_per``) straight into a CSV file; progress goes through a second session
+so committing it does not close the cursor.
+"""
+
+import csv
+import io
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..models.io_job import ExportJob, ImportJob
+from ..schemas.io_job import ImportRowErrorCreate
+from .io_jobs import EXPORT_DIR, get_export_path, get_upload_path, log_import_row_errors
+
+IMPORT_CHUNK_ROWS = int(os.getenv("IO_IMPORT_CHUNK_ROWS", "5000"))
+EXPORT_CHUNK_ROWS = int(os.getenv("IO_EXPORT_CHUNK_ROWS", "5000"))
+EXECUTOR_KIND = os.getenv("IO_JOB_EXECUTOR", "process")
+MAX_WORKERS = int(os.getenv("IO_JOB_WORKERS", "2"))
+
+
+# ---- kinds ----
+
+def _kind(kind: str) -> Tuple[Any, Optional[Callable[..., Any]]]:
+    """(table, row schema) for a job kind; the schema validates and fills defaults."""
+    k = (kind or "").strip().lower()
+    if k in ("lead", "leads"):
+        from ..models.lead import Lead
+        from ..schemas.lead import LeadCreate
+
+        return Lead.__table__, LeadCreate
+    if k in ("buyer", "buyers"):
+        from ..models.buyer import Buyer
+        from ..schemas.buyer import BuyerCreate
+
+        return Buyer.__table__, BuyerCreate
+    raise ValueError(f"unsupported kind: {kind}")
+
+
+def _clean_row(row: Dict[str, Any], table: Any) -> Dict[str, Any]:
+    # blank cells fall back to schema defaults; unknown headers and ids are ignored
+    return {k: v for k, v in row.items() if k and k != "id" and k in table.c and v not in ("", None)}
+
+
+# ---- progress ----
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class _Progress:
+    def __init__(self, total: Optional[float]):
+        self.t0 = time.perf_counter()
+        self.total = total
+
+    def rate(self, done: float) -> Tuple[float, Optional[float]]:
+        """(per second, eta seconds) for ``done`` units against ``total``."""
+        elapsed = max(time.perf_counter() - self.t0, 1e-6)
+        per_sec = done / elapsed
+        if not self.total or per_sec <= 0:
+            return per_sec, None
+        return per_sec, max(0.0, (self.total - done) / per_sec)
+
+
+class _CountingReader(io.RawIOBase):
+    """Binary reader that counts bytes consumed, so progress is measured on the file."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.count = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = self.raw.readinto(b)
+        self.count += n or 0
+        return n
+
+
+# ---- import ----
+
+def _copy_literal(v: Any) -> str:
+    if v is None:
+        return ""  # unquoted empty = NULL in COPY csv
+    if isinstance(v, (bool, int, float)):
+        return str(v)
+    return '"' + str(v).replace('"', '""') + '"'
+
+
+def _bulk_insert(db: Session, table: Any, rows: List[Dict[str, Any]]) -> None:
+    if not rows:
+        return
+    cols = list(rows[0].keys())
+    conn = db.connection()
+    if conn.dialect.name == "postgresql":
+        cur = conn.connection.cursor()
+        if hasattr(cur, "copy_expert"):
+            buf = io.StringIO()
+            for r in rows:
+                buf.write(",".join(_copy_literal(r.get(c)) for c in cols))
+                buf.write("\n")
+            buf.seek(0)
+            col_sql = ", ".join(f'"{c}"' for c in cols)
+            cur.copy_expert(f'COPY "{table.name}" ({col_sql}) FROM STDIN WITH (FORMAT csv)', buf)
+            return
+    conn.execute(table.insert(), rows)
+
+
+def _flush_chunk(
+    db: Session,
+    table: Any,
+    job_id: int,
+    good: List[Tuple[int, Dict[str, Any]]],
+    bad: List[ImportRowErrorCreate],
+) -> int:
+    """Write one chunk (no commit); returns rows inserted, appending DB rejects to ``bad``."""
+    rows = [r for _, r in good]
+    try:
+        with db.begin_nested():
+            _bulk_insert(db, table, rows)
+        inserted = len(rows)
+    except Exception:
+        inserted = 0
+        for n, r in good:
+            try:
+                with db.begin_nested():
+                    db.execute(table.insert(), [r])
+                inserted += 1
+            except Exception as e:
+                bad.append(ImportRowErrorCreate(job_id=job_id, row_number=n, data=r, error=str(e)[:1000]))
+    log_import_row_errors(db, bad, commit=False)
+    return inserted
+
+
+def run_import_job(job_id: int, session_factory: Optional[Callable[[], Session]] = None, chunk_rows: Optional[int] = None) -> None:
+    if session_factory is None:
+        from ..core.db import SessionLocal as session_factory
+    chunk_rows = chunk_rows or IMPORT_CHUNK_ROWS
+    db = session_factory()
+    try:
+        job = db.get(ImportJob, job_id)
+        if job is None:
+            return
+        try:
+            table, schema = _kind(job.kind)
+            path = get_upload_path(job.src_filename)
+            size = os.path.getsize(path)
+            defaults = {"org_id": job.org_id} if "org_id" in table.c else {}
+            job.status, job.started_at, job.bytes_total = "running", _now(), size
+            job.processed_rows = job.success_rows = job.error_rows = 0
+            db.commit()
+
+            progress = _Progress(size)
+            with open(path, "rb", buffering=0) as raw:
+                counter = _CountingReader(raw)
+                text = io.TextIOWrapper(io.BufferedReader(counter, 1 << 16), encoding="utf-8-sig", newline="")
+                good: List[Tuple[int, Dict[str, Any]]] = []
+                bad: List[ImportRowErrorCreate] = []
+                seen = ok = failed = 0
+                for n, row in enumerate(csv.DictReader(text), start=2):  # line 1 is the header
+                    seen += 1
+                    try:
+                        values = schema(**_clean_row(row, table)).model_dump()
+                        good.append((n, {**defaults, **{k: v for k, v in values.items() if k in table.c}}))
+                    except Exception as e:
+                        bad.append(ImportRowErrorCreate(job_id=job.id, row_number=n, data=dict(row), error=str(e)[:1000]))
+                    if len(good) + len(bad) >= chunk_rows:
+                        ok += _flush_chunk(db, table, job.id, good, bad)
+                        failed += len(bad)
+                        good, bad = [], []
+                        _set_import_progress(job, progress, seen, ok, failed, counter.count)
+                        db.commit()
+                ok += _flush_chunk(db, table, job.id, good, bad)
+                failed += len(bad)
+                _set_import_progress(job, progress, seen, ok, failed, counter.count)
+            job.total_rows = seen
+            job.status, job.finished_at, job.eta_seconds = "completed", _now(), 0.0
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            job.status, job.finished_at, job.error_message = "failed", _now(), str(e)[:2000]
+            db.commit()
+    finally:
+        db.close()
+
+
+def _set_import_progress(job: ImportJob, progress: _Progress, seen: int, ok: int, failed: int, nbytes: int) -> None:
+    _, eta = progress.rate(nbytes)
+    job.processed_rows, job.success_rows, job.error_rows, job.bytes_done = seen, ok, failed, nbytes
+    job.rows_per_sec = round(progress.rate(seen)[0], 2)
+    job.eta_seconds = None if eta is None else round(eta, 2)
+
+
+# ---- export ----
+
+def _export_filters(table: Any, filters: Any, org_id: Optional[int] = None) -> List[Any]:
+    """WHERE clauses for an export: the job's filters, always scoped to its org when the table has one."""
+    out = []
+    if "org_id" in table.c:
+        out.append(table.c.org_id == org_id)
+    for k, v in (filters or {}).items():
+        if k == "org_id" and "org_id" in table.c:
+            continue  # never widen (or move) the export past the job's own org
+        if k not in table.c:
+            raise ValueError(f"unknown filter: {k}")
+        col = table.c[k]
+        out.append(col.in_(v) if isinstance(v, (list, tuple)) else col == v)
+    return out
+
+
+def run_export_job(job_id: int, session_factory: Optional[Callable[[], Session]] = None, chunk_rows: Optional[int] = None) -> None:
+    if session_factory is None:
+        from ..core.db import SessionLocal as session_factory
+    chunk_rows = chunk_rows or EXPORT_CHUNK_ROWS
+    db, stream = session_factory(), session_factory()
+    try:
+        job = db.get(ExportJob, job_id)
+        if job is None:
+            return
+        tmp = None
+        try:
+            table, _ = _kind(job.kind)
+            where = _export_filters(table, job.filters, job.org_id)
+            total = stream.execute(select(func.count()).select_from(table).where(*where)).scalar_one()
+            out_name = f"{table.name}_{job.id}.csv"
+            job.status, job.started_at, job.total_rows, job.processed_rows = "running", _now(), total, 0
+            db.commit()
+
+            os.makedirs(EXPORT_DIR, exist_ok=True)
+            out_path = get_export_path(out_name)
+            tmp = out_path + ".part"
+            progress = _Progress(total)
+            cols = [c.name for c in table.c]
+            result = stream.execute(
+                select(table).where(*where).order_by(table.c.id),
+                execution_options={"stream_results": True, "yield_per": chunk_rows},
+            )
+            done = 0
+            with open(tmp, "w", newline="", encoding="utf-8") as f:
+                w = csv.writer(f)
+                w.writerow(cols)
+                for part in result.partitions(chunk_rows):
+                    w.writerows(["" if v is None else v for v in r] for r in part)
+                    done += len(part)
+                    per_sec, eta = progress.rate(done)
+                    job.processed_rows, job.bytes_done = done, f.tell()
+                    job.rows_per_sec = round(per_sec, 2)
+                    job.eta_seconds = None if eta is None else round(eta, 2)
+                    db.commit()
+                nbytes = f.tell()
+            os.replace(tmp, out_path)
+            job.out_filename, job.file_type = out_name, "text/csv"
+            job.processed_rows, job.bytes_done, job.eta_seconds = done, nbytes, 0.0
+            job.status, job.finished_at = "completed", _now()
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            if tmp and os.path.exists(tmp):
+                os.remove(tmp)
+            job.status, job.finished_at, job.error_message = "failed", _now(), str(e)[:2000]
+            db.commit()
+    finally:
+        stream.close()
+        db.close()
+
+
+# ---- dispatch ----
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> Optional[Executor]:
+    """Shared pool for io jobs (None in inline mode)."""
+    global _executor
+    if EXECUTOR_KIND == "inline":
+        return None
+    with _executor_lock:
+        if _executor is None:
+            if EXECUTOR_KIND == "thread":
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="io-job")
+            else:
+                # spawn: children must not inherit the parent's pooled DB connections
+                _executor = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _executor
+
+
+def _submit(fn: Callable[[int], None], job_id: int) -> None:
+    ex = get_executor()
+    if ex is None:
+        fn(job_id)
+    else:
+        ex.submit(fn, job_id)
+
+
+def submit_import(job_id: int) -> None:
+    _submit(run_import_job, job_id)
+
+
+def submit_export(job_id: int) -> None:
+    _submit(run_export_job, job_id)
+
+
+def shutdown(wait: bool = True) -> None:
+    global _executor
+    with _executor_lock:
+        ex, _executor = _executor, None
+    if ex is not None:
+        ex.shutdown(wait=wait)
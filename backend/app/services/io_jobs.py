@@ -1,5 +1,5 @@
 import os
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -41,6 +41,16 @@ def log_import_row_error(db: Session, error_in: ImportRowErrorCreate) -> ImportR
     return error
 
 
+def log_import_row_errors(db: Session, errors: Iterable[ImportRowErrorCreate], commit: bool = True) -> int:
+    """Insert many row errors in one statement; returns how many were written."""
+    rows = [e.dict() for e in errors]
+    if rows:
+        db.execute(ImportRowError.__table__.insert(), rows)
+        if commit:
+            db.commit()
+    return len(rows)
+
+
 def get_import_job(db: Session, job_id: int) -> Optional[ImportJob]:
     return db.query(ImportJob).filter(ImportJob.id == job_id).first()
 
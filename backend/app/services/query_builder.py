@@ -1,9 +1,21 @@
-from typing import Any, Dict, List
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from sqlalchemy import Column, and_, not_, or_
+from sqlalchemy import Column, and_, false, not_, or_
 from sqlalchemy.orm import Query
 from sqlalchemy.sql.elements import BinaryExpression
 
+COUNT_TTL_SECONDS = float(os.getenv("SEARCH_COUNT_TTL_SECONDS", "30"))
+COUNT_CACHE_SIZE = int(os.getenv("SEARCH_COUNT_CACHE_SIZE", "2048"))
+
 OPS = {
     "=": lambda c, v: c == v,
     "!=": lambda c, v: c != v,
@@ -52,21 +64,171 @@ def apply_filters(q: Query, model, filters: Dict[str, Any] | None):
     return q.filter(clause)
 
 
+def sort_keys(model, sort: List[Dict[str, str]] | None) -> List[Tuple[str, Any, bool]]:
+    """(field, column, descending) for ``sort``, ending with ``id`` so the order is total."""
+    keys: List[Tuple[str, Any, bool]] = []
+    for s in sort or []:
+        name = s.get("field", "")
+        col = getattr(model, name, None)
+        if col is None or any(k[0] == name for k in keys):
+            continue
+        keys.append((name, col, s.get("dir", "asc").lower() == "desc"))
+    if not any(k[0] == "id" for k in keys):
+        keys.append(("id", model.id, False))
+    return keys
+
+
 def apply_sort(q: Query, model, sort: List[Dict[str, str]] | None):
     if not sort:
         return q
-    order_exprs = []
-    for s in sort:
-        col = getattr(model, s.get("field", ""), None)
-        if col is None:
-            continue
-        order_exprs.append(col.desc() if s.get("dir", "asc").lower() == "desc" else col.asc())
-    return q.order_by(*order_exprs)
+    keys = sort_keys(model, sort)
+    return q.order_by(*[col.desc() if desc else col.asc() for _, col, desc in keys])
 
 
-def paginate(q: Query, page: int = 1, size: int = 25):
+def paginate(q: Query, page: int = 1, size: int = 25, count_key: str | None = None):
     page = max(page, 1)
     size = max(min(size, 200), 1)
-    total = q.count()
+    total = count_cached(q, count_key) if count_key else q.count()
     rows = q.offset((page - 1) * size).limit(size).all()
     return total, rows
+
+
+# ---- keyset pagination ----
+#
+# The cursor carries the sort-key values of the last row of the page; the next
+# page is "rows after that tuple" in the sort order, which an index on the sort
+# columns answers without skipping rows. NULLs sort last in both directions.
+
+
+def _enc(v: Any) -> Any:
+    if isinstance(v, datetime):
+        return {"$dt": v.isoformat()}
+    if isinstance(v, date):
+        return {"$d": v.isoformat()}
+    if isinstance(v, Decimal):
+        return {"$dec": str(v)}
+    return v
+
+
+def _dec(v: Any) -> Any:
+    if isinstance(v, dict):
+        if "$dt" in v:
+            return datetime.fromisoformat(v["$dt"])
+        if "$d" in v:
+            return date.fromisoformat(v["$d"])
+        if "$dec" in v:
+            return Decimal(v["$dec"])
+    return v
+
+
+def encode_cursor(values: List[Any], fingerprint: str = "") -> str:
+    raw = json.dumps({"k": [_enc(v) for v in values], "q": fingerprint}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, fingerprint: str = "") -> List[Any]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        values = [_dec(v) for v in data["k"]]
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if data.get("q", "") != fingerprint:
+        raise ValueError("Cursor does not belong to this query")
+    return values
+
+
+def _after(col, desc: bool, v: Any):
+    if v is None:
+        return false()  # only NULLs follow a NULL, and those tie
+    return or_(col < v if desc else col > v, col.is_(None))
+
+
+def keyset_filter(keys: List[Tuple[str, Any, bool]], values: List[Any]):
+    """Rows strictly after ``values`` in the order given by ``keys``."""
+    if len(values) != len(keys):
+        raise ValueError("Cursor does not belong to this query")
+    clauses = []
+    for i, (_, col, desc) in enumerate(keys):
+        same = [keys[j][1].is_(None) if values[j] is None else keys[j][1] == values[j] for j in range(i)]
+        clauses.append(and_(*same, _after(col, desc, values[i])))
+    return or_(*clauses)
+
+
+def paginate_keyset(
+    q: Query,
+    model,
+    sort: List[Dict[str, str]] | None,
+    cursor: str | None = None,
+    size: int = 25,
+    fingerprint: str = "",
+) -> Tuple[List[Any], Optional[str]]:
+    """One page after ``cursor`` (None = first page); returns (rows, next cursor or None)."""
+    size = max(min(size, 200), 1)
+    keys = sort_keys(model, sort)
+    q = q.order_by(None).order_by(*[(col.desc() if desc else col.asc()).nulls_last() for _, col, desc in keys])
+    if cursor:
+        q = q.filter(keyset_filter(keys, decode_cursor(cursor, fingerprint)))
+    rows = q.limit(size + 1).all()
+    if len(rows) <= size:
+        return rows, None
+    rows = rows[:size]
+    return rows, encode_cursor([getattr(rows[-1], name) for name, _, _ in keys], fingerprint)
+
+
+# ---- totals ----
+
+
+def _normalize(node: Any) -> Any:
+    if isinstance(node, dict):
+        out = {k: _normalize(v) for k, v in node.items()}
+        for k in ("and", "or"):
+            if isinstance(out.get(k), list):
+                out[k] = sorted(out[k], key=lambda n: json.dumps(n, sort_keys=True, default=str))
+        if out.get("op") in ("in", "not_in") and isinstance(out.get("value"), list):
+            out["value"] = sorted(out["value"], key=lambda v: json.dumps(v, default=str))
+        return out
+    if isinstance(node, list):
+        return [_normalize(n) for n in node]
+    return node
+
+
+def query_fingerprint(*parts: Any) -> str:
+    """Stable hash of a query description; filter trees hash equal regardless of and/or/in order."""
+    raw = json.dumps([_normalize(p) for p in parts], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+class CountCache:
+    """Process-local LRU of query totals with a TTL; totals may lag writes by up to ``ttl`` seconds."""
+
+    def __init__(self, ttl: float = COUNT_TTL_SECONDS, max_entries: int = COUNT_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: str, compute: Callable[[], int]) -> int:
+        now = time.monotonic()
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None and now - hit[0] < self.ttl:
+                self._data.move_to_end(key)
+                return hit[1]
+        value = compute()
+        with self._lock:
+            self._data[key] = (now, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+count_cache = CountCache()
+
+
+def count_cached(q: Query, key: str) -> int:
+    return count_cache.get_or_compute(key, lambda: q.order_by(None).count())
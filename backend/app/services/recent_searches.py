@@ -0,0 +1,155 @@
+"""
+Buffered RecentSearch writes.
+
+``/search`` calls ``record`` instead of inserting and committing a row per
+request. Entries carry their own created_at and are written by a background
+thread in one multi-row insert every ``RECENT_SEARCH_FLUSH_SECONDS`` or as soon
+as ``RECENT_SEARCH_BATCH_SIZE`` are pending. If the database is unreachable
+the buffer keeps at most ``RECENT_SEARCH_MAX_PENDING`` entries and drops the
+oldest; recents are a convenience, not an audit trail.
+"""
+
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..models.saved_view import RecentSearch
+
+log = logging.getLogger(__name__)
+
+FLUSH_SECONDS = float(os.getenv("RECENT_SEARCH_FLUSH_SECONDS", "2"))
+BATCH_SIZE = int(os.getenv("RECENT_SEARCH_BATCH_SIZE", "200"))
+MAX_PENDING = int(os.getenv("RECENT_SEARCH_MAX_PENDING", "10000"))
+
+
+class RecentSearchBuffer:
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        flush_seconds: float = FLUSH_SECONDS,
+        batch_size: int = BATCH_SIZE,
+        max_pending: int = MAX_PENDING,
+    ):
+        self.session_factory = session_factory
+        self.flush_seconds = flush_seconds
+        self.batch_size = batch_size
+        self._pending: deque = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="recent-search-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def add(self, org_id: int, user_id: int, entity: str, query: Dict[str, Any]) -> None:
+        row = {
+            "org_id": org_id,
+            "user_id": user_id,
+            "entity": entity,
+            "query": query,
+            "created_at": datetime.now(timezone.utc),
+        }
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._pending.append(row)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Write everything pending now; returns rows written (0 if the write failed)."""
+        with self._flush_lock:
+            with self._lock:
+                rows: List[Dict[str, Any]] = list(self._pending)
+                self._pending.clear()
+            if not rows:
+                return 0
+            factory = self.session_factory
+            if factory is None:
+                from ..core.db import SessionLocal as factory
+            db = factory()
+            try:
+                for i in range(0, len(rows), self.batch_size):
+                    db.execute(RecentSearch.__table__.insert(), rows[i : i + self.batch_size])
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                log.warning("recent search flush failed, will retry: %s", e)
+                with self._lock:
+                    # newest entries win if the buffer overflowed meanwhile
+                    room = self._pending.maxlen - len(self._pending)
+                    self.dropped += max(0, len(rows) - room)
+                    self._pending.extendleft(reversed(rows[-room:] if room else []))
+                return 0
+            finally:
+                db.close()
+            self.written += len(rows)
+            return len(rows)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        return {"pending": self.pending(), "written": self.written, "dropped": self.dropped}
+
+
+_lock = threading.Lock()
+_buffer: Optional[RecentSearchBuffer] = None
+
+
+def get_buffer(start: bool = True) -> RecentSearchBuffer:
+    """Process-wide buffer (writer thread started on first use)."""
+    global _buffer
+    with _lock:
+        if _buffer is None:
+            _buffer = RecentSearchBuffer()
+        b = _buffer
+    if start and not b.running:
+        b.start()
+    return b
+
+
+def shutdown_buffer(timeout: float = 5.0) -> None:
+    global _buffer
+    with _lock:
+        b, _buffer = _buffer, None
+    if b is not None:
+        b.stop(timeout)
+
+
+def record(org_id: int, user_id: int, entity: str, query: Dict[str, Any]) -> None:
+    get_buffer().add(org_id, user_id, entity, query)
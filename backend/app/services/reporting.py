@@ -1,8 +1,17 @@
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Tuple
+"""
+Deal metrics for /reporting. Closed days are read from the daily rollups
+(services/deal_rollups), so a range costs one small aggregate over at most
+days x statuses rollup rows plus a live query over the deals of the partial
+first day and of the days after the rollup watermark (normally just today).
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.models.deal import Deal
-from sqlalchemy import func
+from app.models.deal_rollup import DealDailyRollup
+from app.services import deal_rollups
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 
@@ -19,33 +28,69 @@ def _parse_range(r: str) -> datetime:
     return _now() - timedelta(days=3650)
 
 
+def _window(db: Session, org_id: int, since: datetime) -> Tuple[Optional[List[Any]], List[Any]]:
+    """(rollup filter or None, live deals filter) that together cover created_at >= since."""
+    through = deal_rollups.catch_up(db)
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc)
+    since_iso = since.strftime("%Y-%m-%dT%H:%M:%S")
+    first_full = since.date() if since_iso.endswith("T00:00:00") else since.date() + timedelta(days=1)
+    live = [Deal.org_id == org_id, Deal.created_at >= since_iso]
+    if through is None or first_full.isoformat() > through:
+        return None, live
+    rolled = [
+        DealDailyRollup.org_id == org_id,
+        DealDailyRollup.day >= first_full.isoformat(),
+        DealDailyRollup.day <= through,
+    ]
+    live.append(or_(Deal.created_at < first_full.isoformat(), Deal.created_at >= deal_rollups.next_day(through)))
+    return rolled, live
+
+
 def deals_by_status(db: Session, org_id: int, since: datetime) -> Dict[str, int]:
-    q = (
-        db.query(Deal.status, func.count(Deal.id))
-        .filter(Deal.org_id == org_id)
-        .filter(Deal.created_at >= since)
-        .group_by(Deal.status)
-    )
-    return {k: v for (k, v) in q.all()}
+    rolled, live = _window(db, org_id, since)
+    out: Dict[str, int] = {}
+    if rolled is not None:
+        q = (
+            db.query(DealDailyRollup.status, func.sum(DealDailyRollup.deal_count))
+            .filter(*rolled)
+            .group_by(DealDailyRollup.status)
+        )
+        out.update({k: int(v) for (k, v) in q.all() if v})
+    q = db.query(Deal.status, func.count(Deal.id)).filter(*live).group_by(Deal.status)
+    for k, v in q.all():
+        out[k] = out.get(k, 0) + v
+    return out
 
 
 def deals_timeseries_count(db: Session, org_id: int, since: datetime) -> List[Tuple[str, int]]:
-    rows = (
-        db.query(func.date_trunc("day", Deal.created_at), func.count(Deal.id))
-        .filter(Deal.org_id == org_id, Deal.created_at >= since)
-        .group_by(func.date_trunc("day", Deal.created_at))
-        .order_by(func.date_trunc("day", Deal.created_at))
-    )
-    return [(d.isoformat(), c) for (d, c) in rows.all()]
+    rolled, live = _window(db, org_id, since)
+    days: Dict[str, int] = {}
+    if rolled is not None:
+        q = (
+            db.query(DealDailyRollup.day, func.sum(DealDailyRollup.deal_count))
+            .filter(*rolled)
+            .group_by(DealDailyRollup.day)
+        )
+        days.update({d: int(c) for (d, c) in q.all() if c})
+    day = deal_rollups.day_of(Deal.created_at)
+    for d, c in db.query(day, func.count(Deal.id)).filter(*live).group_by(day).all():
+        days[d] = days.get(d, 0) + c
+    return [
+        (datetime.combine(date.fromisoformat(d), datetime.min.time(), timezone.utc).isoformat(), days[d])
+        for d in sorted(days)
+    ]
 
 
 def avg_deal_price(db: Session, org_id: int, since: datetime) -> float | None:
-    row = (
-        db.query(func.avg(Deal.price))
-        .filter(Deal.org_id == org_id, Deal.created_at >= since)
-        .first()
-    )
-    return float(row[0]) if row and row[0] is not None else None
+    rolled, live = _window(db, org_id, since)
+    total, n = 0.0, 0
+    if rolled is not None:
+        row = db.query(func.sum(DealDailyRollup.price_sum), func.sum(DealDailyRollup.price_count)).filter(*rolled).first()
+        total, n = float(row[0] or 0.0), int(row[1] or 0)
+    row = db.query(func.sum(Deal.price), func.count(Deal.price)).filter(*live).first()
+    total, n = total + float(row[0] or 0.0), n + int(row[1] or 0)
+    return total / n if n else None
 
 
 REGISTRY = {
@@ -0,0 +1,244 @@
+"""
+Async webhook dispatcher: drains the WebhookOutbox on a background event loop.
+
+One daemon thread runs an asyncio loop with a single pooled, keep-alive
+``httpx.AsyncClient``. Each target gets at most ``concurrency_per_target``
+requests in flight; with ``batch_size > 1`` up to that many queued events for a
+target are posted together as ``{"events": [...]}`` (otherwise the body is the
+usual ``{"event": ..., "data": ...}``). Failed attempts (network errors, 5xx,
+408/425/429) are retried with capped exponential backoff plus jitter; other
+4xx responses and exhausted retries are dead-lettered in the outbox.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from .webhook_outbox import Delivery, WebhookOutbox
+
+try:
+    from ..observability.metrics import WEBHOOK_ATTEMPTS, WEBHOOK_LATENCY
+except Exception:  # metrics are optional
+    WEBHOOK_ATTEMPTS = WEBHOOK_LATENCY = None
+
+RETRYABLE_STATUS = {408, 425, 429}
+
+
+def _pct(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    s = sorted(values)
+    return round(s[min(len(s) - 1, int(q * len(s)))] * 1000.0, 3)
+
+
+class WebhookDispatcher:
+    def __init__(
+        self,
+        outbox: WebhookOutbox,
+        concurrency_per_target: int = 4,
+        batch_size: int = 1,
+        max_attempts: int = 8,
+        backoff_base: float = 1.0,
+        backoff_max: float = 300.0,
+        timeout: float = 5.0,
+        poll_interval: float = 5.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.outbox = outbox
+        self.concurrency_per_target = max(1, int(concurrency_per_target))
+        self.batch_size = max(1, int(batch_size))
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.timeout = float(timeout)
+        self.poll_interval = float(poll_interval)
+        self.transport = transport
+
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._ready = threading.Event()
+        self._stopping = False
+        self._inflight: Dict[str, int] = defaultdict(int)
+        self._tasks: set = set()
+
+        self._stats_lock = threading.Lock()
+        self._per_target: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"attempts": 0, "delivered": 0, "failed_attempts": 0, "dead": 0, "last_error": None}
+        )
+        self._latency: Deque[float] = deque(maxlen=2000)  # enqueue -> delivered, seconds
+        self._request: Deque[float] = deque(maxlen=2000)  # single HTTP attempt, seconds
+
+    # ---- lifecycle ----
+
+    def start(self) -> "WebhookDispatcher":
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stopping = False
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._thread_main, name="webhook-dispatcher", daemon=True)
+        self._thread.start()
+        self._ready.wait(5.0)
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopping = True
+        self.wake()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def wake(self) -> None:
+        """Thread-safe nudge: new work was queued."""
+        loop, ev = self._loop, self._wake
+        if loop is not None and ev is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(ev.set)
+            except RuntimeError:
+                pass
+
+    def wait_idle(self, timeout: float = 10.0) -> bool:
+        """Block until nothing is pending or inflight (for tests and shutdown)."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            c = self.outbox.counts()
+            if not c["pending"] and not c["inflight"]:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def _thread_main(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            loop.run_until_complete(self._run())
+        finally:
+            self._loop = None
+            loop.close()
+
+    async def _run(self) -> None:
+        self._wake = asyncio.Event()
+        self.outbox.recover_inflight()
+        limits = httpx.Limits(
+            max_connections=None,
+            max_keepalive_connections=self.concurrency_per_target * 8,
+            keepalive_expiry=30.0,
+        )
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits, transport=self.transport) as client:
+            self._ready.set()
+            while not self._stopping:
+                self._dispatch_due(client)
+                now = time.time()
+                nd = self.outbox.next_due_at()
+                if nd is None or nd <= now:
+                    delay = self.poll_interval  # idle, or due work blocked on per-target limits
+                else:
+                    delay = min(self.poll_interval, nd - now)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+            if self._tasks:
+                await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    # ---- delivery ----
+
+    def _dispatch_due(self, client: httpx.AsyncClient) -> None:
+        for target in self.outbox.due_targets():
+            while self._inflight[target] < self.concurrency_per_target:
+                batch = self.outbox.claim(target, self.batch_size)
+                if not batch:
+                    break
+                self._inflight[target] += 1
+                task = asyncio.get_running_loop().create_task(self._deliver(client, target, batch))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    def _body(self, batch: List[Delivery]) -> Dict[str, Any]:
+        if self.batch_size == 1:
+            return {"event": batch[0].event, "data": batch[0].data}
+        return {"events": [{"event": d.event, "data": d.data} for d in batch]}
+
+    def backoff(self, attempts: int) -> float:
+        """Delay before retry number ``attempts`` (1-based): base * 2^(n-1), capped, 50-100% jitter."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** max(0, attempts - 1)))
+        return delay * (0.5 + random.random() / 2)
+
+    async def _deliver(self, client: httpx.AsyncClient, target: str, batch: List[Delivery]) -> None:
+        ids = [d.id for d in batch]
+        t0 = time.perf_counter()
+        try:
+            resp = await client.post(target, json=self._body(batch))
+            ok = 200 <= resp.status_code < 300
+            error = "" if ok else f"HTTP {resp.status_code}"
+            retryable = resp.status_code >= 500 or resp.status_code in RETRYABLE_STATUS
+        except httpx.HTTPError as e:
+            ok, error, retryable = False, f"{type(e).__name__}: {e}", True
+        except Exception as e:  # never let one bad target kill the loop
+            ok, error, retryable = False, f"{type(e).__name__}: {e}", True
+        finally:
+            self._inflight[target] -= 1
+            if self._wake is not None:
+                self._wake.set()
+        elapsed = time.perf_counter() - t0
+        now = time.time()
+        label = urlsplit(target).netloc or target
+        attempts = max(d.attempts for d in batch) + 1
+        dead = not ok and (not retryable or attempts >= self.max_attempts)
+        outcome = "delivered" if ok else ("dead" if dead else "retry")
+
+        with self._stats_lock:
+            st = self._per_target[target]
+            st["attempts"] += 1
+            self._request.append(elapsed)
+            if ok:
+                st["delivered"] += len(batch)
+                self._latency.extend(now - d.created_at for d in batch)
+            else:
+                st["failed_attempts"] += 1
+                st["last_error"] = error
+                if dead:
+                    st["dead"] += len(batch)
+        if WEBHOOK_ATTEMPTS is not None:
+            WEBHOOK_ATTEMPTS.labels(target=label, outcome=outcome).inc()
+            if ok:
+                for d in batch:
+                    WEBHOOK_LATENCY.labels(target=label).observe(max(0.0, now - d.created_at))
+        # outbox last, so wait_idle() never returns before the stats above are recorded
+        if ok:
+            self.outbox.mark_delivered(ids, now=now)
+        else:
+            self.outbox.mark_failed(ids, error, None if dead else now + self.backoff(attempts))
+
+    # ---- metrics ----
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            latency = list(self._latency)
+            request = list(self._request)
+            per_target = {t: dict(v, inflight=self._inflight.get(t, 0)) for t, v in self._per_target.items()}
+        return {
+            "running": self.running,
+            "queue": self.outbox.counts(),
+            "targets": per_target,
+            "delivery_latency_ms": {"p50": _pct(latency, 0.5), "p95": _pct(latency, 0.95), "max": _pct(latency, 1.0)},
+            "request_ms": {"p50": _pct(request, 0.5), "p95": _pct(request, 0.95), "max": _pct(request, 1.0)},
+            "config": {
+                "concurrency_per_target": self.concurrency_per_target,
+                "batch_size": self.batch_size,
+                "max_attempts": self.max_attempts,
+                "timeout": self.timeout,
+            },
+        }
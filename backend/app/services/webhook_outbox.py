@@ -0,0 +1,186 @@
+"""
+Durable outbound queue for webhook deliveries (SQLite, one row per event x target).
+
+Rows move pending -> inflight -> delivered, or back to pending with a later
+``next_attempt_at`` after a failed attempt, or to dead once attempts run out.
+Inflight rows left behind by a crashed dispatcher are returned to pending when
+the next dispatcher starts (``recover_inflight``), so delivery is at-least-once.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "../../data/webhooks/outbox.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deliveries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    target TEXT NOT NULL,
+    event TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    delivered_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_deliveries_due ON deliveries (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS ix_deliveries_target ON deliveries (target, status, id);
+"""
+
+
+@dataclass
+class Delivery:
+    id: int
+    target: str
+    event: str
+    data: Any
+    attempts: int
+    created_at: float
+
+
+class WebhookOutbox:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_PATH
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _write_many(self, sql: str, rows: List[tuple]) -> None:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany(sql, rows)
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    # ---- producer side ----
+
+    def enqueue(self, targets: Iterable[str], event: str, data: Any, now: Optional[float] = None) -> List[int]:
+        """Queue one delivery of ``event`` per target; returns the row ids."""
+        now = time.time() if now is None else now
+        payload = json.dumps(data, default=str)
+        ids = []
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for t in targets:
+                    cur = self._db.execute(
+                        "INSERT INTO deliveries (target, event, payload, created_at, next_attempt_at) VALUES (?, ?, ?, ?, ?)",
+                        (t, event, payload, now, now),
+                    )
+                    ids.append(cur.lastrowid)
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return ids
+
+    # ---- dispatcher side ----
+
+    def recover_inflight(self) -> int:
+        with self._lock:
+            return self._db.execute("UPDATE deliveries SET status='pending' WHERE status='inflight'").rowcount
+
+    def due_targets(self, now: Optional[float] = None) -> Dict[str, int]:
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT target, COUNT(*) FROM deliveries WHERE status='pending' AND next_attempt_at <= ? GROUP BY target",
+                (now,),
+            ).fetchall()
+        return {t: n for t, n in rows}
+
+    def next_due_at(self) -> Optional[float]:
+        with self._lock:
+            row = self._db.execute("SELECT MIN(next_attempt_at) FROM deliveries WHERE status='pending'").fetchone()
+        return row[0] if row else None
+
+    def claim(self, target: str, limit: int, now: Optional[float] = None) -> List[Delivery]:
+        """Mark up to ``limit`` due deliveries for ``target`` inflight, oldest first."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    "SELECT id, target, event, payload, attempts, created_at FROM deliveries "
+                    "WHERE target=? AND status='pending' AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                    (target, now, int(limit)),
+                ).fetchall()
+                if rows:
+                    self._db.executemany("UPDATE deliveries SET status='inflight' WHERE id=?", [(r[0],) for r in rows])
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return [Delivery(id=r[0], target=r[1], event=r[2], data=json.loads(r[3]), attempts=r[4], created_at=r[5]) for r in rows]
+
+    def mark_delivered(self, ids: Iterable[int], now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self._write_many(
+            "UPDATE deliveries SET status='delivered', attempts=attempts+1, delivered_at=?, last_error=NULL WHERE id=?",
+            [(now, i) for i in ids],
+        )
+
+    def mark_failed(self, ids: Iterable[int], error: str, retry_at: Optional[float]) -> None:
+        """Count a failed attempt; ``retry_at=None`` dead-letters the rows."""
+        if retry_at is None:
+            self._write_many(
+                "UPDATE deliveries SET status='dead', attempts=attempts+1, last_error=? WHERE id=?",
+                [(error[:500], i) for i in ids],
+            )
+        else:
+            self._write_many(
+                "UPDATE deliveries SET status='pending', attempts=attempts+1, next_attempt_at=?, last_error=? WHERE id=?",
+                [(retry_at, error[:500], i) for i in ids],
+            )
+
+    # ---- admin ----
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM deliveries GROUP BY status").fetchall()
+        out = {"pending": 0, "inflight": 0, "delivered": 0, "dead": 0}
+        out.update({s: n for s, n in rows})
+        return out
+
+    def dead(self, limit: int = 100) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, target, event, attempts, last_error, created_at FROM deliveries WHERE status='dead' ORDER BY id DESC LIMIT ?",
+                (int(limit),),
+            ).fetchall()
+        keys = ("id", "target", "event", "attempts", "last_error", "created_at")
+        return [dict(zip(keys, r)) for r in rows]
+
+    def requeue_dead(self, target: Optional[str] = None, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        sql, args = "UPDATE deliveries SET status='pending', attempts=0, next_attempt_at=? WHERE status='dead'", [now]
+        if target:
+            sql += " AND target=?"
+            args.append(target)
+        with self._lock:
+            return self._db.execute(sql, args).rowcount
+
+    def purge_delivered(self, older_than_seconds: float = 7 * 86400, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._db.execute(
+                "DELETE FROM deliveries WHERE status='delivered' AND delivered_at < ?", (now - older_than_seconds,)
+            ).rowcount
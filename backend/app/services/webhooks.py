@@ -1,9 +1,12 @@
-import json
-import urllib.error
-import urllib.request
-from typing import List
+import threading
+from typing import List, Optional
 
 from ..core.config import get_settings
+from .webhook_dispatcher import WebhookDispatcher
+from .webhook_outbox import WebhookOutbox
+
+_lock = threading.Lock()
+_dispatcher: Optional[WebhookDispatcher] = None
 
 
 def _get_targets() -> List[str]:
@@ -12,17 +15,41 @@ def _get_targets() -> List[str]:
     return [x.strip() for x in csv.split(",") if x.strip()]
 
 
+def get_dispatcher(start: bool = True) -> WebhookDispatcher:
+    """Process-wide dispatcher built from settings (started on first use)."""
+    global _dispatcher
+    with _lock:
+        if _dispatcher is None:
+            s = get_settings()
+            _dispatcher = WebhookDispatcher(
+                WebhookOutbox(s.WEBHOOK_OUTBOX_PATH),
+                concurrency_per_target=s.WEBHOOK_CONCURRENCY_PER_TARGET,
+                batch_size=s.WEBHOOK_BATCH_SIZE,
+                max_attempts=s.WEBHOOK_MAX_ATTEMPTS,
+                backoff_base=s.WEBHOOK_BACKOFF_BASE_SECONDS,
+                backoff_max=s.WEBHOOK_BACKOFF_MAX_SECONDS,
+                timeout=s.WEBHOOK_TIMEOUT_SECONDS,
+            )
+        d = _dispatcher
+    if start and not d.running:
+        d.start()
+    return d
+
+
+def shutdown_dispatcher(timeout: float = 5.0) -> None:
+    global _dispatcher
+    with _lock:
+        d, _dispatcher = _dispatcher, None
+    if d is not None:
+        d.stop(timeout)
+        d.outbox.close()
+
+
 def send_webhook(event: str, data: dict) -> None:
+    """Queue ``event`` for every configured target; delivery happens in the background."""
     targets = _get_targets()
     if not targets:
         return
-    body = json.dumps({"event": event, "data": data}).encode("utf-8")
-    for url in targets:
-        try:
-            req = urllib.request.Request(
-                url, data=body, headers={"Content-Type": "application/json"}
-            )
-            with urllib.request.urlopen(req, timeout=5) as _:
-                pass
-        except urllib.error.URLError:
-            pass
+    d = get_dispatcher()
+    d.outbox.enqueue(targets, event, data)
+    d.wake()
@@ -0,0 +1,125 @@
+import os
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test_deal_rollups.db")
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Column, Integer, Table, create_engine
+from sqlalchemy.orm import sessionmaker
+
+# same import path as services/reporting, so the flush hooks see the Deal class the test writes
+from app.core.db import Base
+from app.models.deal import Deal
+from app.models.deal_rollup import DealDailyRollup, RollupWatermark
+from app.models.lead import Lead
+from app.services import deal_rollups, reporting
+
+TODAY = datetime.now(timezone.utc).date()
+
+# deals.legacy_id points at a table this app does not model; a stand-in lets the mapper sort the FK
+if "legacies" not in Base.metadata.tables:
+    Table("legacies", Base.metadata, Column("id", Integer, primary_key=True))
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rollups.db'}")
+    tables = [Base.metadata.tables["legacies"], Lead.__table__, Deal.__table__, DealDailyRollup.__table__, RollupWatermark.__table__]
+    Base.metadata.create_all(engine, tables=tables)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _ts(days_ago, hour=12):
+    d = TODAY - timedelta(days=days_ago)
+    return f"{d.isoformat()}T{hour:02d}:00:00"
+
+
+def _deal(db, days_ago, status="open", price=100.0, org_id=1, hour=12):
+    obj = Deal(org_id=org_id, status=status, price=price, created_at=_ts(days_ago, hour))
+    db.add(obj)
+    db.commit()
+    return obj
+
+
+def _seed(db):
+    for i in range(40):
+        _deal(db, days_ago=i % 10, status="won" if i % 4 == 0 else "open", price=float(100 + i))
+    _deal(db, days_ago=2, org_id=2, price=None)
+    _deal(db, days_ago=500, status="lost")
+
+
+def _plain(db, org_id, since):
+    """Reference answers straight from deals."""
+    since_iso = since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    rows = [d for d in db.query(Deal).filter(Deal.org_id == org_id).all() if d.created_at >= since_iso]
+    by_status, by_day = {}, {}
+    for d in rows:
+        by_status[d.status] = by_status.get(d.status, 0) + 1
+        by_day[d.created_at[:10]] = by_day.get(d.created_at[:10], 0) + 1
+    prices = [d.price for d in rows if d.price is not None]
+    series = [(f"{k}T00:00:00+00:00", v) for k, v in sorted(by_day.items())]
+    return by_status, series, (sum(prices) / len(prices) if prices else None)
+
+
+def _check(db, org_id, since):
+    by_status, series, avg = _plain(db, org_id, since)
+    assert reporting.deals_by_status(db, org_id, since) == by_status
+    assert reporting.deals_timeseries_count(db, org_id, since) == series
+    assert reporting.avg_deal_price(db, org_id, since) == pytest.approx(avg)
+
+
+def test_rollups_match_live_queries_for_partial_and_full_ranges(db):
+    _seed(db)
+    yesterday = (TODAY - timedelta(days=1)).isoformat()
+    for since in (
+        reporting._parse_range("7d"),
+        reporting._parse_range("12m"),
+        datetime.combine(TODAY - timedelta(days=3), datetime.min.time(), timezone.utc),
+        datetime.combine(TODAY - timedelta(days=3), datetime.min.time(), timezone.utc) + timedelta(hours=13),
+    ):
+        _check(db, 1, since)
+    assert deal_rollups.watermark(db) == yesterday
+    assert db.query(DealDailyRollup).filter(DealDailyRollup.day == TODAY.isoformat()).count() == 0
+    assert reporting.deals_by_status(db, 2, reporting._parse_range("30d")) == {"open": 1}
+    assert reporting.avg_deal_price(db, 2, reporting._parse_range("30d")) is None
+
+
+def test_writes_to_rolled_up_days_keep_rollups_exact(db):
+    _seed(db)
+    since = reporting._parse_range("30d")
+    reporting.deals_by_status(db, 1, since)  # first catch-up
+
+    _deal(db, days_ago=3, status="won", price=1000.0)  # late insert into a closed day
+    moved = db.query(Deal).filter(Deal.status == "open", Deal.created_at.like(_ts(5)[:10] + "%")).first()
+    moved.status, moved.created_at, moved.price = "lost", _ts(8), 5.0  # after commit: old values must be reloaded
+    db.commit()
+    db.delete(db.query(Deal).filter(Deal.status == "won").first())
+    db.commit()
+    _deal(db, days_ago=0, status="won")  # today stays live
+
+    _check(db, 1, since)
+    before = {(r.day, r.status): (r.deal_count, r.price_sum, r.price_count) for r in db.query(DealDailyRollup)}
+    deal_rollups.rebuild(db)
+    after = {(r.day, r.status): (r.deal_count, r.price_sum, r.price_count) for r in db.query(DealDailyRollup)}
+    assert {k for k, v in before.items() if v[0]} == set(after)
+    for k, (n, price_sum, price_n) in after.items():
+        assert before[k][0] == n and before[k][2] == price_n
+        assert before[k][1] == pytest.approx(price_sum)
+
+
+def test_catch_up_only_rolls_new_closed_days(db):
+    _seed(db)
+    assert deal_rollups.catch_up(db, today=TODAY - timedelta(days=5)) == (TODAY - timedelta(days=6)).isoformat()
+    rolled = db.query(DealDailyRollup).count()
+    # a deal created after the watermark is not written to the rollups until its day is caught up
+    _deal(db, days_ago=2, status="pending")
+    assert db.query(DealDailyRollup).count() == rolled
+    assert deal_rollups.catch_up(db) == (TODAY - timedelta(days=1)).isoformat()
+    assert db.query(DealDailyRollup).filter(DealDailyRollup.status == "pending").one().deal_count == 1
+    assert deal_rollups.catch_up(db) == (TODAY - timedelta(days=1)).isoformat()
+    assert isinstance(date.fromisoformat(deal_rollups.watermark(db)), date)
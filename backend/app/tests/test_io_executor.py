@@ -0,0 +1,116 @@
+import csv
+import os
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test_io_executor.db")
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from ..core.db import Base
+from ..models.buyer import Buyer
+from ..models.io_job import ExportJob, ImportJob, ImportRowError
+from ..models.lead import Lead
+from ..models import org, user  # noqa: F401  (tables the leads FKs point at)
+from ..services import io_executor, io_jobs
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_jobs, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(io_jobs, "EXPORT_DIR", str(tmp_path / "exports"))
+    monkeypatch.setattr(io_executor, "EXPORT_DIR", str(tmp_path / "exports"))
+    os.makedirs(tmp_path / "uploads")
+    engine = create_engine(f"sqlite:///{tmp_path / 'io.db'}")
+    # WAL lets the export's streaming reader and the progress writer overlap, as on Postgres
+    event.listen(engine, "connect", lambda conn, _: conn.execute("PRAGMA journal_mode=WAL"))
+    tables = [Buyer.__table__, ImportJob.__table__, ImportRowError.__table__, ExportJob.__table__, Lead.__table__]
+    Base.metadata.create_all(engine, tables=tables)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _write_upload(name, lines):
+    with open(io_jobs.get_upload_path(name), "w", newline="") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def test_import_streams_chunks_and_batches_errors(session_factory):
+    lines = ["name,email,price_min,markets"]
+    for i in range(250):
+        email = "not-an-email" if i % 50 == 0 else f"b{i}@example.com"
+        lines.append(f"Buyer {i},{email},{i * 1000},winnipeg")
+    _write_upload("buyers.csv", lines)
+    db = session_factory()
+    job = ImportJob(org_id=1, kind="buyers", src_filename="buyers.csv")
+    db.add(job)
+    db.commit()
+
+    io_executor.run_import_job(job.id, session_factory=session_factory, chunk_rows=40)
+
+    db.expire_all()
+    job = db.get(ImportJob, job.id)
+    assert job.status == "completed"
+    assert (job.total_rows, job.success_rows, job.error_rows) == (250, 245, 5)
+    assert job.bytes_done == job.bytes_total == os.path.getsize(io_jobs.get_upload_path("buyers.csv"))
+    assert job.rows_per_sec > 0 and job.eta_seconds == 0.0
+    assert db.query(Buyer).count() == 245
+    errors = db.query(ImportRowError).filter(ImportRowError.job_id == job.id).all()
+    assert sorted(e.row_number for e in errors) == [2, 52, 102, 152, 202]
+    db.close()
+
+
+def test_import_unknown_kind_fails_job(session_factory):
+    _write_upload("x.csv", ["a"])
+    db = session_factory()
+    job = ImportJob(org_id=1, kind="widgets", src_filename="x.csv")
+    db.add(job)
+    db.commit()
+    io_executor.run_import_job(job.id, session_factory=session_factory)
+    db.expire_all()
+    job = db.get(ImportJob, job.id)
+    assert job.status == "failed" and "unsupported kind" in job.error_message
+    db.close()
+
+
+def test_export_streams_to_csv(session_factory):
+    db = session_factory()
+    db.add_all([Buyer(name=f"B{i}", email=f"b{i}@x.com", markets="m" if i % 2 else "n") for i in range(101)])
+    job = ExportJob(org_id=1, kind="buyers", filters={"markets": "m"})
+    db.add(job)
+    db.commit()
+
+    io_executor.run_export_job(job.id, session_factory=session_factory, chunk_rows=7)
+
+    db.expire_all()
+    job = db.get(ExportJob, job.id)
+    assert job.status == "completed" and job.file_type == "text/csv"
+    assert job.total_rows == job.processed_rows == 50
+    path = io_jobs.get_export_path(job.out_filename)
+    with open(path, newline="") as f:
+        lines = f.read().splitlines()
+    assert lines[0].startswith("id,name,email")
+    assert len(lines) == 51
+    assert job.bytes_done == os.path.getsize(path)
+    db.close()
+
+
+def test_export_is_scoped_to_the_jobs_org(session_factory):
+    db = session_factory()
+    db.add_all([Lead(name=f"mine{i}", org_id=1, status="new") for i in range(3)])
+    db.add_all([Lead(name=f"theirs{i}", org_id=2, status="new") for i in range(4)])
+    job = ExportJob(org_id=1, kind="leads", filters={"status": "new", "org_id": 2})
+    db.add(job)
+    db.commit()
+
+    io_executor.run_export_job(job.id, session_factory=session_factory)
+
+    db.expire_all()
+    job = db.get(ExportJob, job.id)
+    assert job.status == "completed" and job.total_rows == 3
+    with open(io_jobs.get_export_path(job.out_filename), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert sorted(r["name"] for r in rows) == ["mine0", "mine1", "mine2"]
+    assert {r["org_id"] for r in rows} == {"1"}
+    db.close()
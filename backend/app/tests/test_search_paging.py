@@ -0,0 +1,128 @@
+import os
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test_search_paging.db")
+
+import pytest
+from sqlalchemy import Column, Float, Integer, String, create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.core.db import Base
+from app.models.saved_view import RecentSearch
+from app.services import query_builder
+from app.services.query_builder import CountCache, paginate_keyset, query_fingerprint
+from app.services.recent_searches import RecentSearchBuffer
+
+Local = declarative_base()
+
+
+class Item(Local):
+    __tablename__ = "items"
+    id = Column(Integer, primary_key=True)
+    org_id = Column(Integer, nullable=False)
+    status = Column(String)
+    price = Column(Float)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    Local.metadata.create_all(engine)
+    Base.metadata.create_all(engine, tables=[RecentSearch.__table__])
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    for i in range(1, 58):
+        # few distinct prices and some NULLs, so ties and NULL ordering are exercised
+        db.add(Item(id=i, org_id=1, status="open" if i % 3 else "won", price=None if i % 7 == 0 else float(i % 5)))
+    db.commit()
+    db.close()
+    yield factory
+    engine.dispose()
+
+
+def _walk(db, sort, size):
+    q = db.query(Item).filter(Item.org_id == 1)
+    seen, cursor, pages = [], None, 0
+    while True:
+        rows, cursor = paginate_keyset(q, Item, sort, cursor, size, fingerprint="fp")
+        seen.extend(rows)
+        pages += 1
+        if cursor is None:
+            return seen, pages
+
+
+@pytest.mark.parametrize(
+    "sort",
+    [
+        None,
+        [{"field": "price", "dir": "asc"}],
+        [{"field": "price", "dir": "desc"}, {"field": "status", "dir": "asc"}],
+        [{"field": "status", "dir": "desc"}, {"field": "id", "dir": "desc"}],
+    ],
+)
+def test_keyset_pages_cover_every_row_once_in_sort_order(session_factory, sort):
+    db = session_factory()
+    rows, pages = _walk(db, sort, size=10)
+    assert pages == 6
+    assert sorted(r.id for r in rows) == list(range(1, 58))
+
+    expected = sorted(rows, key=lambda r: r.id)
+    for name, _, desc in reversed(query_builder.sort_keys(Item, sort)):
+        # stable sorts from the last key to the first; NULLs last in both directions
+        present = [r for r in expected if getattr(r, name) is not None]
+        expected = sorted(present, key=lambda r: getattr(r, name), reverse=desc) + [
+            r for r in expected if getattr(r, name) is None
+        ]
+    assert [r.id for r in rows] == [r.id for r in expected]
+    db.close()
+
+
+def test_cursor_is_bound_to_its_query(session_factory):
+    db = session_factory()
+    q = db.query(Item)
+    _, cursor = paginate_keyset(q, Item, [{"field": "price"}], None, 5, fingerprint=query_fingerprint("a"))
+    with pytest.raises(ValueError):
+        paginate_keyset(q, Item, [{"field": "price"}], cursor, 5, fingerprint=query_fingerprint("b"))
+    with pytest.raises(ValueError):
+        paginate_keyset(q, Item, None, "not-a-cursor", 5)
+    db.close()
+
+
+def test_totals_are_cached_by_normalized_filters(session_factory, monkeypatch):
+    cache = CountCache(ttl=60, max_entries=2)
+    monkeypatch.setattr(query_builder, "count_cache", cache)
+    a = {"and": [{"field": "status", "op": "in", "value": ["won", "open"]}, {"field": "price", "op": ">", "value": 1}]}
+    b = {"and": [{"field": "price", "op": ">", "value": 1}, {"field": "status", "op": "in", "value": ["open", "won"]}]}
+    assert query_fingerprint(a) == query_fingerprint(b) != query_fingerprint(None)
+
+    db = session_factory()
+    q = query_builder.apply_filters(db.query(Item), Item, a)
+    total, _ = query_builder.paginate(q, page=2, size=5, count_key=query_fingerprint(a))
+    db.add(Item(id=100, org_id=1, status="won", price=4.0))
+    db.commit()
+    assert query_builder.paginate(q, page=1, size=5, count_key=query_fingerprint(b))[0] == total
+    assert query_builder.paginate(q, page=1, size=5)[0] == total + 1
+    cache.clear()
+    assert query_builder.count_cached(q, query_fingerprint(a)) == total + 1
+    db.close()
+
+
+def test_recent_searches_are_written_in_batches(session_factory):
+    buf = RecentSearchBuffer(session_factory=session_factory, flush_seconds=30, batch_size=50, max_pending=100)
+    for i in range(120):
+        buf.add(1, 7, "deals", {"filters": None, "n": i})
+    assert buf.dropped == 20 and buf.pending() == 100
+
+    db = session_factory()
+    assert db.query(RecentSearch).count() == 0  # nothing written on the request path
+    assert buf.flush() == 100
+    rows = db.query(RecentSearch).order_by(RecentSearch.id).all()
+    assert [r.query["n"] for r in rows] == list(range(20, 120))
+    assert all(r.created_at is not None for r in rows)
+
+    buf.start()
+    for i in range(50):
+        buf.add(1, 7, "deals", {"n": i})  # a full batch wakes the writer
+    buf.stop()
+    assert db.query(RecentSearch).count() == 150 and buf.stats()["pending"] == 0
+    db.close()
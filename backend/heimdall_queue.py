@@ -0,0 +1,256 @@
+"""Claim/lease protocol for the Heimdall file queue.
+
+A pending task is a ``*.yaml`` file in ``queue_dir``. A worker owns a task once
+it has renamed it into ``queue_dir/inflight/<worker_id>/``: rename is atomic on
+one filesystem, so exactly one of several competing workers (threads, asyncio
+tasks or processes) wins and the losers just move on to the next file.
+
+Every claim writes a lease (``inflight/.leases/<name>.json``) with an expiry
+timestamp and the attempt count. A worker that dies (or overruns its lease
+without renewing it) leaves its task behind in its inflight dir;
+``reclaim_expired`` moves such tasks back into ``queue_dir`` for a retry, or
+into ``queue_dir/failed/`` once ``max_attempts`` is reached.
+
+``DirWatcher`` wakes consumers on new files through inotify (Linux, via libc)
+and degrades to plain timed polling everywhere else.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import socket
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def default_worker_id(index: int = 0) -> str:
+    return f"{socket.gethostname()}-{os.getpid()}-{index}"
+
+
+@dataclass
+class Claim:
+    name: str
+    path: Path  # current location under inflight/<worker_id>/
+    worker_id: str
+    attempts: int
+    expires_at: float
+
+
+class ClaimQueue:
+    def __init__(
+        self,
+        queue_dir: Path,
+        lease_seconds: float = 900.0,
+        max_attempts: int = 3,
+        patterns: Tuple[str, ...] = ("*.yaml",),
+        skip_suffixes: Tuple[str, ...] = (".done.yaml",),
+    ):
+        self.queue_dir = Path(queue_dir)
+        self.inflight_dir = self.queue_dir / "inflight"
+        self.lease_dir = self.inflight_dir / ".leases"
+        self.failed_dir = self.queue_dir / "failed"
+        self.lease_seconds = float(lease_seconds)
+        self.max_attempts = max(1, int(max_attempts))
+        self.patterns = patterns
+        self.skip_suffixes = skip_suffixes
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+
+    # ---- discovery ----
+
+    def is_task(self, path: Path) -> bool:
+        name = path.name
+        return (
+            not name.startswith(".")
+            and any(path.match(p) for p in self.patterns)
+            and not any(name.endswith(s) for s in self.skip_suffixes)
+        )
+
+    def pending(self) -> List[Path]:
+        """Unclaimed task files, oldest name first (same order the old glob loop used)."""
+        seen: Dict[str, Path] = {}
+        for pat in self.patterns:
+            for p in self.queue_dir.glob(pat):
+                if self.is_task(p):
+                    seen[p.name] = p
+        return [seen[k] for k in sorted(seen)]
+
+    def inflight(self) -> List[Path]:
+        return [p for d in self._worker_dirs() for p in d.iterdir() if p.is_file()]
+
+    def _worker_dirs(self) -> List[Path]:
+        try:
+            return [d for d in self.inflight_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
+        except FileNotFoundError:
+            return []
+
+    # ---- leases ----
+
+    def _lease_path(self, name: str) -> Path:
+        return self.lease_dir / f"{name}.json"
+
+    def _read_lease(self, name: str) -> Dict[str, Any]:
+        try:
+            return json.loads(self._lease_path(name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_lease(self, name: str, lease: Dict[str, Any]) -> None:
+        path = self._lease_path(name)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(lease), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # ---- claim lifecycle ----
+
+    def claim(self, path: Path, worker_id: str) -> Optional[Claim]:
+        """Atomically take ``path``; None when another worker already has it."""
+        wdir = self.inflight_dir / worker_id
+        target = wdir / path.name
+        for _ in range(2):
+            wdir.mkdir(parents=True, exist_ok=True)
+            try:
+                os.rename(path, target)
+                break
+            except FileNotFoundError:
+                # lost the race, unless a reclaim sweep removed our (empty) dir in between
+                if not path.exists():
+                    return None
+        else:
+            return None
+        now = time.time()
+        attempts = int(self._read_lease(path.name).get("attempts", 0)) + 1
+        expires = now + self.lease_seconds
+        self._write_lease(
+            path.name,
+            {"worker": worker_id, "pid": os.getpid(), "claimed_at": now, "expires_at": expires, "attempts": attempts},
+        )
+        return Claim(name=path.name, path=target, worker_id=worker_id, attempts=attempts, expires_at=expires)
+
+    def renew(self, claim: Claim) -> None:
+        claim.expires_at = time.time() + self.lease_seconds
+        lease = self._read_lease(claim.name)
+        lease.update(worker=claim.worker_id, expires_at=claim.expires_at, attempts=claim.attempts)
+        self._write_lease(claim.name, lease)
+
+    def done(self, claim: Claim) -> None:
+        """Drop the lease once the task file has been moved out of inflight."""
+        try:
+            self._lease_path(claim.name).unlink()
+        except FileNotFoundError:
+            pass
+
+    def release(self, claim: Claim) -> bool:
+        """Hand a claimed task back to the queue right away (keeps the attempt count)."""
+        try:
+            os.rename(claim.path, self.queue_dir / claim.name)
+        except FileNotFoundError:
+            return False
+        lease = self._read_lease(claim.name)
+        lease.update(worker=None, expires_at=0)
+        self._write_lease(claim.name, lease)
+        return True
+
+    def reclaim_expired(self, now: Optional[float] = None) -> Dict[str, int]:
+        """Return tasks with expired leases to the queue (or to failed/ after max_attempts)."""
+        now = time.time() if now is None else now
+        requeued = failed = 0
+        for wdir in self._worker_dirs():
+            for p in list(wdir.iterdir()):
+                lease = self._read_lease(p.name)
+                try:
+                    expires = float(lease.get("expires_at") or (p.stat().st_mtime + self.lease_seconds))
+                except FileNotFoundError:
+                    continue  # finished while we looked
+                if expires > now:
+                    continue
+                give_up = int(lease.get("attempts", 1)) >= self.max_attempts
+                dest = (self.failed_dir if give_up else self.queue_dir) / p.name
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.rename(p, dest)
+                except FileNotFoundError:
+                    continue
+                if give_up:
+                    self.done(Claim(p.name, dest, "", 0, 0.0))
+                    failed += 1
+                else:
+                    lease.update(worker=None, expires_at=0)
+                    self._write_lease(p.name, lease)
+                    requeued += 1
+            try:
+                wdir.rmdir()  # only succeeds once a dead worker's dir is empty
+            except OSError:
+                pass
+        return {"requeued": requeued, "failed": failed}
+
+
+# inotify(7) flags
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_EVENT_HDR = struct.Struct("iIII")
+
+
+class DirWatcher:
+    """New-file notifications for one directory: inotify when available, else timed polling."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.fd: Optional[int] = None
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return
+            if libc.inotify_add_watch(fd, os.fsencode(str(self.path)), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+                os.close(fd)
+                return
+            self.fd = fd
+        except (OSError, AttributeError):
+            self.fd = None
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self.fd is not None
+
+    def drain(self) -> List[str]:
+        """Names of files written/moved into the directory since the last call (non-blocking)."""
+        if self.fd is None:
+            return []
+        names: List[str] = []
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return names
+            if not buf:
+                return names
+            off = 0
+            while off + _EVENT_HDR.size <= len(buf):
+                _, _, _, ln = _EVENT_HDR.unpack_from(buf, off)
+                off += _EVENT_HDR.size
+                name = buf[off:off + ln].rstrip(b"\0").decode("utf-8", "replace")
+                off += ln
+                if name:
+                    names.append(name)
+
+    def wait(self, timeout: float) -> List[str]:
+        """Block up to ``timeout`` seconds for new files (just sleeps when polling)."""
+        if self.fd is None:
+            time.sleep(timeout)
+            return []
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        return self.drain() if ready else []
+
+    def close(self) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
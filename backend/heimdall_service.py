@@ -1,3 +1,4 @@
+from backend.heimdall_queue import ClaimQueue, DirWatcher, default_worker_id
 from backend.notify import post_discord
 
 
@@ -501,14 +502,15 @@ def start_scheduler(cfg: Dict[str, Any]):
 
 
 # ---------- task router / watcher ----------
-async def process_task(task_path: Path, cfg: Dict[str, Any]) -> None:
+async def process_task(task_path: Path, cfg: Dict[str, Any], done_dir: Path | None = None) -> bool:
+    """Run one task file; on success rename it to ``<name>.done.yaml`` in ``done_dir`` (default: beside it)."""
     try:
         data = yaml.safe_load(task_path.read_text(encoding="utf-8")) or {}
     except Exception:
         # YAML parse error
         log.exception("YAML parse error in %s", task_path)
         _metrics_bump(cfg, "parse_error", False)
-        return
+        return False
     t = data.get("type", "task")
     try:
         if t == "scaffold_route":
@@ -566,11 +568,15 @@ async def process_task(task_path: Path, cfg: Dict[str, Any]) -> None:
             log.warning("Unknown task type %r in %s", t, task_path.name)
             _metrics_bump(cfg, "unknown", False)
         done = task_path.with_suffix(cfg.get("processed_suffix", ".done.yaml"))
+        if done_dir is not None:
+            done = Path(done_dir) / done.name
         task_path.rename(done)
         log.info("Processed %s -> %s", task_path.name, done.name)
+        return True
     except Exception:
         log.exception("Failed processing %s", task_path)
         _metrics_bump(cfg, "exception", False)
+        return False
 
 
 # ---------- spec → bundle fan-out ----------
@@ -643,16 +649,37 @@ async def process_spec(task: Dict[str, Any], cfg: Dict[str, Any]) -> None:
     # metrics recorded at the time sub-tasks are processed
 
 
+async def _renew_lease(claims: ClaimQueue, claim) -> None:
+    while True:
+        await asyncio.sleep(max(1.0, claims.lease_seconds / 3))
+        claims.renew(claim)
+
+
 async def watch_queue(cfg: Dict[str, Any]) -> None:
+    """
+    One discovery loop feeds a shared asyncio.Queue; ``max_concurrency`` workers pull
+    from it and claim each file (atomic rename into inflight/<worker>/) before running it,
+    so concurrent workers - and other Heimdall processes on the same queue dir - never
+    process the same task twice. New files wake the feeder via inotify; ``poll_seconds``
+    is the fallback rescan interval and the lease sweep cadence.
+    """
     qdir = Path(cfg["queue_dir"])
     qdir.mkdir(parents=True, exist_ok=True)
     poll = int(cfg.get("poll_seconds", 2))
     rl_cfg = get_rate_limit_cfg(cfg)
     queue_status["max_concurrency"] = rl_cfg["max_concurrency"]
     queue_status["throttle"] = rl_cfg["throttle_seconds"]
+    claims = ClaimQueue(
+        qdir,
+        lease_seconds=float(cfg.get("lease_seconds", (cfg.get("jobs", {}) or {}).get("max_seconds", 900))),
+        max_attempts=int(cfg.get("max_attempts", 3)),
+        skip_suffixes=(cfg.get("processed_suffix", ".done.yaml"),),
+    )
+    watcher = DirWatcher(qdir)
     log.info(
-        "Watching %s every %ss (dry_run=%s, max_concurrency=%s, throttle=%ss)",
+        "Watching %s (%s, rescan every %ss, dry_run=%s, max_concurrency=%s, throttle=%ss)",
         qdir,
+        "inotify" if watcher.uses_inotify else "polling",
         poll,
         cfg.get("dry_run", True),
         rl_cfg["max_concurrency"],
@@ -665,29 +692,71 @@ async def watch_queue(cfg: Dict[str, Any]) -> None:
     except Exception:
         log.warning("could not start alert watcher", exc_info=True)
 
-    async def worker():
+    tasks: asyncio.Queue = asyncio.Queue()
+    queued: set = set()
+    wake = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    if watcher.uses_inotify:
+        loop.add_reader(watcher.fd, lambda: watcher.drain() and wake.set())
+
+    async def feeder():
+        while True:
+            wake.clear()
+            try:
+                res = claims.reclaim_expired()
+                if res["requeued"] or res["failed"]:
+                    log.warning("Reclaimed expired leases: %s", res)
+                pending = claims.pending()
+                for p in pending:
+                    if p.name not in queued:
+                        queued.add(p.name)
+                        tasks.put_nowait(p)
+                queue_status["pending"] = len(pending)
+            except Exception:
+                log.exception("queue scan failed")
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=poll)
+            except asyncio.TimeoutError:
+                pass
+
+    async def worker(i: int):
+        worker_id = default_worker_id(i)
         while True:
             update_queue_heartbeat()
             if is_queue_paused():
                 queue_status["last_status"] = "paused"
                 await asyncio.sleep(1)
                 continue
+            p = await tasks.get()
+            queued.discard(p.name)
+            claim = claims.claim(p, worker_id)
+            if claim is None:
+                continue  # another worker/process took it
             queue_status["last_status"] = "active"
-            for p in sorted(qdir.glob("*.yaml")):
-                if p.name.endswith(cfg.get("processed_suffix", ".done.yaml")):
-                    continue
-                await process_task(p, cfg)
-                if rl_cfg["throttle_seconds"] > 0:
-                    await asyncio.sleep(rl_cfg["throttle_seconds"])
-            await asyncio.sleep(poll)
+            renew = asyncio.create_task(_renew_lease(claims, claim))
+            try:
+                ok = await process_task(claim.path, cfg, done_dir=qdir)
+            finally:
+                renew.cancel()
+            if ok:
+                claims.done(claim)
+            # on failure the file stays in inflight/ and is retried once its lease expires
+            update_queue_heartbeat()
+            if rl_cfg["throttle_seconds"] > 0:
+                await asyncio.sleep(rl_cfg["throttle_seconds"])
 
     # Launch up to max_concurrency workers
-    workers = []
+    workers = [asyncio.create_task(feeder())]
     for i in range(rl_cfg["max_concurrency"]):
-        w = asyncio.create_task(worker())
+        w = asyncio.create_task(worker(i))
         workers.append(w)
-    queue_status["active_workers"] = len(workers)
-    await asyncio.gather(*workers)
+    queue_status["active_workers"] = len(workers) - 1
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        if watcher.uses_inotify:
+            loop.remove_reader(watcher.fd)
+        watcher.close()
 
 
 def _attach_file_logging(cfg: Dict[str, Any]):
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 
 from backend.storage.factory import get_storage
+from backend.storage.stream import aiter_upload
 from backend.storage.util import build_key
 from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
 
@@ -46,19 +47,28 @@ async def upload_local(
     from backend.storage.local import LocalStorage
 
     storage = LocalStorage()
-    data = await file.read()
-    dest = (storage.UPLOAD_ROOT / key).resolve()
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    with open(dest, "wb") as f:
-        f.write(data)
+    try:
+        dest = storage._path(key)
+    except ValueError:
+        raise HTTPException(400, "Invalid key")
+    # chunked, off the event loop; identical content is stored once
+    stored = await storage.save_stream(key, aiter_upload(file), content_type)
 
     # Scan after saving
     from backend.security.malware_scan import scan_file
 
     clean, msg = await scan_file(str(dest))
     if not clean:
-        os.remove(dest)
+        await storage.discard(stored)  # the blob too, unless other keys share it
         raise HTTPException(400, f"Malware detected: {msg}")
 
     dl = await storage.generate_download_url(f"uploads/{key}")
-    return {"ok": True, "download_url": dl, "key": f"uploads/{key}", "scan": msg}
+    return {
+        "ok": True,
+        "download_url": dl,
+        "key": f"uploads/{key}",
+        "scan": msg,
+        "sha256": stored["sha256"],
+        "size": stored["size"],
+        "deduped": stored["deduped"],
+    }
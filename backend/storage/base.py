@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import AsyncIterable, AsyncIterator, Iterable
+
 
 class UploadSpec(dict):
     """
@@ -18,6 +20,22 @@ class UploadSpec(dict):
     pass
 
 
+class StoredObject(dict):
+    """
+    Result of a streamed save:
+    {
+      "backend": "local"|"s3"|"gcs",
+      "key": "org_123/foo.png",
+      "sha256": "ab12...",    # content address; identical payloads share one blob
+      "size": 1234,
+      "content_type": "image/png",
+      "deduped": True         # blob already existed, nothing new was stored
+    }
+    """
+
+    pass
+
+
 class StorageAdapter:
     backend_name: str = "base"
 
@@ -35,6 +53,23 @@ class StorageAdapter:
     async def delete(self, key: str) -> None:
         raise NotImplementedError
 
+    # Streaming I/O (never holds the whole payload, never blocks the loop):
+    async def save_stream(
+        self, key: str, chunks: AsyncIterable[bytes] | Iterable[bytes], content_type: str
+    ) -> StoredObject:
+        raise NotImplementedError
+
+    def open_range(self, key: str, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        """Async iterator over bytes [start, end] (inclusive, as in an HTTP Range header)."""
+        raise NotImplementedError
+
+    async def size(self, key: str) -> int:
+        raise NotImplementedError
+
+    async def collect_garbage(self, grace_seconds: float | None = None) -> int:
+        """Remove content-addressed blobs no key references any more; returns how many."""
+        raise NotImplementedError
+
     # Local only convenience:
     async def save_bytes(self, key: str, data: bytes, content_type: str) -> str:
         raise NotImplementedError
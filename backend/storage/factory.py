@@ -4,19 +4,20 @@ from backend.storage.base import StorageAdapter
 from backend.storage.local import LocalStorage
 
 try:
-    from backend.storage.s3 import S3Storage
+    from backend.storage.s3 import S3Storage, aioboto3
 except Exception:
-    S3Storage = None
+    S3Storage = aioboto3 = None
 try:
     from backend.storage.gcs import GCSStorage
+    from backend.storage.gcs import storage as gcs_sdk
 except Exception:
-    GCSStorage = None
+    GCSStorage = gcs_sdk = None
 
 
 def get_storage() -> StorageAdapter:
     backend = os.getenv("STORAGE_BACKEND", "local").lower()
-    if backend == "s3" and S3Storage:
+    if backend == "s3" and S3Storage and aioboto3:
         return S3Storage()
-    if backend == "gcs" and GCSStorage:
+    if backend == "gcs" and GCSStorage and gcs_sdk:
         return GCSStorage()
     return LocalStorage()
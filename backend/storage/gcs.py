@@ -2,16 +2,29 @@ from __future__ import annotations
 
 import json
 import os
+from datetime import datetime, timedelta, timezone
 
-from backend.storage.base import StorageAdapter, UploadSpec
-from google.cloud import storage
-from google.oauth2 import service_account
+from backend.storage.base import StorageAdapter, StoredObject, UploadSpec
+from backend.storage.stream import CAS_PREFIX, CHUNK_SIZE, GC_GRACE_SECONDS, PART_SIZE, run_io, spool
+from backend.storage.util import cas_key
+
+try:
+    from google.cloud import storage
+    from google.oauth2 import service_account
+except ImportError:  # the adapter then needs an injected client
+    storage = service_account = None
 
 GCS_BUCKET = os.getenv("STORAGE_GCS_BUCKET")
 GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID")
 SA_PATH = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
 SA_JSON = os.getenv("GCP_SERVICE_ACCOUNT_JSON")
 
+# metadata on a key that points at a content-addressed blob
+META_SHA = "cas-sha256"
+META_SIZE = "cas-size"
+# resumable uploads need a chunk size that is a multiple of 256 KiB
+_GCS_CHUNK = max(PART_SIZE // (256 * 1024), 1) * 256 * 1024
+
 
 def _client():
     if SA_JSON:
@@ -23,20 +36,51 @@ def _client():
 
 
 class GCSStorage(StorageAdapter):
+    """
+    Same layout as S3Storage: streamed saves go once to ``cas/<sha256>``
+    (a chunked resumable upload) and the key is an empty blob whose metadata
+    points there. The google client is blocking, so every call runs on the
+    storage I/O pool.
+    """
+
     backend_name = "gcs"
 
+    def __init__(self, client=None, bucket: str | None = None):
+        if client is None and storage is None:
+            raise RuntimeError("google-cloud-storage is not installed")
+        self._gcs = client
+        self.bucket_name = bucket or GCS_BUCKET
+
+    def _bucket(self):
+        if self._gcs is None:
+            self._gcs = _client()
+        return self._gcs.bucket(self.bucket_name)
+
+    def _resolve(self, key: str):
+        """(blob holding the bytes, size) for a key; FileNotFoundError if missing."""
+        bucket = self._bucket()
+        ref = bucket.get_blob(key)
+        if ref is None:
+            raise FileNotFoundError(key)
+        meta = ref.metadata or {}
+        if META_SHA in meta:
+            return bucket.blob(cas_key(CAS_PREFIX, meta[META_SHA])), int(meta[META_SIZE])
+        return ref, int(ref.size or 0)
+
     async def generate_download_url(self, key: str, expires_in: int = 3600) -> str:
-        client = _client()
-        bucket = client.bucket(GCS_BUCKET)
-        blob = bucket.blob(key)
-        return blob.generate_signed_url(expiration=expires_in, method="GET")
+        def _sign() -> str:
+            try:
+                blob, _ = self._resolve(key)
+            except FileNotFoundError:
+                blob = self._bucket().blob(key)
+            return blob.generate_signed_url(expiration=expires_in, method="GET")
+
+        return await run_io(_sign)
 
     async def generate_upload_url(
         self, key: str, content_type: str, expires_in: int = 3600
     ) -> UploadSpec:
-        client = _client()
-        bucket = client.bucket(GCS_BUCKET)
-        blob = bucket.blob(key)
+        blob = self._bucket().blob(key)
         url = blob.generate_signed_url(
             version="v4",
             expiration=expires_in,
@@ -53,12 +97,84 @@ class GCSStorage(StorageAdapter):
             expires_in=expires_in,
         )
 
+    async def save_stream(self, key, chunks, content_type: str) -> StoredObject:
+        f, digest, size = await spool(chunks)
+
+        def _store() -> bool:
+            bucket = self._bucket()
+            blob = bucket.blob(cas_key(CAS_PREFIX, digest))
+            deduped = blob.exists()
+            if not deduped:
+                blob.chunk_size = _GCS_CHUNK  # resumable, one request per chunk
+                blob.upload_from_file(f, size=size, content_type=content_type, rewind=True)
+            ref = bucket.blob(key)
+            ref.metadata = {META_SHA: digest, META_SIZE: str(size)}
+            ref.upload_from_string(b"", content_type=content_type)
+            return deduped
+
+        try:
+            deduped = await run_io(_store)
+        finally:
+            await run_io(f.close)
+        return StoredObject(
+            backend=self.backend_name,
+            key=key,
+            sha256=digest,
+            size=size,
+            content_type=content_type,
+            deduped=deduped,
+        )
+
+    async def save_bytes(self, key: str, data: bytes, content_type: str) -> str:
+        await self.save_stream(key, [data], content_type)
+        return key
+
+    async def open_range(self, key: str, start: int = 0, end: int | None = None):
+        blob, size = await run_io(self._resolve, key)
+        end = size - 1 if end is None else min(end, size - 1)
+        pos = start
+        while pos <= end:
+            last = min(pos + CHUNK_SIZE, end + 1) - 1
+            chunk = await run_io(lambda: blob.download_as_bytes(start=pos, end=last))
+            if not chunk:
+                return
+            yield chunk
+            pos += len(chunk)
+
+    async def size(self, key: str) -> int:
+        return (await run_io(self._resolve, key))[1]
+
     async def exists(self, key: str) -> bool:
-        client = _client()
-        bucket = client.bucket(GCS_BUCKET)
-        return bucket.blob(key).exists()
+        return await run_io(lambda: self._bucket().blob(key).exists())
 
     async def delete(self, key: str) -> None:
-        client = _client()
-        bucket = client.bucket(GCS_BUCKET)
-        bucket.blob(key).delete()
+        # drops the key (or pointer); a shared blob under cas/ stays for other keys
+        await run_io(lambda: self._bucket().blob(key).delete())
+
+    async def collect_garbage(self, grace_seconds: float | None = None) -> int:
+        """
+        Remove ``cas/`` blobs no pointer references any more and last written
+        more than ``grace_seconds`` (GC_GRACE_SECONDS) ago; returns how many.
+        Listed blobs carry their metadata, so pointers need no extra lookups.
+        """
+        grace = GC_GRACE_SECONDS if grace_seconds is None else grace_seconds
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=grace)
+        prefix = CAS_PREFIX.rstrip("/") + "/"
+
+        def _sweep() -> int:
+            bucket = self._bucket()
+            old = [b for b in bucket.list_blobs(prefix=prefix) if b.updated is not None and b.updated <= cutoff]
+            if not old:
+                return 0
+            live = {(b.metadata or {}).get(META_SHA) for b in bucket.list_blobs() if not b.name.startswith(prefix)}
+            n = 0
+            for blob in old:
+                if blob.name.rsplit("/", 1)[-1] not in live:
+                    try:
+                        blob.delete()
+                    except Exception:
+                        continue  # already gone (another sweep)
+                    n += 1
+            return n
+
+        return await run_io(_sweep)
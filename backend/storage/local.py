@@ -1,18 +1,75 @@
 from __future__ import annotations
 
+import os
+import shutil
+import threading
+import time
+import uuid
 from pathlib import Path
 
-from backend.storage.base import StorageAdapter, UploadSpec
+from backend.storage.base import StorageAdapter, StoredObject, UploadSpec
+from backend.storage.stream import CAS_PREFIX, GC_GRACE_SECONDS, read_file_range, run_io, write_chunks
+from backend.storage.util import cas_key
 from backend.utils.signed_url import generate_signed_url
 
 BASE_DIR = Path("exports").resolve()  # reuse export dir
 UPLOAD_ROOT = BASE_DIR / "uploads"
 UPLOAD_ROOT.mkdir(parents=True, exist_ok=True)
+# blobs live outside uploads/ so they are never served by path; keys are hard links
+CAS_ROOT = BASE_DIR / f".{CAS_PREFIX}"
+
+# saves (store + link) and the sweep never interleave within a process
+_cas_lock = threading.Lock()
+
+
+def _link(blob: Path, dest: Path) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}")
+    try:
+        os.link(blob, tmp)
+    except FileNotFoundError:
+        raise
+    except OSError:  # no hard links (other device / filesystem): keep a copy
+        shutil.copyfile(blob, tmp)
+    os.replace(tmp, dest)
+
+
+def _store(tmp: Path, blob: Path, dest: Path) -> bool:
+    """
+    Point ``dest`` at the blob holding tmp's content, moving tmp into the store
+    if that blob does not exist yet. Returns True if the blob was created.
+    """
+    with _cas_lock:
+        if blob.exists():
+            try:
+                _link(blob, dest)
+                tmp.unlink()
+                return False
+            except FileNotFoundError:
+                pass  # swept by another process in between: store ours
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(tmp, 0o444)  # shared by every key with this content: never write in place
+        os.replace(tmp, blob)
+        _link(blob, dest)
+        return True
 
 
 class LocalStorage(StorageAdapter):
     backend_name = "local"
 
+    def __init__(self, root: Path | None = None, cas_root: Path | None = None):
+        self.UPLOAD_ROOT = Path(root or UPLOAD_ROOT).resolve()
+        self.CAS_ROOT = Path(cas_root or CAS_ROOT).resolve()
+
+    def _blob(self, digest: str) -> Path:
+        return self.CAS_ROOT / cas_key("", digest)
+
+    def _path(self, key: str) -> Path:
+        p = (self.UPLOAD_ROOT / key).resolve()
+        if not p.is_relative_to(self.UPLOAD_ROOT):
+            raise ValueError(f"key escapes upload root: {key}")
+        return p
+
     async def generate_download_url(self, key: str, expires_in: int = 3600) -> str:
         # key is relative to exports/, so compose path for signed link
         rel = str(key)
@@ -32,18 +89,79 @@ class LocalStorage(StorageAdapter):
             expires_in=expires_in,
         )
 
+    async def save_stream(self, key, chunks, content_type: str) -> StoredObject:
+        dest = self._path(key)
+        tmp_dir = self.CAS_ROOT / "tmp"
+        await run_io(lambda: tmp_dir.mkdir(parents=True, exist_ok=True))
+        tmp = tmp_dir / uuid.uuid4().hex
+        f = await run_io(open, tmp, "wb")
+        try:
+            digest, size = await write_chunks(f, chunks)
+        except BaseException:
+            await run_io(f.close)
+            await run_io(lambda: tmp.unlink(missing_ok=True))
+            raise
+        await run_io(f.close)
+        created = await run_io(_store, tmp, self._blob(digest), dest)
+        return StoredObject(
+            backend=self.backend_name,
+            key=key,
+            sha256=digest,
+            size=size,
+            content_type=content_type,
+            deduped=not created,
+        )
+
     async def save_bytes(self, key: str, data: bytes, content_type: str) -> str:
-        dest = (UPLOAD_ROOT / key).resolve()
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        with open(dest, "wb") as f:
-            f.write(data)
+        await self.save_stream(key, [data], content_type)
         # return a path usable by /api/files/download signed route
         return f"uploads/{key}"
 
+    def open_range(self, key: str, start: int = 0, end: int | None = None):
+        return read_file_range(self._path(key), start, end)
+
+    async def size(self, key: str) -> int:
+        return await run_io(os.path.getsize, self._path(key))
+
     async def exists(self, key: str) -> bool:
-        return (UPLOAD_ROOT / key).exists()
+        return self._path(key).exists()
 
     async def delete(self, key: str) -> None:
-        p = UPLOAD_ROOT / key
+        p = self._path(key)
         if p.exists():
-            p.unlink()
+            await run_io(p.unlink)
+
+    async def discard(self, stored: StoredObject) -> None:
+        """
+        Undo a save_stream (e.g. a rejected upload): drop the key and, when that
+        save created the blob and no other key links to it, the blob itself.
+        """
+        dest, blob = self._path(stored["key"]), self._blob(stored["sha256"])
+
+        def _drop() -> None:
+            with _cas_lock:
+                dest.unlink(missing_ok=True)
+                if not stored["deduped"] and blob.exists() and blob.stat().st_nlink <= 1:
+                    blob.unlink()
+
+        await run_io(_drop)
+
+    async def collect_garbage(self, grace_seconds: float | None = None) -> int:
+        """
+        Remove blobs no key links to any more (hard-link count 1) and untouched
+        for ``grace_seconds`` (GC_GRACE_SECONDS); returns how many.
+        """
+        grace = GC_GRACE_SECONDS if grace_seconds is None else grace_seconds
+
+        def _sweep() -> int:
+            n = 0
+            cutoff = time.time() - grace
+            with _cas_lock:
+                for blob in self.CAS_ROOT.glob("??/*"):
+                    st = blob.stat()
+                    if st.st_nlink <= 1 and st.st_ctime <= cutoff:
+                        blob.unlink()
+                        n += 1
+            return n
+
+        return await run_io(_sweep)
@@ -1,33 +1,72 @@
 from __future__ import annotations
 
 import os
+import time
 
-import aioboto3
-from backend.storage.base import StorageAdapter, UploadSpec
+from backend.storage.base import StorageAdapter, StoredObject, UploadSpec
+from backend.storage.stream import CAS_PREFIX, CHUNK_SIZE, GC_GRACE_SECONDS, PART_SIZE, run_io, spool
+from backend.storage.util import cas_key
+
+try:
+    import aioboto3
+except ImportError:  # the adapter then needs an injected client
+    aioboto3 = None
 
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 S3_BUCKET = os.getenv("STORAGE_S3_BUCKET")
 
+# metadata on a key that points at a content-addressed blob
+META_SHA = "cas-sha256"
+META_SIZE = "cas-size"
+
+
+def _session_client():
+    return aioboto3.Session().client("s3", region_name=AWS_REGION)
+
 
 class S3Storage(StorageAdapter):
+    """
+    Streamed saves are content-addressed: the payload is spooled and hashed,
+    uploaded once to ``cas/<sha256>`` (multipart above PART_SIZE) unless that
+    blob already exists, and the key itself becomes an empty object whose
+    metadata points at the blob. Downloads and range reads resolve the pointer;
+    keys written by presigned uploads are plain objects and are read as-is.
+    """
+
     backend_name = "s3"
 
+    def __init__(self, client_factory=None, bucket: str | None = None):
+        if client_factory is None and aioboto3 is None:
+            raise RuntimeError("aioboto3 is not installed")
+        self._client = client_factory or _session_client
+        self.bucket = bucket or S3_BUCKET
+
+    async def _resolve(self, s3, key: str) -> tuple[str, int]:
+        """(object key holding the bytes, size) for a key."""
+        head = await s3.head_object(Bucket=self.bucket, Key=key)
+        meta = head.get("Metadata") or {}
+        if META_SHA in meta:
+            return cas_key(CAS_PREFIX, meta[META_SHA]), int(meta[META_SIZE])
+        return key, int(head["ContentLength"])
+
     async def generate_download_url(self, key: str, expires_in: int = 3600) -> str:
-        session = aioboto3.Session()
-        async with session.client("s3", region_name=AWS_REGION) as s3:
+        async with self._client() as s3:
+            try:
+                target, _ = await self._resolve(s3, key)
+            except Exception:
+                target = key  # not uploaded yet: presign the key itself
             return await s3.generate_presigned_url(
                 "get_object",
-                Params={"Bucket": S3_BUCKET, "Key": key},
+                Params={"Bucket": self.bucket, "Key": target},
                 ExpiresIn=expires_in,
             )
 
     async def generate_upload_url(
         self, key: str, content_type: str, expires_in: int = 3600
     ) -> UploadSpec:
-        session = aioboto3.Session()
-        async with session.client("s3", region_name=AWS_REGION) as s3:
+        async with self._client() as s3:
             presigned = await s3.generate_presigned_post(
-                Bucket=S3_BUCKET,
+                Bucket=self.bucket,
                 Key=key,
                 Fields={"Content-Type": content_type},
                 Conditions=[
@@ -46,16 +85,136 @@ class S3Storage(StorageAdapter):
                 expires_in=expires_in,
             )
 
+    async def _upload(self, s3, blob_key: str, f, size: int, content_type: str) -> None:
+        if size <= PART_SIZE:
+            body = await run_io(f.read)
+            await s3.put_object(Bucket=self.bucket, Key=blob_key, Body=body, ContentType=content_type)
+            return
+        mpu = await s3.create_multipart_upload(Bucket=self.bucket, Key=blob_key, ContentType=content_type)
+        upload_id = mpu["UploadId"]
+        parts = []
+        try:
+            while True:
+                body = await run_io(f.read, PART_SIZE)
+                if not body:
+                    break
+                n = len(parts) + 1
+                part = await s3.upload_part(
+                    Bucket=self.bucket, Key=blob_key, UploadId=upload_id, PartNumber=n, Body=body
+                )
+                parts.append({"PartNumber": n, "ETag": part["ETag"]})
+            await s3.complete_multipart_upload(
+                Bucket=self.bucket, Key=blob_key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            await s3.abort_multipart_upload(Bucket=self.bucket, Key=blob_key, UploadId=upload_id)
+            raise
+
+    async def save_stream(self, key, chunks, content_type: str) -> StoredObject:
+        f, digest, size = await spool(chunks)
+        blob_key = cas_key(CAS_PREFIX, digest)
+        try:
+            async with self._client() as s3:
+                try:
+                    await s3.head_object(Bucket=self.bucket, Key=blob_key)
+                    deduped = True
+                except Exception:
+                    deduped = False
+                    await self._upload(s3, blob_key, f, size, content_type)
+                await s3.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=b"",
+                    ContentType=content_type,
+                    Metadata={META_SHA: digest, META_SIZE: str(size)},
+                )
+        finally:
+            await run_io(f.close)
+        return StoredObject(
+            backend=self.backend_name,
+            key=key,
+            sha256=digest,
+            size=size,
+            content_type=content_type,
+            deduped=deduped,
+        )
+
+    async def save_bytes(self, key: str, data: bytes, content_type: str) -> str:
+        await self.save_stream(key, [data], content_type)
+        return key
+
+    async def open_range(self, key: str, start: int = 0, end: int | None = None):
+        async with self._client() as s3:
+            target, size = await self._resolve(s3, key)
+            end = size - 1 if end is None else min(end, size - 1)
+            if start > end:
+                return
+            resp = await s3.get_object(Bucket=self.bucket, Key=target, Range=f"bytes={start}-{end}")
+            body = resp["Body"]
+            try:
+                while True:
+                    chunk = await body.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+            finally:
+                body.close()
+
+    async def size(self, key: str) -> int:
+        async with self._client() as s3:
+            return (await self._resolve(s3, key))[1]
+
     async def exists(self, key: str) -> bool:
-        session = aioboto3.Session()
-        async with session.client("s3", region_name=AWS_REGION) as s3:
+        async with self._client() as s3:
             try:
-                await s3.head_object(Bucket=S3_BUCKET, Key=key)
+                await s3.head_object(Bucket=self.bucket, Key=key)
                 return True
             except Exception:
                 return False
 
     async def delete(self, key: str) -> None:
-        session = aioboto3.Session()
-        async with session.client("s3", region_name=AWS_REGION) as s3:
-            await s3.delete_object(Bucket=S3_BUCKET, Key=key)
+        # drops the key (or pointer); a shared blob under cas/ stays for other keys
+        async with self._client() as s3:
+            await s3.delete_object(Bucket=self.bucket, Key=key)
+
+    async def _list(self, s3, prefix: str = "") -> list[dict]:
+        out, token = [], None
+        while True:
+            kw = {"Bucket": self.bucket, "Prefix": prefix}
+            if token:
+                kw["ContinuationToken"] = token
+            page = await s3.list_objects_v2(**kw)
+            out.extend(page.get("Contents", []))
+            if not page.get("IsTruncated"):
+                return out
+            token = page["NextContinuationToken"]
+
+    async def collect_garbage(self, grace_seconds: float | None = None) -> int:
+        """
+        Remove ``cas/`` blobs no pointer references any more and last written
+        more than ``grace_seconds`` (GC_GRACE_SECONDS) ago; returns how many.
+        Blobs are listed before pointers, so a save that dedupes onto a blob
+        while the sweep runs still has its pointer seen.
+        """
+        grace = GC_GRACE_SECONDS if grace_seconds is None else grace_seconds
+        cutoff = time.time() - grace
+        prefix = CAS_PREFIX.rstrip("/") + "/"
+        async with self._client() as s3:
+            old = [o["Key"] for o in await self._list(s3, prefix) if o["LastModified"].timestamp() <= cutoff]
+            if not old:
+                return 0
+            live = set()
+            for o in await self._list(s3):
+                if o["Key"].startswith(prefix) or o["Size"]:
+                    continue  # pointers are empty; non-empty keys are plain uploads
+                try:
+                    head = await s3.head_object(Bucket=self.bucket, Key=o["Key"])
+                except Exception:
+                    continue  # deleted since the listing
+                live.add((head.get("Metadata") or {}).get(META_SHA))
+            n = 0
+            for blob_key in old:
+                if blob_key.rsplit("/", 1)[-1] not in live:
+                    await s3.delete_object(Bucket=self.bucket, Key=blob_key)
+                    n += 1
+            return n
@@ -0,0 +1,117 @@
+"""
+Chunked I/O helpers shared by the storage adapters.
+
+Blocking file work (writes, reads, hashing) runs on a small module-level
+thread pool so an upload or download never stalls the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable
+
+CHUNK_SIZE = int(os.getenv("STORAGE_CHUNK_SIZE", str(1024 * 1024)))
+# S3 needs >= 5 MiB per part (except the last); GCS wants multiples of 256 KiB
+PART_SIZE = max(int(os.getenv("STORAGE_MULTIPART_PART_SIZE", str(8 * 1024 * 1024))), 5 * 1024 * 1024)
+IO_WORKERS = int(os.getenv("STORAGE_IO_WORKERS", "4"))
+CAS_PREFIX = os.getenv("STORAGE_CAS_PREFIX", "cas")
+# the sweep leaves blobs touched (created / linked) this recently alone, so a
+# save in another process between storing and linking a blob is never raced
+GC_GRACE_SECONDS = float(os.getenv("STORAGE_CAS_GC_GRACE_SECONDS", "3600"))
+
+_io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="storage-io")
+
+
+async def run_io(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking call on the storage I/O pool."""
+    return await asyncio.get_running_loop().run_in_executor(_io_pool, fn, *args)
+
+
+async def aiter_bytes(data: bytes, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
+
+
+async def aiter_upload(upload: Any, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Chunks of anything with an async read(n) (e.g. fastapi.UploadFile)."""
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def coalesce(chunks: AsyncIterable[bytes] | Iterable[bytes], size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Re-chunk a stream into pieces of at least ``size`` bytes (the last may be shorter)."""
+    buf = bytearray()
+    if not hasattr(chunks, "__aiter__"):
+        chunks = _aiter(chunks)
+    async for chunk in chunks:
+        buf += chunk
+        if len(buf) >= size:
+            yield bytes(buf)
+            buf.clear()
+    if buf:
+        yield bytes(buf)
+
+
+async def _aiter(items: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for item in items:
+        yield item
+
+
+def _write(f: Any, h: Any, chunk: bytes) -> None:
+    h.update(chunk)
+    f.write(chunk)
+
+
+async def write_chunks(f: Any, chunks: AsyncIterable[bytes] | Iterable[bytes]) -> tuple[str, int]:
+    """Write a stream to an open binary file off-loop; returns (sha256 hex, size)."""
+    h = hashlib.sha256()
+    size = 0
+    async for chunk in coalesce(chunks):
+        await run_io(_write, f, h, chunk)
+        size += len(chunk)
+    await run_io(f.flush)
+    return h.hexdigest(), size
+
+
+async def spool(chunks: AsyncIterable[bytes] | Iterable[bytes]) -> tuple[Any, str, int]:
+    """
+    Buffer a stream (in memory up to PART_SIZE, then on disk) while hashing it,
+    so remote backends know the content address before uploading anything.
+    Returns (rewound file, sha256 hex, size); the caller closes the file.
+    """
+    f = tempfile.SpooledTemporaryFile(max_size=PART_SIZE)
+    try:
+        digest, size = await write_chunks(f, chunks)
+        await run_io(f.seek, 0)
+    except BaseException:
+        f.close()
+        raise
+    return f, digest, size
+
+
+def _read_range(path: str, start: int, length: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(length)
+
+
+async def read_file_range(
+    path: str | os.PathLike, start: int = 0, end: int | None = None, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield bytes [start, end] (inclusive, HTTP-style) of a local file, chunk by chunk."""
+    if end is None:
+        end = (await run_io(os.path.getsize, path)) - 1
+    pos = start
+    while pos <= end:
+        chunk = await run_io(_read_range, os.fspath(path), pos, min(chunk_size, end - pos + 1))
+        if not chunk:
+            return
+        yield chunk
+        pos += len(chunk)
@@ -12,3 +12,30 @@ def sanitize_filename(name: str) -> str:
 def build_key(base_prefix: str, org_id: str | int, filename: str) -> str:
     filename = sanitize_filename(filename)
     return str(PurePosixPath(base_prefix) / f"org_{org_id}" / filename)
+
+
+def cas_key(prefix: str, digest: str) -> str:
+    """Content-addressed location of a blob: <prefix>/ab/abcdef... (sha256 hex)."""
+    return str(PurePosixPath(prefix) / digest[:2] / digest)
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Single HTTP byte range -> inclusive (start, end) clamped to size.
+    None means "whole object"; ValueError means unsatisfiable (416).
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None  # multi-range / other units: serve the full body
+    first, _, last = spec.strip().partition("-")
+    if not first:
+        if not last or int(last) == 0:
+            raise ValueError("unsatisfiable range")
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("unsatisfiable range")
+    return start, end
@@ -0,0 +1,257 @@
+"""
+In-memory stand-ins for the S3 (aioboto3) and GCS (google-cloud-storage)
+clients, covering exactly the calls the adapters make, so the S3Storage /
+GCSStorage tests run offline.
+
+    bucket = FakeBucket()
+    S3Storage(client_factory=fake_s3_factory(bucket))
+    GCSStorage(client=FakeGCSClient(bucket))
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class FakeObject:
+    data: bytes
+    content_type: str = "application/octet-stream"
+    metadata: Dict[str, str] = field(default_factory=dict)
+    modified: float = field(default_factory=time.time)  # tests age objects by lowering this
+
+
+class FakeBucket:
+    """Objects by key, plus a log of (operation, key) so tests can assert traffic."""
+
+    def __init__(self):
+        self.objects: Dict[str, FakeObject] = {}
+        self.calls: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def record(self, op: str, key: str) -> None:
+        with self._lock:
+            self.calls.append((op, key))
+
+    def ops(self, op: str) -> List[str]:
+        return [k for o, k in self.calls if o == op]
+
+
+class FakeClientError(Exception):
+    """Shaped like botocore.exceptions.ClientError for the bits callers inspect."""
+
+    def __init__(self, code: str, op: str):
+        super().__init__(f"An error occurred ({code}) when calling the {op} operation")
+        self.response = {"Error": {"Code": code}}
+
+
+# ---- S3 ----
+
+
+class _FakeBody:
+    def __init__(self, data: bytes):
+        self._data, self._pos = data, 0
+
+    async def read(self, n: int = -1) -> bytes:
+        end = len(self._data) if n is None or n < 0 else self._pos + n
+        chunk = self._data[self._pos : end]
+        self._pos += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        pass
+
+
+class FakeS3Client:
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
+    def __init__(self, bucket: FakeBucket):
+        self.bucket = bucket
+        self._uploads: Dict[str, tuple] = {}  # upload id -> (content type, metadata, {part number: bytes})
+
+    def _get(self, key: str, op: str) -> FakeObject:
+        obj = self.bucket.objects.get(key)
+        if obj is None:
+            raise FakeClientError("404" if op == "HeadObject" else "NoSuchKey", op)
+        return obj
+
+    async def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        self.bucket.record("head", Key)
+        obj = self._get(Key, "HeadObject")
+        return {"ContentLength": len(obj.data), "ContentType": obj.content_type, "Metadata": dict(obj.metadata)}
+
+    async def get_object(self, Bucket: str, Key: str, Range: Optional[str] = None) -> Dict[str, Any]:
+        self.bucket.record("get", Key)
+        data = self._get(Key, "GetObject").data
+        if Range:
+            first, _, last = Range.split("=", 1)[1].partition("-")
+            data = data[int(first) : int(last) + 1 if last else None]
+        return {"Body": _FakeBody(data), "ContentLength": len(data)}
+
+    async def put_object(self, Bucket: str, Key: str, Body: bytes = b"", ContentType: str = "application/octet-stream",
+                         Metadata: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        self.bucket.record("put", Key)
+        self.bucket.objects[Key] = FakeObject(bytes(Body), ContentType, dict(Metadata or {}))
+        return {}
+
+    async def delete_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        self.bucket.record("delete", Key)
+        self.bucket.objects.pop(Key, None)
+        return {}
+
+    async def list_objects_v2(self, Bucket: str, Prefix: str = "", ContinuationToken: Optional[str] = None,
+                              MaxKeys: int = 1000) -> Dict[str, Any]:
+        self.bucket.record("list", Prefix)
+        keys = sorted(k for k in self.bucket.objects if k.startswith(Prefix) and k > (ContinuationToken or ""))
+        page = keys[:MaxKeys]
+        out: Dict[str, Any] = {
+            "Contents": [
+                {
+                    "Key": k,
+                    "Size": len(self.bucket.objects[k].data),
+                    "LastModified": datetime.fromtimestamp(self.bucket.objects[k].modified, timezone.utc),
+                }
+                for k in page
+            ],
+            "IsTruncated": len(keys) > MaxKeys,
+        }
+        if out["IsTruncated"]:
+            out["NextContinuationToken"] = page[-1]
+        return out
+
+    async def create_multipart_upload(self, Bucket: str, Key: str, ContentType: str = "application/octet-stream",
+                                      Metadata: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        self.bucket.record("create_multipart", Key)
+        upload_id = uuid.uuid4().hex
+        self._uploads[upload_id] = (ContentType, dict(Metadata or {}), {})
+        return {"UploadId": upload_id}
+
+    async def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes) -> Dict[str, Any]:
+        self.bucket.record("upload_part", Key)
+        self._uploads[UploadId][2][PartNumber] = bytes(Body)
+        return {"ETag": f'"{uuid.uuid4().hex}"'}
+
+    async def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str,
+                                        MultipartUpload: Dict[str, Any]) -> Dict[str, Any]:
+        self.bucket.record("complete_multipart", Key)
+        content_type, metadata, parts = self._uploads.pop(UploadId)
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        if any(len(parts[n]) < self.MIN_PART_SIZE for n in numbers[:-1]):
+            raise FakeClientError("EntityTooSmall", "CompleteMultipartUpload")
+        self.bucket.objects[Key] = FakeObject(b"".join(parts[n] for n in numbers), content_type, metadata)
+        return {}
+
+    async def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> Dict[str, Any]:
+        self.bucket.record("abort_multipart", Key)
+        self._uploads.pop(UploadId, None)
+        return {}
+
+    async def generate_presigned_url(self, op: str, Params: Dict[str, Any], ExpiresIn: int = 3600) -> str:
+        return f"https://fake-s3.local/{Params['Bucket']}/{Params['Key']}?expires={ExpiresIn}"
+
+    async def generate_presigned_post(self, Bucket: str, Key: str, Fields=None, Conditions=None,
+                                      ExpiresIn: int = 3600) -> Dict[str, Any]:
+        return {"url": f"https://fake-s3.local/{Bucket}", "fields": {**(Fields or {}), "key": Key}}
+
+
+def fake_s3_factory(bucket: Optional[FakeBucket] = None):
+    """client_factory for S3Storage: each call yields a client over the same bucket."""
+    bucket = bucket if bucket is not None else FakeBucket()
+
+    @asynccontextmanager
+    async def _client():
+        yield FakeS3Client(bucket)
+
+    _client.bucket = bucket
+    return _client
+
+
+# ---- GCS (sync client, like google-cloud-storage) ----
+
+
+class FakeBlob:
+    def __init__(self, bucket: FakeBucket, name: str):
+        self._bucket, self.name = bucket, name
+        self.metadata: Optional[Dict[str, str]] = None
+        self.content_type: Optional[str] = None
+        self.chunk_size: Optional[int] = None
+        self.size: Optional[int] = None
+        self.updated: Optional[datetime] = None
+
+    def _load(self) -> "FakeBlob":
+        obj = self._bucket.objects[self.name]
+        self.metadata, self.content_type, self.size = dict(obj.metadata) or None, obj.content_type, len(obj.data)
+        self.updated = datetime.fromtimestamp(obj.modified, timezone.utc)
+        return self
+
+    def exists(self) -> bool:
+        self._bucket.record("exists", self.name)
+        return self.name in self._bucket.objects
+
+    def delete(self) -> None:
+        self._bucket.record("delete", self.name)
+        if self._bucket.objects.pop(self.name, None) is None:
+            raise FakeClientError("404", "delete")
+
+    def upload_from_string(self, data: bytes, content_type: Optional[str] = None) -> None:
+        self._bucket.record("upload", self.name)
+        self._bucket.objects[self.name] = FakeObject(bytes(data), content_type or "application/octet-stream",
+                                                     dict(self.metadata or {}))
+
+    def upload_from_file(self, file_obj, size: Optional[int] = None, content_type: Optional[str] = None,
+                         rewind: bool = False) -> None:
+        if rewind:
+            file_obj.seek(0)
+        if self.chunk_size:  # resumable upload, one request per chunk
+            parts = []
+            while True:
+                chunk = file_obj.read(self.chunk_size)
+                if not chunk:
+                    break
+                self._bucket.record("upload_chunk", self.name)
+                parts.append(chunk)
+            data = b"".join(parts)
+        else:
+            self._bucket.record("upload", self.name)
+            data = file_obj.read()
+        self._bucket.objects[self.name] = FakeObject(data, content_type or "application/octet-stream",
+                                                     dict(self.metadata or {}))
+
+    def download_as_bytes(self, start: Optional[int] = None, end: Optional[int] = None) -> bytes:
+        self._bucket.record("download", self.name)
+        data = self._bucket.objects[self.name].data
+        return data[start or 0 : (end + 1) if end is not None else None]
+
+    def generate_signed_url(self, expiration=None, method: str = "GET", **kw) -> str:
+        return f"https://fake-gcs.local/{self.name}?method={method}&expires={expiration}"
+
+
+class FakeGCSBucket:
+    def __init__(self, bucket: FakeBucket, name: Optional[str]):
+        self._bucket, self.name = bucket, name
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self._bucket, name)
+
+    def get_blob(self, name: str) -> Optional[FakeBlob]:
+        self._bucket.record("get_blob", name)
+        return FakeBlob(self._bucket, name)._load() if name in self._bucket.objects else None
+
+    def list_blobs(self, prefix: Optional[str] = None) -> List[FakeBlob]:
+        self._bucket.record("list", prefix or "")
+        names = sorted(k for k in self._bucket.objects if k.startswith(prefix or ""))
+        return [FakeBlob(self._bucket, k)._load() for k in names]
+
+
+class FakeGCSClient:
+    def __init__(self, bucket: Optional[FakeBucket] = None):
+        self.store = bucket if bucket is not None else FakeBucket()
+
+    def bucket(self, name: Optional[str]) -> FakeGCSBucket:
+        return FakeGCSBucket(self.store, name)
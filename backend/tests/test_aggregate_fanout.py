@@ -0,0 +1,83 @@
+import json
+import time
+
+from backend.app.core_gov.aggregate import Section, invalidate, run_sections
+from backend.app.core_gov.brief import service as brief
+
+
+def _slow(value, delay=0.2):
+    def fn():
+        time.sleep(delay)
+        return value
+    return fn
+
+
+class TestRunSections:
+    def setup_method(self):
+        invalidate("t.")
+
+    def test_sections_run_concurrently(self):
+        sections = [Section(f"s{i}", _slow(i), ttl=0) for i in range(4)]
+        results, timings = run_sections(sections)
+        assert results == {"s0": 0, "s1": 1, "s2": 2, "s3": 3}
+        assert all(timings[f"s{i}"]["status"] == "ok" for i in range(4))
+        assert timings["_total"]["ms"] < 600  # sum would be ~800ms
+
+    def test_timeout_and_error_fall_back(self):
+        def boom():
+            raise RuntimeError("nope")
+
+        results, timings = run_sections([
+            Section("slow", _slow("late", 0.5), timeout=0.05, ttl=0, default="fallback"),
+            Section("bad", boom, ttl=0, on_error=lambda e: {"error": str(e)}),
+        ])
+        assert results == {"slow": "fallback", "bad": {"error": "nope"}}
+        assert timings["slow"]["status"] == "timeout"
+        assert timings["bad"]["status"] == "error" and "nope" in timings["bad"]["error"]
+
+    def test_cache_hit_and_invalidation_on_dep_write(self, tmp_path):
+        dep = tmp_path / "state.json"
+        dep.write_text("1", encoding="utf-8")
+        calls = []
+
+        def read():
+            calls.append(1)
+            return dep.read_text(encoding="utf-8")
+
+        section = Section("state", read, ttl=60, deps=(str(dep),), key="t.state")
+        assert run_sections([section])[0]["state"] == "1"
+        results, timings = run_sections([section])
+        assert results["state"] == "1" and timings["state"]["status"] == "cached"
+        assert len(calls) == 1
+
+        dep.write_text("22", encoding="utf-8")  # size changes, so the signature does too
+        assert run_sections([section])[0]["state"] == "22"
+        assert len(calls) == 2
+
+        assert invalidate("t.") == 1
+        assert run_sections([section])[1]["state"]["status"] == "ok"
+        assert run_sections([section], use_cache=False)[1]["state"]["status"] == "ok"
+
+    def test_callable_dep_version(self):
+        version = [1]
+        section = Section("v", lambda: version[0], ttl=60, deps=(lambda: version[0],), key="t.v")
+        assert run_sections([section])[0]["v"] == 1
+        version[0] = 2
+        assert run_sections([section])[0]["v"] == 2
+
+
+class TestBriefSections:
+    def setup_method(self):
+        invalidate("brief.")
+
+    def test_store_write_invalidates_a_brief_section(self, tmp_path, monkeypatch):
+        bills = tmp_path / "items.json"
+        bills.write_text('["rent"]', encoding="utf-8")
+        monkeypatch.setattr(brief, "BILLS_PATH", str(bills))
+        monkeypatch.setattr(brief, "_bills_upcoming", lambda: json.loads(bills.read_text(encoding="utf-8")))
+        assert brief.build()["bills_upcoming"] == ["rent"]
+
+        bills.write_text('["rent", "hydro"]', encoding="utf-8")  # well inside the 5s TTL
+        out = brief.build()
+        assert out["bills_upcoming"] == ["rent", "hydro"]
+        assert out["timings"]["bills_upcoming"]["status"] == "ok"
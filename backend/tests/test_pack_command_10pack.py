@@ -36,6 +36,26 @@ class TestReconcile:
         assert "suggestions" in result
         assert "warnings" in result
 
+    def test_candidate_index_range_query(self):
+        from datetime import date
+        from backend.app.core_gov.reconcile.index import CandidateIndex
+        pays = [
+            {"id": "p1", "amount": 100.0, "paid_date": "2026-01-10"},
+            {"id": "p2", "amount": 100.5, "paid_date": "2026-03-01"},
+            {"id": "p3", "amount": 250.0, "paid_date": "2026-01-10"},
+        ]
+        rcs = [{"id": "r1", "total": 99.4, "date": ""}]
+        idx = CandidateIndex(pays, rcs, bucket_width=1.0)
+        got = {e["target_id"] for e in idx.candidates(100.0, date(2026, 1, 12), 1.0, 5)}
+        assert got == {"p1", "r1"}
+
+    def test_assign_is_one_to_one_and_maximal(self):
+        from backend.app.core_gov.reconcile.index import assign
+        # greedy would give txn0 -> c0 (0.99) and leave txn1 unmatched
+        edges = [(0, 0, 0.99), (0, 1, 0.95), (1, 0, 0.97)]
+        out = assign(edges, 2, 2)
+        assert out == {0: (1, 0.95), 1: (0, 0.97)}
+
 
 class TestAutopayVerify:
     def test_verify(self):
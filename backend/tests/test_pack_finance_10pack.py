@@ -80,6 +80,26 @@ class TestTransactionImport:
         assert result["imported"] == 1
         # negative amount should become positive with expense kind
 
+    def test_import_csv_dedupe_is_idempotent(self):
+        import uuid
+        from backend.app.core_gov.txn_import import service as svc
+        acct = "acct_" + uuid.uuid4().hex[:8]
+        csv_text = "date,amount,description\n2026-01-03,-4.50,Coffee\n2026-01-03,-4.50,Coffee\n2026-01-04,-20.00,Gas"
+        first = svc.import_csv(csv_text=csv_text, account_id=acct, dedupe=True)
+        assert first["imported"] == 3
+        overlap = csv_text + "\n2026-01-05,-9.99,Lunch"
+        second = svc.import_csv(csv_text=overlap, account_id=acct, dedupe=True)
+        assert second["imported"] == 1
+        assert second["duplicates"] == 3
+
+    def test_ledger_create_many_batches_and_reports_errors(self):
+        from backend.app.core_gov.ledger import service as lsvc
+        rows = ({"kind": "expense", "date": "2026-02-01", "amount": i} for i in range(7))
+        res = lsvc.create_many(list(rows) + [{"kind": "bogus", "date": "2026-02-01", "amount": 1}], batch_size=3)
+        assert res["created"] == 7
+        assert res["failed"] == 1
+        assert "kind must be" in res["errors"][0]
+
 
 class TestCategoryRules:
     def test_create_rule(self):
@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+
+from backend.app.core_gov.recurrence import compile_rule, expand, make_rule, merge, next_due
+
+
+def _stepwise(rule, start, end):
+    out, d = [], start
+    c = compile_rule(rule)
+    while d <= end:
+        nd = c.first_on_or_after(d)
+        if nd is None or nd > end:
+            break
+        out.append(nd)
+        d = nd + timedelta(days=1)
+    return tuple(out)
+
+
+class TestRecurrenceEngine:
+    def test_month_end_does_not_drift(self):
+        rule = make_rule("monthly", day_of_month=31)
+        assert expand(rule, date(2026, 1, 1), date(2026, 4, 30)) == (
+            date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31), date(2026, 4, 30),
+        )
+        safe = make_rule("monthly", day_of_month=31, max_day=28)
+        assert expand(safe, date(2026, 1, 1), date(2026, 2, 28)) == (date(2026, 1, 28), date(2026, 2, 28))
+
+    def test_unanchored_phase_counts_from_window_start(self):
+        q = make_rule("quarterly", day_of_month=10)
+        assert expand(q, date(2026, 1, 15), date(2026, 12, 31)) == (date(2026, 4, 10), date(2026, 7, 10), date(2026, 10, 10))
+        assert next_due(make_rule("yearly", day_of_month=5, month=3), date(2026, 10, 18)) == date(2027, 3, 5)
+        assert expand(make_rule("weekly", day_of_week=0), date(2026, 10, 18), date(2026, 11, 2)) == (
+            date(2026, 10, 19), date(2026, 10, 26), date(2026, 11, 2),
+        )
+
+    def test_anchored_seek_matches_stepping(self):
+        start, end = date(2026, 1, 1), date(2027, 6, 30)
+        for cadence, kw in [
+            ("biweekly", {"anchor": "2025-12-30"}),
+            ("every_n_months", {"interval": 5, "day_of_month": 30, "anchor": "2024-02-01"}),
+            ("yearly", {"month": 2, "day_of_month": 29, "anchor": "2020-01-01"}),
+            ("daily", {"interval": 9, "anchor": "2025-11-11"}),
+            ("once", {"anchor": "2026-07-04"}),
+        ]:
+            rule = make_rule(cadence, **kw)
+            assert expand(rule, start, end) == _stepwise(rule, start, end)
+        assert expand(make_rule("monthly", anchor="2026-03-01", until="2026-05-01"), start, end) == (
+            date(2026, 3, 1), date(2026, 4, 1), date(2026, 5, 1),
+        )
+
+    def test_merge_is_date_ordered_and_stable(self):
+        rules = [("rent", make_rule("monthly", day_of_month=1)), ("gym", make_rule("weekly", day_of_week=2)), ("tax", make_rule("monthly", day_of_month=1))]
+        got = list(merge(rules, date(2026, 11, 1), date(2026, 11, 30)))
+        assert [d for d, _ in got] == sorted(d for d, _ in got)
+        assert got[:2] == [(date(2026, 11, 1), "rent"), (date(2026, 11, 1), "tax")]
+        assert sum(1 for _, k in got if k == "gym") == 4
+
+    def test_modules_agree_on_bill_dates(self):
+        from backend.app.core_gov.bills.due import bill_rule
+        from backend.app.core_gov.budget_calendar.service import obligation_rule
+        from backend.app.core_gov.payments.service import payment_rule
+
+        start, end = date(2026, 1, 1), date(2026, 12, 31)
+        bill = bill_rule({"cadence": "monthly", "due_day": 30})
+        obligation = obligation_rule({"cadence": "monthly", "due_day": 30})
+        payment = payment_rule({"cadence": "monthly", "due_day": 30})
+        assert expand(bill, start, end) == expand(obligation, start, end) == expand(payment, start, end)
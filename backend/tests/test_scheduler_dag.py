@@ -0,0 +1,120 @@
+import threading
+import time
+
+from backend.app.core_gov.scheduler import dag, service, store
+from backend.app.core_gov.scheduler.dag import Step, plan, run
+
+
+class _Versions:
+    def __init__(self, **versions):
+        self.v = dict(versions)
+
+    def __call__(self, name):
+        return self.v.get(name)
+
+    def bump(self, name):
+        self.v[name] = self.v.get(name, 0) + 1
+
+
+def _sleeper(log, name, delay=0.2):
+    def fn():
+        log.append(("start", name, time.perf_counter()))
+        time.sleep(delay)
+        log.append(("end", name, time.perf_counter()))
+        return name
+    return fn
+
+
+class TestTickDag:
+    def test_plan_orders_only_conflicting_steps(self):
+        steps = [
+            Step("a", lambda: 1, reads=("bills",), writes=("reminders",)),
+            Step("b", lambda: 1, reads=("shopping",), writes=("shopping",)),
+            Step("c", lambda: 1, reads=("reminders",)),
+            Step("d", lambda: 1, writes=("bills",)),
+        ]
+        assert plan(steps) == {"a": [], "b": [], "c": ["a"], "d": ["a"]}
+
+    def test_independent_steps_run_concurrently_and_conflicts_serialize(self):
+        log = []
+        versions = _Versions(x=1, y=1)
+        steps = [
+            Step("w1", _sleeper(log, "w1"), reads=("x",), writes=("x",)),
+            Step("w2", _sleeper(log, "w2"), reads=("x",), writes=("x",)),
+            Step("r", _sleeper(log, "r"), reads=("y",)),
+        ]
+        t0 = time.perf_counter()
+        results, stats = run(steps, version=versions)
+        assert time.perf_counter() - t0 < 0.55  # w1 -> w2 chain with r alongside; serial would be 0.6s
+        assert results == {"w1": "w1", "w2": "w2", "r": "r"}
+        at = {(kind, name): t for kind, name, t in log}
+        assert at[("start", "w2")] >= at[("end", "w1")]
+        assert at[("start", "r")] < at[("end", "w1")]
+        assert all(stats[n]["status"] == "ran" and stats[n]["ms"] >= 150 for n in ("w1", "w2", "r"))
+
+    def test_unchanged_inputs_are_skipped_until_a_read_store_changes(self):
+        calls = []
+        versions = _Versions(bills=1, reminders=1)
+
+        def push():
+            calls.append("push")
+            versions.bump("reminders")  # the step's own write
+
+        steps = [
+            Step("push", push, reads=("bills", "reminders"), writes=("reminders",)),
+            Step("always", lambda: calls.append("always"), reads=("bills",), skip_unchanged=False),
+            Step("unknown", lambda: calls.append("unknown"), reads=("nowhere",)),
+        ]
+        _, first = run(steps, version=versions)
+        _, second = run(steps, previous=first, version=versions)
+        assert second["push"]["status"] == "skipped" and second["push"]["last_ok"] == first["push"]["last_ok"]
+        assert calls.count("push") == 1 and calls.count("always") == 2 and calls.count("unknown") == 2
+
+        _, third = run(steps, previous=second, version=versions)
+        assert third["push"]["status"] == "skipped"
+        versions.bump("bills")
+        _, fourth = run(steps, previous=third, version=versions)
+        assert fourth["push"]["status"] == "ran" and calls.count("push") == 2
+        _, forced = run(steps, previous=fourth, version=versions, force=True)
+        assert forced["push"]["status"] == "ran"
+
+    def test_errors_are_recorded_and_retried(self):
+        versions = _Versions(a=1)
+        fail = threading.Event()
+        fail.set()
+
+        def flaky():
+            if fail.is_set():
+                raise RuntimeError("store locked")
+            return "ok"
+
+        steps = [Step("flaky", flaky, reads=("a",)), Step("after", lambda: "fine", reads=("a",), writes=("a",))]
+        results, first = run(steps, version=versions)
+        assert first["flaky"]["status"] == "error" and "store locked" in first["flaky"]["error"]
+        assert results == {"after": "fine"}  # a failed step does not block its dependents
+        fail.clear()
+        _, second = run(steps, previous=first, version=versions)
+        assert second["flaky"]["status"] == "ran"
+
+    def test_store_version_uses_data_dir_signature(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dag, "DATA_ROOT", str(tmp_path))
+        assert dag.store_version("no_such_store_xyz") is None
+        d = tmp_path / "no_such_store_xyz"
+        d.mkdir()
+        (d / "items.json").write_text("[]", encoding="utf-8")
+        before = dag.store_version("no_such_store_xyz")
+        (d / "items.json").write_text("[1, 2]", encoding="utf-8")
+        assert dag.store_version("no_such_store_xyz") != before
+
+    def test_tick_persists_step_stats(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(store, "STATE_FILE", str(tmp_path / "scheduler_state.json"))
+        monkeypatch.setattr(service, "TICK_STEPS", [
+            Step("daily_ops", lambda: {"ok": True}, skip_unchanged=False),
+            Step("broken", lambda: 1 / 0),
+        ])
+        result = service.tick()
+        assert result["success"] and result["daily_ops_result"] == {"ok": True}
+        assert result["steps"]["broken"]["status"] == "error"
+        saved = store.get_steps()
+        assert saved["broken"]["error"].startswith("ZeroDivisionError")
+        assert store.get_state()["last_tick_id"] == result["tick_id"]
@@ -0,0 +1,58 @@
+from backend.app.core_gov.storage.bm25_index import BM25Index, tokenize
+from backend.app.core_gov.storage.segment_log import SegmentedJsonStore
+
+
+def _index(tmp_path, **kw):
+    src = SegmentedJsonStore(tmp_path / "chunks.json", key="chunks")
+    return src, BM25Index(src, **kw)
+
+
+class TestBM25Index:
+    def test_tokenize_drops_stopwords(self):
+        assert tokenize("The Roof of the HOUSE, 2024!") == ["roof", "house", "2024"]
+
+    def test_ranks_by_bm25_and_filters_tags(self, tmp_path):
+        src, idx = _index(tmp_path)
+        docs = [
+            {"id": "a", "text": "furnace repair furnace filter", "tags": ["house"]},
+            {"id": "b", "text": "furnace", "tags": ["rental"]},
+            {"id": "c", "text": "roof shingles", "tags": ["house"]},
+        ]
+        src.append_many(docs)
+        idx.add(docs)
+        assert [rid for _, rid in idx.search("furnace filter")] == ["a", "b"]
+        assert [rid for _, rid in idx.search("furnace", tags=["rental"])] == ["b"]
+        assert idx.search("furnace", tags=["missing"]) == []
+
+    def test_catches_up_with_writes_it_did_not_see(self, tmp_path):
+        src, idx = _index(tmp_path)
+        src.append({"id": "a", "text": "alpha"})
+        assert [rid for _, rid in idx.search("alpha")] == ["a"]
+        src.append({"id": "b", "text": "alpha beta"})
+        src.delete("a")
+        assert [rid for _, rid in idx.search("alpha")] == ["b"]
+
+    def test_persisted_sidecar_is_reloaded(self, tmp_path):
+        src, idx = _index(tmp_path, persist_every=1)
+        docs = [{"id": "a", "text": "escrow deposit"}]
+        src.append_many(docs)
+        idx.add(docs)
+        assert idx.path.exists()
+        fresh = BM25Index(src, persist_every=1)
+        assert [rid for _, rid in fresh.search("deposit")] == ["a"]
+
+
+class TestKnowledgeRetrieve:
+    def test_ingest_then_search(self):
+        from backend.app.core_gov.knowledge import ingest, retrieve
+        ingest.ingest_doc(doc_id="doc_bm25", title="T", text="Quitclaim deed transfers interest. " * 3, tags=["legal"])
+        out = retrieve.search(q="quitclaim deed", k=3, tag="legal")
+        assert out["count"] >= 1
+        assert out["sources"][0]["doc_id"] == "doc_bm25"
+
+    def test_know_retrieve_uses_index(self):
+        from backend.app.core_gov.know_chunks import service as csvc
+        from backend.app.core_gov.know_retrieve import service as rsvc
+        csvc.chunk_text(source_id="src_bm25", text="Assignment fee schedule for wholesale deals. " * 10)
+        out = rsvc.search(query="assignment fee", limit=5)
+        assert any(h["source_id"] == "src_bm25" for h in out["hits"])
@@ -0,0 +1,76 @@
+import json
+import os
+
+from backend.app.core_gov.storage.event_log import SegmentedEventLog
+
+
+def _ev(i, day="2026-03-01", etype="tick"):
+    return {"id": i, "event_type": etype, "timestamp": f"{day}T00:00:{i % 60:02d}.{i:06d}", "payload": {}}
+
+
+class TestSegmentedEventLog:
+    def test_rotation_by_size_and_day(self, tmp_path):
+        log = SegmentedEventLog(tmp_path, max_events=10)
+        log.append_many(_ev(i) for i in range(25))
+        log.append(_ev(99, day="2026-03-02"))
+        log.flush()
+        segs = log.segments()
+        assert [s.count for s in segs] == [10, 10, 5, 1]
+        assert all(s.sealed for s in segs[:3]) and not segs[-1].sealed
+        assert segs[-1].min_ts.startswith("2026-03-02")
+        idx = json.loads((tmp_path / "seg-000001.idx.json").read_text(encoding="utf-8"))
+        assert idx["count"] == 10 and idx["types"] == {"tick": 10}
+
+    def test_query_newest_first_with_window_and_type(self, tmp_path):
+        log = SegmentedEventLog(tmp_path, max_events=4)
+        for i in range(20):
+            log.append(_ev(i, etype="boot" if i % 5 == 0 else "tick"))
+        assert [e["id"] for e in log.query(limit=3)] == [19, 18, 17]
+        assert [e["id"] for e in log.query(event_type="boot", limit=10)] == [15, 10, 5, 0]
+        start, end = _ev(6)["timestamp"], _ev(9)["timestamp"]
+        assert [e["id"] for e in log.query(start=start, end=end)] == [9, 8, 7, 6]
+        assert log.query(event_type="nope") == []
+        assert log.count() == 20 and log.count("boot") == 4
+
+    def test_index_pruning_skips_unrelated_segments(self, tmp_path, monkeypatch):
+        log = SegmentedEventLog(tmp_path)
+        log.append_many(_ev(i, day="2026-03-01") for i in range(5))
+        log.append_many(_ev(i, day="2026-03-02", etype="other") for i in range(5, 10))
+        opened = []
+        real = log._read_lines
+        monkeypatch.setattr(log, "_read_lines", lambda seq: (opened.append(seq), real(seq))[1])
+        assert len(log.query(start="2026-03-02", limit=50)) == 5
+        assert opened == [2]
+        opened.clear()
+        assert len(log.query(event_type="tick", limit=50)) == 5
+        assert opened == [1]
+
+    def test_reopen_rebuilds_stale_sidecar(self, tmp_path):
+        log = SegmentedEventLog(tmp_path, fsync_every=1000, fsync_interval=3600)
+        log.append_many(_ev(i) for i in range(3))
+        log.flush()
+        log.append(_ev(3))  # not synced: sidecar still says 3 events
+        other = SegmentedEventLog(tmp_path)
+        assert other.count() == 4
+        other.append(_ev(4))
+        assert [e["id"] for e in other.query(limit=2)] == [4, 3]
+        log.close()
+        other.close()
+
+    def test_audit_store_converts_legacy_file(self, tmp_path, monkeypatch):
+        from backend.app.core_gov.audit_log import store
+
+        legacy = tmp_path / "audit_log.json"
+        legacy.write_text(json.dumps([
+            {"id": 2, "event_type": "b", "payload": {}, "timestamp": "2026-01-02T00:00:00"},
+            {"id": 1, "event_type": "a", "payload": {}, "timestamp": "2026-01-01T00:00:00"},
+        ]), encoding="utf-8")
+        monkeypatch.setattr(store, "AUDIT_FILE", str(legacy))
+        monkeypatch.setattr(store, "AUDIT_DIR", str(tmp_path / "audit_log"))
+        monkeypatch.setattr(store, "_LOG", None)
+
+        ev = store.append("user_action", {"x": 1})
+        assert not legacy.exists() and os.path.exists(str(legacy) + ".migrated")
+        assert [e["id"] for e in store.list_events()] == [ev["id"], 2, 1]
+        assert [e["id"] for e in store.list_events(event_type="a")] == [1]
+        assert store.stats()["events"] == 3
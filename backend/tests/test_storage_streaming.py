@@ -0,0 +1,157 @@
+import asyncio
+import os
+
+import pytest
+
+from backend.storage import local, stream
+from backend.tests.storage_fakes import FakeBucket, FakeGCSClient, fake_s3_factory
+from backend.storage.gcs import GCSStorage
+from backend.storage.local import LocalStorage
+from backend.storage.s3 import S3Storage
+from backend.storage.util import parse_range
+
+
+async def _chunks(data, size):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+async def _read(storage, key, start=0, end=None):
+    return b"".join([c async for c in storage.open_range(key, start, end)])
+
+
+class TestParseRange:
+    def test_forms(self):
+        assert parse_range(None, 10) is None
+        assert parse_range("bytes=2-5", 10) == (2, 5)
+        assert parse_range("bytes=7-", 10) == (7, 9)
+        assert parse_range("bytes=-3", 10) == (7, 9)
+        assert parse_range("bytes=4-99", 10) == (4, 9)
+        assert parse_range("bytes=0-1,4-5", 10) is None
+        with pytest.raises(ValueError):
+            parse_range("bytes=10-", 10)
+
+
+class TestLocalStreaming:
+    def test_chunked_save_dedupes_and_reads_ranges(self, tmp_path):
+        storage = LocalStorage(root=tmp_path / "uploads", cas_root=tmp_path / "cas")
+        data = os.urandom(3 * 1024 + 7)
+
+        async def go():
+            a = await storage.save_stream("org_1/a.bin", _chunks(data, 1000), "application/octet-stream")
+            b = await storage.save_stream("org_2/b.bin", _chunks(data, 333), "application/octet-stream")
+            return a, b, await _read(storage, "org_2/b.bin", 100, 2099), await storage.size("org_1/a.bin")
+
+        a, b, part, size = asyncio.run(go())
+        assert not a["deduped"] and b["deduped"] and a["sha256"] == b["sha256"]
+        assert part == data[100:2100] and size == len(data)
+        blobs = list((tmp_path / "cas").glob("??/*"))
+        assert len(blobs) == 1 and blobs[0].stat().st_nlink == 3  # one blob, two keys
+
+    def test_save_bytes_delete_and_garbage_collection(self, tmp_path):
+        storage = LocalStorage(root=tmp_path / "uploads", cas_root=tmp_path / "cas")
+
+        async def go():
+            path = await storage.save_bytes("x/y.txt", b"hello", "text/plain")
+            await storage.delete("x/y.txt")
+            fresh = await storage.collect_garbage()  # within the grace period: a save may be mid-link
+            return path, await storage.exists("x/y.txt"), fresh, await storage.collect_garbage(grace_seconds=0)
+
+        assert asyncio.run(go()) == ("uploads/x/y.txt", False, 0, 1)
+        with pytest.raises(ValueError):
+            storage._path("../../etc/passwd")
+
+
+class TestRemoteStreaming:
+    def test_s3_multipart_dedupe_and_range(self, monkeypatch):
+        monkeypatch.setattr("backend.storage.s3.PART_SIZE", 5 * 1024 * 1024)
+        factory = fake_s3_factory()
+        storage = S3Storage(client_factory=factory, bucket="b")
+        data = os.urandom(11 * 1024 * 1024)
+
+        async def go():
+            a = await storage.save_stream("k1", _chunks(data, 256 * 1024), "video/mp4")
+            b = await storage.save_stream("k2", _chunks(data, 1024 * 1024), "video/mp4")
+            small = await storage.save_stream("k3", [b"abc"], "text/plain")
+            url = await storage.generate_download_url("k2")
+            return a, b, small, url, await _read(storage, "k2", 5, 6 * 1024 * 1024), await _read(storage, "k3")
+
+        a, b, small, url, part, whole = asyncio.run(go())
+        bucket = factory.bucket
+        assert bucket.ops("upload_part").count(f"cas/{a['sha256'][:2]}/{a['sha256']}") == 3
+        assert len(bucket.ops("complete_multipart")) == 1 and b["deduped"] and not small["deduped"]
+        assert len(bucket.objects["k1"].data) == 0 and a["sha256"] in url
+        assert part == data[5 : 6 * 1024 * 1024 + 1] and whole == b"abc"
+
+    def test_gcs_resumable_dedupe_and_range(self):
+        client = FakeGCSClient()
+        storage = GCSStorage(client=client, bucket="b")
+        data = os.urandom(3 * stream.CHUNK_SIZE + 11)
+
+        async def go():
+            a = await storage.save_stream("k1", _chunks(data, 4096), "application/pdf")
+            b = await storage.save_stream("k2", [data], "application/pdf")
+            return a, b, await _read(storage, "k1", stream.CHUNK_SIZE - 1), await storage.size("k2")
+
+        a, b, tail, size = asyncio.run(go())
+        assert not a["deduped"] and b["deduped"]
+        assert len(client.store.ops("upload_chunk")) == 1
+        assert tail == data[stream.CHUNK_SIZE - 1 :] and size == len(data)
+
+    def test_discard_drops_a_rejected_blob_unless_shared(self, tmp_path):
+        storage = LocalStorage(root=tmp_path / "uploads", cas_root=tmp_path / "cas")
+
+        async def go():
+            bad = await storage.save_stream("a/bad.exe", [b"EICAR"], "application/octet-stream")
+            await storage.discard(bad)
+            alone = list((tmp_path / "cas").glob("??/*"))
+            first = await storage.save_stream("a/one.txt", [b"same"], "text/plain")
+            second = await storage.save_stream("a/two.txt", [b"same"], "text/plain")
+            await storage.discard(second)  # deduped: only the key goes
+            await storage.discard(first)  # created it, but nothing else links it now
+            return alone, await storage.exists("a/bad.exe"), await storage.exists("a/two.txt")
+
+        alone, bad_exists, two_exists = asyncio.run(go())
+        assert alone == [] and not bad_exists and not two_exists
+        assert list((tmp_path / "cas").glob("??/*")) == []
+
+    def test_save_survives_the_blob_being_swept_before_linking(self, tmp_path, monkeypatch):
+        storage = LocalStorage(root=tmp_path / "uploads", cas_root=tmp_path / "cas")
+        asyncio.run(storage.save_stream("a/one.txt", [b"same"], "text/plain"))
+        asyncio.run(storage.delete("a/one.txt"))
+        real_link, swept = local._link, []
+
+        def link_after_sweep(blob, dest):
+            if not swept:  # another process's GC removes the blob right after the exists() check
+                swept.append(blob)
+                os.chmod(blob, 0o644)
+                blob.unlink()
+            real_link(blob, dest)
+
+        monkeypatch.setattr(local, "_link", link_after_sweep)
+        out = asyncio.run(storage.save_stream("a/two.txt", [b"same"], "text/plain"))
+        assert swept and not out["deduped"]
+        assert asyncio.run(_read(storage, "a/two.txt")) == b"same"
+
+    @pytest.mark.parametrize("make", [
+        lambda bucket: S3Storage(client_factory=fake_s3_factory(bucket), bucket="b"),
+        lambda bucket: GCSStorage(client=FakeGCSClient(bucket), bucket="b"),
+    ])
+    def test_remote_garbage_collection_keeps_referenced_blobs(self, make):
+        bucket = FakeBucket()
+        storage = make(bucket)
+
+        async def go():
+            kept = await storage.save_stream("a/one.txt", [b"same"], "text/plain")
+            await storage.save_stream("a/two.txt", [b"same"], "text/plain")
+            gone = await storage.save_stream("a/three.txt", [b"other"], "text/plain")
+            await storage.delete("a/one.txt")  # "same" is still referenced by two.txt
+            await storage.delete("a/three.txt")
+            fresh = await storage.collect_garbage()  # within the grace period
+            return kept, gone, fresh, await storage.collect_garbage(grace_seconds=0)
+
+        kept, gone, fresh, swept = asyncio.run(go())
+        assert (fresh, swept) == (0, 1)
+        blobs = sorted(k for k in bucket.objects if k.startswith("cas/"))
+        assert blobs == [f"cas/{kept['sha256'][:2]}/{kept['sha256']}"] and gone["sha256"] not in "".join(blobs)
+        assert asyncio.run(_read(storage, "a/two.txt")) == b"same"
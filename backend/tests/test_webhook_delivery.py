@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.app.services.webhook_dispatcher import WebhookDispatcher
+from backend.app.services.webhook_outbox import WebhookOutbox
+
+
+class _Hook:
+    """Local receiver that records bodies; fails the first ``fail`` requests with ``status``."""
+
+    def __init__(self, fail=0, status=500, delay=0.0):
+        self.fail, self.status, self.delay = fail, status, delay
+        self.bodies, self.active, self.peak = [], 0, 0
+        self.lock = threading.Lock()
+        hook = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with hook.lock:
+                    hook.active += 1
+                    hook.peak = max(hook.peak, hook.active)
+                    failing = hook.fail > 0
+                    if failing:
+                        hook.fail -= 1
+                time.sleep(hook.delay)
+                with hook.lock:
+                    hook.active -= 1
+                    if not failing:
+                        hook.bodies.append(body)
+                self.send_response(hook.status if failing else 200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *a):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestWebhookDelivery:
+    def setup_method(self):
+        self.hooks = []
+        self.dispatchers = []
+
+    def teardown_method(self):
+        for d in self.dispatchers:
+            d.stop()
+        for h in self.hooks:
+            h.close()
+
+    def _hook(self, **kw):
+        h = _Hook(**kw)
+        self.hooks.append(h)
+        return h
+
+    def _dispatcher(self, path, **kw):
+        kw.setdefault("backoff_base", 0.01)
+        kw.setdefault("poll_interval", 0.05)
+        d = WebhookDispatcher(WebhookOutbox(str(path)), **kw)
+        self.dispatchers.append(d)
+        return d.start()
+
+    def test_delivers_and_retries_server_errors(self, tmp_path):
+        hook = self._hook(fail=2, status=503)
+        d = self._dispatcher(tmp_path / "o.db")
+        d.outbox.enqueue([hook.url], "lead.created", {"id": 1})
+        d.wake()
+        assert d.wait_idle(5)
+        assert hook.bodies == [{"event": "lead.created", "data": {"id": 1}}]
+        st = d.stats()
+        assert st["queue"]["delivered"] == 1
+        assert st["targets"][hook.url]["attempts"] == 3
+
+    def test_client_error_is_dead_lettered(self, tmp_path):
+        hook = self._hook(fail=1, status=400)
+        d = self._dispatcher(tmp_path / "o.db")
+        d.outbox.enqueue([hook.url], "deal.created", {"id": 2})
+        d.wake()
+        assert d.wait_idle(5)
+        dead = d.outbox.dead()
+        assert len(dead) == 1 and dead[0]["last_error"] == "HTTP 400"
+        assert d.outbox.requeue_dead() == 1
+        d.wake()
+        assert d.wait_idle(5)
+        assert len(hook.bodies) == 1
+
+    def test_exhausted_retries_are_dead(self, tmp_path):
+        hook = self._hook(fail=10, status=500)
+        d = self._dispatcher(tmp_path / "o.db", max_attempts=3)
+        d.outbox.enqueue([hook.url], "x", {})
+        d.wake()
+        assert d.wait_idle(5)
+        assert d.outbox.counts()["dead"] == 1
+        assert d.outbox.dead()[0]["attempts"] == 3
+
+    def test_batches_and_per_target_concurrency(self, tmp_path):
+        hook = self._hook(delay=0.05)
+        path = tmp_path / "o.db"
+        outbox = WebhookOutbox(str(path))
+        for i in range(20):
+            outbox.enqueue([hook.url], "e", {"i": i})
+        outbox.close()
+        d = self._dispatcher(path, batch_size=5, concurrency_per_target=2)
+        assert d.wait_idle(5)
+        assert all(len(b["events"]) == 5 for b in hook.bodies)
+        assert sorted(e["data"]["i"] for b in hook.bodies for e in b["events"]) == list(range(20))
+        assert hook.peak <= 2
+
+    def test_inflight_rows_survive_restart(self, tmp_path):
+        hook = self._hook()
+        path = str(tmp_path / "o.db")
+        outbox = WebhookOutbox(path)
+        outbox.enqueue([hook.url], "e", {"n": 1})
+        assert len(outbox.claim(hook.url, 10)) == 1  # "crash" with the row inflight
+        outbox.close()
+        d = self._dispatcher(path)
+        assert d.wait_idle(5)
+        assert hook.bodies == [{"event": "e", "data": {"n": 1}}]
+
+    def test_enqueue_does_not_wait_for_slow_targets(self, tmp_path):
+        hook = self._hook(delay=0.3)
+        d = self._dispatcher(tmp_path / "o.db")
+        t0 = time.perf_counter()
+        for i in range(10):
+            d.outbox.enqueue([hook.url], "e", {"i": i})
+            d.wake()
+        assert time.perf_counter() - t0 < 0.3
+        assert d.wait_idle(10)
+        assert len(hook.bodies) == 10
@@ -1,11 +1,18 @@
+import os
+import queue
 import shutil
-import time
+import sys
+import threading
 from pathlib import Path
 
 import yaml
 from jinja2 import Environment, FileSystemLoader
 
 ROOT = Path.cwd()
+sys.path.insert(0, str(ROOT))
+
+from backend.heimdall_queue import ClaimQueue, DirWatcher, default_worker_id  # noqa: E402
+
 QUEUE_DIR = ROOT / "heimdall" / "queue"
 TPL_DIR = ROOT / "heimdall" / "templates"
 PROCESSED_DIR = QUEUE_DIR / "processed"
@@ -35,6 +42,7 @@ def handle_task(data):
 
 
 def process_yaml(file: Path):
+    """Run a (claimed) task file, then move it to processed/ or error/."""
     log("Processing:", file.name)
     try:
         data = yaml.safe_load(file.read_text())
@@ -52,14 +60,48 @@ def process_yaml(file: Path):
         log("ERROR:", file.name, "-", e)
 
 
-def main():
+def main(workers: int = 1, poll_seconds: float = 2.0, lease_seconds: float = 300.0):
+    """
+    Feed task files from QUEUE_DIR to ``workers`` threads through one shared queue.
+
+    Each thread claims a file (atomic rename into queue/inflight/<worker>/) before
+    processing it, so threads - and other worker processes on the same queue -
+    never render the same task twice. New files are picked up via inotify when
+    available; ``poll_seconds`` is the rescan / expired-lease sweep interval.
+    """
     QUEUE_DIR.mkdir(parents=True, exist_ok=True)
-    log("Watching", QUEUE_DIR)
+    claims = ClaimQueue(QUEUE_DIR, lease_seconds=lease_seconds, patterns=("*.yaml", "*.yml"), skip_suffixes=())
+    watcher = DirWatcher(QUEUE_DIR)
+    tasks: "queue.Queue[Path]" = queue.Queue()
+    queued = set()
+    queued_lock = threading.Lock()
+
+    def run(i: int):
+        worker_id = default_worker_id(i)
+        while True:
+            f = tasks.get()
+            with queued_lock:
+                queued.discard(f.name)
+            claim = claims.claim(f, worker_id)
+            if claim is None:
+                continue
+            process_yaml(claim.path)  # always moves the file out of inflight/
+            claims.done(claim)
+
+    for i in range(max(1, workers)):
+        threading.Thread(target=run, args=(i,), name=f"heimdall-worker-{i}", daemon=True).start()
+
+    log("Watching", QUEUE_DIR, f"({'inotify' if watcher.uses_inotify else 'polling'}, workers={workers})")
     while True:
-        for f in list(QUEUE_DIR.glob("*.yaml")) + list(QUEUE_DIR.glob("*.yml")):
-            process_yaml(f)
-        time.sleep(2)
+        claims.reclaim_expired()
+        for f in claims.pending():
+            with queued_lock:
+                if f.name in queued:
+                    continue
+                queued.add(f.name)
+            tasks.put(f)
+        watcher.wait(poll_seconds)
 
 
 if __name__ == "__main__":
-    main()
+    main(workers=int(os.getenv("HEIMDALL_WORKERS", "1")))
@@ -29,6 +29,8 @@ class EngineCycleResult:
     intents: int = 0
     notes: List[str] = field(default_factory=list)
     metrics: Dict[str, Any] = field(default_factory=dict)
+    # stage -> {"wall_ms", "cpu_ms", "wait_ms"}
+    timings: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
 
 class EngineProfile(Protocol):
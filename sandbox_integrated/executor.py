@@ -0,0 +1,209 @@
+from __future__ import annotations
+import importlib
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sandbox_integrated.engine_profile import EngineCycleResult, EngineProfile
+
+STAGES = ("ingest", "analyze", "propose_actions", "export")
+MODES = ("sequential", "concurrent", "pipelined")
+
+
+@dataclass
+class ExecutionConfig:
+    """
+    How the orchestrator runs engine stages.
+
+    mode:
+      - sequential: engines one after another (original behaviour)
+      - concurrent: engines of a cycle run in parallel; the cycle ends when all are done
+      - pipelined:  like concurrent, but cycle N+1 may start while cycle N is still
+                    running; each engine's stages stay in cycle order (ingest of N+1
+                    only after ingest of N, export of N+1 only after export of N)
+    executor: "thread" runs stages on the driver threads; "process" ships each stage
+              to a process pool (engines are loaded once per worker process by module path)
+    schedule: "fixed_rate" starts cycles every cycle_seconds from the first start;
+              "fixed_delay" sleeps cycle_seconds after each cycle (original behaviour)
+    """
+    mode: str = "sequential"
+    executor: str = "thread"
+    max_workers: int = 4
+    pipeline_depth: int = 2
+    schedule: str = "fixed_delay"
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> "ExecutionConfig":
+        raw = raw or {}
+        cfg = cls(
+            mode=str(raw.get("mode", "sequential")),
+            executor=str(raw.get("executor", "thread")),
+            max_workers=max(1, int(raw.get("max_workers", 4))),
+            pipeline_depth=max(1, int(raw.get("pipeline_depth", 2))),
+            schedule=str(raw.get("schedule", "fixed_delay")),
+        )
+        if cfg.mode not in MODES:
+            raise RuntimeError(f"execution.mode must be one of {MODES}, got {cfg.mode!r}")
+        if cfg.executor not in ("thread", "process"):
+            raise RuntimeError(f"execution.executor must be thread or process, got {cfg.executor!r}")
+        if cfg.schedule not in ("fixed_rate", "fixed_delay"):
+            raise RuntimeError(f"execution.schedule must be fixed_rate or fixed_delay, got {cfg.schedule!r}")
+        if cfg.mode != "pipelined":
+            cfg.pipeline_depth = 1
+        return cfg
+
+
+def _call_stage(eng: EngineProfile, stage: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, float, float]:
+    """Run one stage; returns (result, wall_ms, cpu_ms) measured on the executing thread."""
+    w0, c0 = time.perf_counter(), time.thread_time()
+    out = getattr(eng, stage)(*args, **kwargs)
+    return out, (time.perf_counter() - w0) * 1000.0, (time.thread_time() - c0) * 1000.0
+
+
+# Engines loaded inside process-pool workers, by module path
+_WORKER_ENGINES: Dict[str, EngineProfile] = {}
+
+
+def _process_stage(module_path: str, stage: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, float, float]:
+    eng = _WORKER_ENGINES.get(module_path)
+    if eng is None:
+        eng = _WORKER_ENGINES[module_path] = importlib.import_module(module_path).get_engine()
+    return _call_stage(eng, stage, args, kwargs)
+
+
+class _Turnstile:
+    """Lets cycle ``seq`` through only after cycles 0..seq-1 went through."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._next = 0
+
+    def wait_turn(self, seq: int) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._next == seq)
+
+    def advance(self) -> None:
+        with self._cond:
+            self._next += 1
+            self._cond.notify_all()
+
+
+class CycleExecutor:
+    """Runs one cycle's engines according to an ExecutionConfig."""
+
+    def __init__(self, cfg: ExecutionConfig, engines: Dict[str, EngineProfile], modules: Dict[str, str]):
+        self.cfg = cfg
+        self.engines = engines
+        self.modules = modules
+        self._procs: Optional[ProcessPoolExecutor] = None
+        self._drivers: Optional[ThreadPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(cfg.max_workers)
+        # per (engine, stage) turnstiles keep each engine's cycles in order when pipelined
+        self._gates = {(n, s): _Turnstile() for n in engines for s in STAGES}
+        self._seq = 0
+        if cfg.executor == "process":
+            self._procs = ProcessPoolExecutor(max_workers=cfg.max_workers)
+        if cfg.mode != "sequential":
+            self._drivers = ThreadPoolExecutor(
+                max_workers=max(1, len(engines)) * cfg.pipeline_depth,
+                thread_name_prefix="sandbox-engine",
+            )
+
+    def close(self) -> None:
+        if self._drivers is not None:
+            self._drivers.shutdown(wait=True)
+        if self._procs is not None:
+            self._procs.shutdown(wait=True)
+
+    def _stage(self, name: str, stage: str, *args: Any, **kwargs: Any) -> Tuple[Any, float, float]:
+        if self._procs is not None:
+            return self._procs.submit(_process_stage, self.modules[name], stage, args, kwargs).result()
+        with self._slots:
+            return _call_stage(self.engines[name], stage, args, kwargs)
+
+    def run_engine(self, budget: Dict[str, Any], seq: int = 0) -> EngineCycleResult:
+        """ingest -> analyze -> propose_actions -> export for one engine, with per-stage timings."""
+        name = budget["name"]
+        res = EngineCycleResult(engine_name=self.engines[name].name)
+        ordered = self.cfg.mode == "pipelined"
+        data: Dict[str, Any] = {}
+        passed = 0
+        try:
+            for stage in STAGES:
+                t_wait = time.perf_counter()
+                if ordered:
+                    self._gates[(name, stage)].wait_turn(seq)
+                wait_ms = (time.perf_counter() - t_wait) * 1000.0
+                try:
+                    if stage == "ingest":
+                        out, wall, cpu = self._stage(name, stage, max_items=int(budget["max_items"]))
+                        data["items"] = out
+                        res.ingested = len(out)
+                    elif stage == "analyze":
+                        out, wall, cpu = self._stage(name, stage, data["items"])
+                        data["analyzed"] = out
+                        res.analyzed = len(out)
+                    elif stage == "propose_actions":
+                        out, wall, cpu = self._stage(name, stage, data["analyzed"], max_actions=int(budget["max_actions"]))
+                        data["intents"] = out
+                        res.intents = len(out)
+                    else:
+                        out, wall, cpu = self._stage(name, stage, data["analyzed"], data["intents"])
+                        res.metrics.update(out or {})
+                finally:
+                    if ordered:
+                        self._gates[(name, stage)].advance()
+                    passed += 1
+                res.timings[stage] = {"wall_ms": round(wall, 3), "cpu_ms": round(cpu, 3), "wait_ms": round(wait_ms, 3)}
+        finally:
+            # a failed cycle still takes its turn at the remaining stages so later cycles are not stuck
+            if ordered:
+                for stage in STAGES[passed:]:
+                    self._gates[(name, stage)].wait_turn(seq)
+                    self._gates[(name, stage)].advance()
+        return res
+
+    def submit_cycle(self, budgets: List[Dict[str, Any]], on_done: Callable[[List[EngineCycleResult]], None]) -> Future:
+        """
+        Start a cycle; ``on_done`` gets the results (in budget order) when every engine finished.
+        Sequential mode runs the cycle before returning.
+        """
+        done: Future = Future()
+
+        def finish(results: List[EngineCycleResult]) -> None:
+            try:
+                on_done(results)
+                done.set_result(results)
+            except BaseException as e:
+                done.set_exception(e)
+
+        if self._drivers is None:
+            try:
+                finish([self.run_engine(b) for b in budgets])
+            except BaseException as e:
+                done.set_exception(e)
+            return done
+
+        seq, self._seq = self._seq, self._seq + 1
+        futures = [self._drivers.submit(self.run_engine, b, seq) for b in budgets]
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def _one_done(_: Future) -> None:
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            errors = [f.exception() for f in futures if f.exception() is not None]
+            if errors:
+                done.set_exception(errors[0])
+            else:
+                finish([f.result() for f in futures])
+
+        if not futures:
+            finish([])
+        for f in futures:
+            f.add_done_callback(_one_done)
+        return done
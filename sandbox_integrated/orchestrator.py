@@ -3,10 +3,12 @@ import importlib
 import json
 import os
 import time
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from sandbox_integrated.engine_profile import EngineCycleResult, EngineProfile
+from sandbox_integrated.executor import CycleExecutor, ExecutionConfig
 from sandbox_integrated.reporting import write_cycle_report
 from sandbox_integrated.resources import ResourceState, allocate_budgets
 
@@ -16,17 +18,19 @@ from security.phase3_guard import assert_phase3_safety
 
 @dataclass
 class IntegratedSandboxConfig:
-    cycle_seconds: int
+    cycle_seconds: float
     resources: Dict[str, Any]
     engines: List[Dict[str, Any]]
+    execution: ExecutionConfig = field(default_factory=ExecutionConfig)
 
 
 def load_config(path: str) -> IntegratedSandboxConfig:
     raw = json.loads(open(path, "r", encoding="utf-8").read())
     return IntegratedSandboxConfig(
-        cycle_seconds=int(raw.get("cycle_seconds", 30)),
+        cycle_seconds=float(raw.get("cycle_seconds", 30)),
         resources=raw.get("resources", {}),
         engines=raw.get("engines", []),
+        execution=ExecutionConfig.from_dict(raw.get("execution")),
     )
 
 
@@ -57,20 +61,35 @@ def run_integrated(
 
     engines_cfg = cfg.engines
     engines: Dict[str, EngineProfile] = {}
+    modules: Dict[str, str] = {}
     for e in engines_cfg:
         if e.get("enabled"):
             engines[str(e["name"])] = load_engine(str(e["module"]))
+            modules[str(e["name"])] = str(e["module"])
 
     if not engines:
         raise RuntimeError("No enabled engines. Set engines[].enabled=true in config.")
 
-    cycle = 0
-    while True:
-        cycle += 1
-        if max_cycles is not None and cycle > max_cycles:
-            break
-
-        cycle_id = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+    ex = cfg.execution
+    executor = CycleExecutor(ex, engines, modules)
+    period = cfg.cycle_seconds
+    t0 = time.monotonic()
+    tick = 0  # fixed_rate: index of the next scheduled start
+    inflight: List[Future] = []
+
+    def _reap(block_until_below: int) -> None:
+        # drop finished cycles (re-raising engine errors); wait while too many are in flight
+        while True:
+            for f in [f for f in inflight if f.done()]:
+                inflight.remove(f)
+                f.result()
+            if len(inflight) < block_until_below:
+                return
+            inflight[0].result()
+
+    def _start_cycle(cycle: int, scheduled: float, missed: int) -> Future:
+        cycle_id = time.strftime("%Y%m%d_%H%M%S", time.gmtime()) + f"_{cycle:05d}"
+        started = time.monotonic()
 
         budgets = allocate_budgets(engines_cfg, rs)
         budgets_dict = [
@@ -79,44 +98,54 @@ def run_integrated(
             if b.name in engines
         ]
 
-        results: List[EngineCycleResult] = []
-        total_ingested = total_analyzed = total_intents = 0
-
-        for b in budgets_dict:
-            eng = engines[b["name"]]
-            res = EngineCycleResult(engine_name=eng.name)
-
-            items = eng.ingest(max_items=int(b["max_items"]))
-            res.ingested = len(items)
-
-            analyzed = eng.analyze(items)
-            res.analyzed = len(analyzed)
-
-            intents = eng.propose_actions(analyzed, max_actions=int(b["max_actions"]))
-            res.intents = len(intents)
+        def _report(results: List[EngineCycleResult]) -> None:
+            wall_ms = (time.monotonic() - started) * 1000.0
+            global_metrics = {
+                "sim_capital_pool": rs.sim_capital_pool,
+                "total_ingested": sum(r.ingested for r in results),
+                "total_analyzed": sum(r.analyzed for r in results),
+                "total_intents": sum(r.intents for r in results),
+                "cycle_seconds": cfg.cycle_seconds
+            }
+            schedule = {
+                "cycle": cycle,
+                "mode": ex.mode,
+                "executor": ex.executor,
+                "schedule": ex.schedule,
+                "start_lag_ms": round((started - scheduled) * 1000.0, 3),
+                "wall_ms": round(wall_ms, 3),
+                "overrun": wall_ms > period * 1000.0,
+                "missed_ticks": missed,
+            }
+            write_cycle_report(
+                out_dir=out_dir,
+                cycle_id=cycle_id,
+                budgets=budgets_dict,
+                results=results,
+                global_metrics=global_metrics,
+                schedule=schedule
+            )
+
+        return executor.submit_cycle(budgets_dict, _report)
 
-            export_meta = eng.export(analyzed, intents)
-            res.metrics.update(export_meta or {})
-
-            results.append(res)
-            total_ingested += res.ingested
-            total_analyzed += res.analyzed
-            total_intents += res.intents
-
-        global_metrics = {
-            "sim_capital_pool": rs.sim_capital_pool,
-            "total_ingested": total_ingested,
-            "total_analyzed": total_analyzed,
-            "total_intents": total_intents,
-            "cycle_seconds": cfg.cycle_seconds
-        }
-
-        write_cycle_report(
-            out_dir=out_dir,
-            cycle_id=cycle_id,
-            budgets=budgets_dict,
-            results=results,
-            global_metrics=global_metrics
-        )
-
-        time.sleep(cfg.cycle_seconds)
+    cycle = 0
+    try:
+        while max_cycles is None or cycle < max_cycles:
+            cycle += 1
+            if ex.schedule == "fixed_rate":
+                scheduled = t0 + tick * period
+                now = time.monotonic()
+                if now < scheduled:
+                    time.sleep(scheduled - now)
+                _reap(ex.pipeline_depth)
+                # overrun: ticks that passed while waiting for a free slot are skipped, not queued
+                missed = max(0, int((time.monotonic() - scheduled) // period)) if period > 0 else 0
+                tick += missed + 1
+                inflight.append(_start_cycle(cycle, scheduled + missed * period, missed))
+            else:
+                _start_cycle(cycle, time.monotonic(), 0).result()
+                if max_cycles is None or cycle < max_cycles:
+                    time.sleep(period)
+        _reap(1)
+    finally:
+        executor.close()
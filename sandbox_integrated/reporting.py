@@ -2,18 +2,31 @@ from __future__ import annotations
 import json
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from sandbox_integrated.engine_profile import EngineCycleResult
 
 
+def _stage_totals(results: List[EngineCycleResult]) -> Dict[str, Dict[str, float]]:
+    """Per-stage wall/CPU summed over engines (wall overlaps when engines run concurrently)."""
+    totals: Dict[str, Dict[str, float]] = {}
+    for r in results:
+        for stage, t in r.timings.items():
+            acc = totals.setdefault(stage, {"wall_ms": 0.0, "cpu_ms": 0.0, "max_wall_ms": 0.0})
+            acc["wall_ms"] = round(acc["wall_ms"] + t.get("wall_ms", 0.0), 3)
+            acc["cpu_ms"] = round(acc["cpu_ms"] + t.get("cpu_ms", 0.0), 3)
+            acc["max_wall_ms"] = max(acc["max_wall_ms"], t.get("wall_ms", 0.0))
+    return totals
+
+
 def write_cycle_report(
     *,
     out_dir: str,
     cycle_id: str,
     budgets: List[Dict[str, Any]],
     results: List[EngineCycleResult],
-    global_metrics: Dict[str, Any]
+    global_metrics: Dict[str, Any],
+    schedule: Optional[Dict[str, Any]] = None
 ) -> str:
     Path(out_dir).mkdir(parents=True, exist_ok=True)
     payload = {
@@ -23,6 +36,9 @@ def write_cycle_report(
         "results": [r.__dict__ for r in results],
         "global_metrics": global_metrics,
     }
+    if schedule is not None:
+        payload["schedule"] = schedule
+        payload["stage_totals"] = _stage_totals(results)
     out_path = Path(out_dir) / f"INTEGRATED_{cycle_id}.json"
     out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     return str(out_path)
@@ -1,10 +1,28 @@
 #!/usr/bin/env python3
+"""
+Fetch the catalog sources into knowledge/.
+
+Sources run concurrently (defaults.workers). Politeness is per host: a token
+bucket refilled every politeness_delay_ms (burst per_host_burst), so different
+hosts proceed in parallel while one host never sees more than the configured
+rate. Each worker thread keeps a pooled requests.Session, and robots.txt is
+fetched once per host and cached for robots_ttl_seconds.
+
+knowledge/.ingest_state.json remembers, per URL, the ETag/Last-Modified of the
+last response (sent back as If-None-Match/If-Modified-Since) and the content
+hash of every saved doc, so unchanged feeds cost a 304 and unchanged entries
+are not written again. Validators are only remembered once the source that
+fetched the URL was processed without error, so a failed run refetches.
+"""
 import hashlib
 import json
+import os
 import pathlib
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib import robotparser
 from urllib.parse import urlparse
 
@@ -15,11 +33,15 @@ ROOT = pathlib.Path(".").resolve()
 CATALOG = ROOT / "heimdall/sources/catalog.yaml"
 OUTDIR = ROOT / "knowledge"
 INDEX = ROOT / "knowledge/index.jsonl"
+STATE = ROOT / "knowledge/.ingest_state.json"
 
 UA = None
 TIMEOUT = 12
 DELAY_MS = 600
 PER_SOURCE_KEEP = 200
+WORKERS = 8
+PER_HOST_BURST = 1
+ROBOTS_TTL = 3600
 
 
 def load_catalog():
@@ -27,44 +49,234 @@ def load_catalog():
         print(f"Catalog not found: {CATALOG}", file=sys.stderr)
         return {}
     cfg = yaml.safe_load(CATALOG.read_text(encoding="utf-8")) or {}
-    d = cfg.get("defaults", {}) or {}
-    global UA, TIMEOUT, DELAY_MS, PER_SOURCE_KEEP
+    apply_defaults(cfg.get("defaults", {}) or {})
+    return cfg
+
+
+def apply_defaults(d):
+    global UA, TIMEOUT, DELAY_MS, PER_SOURCE_KEEP, WORKERS, PER_HOST_BURST, ROBOTS_TTL
     UA = d.get("user_agent") or "HeimdallBot/1.0"
     TIMEOUT = int(d.get("timeout_seconds", 12))
     DELAY_MS = int(d.get("politeness_delay_ms", 600))
     PER_SOURCE_KEEP = int(d.get("per_source_keep", 200))
-    return cfg
+    WORKERS = int(d.get("workers", 8))
+    PER_HOST_BURST = int(d.get("per_host_burst", 1))
+    ROBOTS_TTL = int(d.get("robots_ttl_seconds", 3600))
 
 
-def polite_get(url):
-    session = requests.Session()
-    session.headers["User-Agent"] = UA
-    try:
+class HostBucket:
+    """Token bucket for one host; take() blocks until the request may go out."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.t = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        if self.rate <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.t) * self.rate)
+            self.t = now
+            self.tokens -= 1  # reserve; a negative balance is the queue ahead of us
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+class Crawler:
+    def __init__(self, state_path=None):
+        self.state_path = pathlib.Path(state_path or STATE)
+        self.state = self._load_state()
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.buckets = {}
+        self.robots = {}  # host -> (RobotFileParser | None, fetched_at)
+        self.robot_locks = {}
+        self.index_lines = []
+        self.stats = {
+            "requests": 0,
+            "not_modified": 0,
+            "docs": 0,
+            "unchanged": 0,
+            "bytes_downloaded": 0,
+            "bytes_not_downloaded": 0,
+            "bytes_not_written": 0,
+        }
+
+    # ---- state ----
+
+    def _load_state(self):
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"http": {}, "docs": {}}
+
+    def save_state(self):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(".tmp")
+        with self.lock:
+            tmp.write_text(json.dumps(self.state, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.state_path)
+
+    def count(self, key, n=1):
+        with self.lock:
+            self.stats[key] += n
+
+    # ---- http ----
+
+    def session(self):
+        s = getattr(self.local, "session", None)
+        if s is None:
+            s = self.local.session = requests.Session()
+            s.headers["User-Agent"] = UA or "HeimdallBot/1.0"
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            s.mount("http://", adapter)
+            s.mount("https://", adapter)
+        return s
+
+    def bucket(self, host):
+        with self.lock:
+            b = self.buckets.get(host)
+            if b is None:
+                rate = 1000.0 / DELAY_MS if DELAY_MS > 0 else 0.0
+                b = self.buckets[host] = HostBucket(rate, PER_HOST_BURST)
+            return b
+
+    def allowed(self, url):
         up = urlparse(url)
-        robots_url = f"{up.scheme}://{up.netloc}/robots.txt"
-        rp = robotparser.RobotFileParser()
-        rp.set_url(robots_url)
-        rp.read()
-        if not rp.can_fetch(UA, url):
-            return None, f"robots-disallow:{url}"
-    except Exception:
-        pass
-    try:
-        r = session.get(url, timeout=TIMEOUT)
+        host = f"{up.scheme}://{up.netloc}"
+        with self.lock:
+            hlock = self.robot_locks.setdefault(host, threading.Lock())
+        with hlock:
+            rp, at = self.robots.get(host, (None, None))
+            if at is None or time.monotonic() - at > ROBOTS_TTL:
+                rp = None
+                try:
+                    self.bucket(up.netloc).take()
+                    r = self.session().get(f"{host}/robots.txt", timeout=TIMEOUT)
+                    self.count("requests")
+                    if r.status_code in (401, 403):
+                        rp = robotparser.RobotFileParser()
+                        rp.disallow_all = True
+                    elif r.status_code < 400:
+                        rp = robotparser.RobotFileParser()
+                        rp.parse(r.text.splitlines())
+                except Exception:
+                    pass  # unreachable robots.txt: allow, as before
+                self.robots[host] = (rp, time.monotonic())
+        return rp is None or rp.can_fetch(UA or "HeimdallBot/1.0", url)
+
+    def get(self, url, conditional=True):
+        """(response, error); error is "not-modified" when a conditional GET got a 304."""
+        try:
+            if not self.allowed(url):
+                return None, f"robots-disallow:{url}"
+        except Exception:
+            pass
+        known = self.state["http"].get(url, {}) if conditional else {}
+        headers = {}
+        if known.get("etag"):
+            headers["If-None-Match"] = known["etag"]
+        if known.get("last_modified"):
+            headers["If-Modified-Since"] = known["last_modified"]
+        try:
+            self.bucket(urlparse(url).netloc).take()
+            r = self.session().get(url, timeout=TIMEOUT, headers=headers)
+            self.count("requests")
+        except Exception as e:
+            return None, str(e)
+        if r.status_code == 304:
+            self.count("not_modified")
+            self.count("bytes_not_downloaded", known.get("bytes", 0))
+            return None, "not-modified"
         if r.status_code >= 400:
             return None, f"http-{r.status_code}"
+        self.count("bytes_downloaded", len(r.content))
+        if conditional and (r.headers.get("ETag") or r.headers.get("Last-Modified")):
+            # held until commit_validators(): the body has not been processed yet
+            self._pending()[url] = {
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "bytes": len(r.content),
+            }
         return r, None
-    except Exception as e:
-        return None, str(e)
+
+    def _pending(self):
+        pending = getattr(self.local, "pending", None)
+        if pending is None:
+            pending = self.local.pending = {}
+        return pending
+
+    def commit_validators(self):
+        """Remember the ETag/Last-Modified of what this thread fetched since the last commit/discard."""
+        pending, self.local.pending = self._pending(), {}
+        if pending:
+            with self.lock:
+                self.state["http"].update(pending)
+
+    def discard_validators(self):
+        self.local.pending = {}
+
+    # ---- docs ----
+
+    def unchanged(self, key, content_bytes):
+        """True if ``key`` was last saved with this exact content; records the new hash otherwise."""
+        h = hashlib.sha256(content_bytes or b"").hexdigest()
+        with self.lock:
+            if self.state["docs"].get(key) == h:
+                self.stats["unchanged"] += 1
+                self.stats["bytes_not_written"] += len(content_bytes or b"")
+                return True
+            self.state["docs"][key] = h
+            self.stats["docs"] += 1
+            return False
+
+    def add_index(self, meta):
+        with self.lock:
+            self.index_lines.append(json.dumps(meta) + "\n")
+
+    def flush_index(self):
+        with self.lock:
+            lines, self.index_lines = self.index_lines, []
+        if lines:
+            INDEX.parent.mkdir(parents=True, exist_ok=True)
+            with INDEX.open("a", encoding="utf-8") as fh:
+                fh.write("".join(lines))
+
+
+_crawler = None
+
+
+def crawler():
+    global _crawler
+    if _crawler is None:
+        _crawler = Crawler()
+    return _crawler
+
+
+def polite_get(url):
+    return crawler().get(url)
 
 
 def sha(s):
     return hashlib.sha256(s.encode("utf-8", "ignore")).hexdigest()[:16]
 
 
-def save_doc(category, source_name, title, url, published, content_bytes, ext="txt", meta=None):
+def _source_dir(category, source_name):
     src_slug = re.sub(r"[^a-z0-9\-_.]+", "-", (source_name or "src").lower())
-    cdir = OUTDIR / category / src_slug
+    return OUTDIR / category / src_slug
+
+
+def save_doc(category, source_name, title, url, published, content_bytes, ext="txt", meta=None):
+    """Write one doc and queue its index line; returns None when the content is unchanged."""
+    c = crawler()
+    if c.unchanged(f"{category}/{source_name}/{url or title}", content_bytes):
+        return None
+    cdir = _source_dir(category, source_name)
     cdir.mkdir(parents=True, exist_ok=True)
     ts = int(time.time())
     hid = sha(url or (title or str(ts)))
@@ -83,32 +295,36 @@ def save_doc(category, source_name, title, url, published, content_bytes, ext="t
             "ts": ts,
         }
     )
-    INDEX.parent.mkdir(parents=True, exist_ok=True)
-    with INDEX.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(meta) + "\n")
+    c.add_index(meta)
     return fpath
 
 
 def prune_source(category, source_name):
-    src_slug = re.sub(r"[^a-z0-9\-_.]+", "-", (source_name or "src").lower())
-    cdir = OUTDIR / category / src_slug
+    cdir = _source_dir(category, source_name)
     if not cdir.exists():
         return
-    files = sorted(
-        [p for p in cdir.glob("*") if p.is_file()], key=lambda p: p.stat().st_mtime, reverse=True
-    )
-    for p in files[PER_SOURCE_KEEP:]:
+
+    def ts_of(name):
+        # files are named {ts}_{hash}.{ext}, so age comes from the name instead of a stat
+        head = name.split("_", 1)[0]
+        return int(head) if head.isdigit() else 0
+
+    with os.scandir(cdir) as it:
+        names = sorted((e.name for e in it if e.is_file()), key=lambda n: (ts_of(n), n), reverse=True)
+    for name in names[PER_SOURCE_KEEP:]:
         try:
-            p.unlink()
-        except:
+            (cdir / name).unlink()
+        except OSError:
             pass
 
 
 def ingest_rss(cat, src):
     import feedparser
 
-    url = src["url"]
-    fp = feedparser.parse(url)
+    r, err = polite_get(src["url"])
+    if err or not r:
+        return 0
+    fp = feedparser.parse(r.content)
     count = 0
     for e in fp.entries[:50]:
         title = e.get("title") or "(no title)"
@@ -116,9 +332,10 @@ def ingest_rss(cat, src):
         published = e.get("published") or e.get("updated") or ""
         summary = e.get("summary") or ""
         text = (title + "\n\n" + summary).encode("utf-8", "ignore")
-        save_doc(cat, src["name"], title, link, published, text, ext="md", meta={"kind": "rss"})
-        count += 1
-    prune_source(cat, src["name"])
+        if save_doc(cat, src["name"], title, link, published, text, ext="md", meta={"kind": "rss"}):
+            count += 1
+    if count:
+        prune_source(cat, src["name"])
     return count
 
 
@@ -143,7 +360,7 @@ def ingest_web(cat, src):
     title = re.search(r"<title>(.*?)</title>", html, flags=re.I | re.S)
     title = title.group(1).strip() if title else src["name"]
     text = html_to_text(html)
-    save_doc(
+    saved = save_doc(
         cat,
         src["name"],
         title,
@@ -153,22 +370,23 @@ def ingest_web(cat, src):
         ext="txt",
         meta={"kind": "web"},
     )
+    if not saved:
+        return 0
     prune_source(cat, src["name"])
-    time.sleep(DELAY_MS / 1000.0)
     return 1
 
 
 def ingest_github(cat, src):
     repo = src["name"]
     branch = src.get("branch", "main")
-    base = f"https://raw.githubusercontent.com/{repo}/{branch}"
+    base = src.get("base_url") or f"https://raw.githubusercontent.com/{repo}/{branch}"
     files = ["README.md"]
     cnt = 0
     for path in files:
         url = f"{base}/{path}"
         r, err = polite_get(url)
         if r and r.ok:
-            save_doc(
+            saved = save_doc(
                 cat,
                 src["name"],
                 f"{repo}:{path}",
@@ -178,9 +396,9 @@ def ingest_github(cat, src):
                 ext="md",
                 meta={"kind": "github"},
             )
-            cnt += 1
-    prune_source(cat, src["name"])
-    time.sleep(DELAY_MS / 1000.0)
+            cnt += 1 if saved else 0
+    if cnt:
+        prune_source(cat, src["name"])
     return cnt
 
 
@@ -201,47 +419,82 @@ def ingest_arxiv(cat, src):
         summary = e.get("summary", "")
         published = e.get("published", "")
         text = f"# {title}\n\n{summary}".encode("utf-8", "ignore")
-        save_doc(cat, src["name"], title, link, published, text, ext="md", meta={"kind": "arxiv"})
-        cnt += 1
-    prune_source(cat, src["name"])
-    time.sleep(DELAY_MS / 1000.0)
+        if save_doc(cat, src["name"], title, link, published, text, ext="md", meta={"kind": "arxiv"}):
+            cnt += 1
+    if cnt:
+        prune_source(cat, src["name"])
     return cnt
 
 
+INGESTERS = {"rss": ingest_rss, "web": ingest_web, "github": ingest_github, "arxiv": ingest_arxiv}
+
+
+def ingest_source(cat, src):
+    fn = INGESTERS.get((src.get("type") or "").lower())
+    if fn is None:
+        return 0  # youtube and unknown types are not fetched
+    c = crawler()
+    c.discard_validators()
+    try:
+        n = fn(cat, src)
+        c.commit_validators()
+        return n
+    except Exception as e:
+        c.discard_validators()
+        save_doc(
+            cat,
+            src.get("name", "src"),
+            f"[ingest error] {src.get('name')}",
+            src.get("url", ""),
+            "",
+            str(e).encode("utf-8"),
+            ext="txt",
+            meta={"kind": "error"},
+        )
+        return 0
+
+
+def run(cfg, workers=None):
+    """Ingest every catalog source; returns the run stats."""
+    global _crawler
+    _crawler = c = Crawler()
+    cats = cfg.get("categories") or {}
+    jobs = [(cat, src) for cat, sources in cats.items() for src in list(sources or [])[:10]]
+    t0 = time.perf_counter()
+    total = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers or WORKERS), thread_name_prefix="ingest") as pool:
+            for n in pool.map(lambda job: ingest_source(*job), jobs):
+                total += n
+    finally:
+        c.flush_index()
+        c.save_state()
+    elapsed = time.perf_counter() - t0
+    stats = dict(c.stats)
+    stats.update(
+        {
+            "sources": len(jobs),
+            "added": total,
+            "seconds": round(elapsed, 3),
+            "docs_per_sec": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+            "bytes_saved": stats["bytes_not_downloaded"] + stats["bytes_not_written"],
+        }
+    )
+    return stats
+
+
 def main():
     cfg = load_catalog()
-    cats = cfg.get("categories") or {}
-    if not cats:
+    if not (cfg.get("categories") or {}):
         print("No categories in catalog.yaml")
         return 0
-    total = 0
-    for cat, sources in cats.items():
-        sources = list(sources or [])[:10]
-        for src in sources:
-            t = (src.get("type") or "").lower()
-            try:
-                if t == "rss":
-                    total += ingest_rss(cat, src)
-                elif t == "web":
-                    total += ingest_web(cat, src)
-                elif t == "github":
-                    total += ingest_github(cat, src)
-                elif t == "arxiv":
-                    total += ingest_arxiv(cat, src)
-                elif t == "youtube":
-                    pass
-            except Exception as e:
-                save_doc(
-                    cat,
-                    src.get("name", "src"),
-                    f"[ingest error] {src.get('name')}",
-                    src.get("url", ""),
-                    "",
-                    str(e).encode("utf-8"),
-                    ext="txt",
-                    meta={"kind": "error"},
-                )
-    print(f"Ingest complete. Total docs added: {total}")
+    stats = run(cfg)
+    print(f"Ingest complete. Total docs added: {stats['added']}")
+    print(
+        f"  {stats['docs_per_sec']} docs/sec over {stats['seconds']}s; "
+        f"{stats['unchanged']} unchanged, {stats['not_modified']} not modified, "
+        f"{stats['bytes_saved']} bytes saved"
+    )
     return 0
 
 
@@ -0,0 +1,33 @@
+"""Add deal_top_matches (precomputed top-N buyers per deal).
+
+Revision ID: 20260201_deal_top_matches
+Revises: 20260122_add_go_live_tables
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "20260201_deal_top_matches"
+down_revision = "20260122_add_go_live_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if "deal_top_matches" in inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "deal_top_matches",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("deal_id", sa.Integer, nullable=False, index=True),
+        sa.Column("buyer_id", sa.Integer, nullable=False, index=True),
+        sa.Column("rank", sa.Integer, nullable=False),
+        sa.Column("score", sa.Float, nullable=False),
+        sa.Column("reasons", sa.Text, nullable=True),
+        sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("deal_top_matches")
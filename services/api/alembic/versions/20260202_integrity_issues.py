@@ -0,0 +1,67 @@
+"""Add integrity_issues and integrity_rule_marks (incremental integrity monitor).
+
+Also indexes the updated_at columns the integrity rules scan from.
+
+Revision ID: 20260202_integrity_issues
+Revises: 20260201_deal_top_matches
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "20260202_integrity_issues"
+down_revision = "20260201_deal_top_matches"
+branch_labels = None
+depends_on = None
+
+_SCAN_INDEXES = [
+    ("ix_wholesale_pipelines_updated_at", "wholesale_pipelines", ["updated_at"]),
+    ("ix_dispo_assignments_updated_at", "dispo_assignments", ["updated_at"]),
+    ("ix_dispo_assignments_pipeline_id", "dispo_assignments", ["pipeline_id"]),
+    ("ix_contract_records_updated_at", "contract_records", ["updated_at"]),
+]
+
+
+def upgrade():
+    insp = inspect(op.get_bind())
+    tables = insp.get_table_names()
+    if "integrity_issues" not in tables:
+        op.create_table(
+            "integrity_issues",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("rule", sa.String(80), nullable=False, index=True),
+            sa.Column("category", sa.String(80), nullable=False),
+            sa.Column("entity_type", sa.String(80), nullable=False),
+            sa.Column("entity_id", sa.Integer, nullable=False),
+            sa.Column("message", sa.String(500), nullable=False),
+            sa.Column("status", sa.String(20), nullable=False, server_default="open", index=True),
+            sa.Column("first_seen", sa.DateTime, nullable=True),
+            sa.Column("last_seen", sa.DateTime, nullable=True),
+            sa.Column("resolved_at", sa.DateTime, nullable=True),
+            sa.UniqueConstraint("rule", "entity_id", name="uq_integrity_issue_rule_entity"),
+        )
+    if "integrity_rule_marks" not in tables:
+        op.create_table(
+            "integrity_rule_marks",
+            sa.Column("rule", sa.String(80), primary_key=True),
+            sa.Column("high_water", sa.DateTime, nullable=True),
+            sa.Column("last_run_at", sa.DateTime, nullable=True),
+            sa.Column("last_mode", sa.String(20), nullable=True),
+            sa.Column("last_scanned", sa.Integer, nullable=True),
+            sa.Column("last_found", sa.Integer, nullable=True),
+            sa.Column("last_ms", sa.Float, nullable=True),
+        )
+    for name, table, cols in _SCAN_INDEXES:
+        if table in tables and name not in {ix["name"] for ix in insp.get_indexes(table)}:
+            op.create_index(name, table, cols)
+
+
+def downgrade():
+    insp = inspect(op.get_bind())
+    tables = insp.get_table_names()
+    for name, table, _ in _SCAN_INDEXES:
+        if table in tables and name in {ix["name"] for ix in insp.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
+    op.drop_table("integrity_rule_marks")
+    op.drop_table("integrity_issues")
@@ -0,0 +1,29 @@
+"""Add aggregate_snapshots (materialized dashboard counters).
+
+Revision ID: 20260203_aggregate_snapshots
+Revises: 20260202_integrity_issues
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "20260203_aggregate_snapshots"
+down_revision = "20260202_integrity_issues"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if "aggregate_snapshots" in inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "aggregate_snapshots",
+        sa.Column("name", sa.String(40), primary_key=True),
+        sa.Column("payload", sa.Text, nullable=False),
+        sa.Column("computed_at", sa.DateTime, nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("aggregate_snapshots")
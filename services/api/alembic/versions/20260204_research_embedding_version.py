@@ -0,0 +1,29 @@
+"""Add research_docs.embedding_updated_at (semantic index version marker).
+
+Revision ID: 20260204_research_embedding_version
+Revises: 20260203_aggregate_snapshots
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "20260204_research_embedding_version"
+down_revision = "20260203_aggregate_snapshots"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    insp = inspect(op.get_bind())
+    if "research_docs" not in insp.get_table_names():
+        return
+    if "embedding_updated_at" in {c["name"] for c in insp.get_columns("research_docs")}:
+        return
+    op.add_column("research_docs", sa.Column("embedding_updated_at", sa.DateTime, nullable=True))
+    op.create_index("ix_research_docs_embedding_updated_at", "research_docs", ["embedding_updated_at"])
+
+
+def downgrade():
+    op.drop_index("ix_research_docs_embedding_updated_at", table_name="research_docs")
+    op.drop_column("research_docs", "embedding_updated_at")
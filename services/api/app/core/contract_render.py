@@ -1,45 +1,251 @@
 """
 Render helper for contracts: Jinja2 template -> text -> PDF (via ReportLab).
+
+Compiled templates are kept in an LRU keyed by the hash of the template
+source (CONTRACT_TEMPLATE_CACHE_SIZE), so rendering the same template again
+is just a ``render`` call. Lines are wrapped on real font metrics: per-character
+widths are measured once per (font, size) and reused by every document.
+
+``render_batch`` renders many documents (a closing packet, mass offer letters)
+on a process pool (CONTRACT_PDF_WORKERS) and hands each PDF to a sink as soon
+as it is done, so finished files reach storage while the rest still render.
+The pool is created on first use, shared by every request and uses the spawn
+start method: forking the threaded API server could copy locks held by other
+threads (DB pool, logging) into the children.
 """
 
+import hashlib
 import io
-from typing import Dict, Any
-from jinja2 import Environment, BaseLoader
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from jinja2 import BaseLoader, Environment, Template
 from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+TEMPLATE_CACHE_SIZE = int(os.getenv("CONTRACT_TEMPLATE_CACHE_SIZE", "256"))
+PDF_WORKERS = int(os.getenv("CONTRACT_PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+FONT = "Helvetica"
+FONT_SIZE = 10
+LEADING = 14
+PARA_GAP = 6
+MARGIN = 0.75 * inch
+
+_env = Environment(loader=BaseLoader(), autoescape=False, trim_blocks=True, lstrip_blocks=True)
+_templates: "OrderedDict[str, Template]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def template_key(template_str: str) -> str:
+    return hashlib.sha256(template_str.encode("utf-8")).hexdigest()
+
+
+def compile_template(template_str: str) -> Template:
+    """Compiled template for this source, from the LRU when it has been seen before."""
+    key = template_key(template_str)
+    with _lock:
+        tmpl = _templates.get(key)
+        if tmpl is not None:
+            _templates.move_to_end(key)
+            return tmpl
+    tmpl = _env.from_string(template_str)
+    with _lock:
+        _templates[key] = tmpl
+        while len(_templates) > TEMPLATE_CACHE_SIZE:
+            _templates.popitem(last=False)
+    return tmpl
 
 
 def render_text(template_str: str, data: Dict[str, Any]) -> str:
-    env = Environment(loader=BaseLoader(), autoescape=False, trim_blocks=True, lstrip_blocks=True)
-    tmpl = env.from_string(template_str)
-    return tmpl.render(**data)
+    return compile_template(template_str).render(**data)
 
 
-def make_pdf(text: str) -> bytes:
+# ---- layout ----
+
+@lru_cache(maxsize=32)
+def _ascii_widths(font: str, size: float) -> Tuple[float, ...]:
+    """Widths of chars 0..255, measured once per (font, size)."""
+    return tuple(stringWidth(chr(i), font, size) for i in range(256))
+
+
+def text_width(s: str, font: str = FONT, size: float = FONT_SIZE) -> float:
+    widths = _ascii_widths(font, size)
+    return sum(widths[o] if (o := ord(ch)) < 256 else stringWidth(ch, font, size) for ch in s)
+
+
+def wrap_lines(para: str, max_width: float, font: str = FONT, size: float = FONT_SIZE) -> List[str]:
+    """
+    Greedy word wrap of one paragraph to ``max_width`` points; words wider than
+    a line are split by character. An empty paragraph yields no lines.
+    """
+    lines: List[str] = []
+    cur, cur_w = "", 0.0
+    space = text_width(" ", font, size)
+    for word in para.split(" "):
+        w = text_width(word, font, size)
+        if cur and cur_w + space + w <= max_width:
+            cur, cur_w = f"{cur} {word}", cur_w + space + w
+            continue
+        if cur:
+            lines.append(cur)
+        cur, cur_w = word, w
+        while cur_w > max_width and len(cur) > 1:
+            # hard-break an over-long word at the last char that fits
+            acc, cut = 0.0, 0
+            for ch in cur:
+                cw = text_width(ch, font, size)
+                if acc + cw > max_width and cut:
+                    break
+                acc, cut = acc + cw, cut + 1
+            lines.append(cur[:cut])
+            cur = cur[cut:]
+            cur_w = text_width(cur, font, size)
+    if cur:
+        lines.append(cur)
+    return lines
+
+
+def render_pdf(text: str, font: str = FONT, size: float = FONT_SIZE) -> Tuple[bytes, int]:
+    """Lay out ``text`` on LETTER pages; returns (pdf bytes, page count)."""
     buf = io.BytesIO()
     c = canvas.Canvas(buf, pagesize=LETTER)
     width, height = LETTER
-    x, y = 0.75 * inch, height - 0.75 * inch
-    c.setFont("Helvetica", 10)
-    # simple word-wrap
+    max_width = width - 2 * MARGIN
+    top = height - MARGIN
+    pages = 1
+    y = top
+    t = c.beginText(MARGIN, y)
+    t.setFont(font, size)
+
+    def new_page():
+        nonlocal t, y, pages
+        c.drawText(t)
+        c.showPage()
+        pages += 1
+        y = top
+        t = c.beginText(MARGIN, y)
+        t.setFont(font, size)
+
     for para in text.split("\n"):
-        line = para
-        while len(line) > 0:
-            # ~90 chars per line approximate; tweak if needed
-            chunk = line[:90]
-            c.drawString(x, y, chunk)
-            y -= 14
-            line = line[90:]
-            if y < 0.75 * inch:
-                c.showPage()
-                c.setFont("Helvetica", 10)
-                y = height - 0.75 * inch
-        y -= 6
-        if y < 0.75 * inch:
-            c.showPage()
-            c.setFont("Helvetica", 10)
-            y = height - 0.75 * inch
+        for line in wrap_lines(para, max_width, font, size):
+            t.setTextOrigin(MARGIN, y)
+            t.textOut(line)
+            y -= LEADING
+            if y < MARGIN:
+                new_page()
+        y -= PARA_GAP
+        if y < MARGIN:
+            new_page()
+    c.drawText(t)
     c.showPage()
     c.save()
-    return buf.getvalue()
+    return buf.getvalue(), pages
+
+
+def make_pdf(text: str) -> bytes:
+    return render_pdf(text)[0]
+
+
+# ---- batch rendering ----
+
+def render_document(template_str: str, data: Dict[str, Any], filename: str) -> Dict[str, Any]:
+    """Render one document: the filename is a template too. Runs in pool workers."""
+    name = render_text(filename, data)
+    if not name.endswith(".pdf"):
+        name += ".pdf"
+    pdf, pages = render_pdf(render_text(template_str, data))
+    return {"filename": name, "pdf": pdf, "pages": pages}
+
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(workers: int = PDF_WORKERS) -> ProcessPoolExecutor:
+    """Shared spawn-context render pool of this size, created on first use."""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return pool
+
+
+def shutdown(wait: bool = True) -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+def render_batch(
+    jobs: Iterable[Dict[str, Any]],
+    sink: Callable[[Dict[str, Any]], None],
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Render ``jobs`` ({"template", "data", "filename"} dicts) and pass each finished
+    document ({"filename", "pdf", "pages"} plus the job's other keys) to ``sink``.
+
+    Uses a process pool when workers > 1; at most 2 * workers documents are in
+    flight, so memory stays flat however long the batch is. Documents reach the
+    sink in completion order. Returns documents, pages, bytes, errors (job index
+    and message), seconds and pages_per_sec.
+    """
+    workers = PDF_WORKERS if workers is None else workers
+    stats: Dict[str, Any] = {"documents": 0, "pages": 0, "bytes": 0, "errors": []}
+    t0 = time.perf_counter()
+
+    def _deliver(job: Dict[str, Any], doc: Dict[str, Any]) -> None:
+        extra = {k: v for k, v in job.items() if k not in ("template", "data", "filename")}
+        sink({**extra, **doc})
+        stats["documents"] += 1
+        stats["pages"] += doc["pages"]
+        stats["bytes"] += len(doc["pdf"])
+
+    if workers <= 1:
+        for i, job in enumerate(jobs):
+            try:
+                doc = render_document(job["template"], job.get("data") or {}, job["filename"])
+            except Exception as e:
+                stats["errors"].append({"index": i, "error": f"{type(e).__name__}: {e}"})
+                continue
+            _deliver(job, doc)
+    else:
+        pool = get_pool(workers)
+        pending: Dict[Any, Tuple[int, Dict[str, Any]]] = {}
+
+        def _drain(block_until: int) -> None:
+            while len(pending) > block_until:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    i, job = pending.pop(fut)
+                    try:
+                        doc = fut.result()
+                    except Exception as e:
+                        stats["errors"].append({"index": i, "error": f"{type(e).__name__}: {e}"})
+                        continue
+                    _deliver(job, doc)
+
+        for i, job in enumerate(jobs):
+            fut = pool.submit(render_document, job["template"], job.get("data") or {}, job["filename"])
+            pending[fut] = (i, job)
+            _drain(2 * workers - 1)
+        _drain(0)
+
+    elapsed = time.perf_counter() - t0
+    stats["errors"].sort(key=lambda e: e["index"])
+    stats["seconds"] = round(elapsed, 3)
+    stats["pages_per_sec"] = round(stats["pages"] / elapsed, 1) if elapsed > 0 else 0.0
+    return stats
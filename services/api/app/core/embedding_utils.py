@@ -2,12 +2,33 @@
 Local embedding utilities for semantic search.
 Provides deterministic pseudo-embeddings without external API calls.
 NOT semantic quality - replace with real embedding model (OpenAI, Cohere) later.
+
+Embeddings go through a provider (``EMBEDDING_PROVIDER``, see
+``register_provider``) and a content-hash keyed cache: an in-memory LRU in
+front of a SQLite file (``EMBEDDING_CACHE_PATH``), so re-embedding unchanged
+text costs a lookup. ``embed_batch`` embeds many texts with one provider call
+for the cache misses; vectors come back as float32-precision lists.
 """
 
 import hashlib
-import math
 import os
-from typing import List
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+CACHE_ENABLED = os.getenv("EMBEDDING_CACHE", "1").lower() in {"1", "true", "yes", "on"}
+CACHE_PATH = os.getenv(
+    "EMBEDDING_CACHE_PATH",
+    os.path.join(os.getenv("EMBEDDING_INDEX_DIR", os.path.join("data", "embeddings")), "cache.sqlite3"),
+)
+CACHE_MEM_ITEMS = int(os.getenv("EMBEDDING_CACHE_MEM_ITEMS", "4096"))
+
+
+def _default_dim() -> int:
+    return int(os.getenv("EMBEDDING_DIM", "256"))
 
 
 def _hash_f32(s: str) -> float:
@@ -19,68 +40,246 @@ def _hash_f32(s: str) -> float:
     return max(-1.0, min(1.0, f))
 
 
+def _hash_matrix(texts: Sequence[str], dim: int) -> np.ndarray:
+    """
+    Pseudo-embeddings for many texts as one (n, dim) float64 matrix.
+
+    Same segmentation as the original per-text loop (up to ``dim`` chunks of
+    len // dim characters, zero padded); the digest prefixes of all chunks are
+    decoded, mapped to [-1, 1) and row-normalized in single NumPy operations.
+    """
+    out = np.zeros((len(texts), dim), dtype=np.float64)
+    digests = bytearray()
+    counts = np.zeros(len(texts), dtype=np.int64)
+    for r, text in enumerate(texts):
+        if not text:
+            continue
+        step = max(1, len(text) // dim)
+        end = min(len(text), step * dim)
+        for i in range(0, end, step):
+            digests += hashlib.sha256(text[i : i + step].encode("utf-8")).digest()[:4]
+        counts[r] = -(-end // step)
+    if digests:
+        n = np.frombuffer(bytes(digests), dtype=">u4").astype(np.int64)
+        rows = np.repeat(np.arange(len(texts)), counts)
+        cols = np.arange(len(n)) - np.repeat(np.cumsum(counts) - counts, counts)
+        out[rows, cols] = (n % 2000000) / 1000000.0 - 1.0
+    norms = np.linalg.norm(out, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return out / norms
+
+
 def local_embed(text: str, dim: int | None = None) -> List[float]:
     """
     Cheap, deterministic pseudo-embedding for development/testing.
-    
+
     Args:
         text: Input text to embed
         dim: Vector dimension (defaults to EMBEDDING_DIM env var or 256)
-    
+
     Returns:
         L2-normalized float vector of length dim
-    
+
     WARNING: This is NOT a semantic embedding! It's deterministic and position-based.
     Documents with similar text structure (not meaning) may have similar vectors.
     Replace with a real embedding model for production use.
     """
     if dim is None:
-        dim = int(os.getenv("EMBEDDING_DIM", "256"))
-    
-    if not text:
-        return [0.0] * dim
-    
-    # Chunk text roughly into dim segments
-    step = max(1, len(text) // dim)
-    vec = []
-    
-    for i in range(0, len(text), step):
-        if len(vec) >= dim:
-            break
-        chunk = text[i:i+step]
-        vec.append(_hash_f32(chunk))
-    
-    # Pad if short
-    while len(vec) < dim:
-        vec.append(0.0)
-    
-    # L2 normalize
-    norm = math.sqrt(sum(x*x for x in vec)) or 1.0
-    return [x / norm for x in vec[:dim]]
+        dim = _default_dim()
+    return _hash_matrix([text], dim)[0].tolist()
+
+
+# ---- providers ----
+
+class EmbeddingProvider:
+    """
+    Turns a batch of texts into an (n, dim) array of L2-normalized vectors.
+
+    Subclass and ``register_provider`` a factory to plug in a real model; bump
+    ``version`` when the model's output changes so old cache entries are not reused.
+    """
+
+    name = "base"
+    version = "1"
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.name}:{self.version}:{self.dim}"
+
+    def embed_batch(self, texts: Sequence[str]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class LocalHashProvider(EmbeddingProvider):
+    name = "local"
+
+    def embed_batch(self, texts: Sequence[str]) -> np.ndarray:
+        return _hash_matrix(texts, self.dim)
+
+
+_PROVIDERS: Dict[str, Callable[[int], EmbeddingProvider]] = {"local": LocalHashProvider}
+_instances: Dict[tuple, EmbeddingProvider] = {}
+_lock = threading.Lock()
+
+
+def register_provider(name: str, factory: Callable[[int], EmbeddingProvider]) -> None:
+    """Make ``EMBEDDING_PROVIDER=<name>`` use ``factory(dim)``."""
+    with _lock:
+        _PROVIDERS[name] = factory
+        for key in [k for k in _instances if k[0] == name]:
+            del _instances[key]
+
+
+def get_provider(name: Optional[str] = None, dim: Optional[int] = None) -> EmbeddingProvider:
+    name = name or os.getenv("EMBEDDING_PROVIDER", "local")
+    dim = dim or _default_dim()
+    if name not in _PROVIDERS:
+        name = "local"  # fall back to local if the provider is not registered
+    with _lock:
+        p = _instances.get((name, dim))
+        if p is None:
+            p = _instances[(name, dim)] = _PROVIDERS[name](dim)
+        return p
+
+
+# ---- cache ----
+
+class EmbeddingCache:
+    """Content-hash -> float32 vector; LRU in memory over a SQLite table."""
+
+    def __init__(self, path: Optional[str] = CACHE_PATH, mem_items: int = CACHE_MEM_ITEMS):
+        self.path = path
+        self.mem_items = mem_items
+        self._mem: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.path:
+            d = os.path.dirname(self.path)
+            if d:
+                os.makedirs(d, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, dim INTEGER, vec BLOB)")
+        return self._conn
+
+    @staticmethod
+    def key(provider: EmbeddingProvider, text: str) -> str:
+        return hashlib.sha256(f"{provider.cache_key}\0{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, vec: np.ndarray) -> None:
+        self._mem[key] = vec
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.mem_items:
+            self._mem.popitem(last=False)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for k in keys:
+                v = self._mem.get(k)
+                if v is not None:
+                    self._mem.move_to_end(k)
+                    found[k] = v
+            rest = [k for k in dict.fromkeys(keys) if k not in found]
+            conn = self._db() if rest else None
+            for i in range(0, len(rest) if conn is not None else 0, 500):
+                part = rest[i : i + 500]
+                sql = f"SELECT key, vec FROM embeddings WHERE key IN ({','.join('?' * len(part))})"
+                for k, blob in conn.execute(sql, part):
+                    v = np.frombuffer(blob, dtype=np.float32)
+                    found[k] = v
+                    self._remember(k, v)
+            self.hits += sum(1 for k in keys if k in found)
+            self.misses += sum(1 for k in keys if k not in found)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            rows = []
+            for k, v in items.items():
+                v = np.ascontiguousarray(v, dtype=np.float32)
+                self._remember(k, v)
+                rows.append((k, int(v.shape[0]), v.tobytes()))
+            conn = self._db()
+            if conn is not None and rows:
+                conn.executemany("INSERT OR REPLACE INTO embeddings (key, dim, vec) VALUES (?, ?, ?)", rows)
+                conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "memory_items": len(self._mem)}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache: Optional[EmbeddingCache] = None
+
+
+def get_cache() -> Optional[EmbeddingCache]:
+    """Process-wide cache, or None when EMBEDDING_CACHE=0."""
+    global _cache
+    if not CACHE_ENABLED:
+        return None
+    with _lock:
+        if _cache is None:
+            _cache = EmbeddingCache()
+        return _cache
+
+
+# ---- public API ----
+
+def embed_batch(
+    texts: Sequence[str],
+    provider: Optional[EmbeddingProvider] = None,
+    cache: Optional[EmbeddingCache] = None,
+) -> List[List[float]]:
+    """
+    Embed many texts; cached vectors are reused and the misses (deduplicated)
+    go to the provider in a single call. Pass ``cache=None`` to use the
+    process-wide cache (disabled with EMBEDDING_CACHE=0).
+    """
+    provider = provider or get_provider()
+    cache = cache if cache is not None else get_cache()
+    texts = [t or "" for t in texts]
+    if not texts:
+        return []
+    if cache is None:
+        return provider.embed_batch(texts).astype(np.float32).tolist()
+
+    keys = [cache.key(provider, t) for t in texts]
+    found = cache.get_many(keys)
+    missing = {k: t for k, t in zip(keys, texts) if k not in found}
+    if missing:
+        mat = np.asarray(provider.embed_batch(list(missing.values())), dtype=np.float32)
+        fresh = dict(zip(missing.keys(), mat))
+        cache.put_many(fresh)
+        found.update(fresh)
+    return np.stack([found[k] for k in keys]).tolist()
 
 
 def embed_text(text: str) -> List[float]:
     """
     Main embedding function with provider abstraction.
-    
+
     Args:
         text: Input text to embed
-    
+
     Returns:
         Embedding vector as list of floats
-    
-    Future: Add OpenAI, Cohere, or other providers via EMBEDDING_PROVIDER setting.
+
+    Providers are chosen by EMBEDDING_PROVIDER (see register_provider); unknown
+    names fall back to the local pseudo-embedding.
     """
-    provider = os.getenv("EMBEDDING_PROVIDER", "local")
-    
-    if provider == "local":
-        return local_embed(text)
-    
-    # Future: plug external providers here
-    # elif provider == "openai":
-    #     return openai_embed(text)
-    # elif provider == "cohere":
-    #     return cohere_embed(text)
-    
-    # Fallback to local if provider not implemented
-    return local_embed(text)
+    return embed_batch([text])[0]
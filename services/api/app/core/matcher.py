@@ -2,9 +2,10 @@
 Buyer-Deal matching core logic with fuzzy scoring.
 """
 
-from typing import List, Tuple
+from typing import Iterator, List, Sequence, Tuple
 from decimal import Decimal
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
 def _split_csv(s: str | None) -> List[str]:
     return [x.strip() for x in (s or "").split(",") if x.strip()]
@@ -70,3 +71,123 @@ def score_buyer_vs_deal(buyer, deal) -> Tuple[float, List[str]]:
             reasons.append(f"tag≈headline ({tscore:.2f})")
 
     return min(1.0, score), reasons
+
+
+class BuyerMatrix:
+    """
+    Buyers pre-parsed once into columns so many deals can be scored in one go.
+
+    ``score(deals)`` returns a (len(deals), len(buyers)) matrix that is equal to
+    calling score_buyer_vs_deal for every pair: the numeric rules are NumPy
+    broadcasts, and region/tag similarity is one rapidfuzz ``cdist`` over the
+    flattened buyer lists, reduced to a per-buyer max.
+    """
+
+    def __init__(self, buyers: Sequence):
+        self.buyers = list(buyers)
+        n = len(self.buyers)
+        self.ids = np.array([b.id for b in self.buyers], dtype=np.int64)
+        self.lo = np.array([float(b.min_price or 0) for b in self.buyers], dtype=np.float64)
+        self.hi = np.array([float(b.max_price or 10**12) for b in self.buyers], dtype=np.float64)
+        self.min_beds = np.array([b.min_beds or 0 for b in self.buyers], dtype=np.int64)
+        self.min_baths = np.array([b.min_baths or 0 for b in self.buyers], dtype=np.int64)
+        self.has_regions = np.array([bool(b.regions) for b in self.buyers], dtype=bool)
+        self.has_tags = np.array([bool(b.tags) for b in self.buyers], dtype=bool)
+        self.regions, self.region_starts = self._flatten([b.regions for b in self.buyers])
+        self.tags, self.tag_starts = self._flatten([b.tags for b in self.buyers])
+        vocab: dict = {}
+        pairs = []
+        for i, b in enumerate(self.buyers):
+            for t in {t.lower() for t in _split_csv(b.property_types)}:
+                pairs.append((i, vocab.setdefault(t, len(vocab))))
+        self.type_vocab = vocab
+        self.types = np.zeros((n, len(vocab)), dtype=bool)
+        for i, j in pairs:
+            self.types[i, j] = True
+
+    def __len__(self) -> int:
+        return len(self.buyers)
+
+    @staticmethod
+    def _flatten(csvs: List[str | None]) -> Tuple[List[str], np.ndarray]:
+        flat: List[str] = []
+        starts = np.zeros(len(csvs) + 1, dtype=np.int64)
+        for i, s in enumerate(csvs):
+            flat.extend(x.lower() for x in _split_csv(s))
+            starts[i + 1] = len(flat)
+        return flat, starts
+
+    def _best_similarity(self, flat: List[str], starts: np.ndarray, texts: List[str], scorer) -> np.ndarray:
+        """(deals, buyers) max similarity in [0,1] between each buyer's list and each text."""
+        out = np.zeros((len(texts), len(self.buyers)), dtype=np.float64)
+        if not flat or not texts:
+            return out
+        sim = process.cdist(flat, texts, scorer=scorer, dtype=np.float64) / 100.0
+        nonempty = np.flatnonzero(starts[1:] > starts[:-1])
+        out[:, nonempty] = np.maximum.reduceat(sim, starts[nonempty], axis=0).T
+        return out
+
+    def score(self, deals: Sequence) -> np.ndarray:
+        deals = list(deals)
+        S = np.zeros((len(deals), len(self.buyers)), dtype=np.float64)
+        if not deals or not self.buyers:
+            return S
+
+        # Region match (soft fuzzy)
+        region = [(d.region or "").lower() for d in deals]
+        rs = self._best_similarity(self.regions, self.region_starts, region, fuzz.token_set_ratio)
+        gate = self.has_regions[None, :] & np.array([bool(d.region) for d in deals])[:, None] & (rs >= 0.6)
+        S += np.where(gate, 0.25 * rs, 0.0)
+
+        # Type match (exact from list)
+        cols = np.array([self.type_vocab.get((d.property_type or "").lower(), -1) if d.property_type else -1 for d in deals])
+        if self.types.shape[1]:
+            hit = self.types[:, np.maximum(cols, 0)].T & (cols >= 0)[:, None]
+            S += np.where(hit, 0.25, 0.0)
+
+        # Price window, with soft decay near the boundary (±10%)
+        has_price = np.array([d.price is not None for d in deals])
+        p = np.array([float(d.price) if d.price is not None else 0.0 for d in deals], dtype=np.float64)[:, None]
+        lo, hi = self.lo[None, :], self.hi[None, :]
+        inside = (lo <= p) & (p <= hi)
+        width = np.maximum(1.0, 0.1 * np.maximum(hi, 1.0))
+        dist = np.where(p < lo, (lo - p) / width, np.where(p > hi, (p - hi) / width, 0.0))
+        near = np.where(dist < 1.0, np.maximum(0.0, 0.15 * (1.0 - dist)), 0.0)
+        S += np.where(has_price[:, None], np.where(inside, 0.25, near), 0.0)
+
+        # Beds/baths minima
+        beds = np.array([d.beds or 0 for d in deals], dtype=np.int64)[:, None]
+        baths = np.array([d.baths or 0 for d in deals], dtype=np.int64)[:, None]
+        S += np.where(self.min_beds[None, :] <= beds, 0.15, 0.0)
+        S += np.where(self.min_baths[None, :] <= baths, 0.10, 0.0)
+
+        # Headline fuzzy alignment with buyer tags
+        heads = [(d.headline or "").lower() for d in deals]
+        ts = self._best_similarity(self.tags, self.tag_starts, heads, fuzz.partial_ratio)
+        gate = self.has_tags[None, :] & np.array([bool(d.headline) for d in deals])[:, None] & (ts >= 0.6)
+        S += np.where(gate, 0.10 * ts, 0.0)
+
+        return np.minimum(S, 1.0)
+
+    def iter_scores(self, deals: Sequence, chunk: int = 512) -> Iterator[Tuple[List, np.ndarray]]:
+        """Score deals in chunks to bound the (chunk, buyers) matrix size."""
+        deals = list(deals)
+        for i in range(0, len(deals), max(1, chunk)):
+            part = deals[i:i + chunk]
+            yield part, self.score(part)
+
+
+def top_n(scores: np.ndarray, limit: int, min_score: float = 0.0) -> List[Tuple[int, float]]:
+    """
+    Best (column, score) pairs of one score row, highest first, ties in column order
+    (the same order a stable sort over the original list gives).
+    """
+    if limit <= 0 or not scores.size:
+        return []
+    if limit < scores.size:
+        kth = np.partition(scores, scores.size - limit)[scores.size - limit]
+        cand = np.flatnonzero(scores >= max(kth, min_score))
+    else:
+        cand = np.flatnonzero(scores >= min_score)
+    order = cand[np.lexsort((cand, -scores[cand]))][:limit]
+    return [(int(j), float(scores[j])) for j in order]
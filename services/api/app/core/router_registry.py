@@ -0,0 +1,255 @@
+"""
+Router registry: mounts the pack routers, profiles their import cost, and can
+defer heavy packs until they are actually used.
+
+``main.py`` calls ``registry.mount(name, module, attr, **include_kwargs)`` for
+every pack instead of a hand-written ``try: import / include_router`` block.
+Each mount records the import wall time and the resident memory it added
+(plus Python allocations when ``STARTUP_PROFILE_TRACEMALLOC=1``). Shared
+modules are charged to the first pack that imports them.
+
+Mount modes (``ROUTER_MOUNT_MODE``):
+
+- ``eager`` (default): every pack is imported at startup, in file order,
+  exactly as before.
+- ``lazy``: a pack whose URL prefixes are known from the manifest and whose
+  last recorded import took at least ``ROUTER_LAZY_MIN_MS`` is deferred. It is
+  imported on the first request under one of its prefixes, or by the
+  background warmup that starts ``ROUTER_WARMUP_DELAY_SECONDS`` after the app
+  is ready (``ROUTER_WARMUP=0`` disables the warmup).
+
+The manifest (``ROUTER_MANIFEST_PATH``; ``services/api/.router_manifest.json``
+by default in lazy mode, not written at all in eager mode unless the path is
+set) stores each pack's prefixes and import time. It is rewritten after any
+boot that imported packs, so the first boot of a new build is always eager.
+Deferred routes are appended after the eager ones, so a deferred pack must not
+depend on route order relative to other packs. Packs with overlapping
+catch-all paths should stay eager.
+"""
+
+import asyncio
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from starlette.concurrency import run_in_threadpool
+
+log = logging.getLogger("valhalla.startup")
+
+MOUNT_MODE = os.getenv("ROUTER_MOUNT_MODE", "eager").strip().lower()
+LAZY_MIN_MS = float(os.getenv("ROUTER_LAZY_MIN_MS", "25"))
+WARMUP = os.getenv("ROUTER_WARMUP", "1").lower() in {"1", "true", "yes", "on"}
+WARMUP_DELAY_SECONDS = float(os.getenv("ROUTER_WARMUP_DELAY_SECONDS", "2"))
+# only lazy mode needs the manifest: eager boots don't write one unless asked to
+MANIFEST_PATH = os.getenv("ROUTER_MANIFEST_PATH") or (
+    os.path.join(os.path.dirname(__file__), "..", "..", ".router_manifest.json") if MOUNT_MODE == "lazy" else None
+)
+TRACE_ALLOC = os.getenv("STARTUP_PROFILE_TRACEMALLOC", "0") == "1"
+
+
+def _rss_kb() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * (os.sysconf("SC_PAGE_SIZE") // 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _route_prefixes(paths: List[str]) -> List[str]:
+    """Static heads of route paths (up to the first path parameter), minus redundant ones."""
+    heads = set()
+    for p in paths:
+        head = p.split("{", 1)[0]
+        if "{" in p:
+            head = head.rsplit("/", 1)[0] + "/"
+        heads.add(head or "/")
+    out: List[str] = []
+    for h in sorted(heads, key=len):
+        if not any(h.startswith(o) and o.endswith("/") for o in out):
+            out.append(h)
+    return sorted(out)
+
+
+@dataclass
+class RouterEntry:
+    name: str
+    module: str
+    attr: str = "router"
+    include_kwargs: Dict[str, Any] = field(default_factory=dict)
+    status: str = "pending"  # pending | deferred | mounted | failed
+    trigger: Optional[str] = None  # startup | request | warmup
+    import_ms: Optional[float] = None
+    rss_kb: Optional[int] = None
+    alloc_kb: Optional[int] = None
+    routes: int = 0
+    prefixes: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class RouterRegistry:
+    def __init__(self, app: FastAPI, mode: str = MOUNT_MODE, manifest_path: Optional[str] = MANIFEST_PATH):
+        self.app = app
+        self.mode = mode
+        self.manifest_path = manifest_path
+        self.entries: Dict[str, RouterEntry] = {}
+        self._lock = threading.RLock()
+        self._manifest = self._read_manifest()
+        self._dirty = False
+        self.t0 = time.perf_counter()
+        self.ready_ms: Optional[float] = None
+        self.warmup_ms: Optional[float] = None
+        if TRACE_ALLOC and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    # ---- manifest ----
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        if not self.manifest_path:
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("routers", {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self) -> None:
+        if not self.manifest_path or not self._dirty:
+            return
+        data = dict(self._manifest)
+        for e in self.entries.values():
+            if e.status == "mounted" and e.prefixes:
+                data[e.name] = {"module": e.module, "attr": e.attr, "prefixes": e.prefixes, "import_ms": e.import_ms}
+        try:
+            tmp = self.manifest_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"routers": data}, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.manifest_path)
+            self._dirty = False
+        except OSError as e:
+            log.warning("Could not write router manifest %s: %s", self.manifest_path, e)
+
+    # ---- mounting ----
+
+    def mount(self, name: str, module: str, attr: str = "router", lazy: Optional[bool] = None, **include_kwargs: Any) -> RouterEntry:
+        """Register a pack router; imports it now unless it can be deferred."""
+        if name in self.entries:
+            name = f"{name}#{sum(1 for n in self.entries if n.split('#')[0] == name) + 1}"
+        entry = RouterEntry(name=name, module=module, attr=attr, include_kwargs=include_kwargs)
+        self.entries[name] = entry
+        known = self._manifest.get(name)
+        if lazy is None:
+            lazy = (
+                self.mode == "lazy"
+                and bool(known)
+                and known.get("module") == module
+                and (known.get("import_ms") or 0.0) >= LAZY_MIN_MS
+            )
+        if lazy and known and known.get("prefixes"):
+            entry.status, entry.prefixes = "deferred", list(known["prefixes"])
+            return entry
+        self._load(entry, "startup")
+        return entry
+
+    def _load(self, entry: RouterEntry, trigger: str) -> None:
+        with self._lock:
+            if entry.status in ("mounted", "failed"):
+                return
+            before = len(self.app.router.routes)
+            rss0 = _rss_kb()
+            alloc0 = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+            t0 = time.perf_counter()
+            try:
+                router = getattr(importlib.import_module(entry.module), entry.attr)
+                entry.import_ms = round((time.perf_counter() - t0) * 1000.0, 3)
+                self.app.include_router(router, **entry.include_kwargs)
+            except Exception as e:
+                entry.status, entry.error = "failed", f"{type(e).__name__}: {e}"
+                entry.import_ms = round((time.perf_counter() - t0) * 1000.0, 3)
+                print(f"WARNING: {entry.name} load failed:", e)
+                return
+            finally:
+                entry.trigger = trigger
+                rss1 = _rss_kb()
+                if rss0 is not None and rss1 is not None:
+                    entry.rss_kb = rss1 - rss0
+                if alloc0 is not None:
+                    entry.alloc_kb = (tracemalloc.get_traced_memory()[0] - alloc0) // 1024
+            added = self.app.router.routes[before:]
+            entry.status, entry.routes = "mounted", len(added)
+            entry.prefixes = _route_prefixes([getattr(r, "path", "") for r in added if getattr(r, "path", "")])
+            self._dirty = True
+            if trigger != "startup":
+                self.app.openapi_schema = None  # regenerate docs with the new routes
+
+    # ---- deferred packs ----
+
+    def deferred(self) -> List[RouterEntry]:
+        return [e for e in self.entries.values() if e.status == "deferred"]
+
+    def _matching(self, path: str) -> List[RouterEntry]:
+        return [e for e in self.deferred() if any(path == p.rstrip("/") or path.startswith(p) for p in e.prefixes)]
+
+    def load_for_path(self, path: str) -> int:
+        hits = self._matching(path)
+        for e in hits:
+            self._load(e, "request")
+        if hits:
+            self.save_manifest()
+        return len(hits)
+
+    def install(self) -> None:
+        """Add the first-request loader middleware (no-op when nothing is deferred)."""
+        if not self.deferred():
+            return
+
+        @self.app.middleware("http")
+        async def _mount_deferred_routers(request: Request, call_next):
+            if self.deferred() and self._matching(request.url.path):
+                await run_in_threadpool(self.load_for_path, request.url.path)
+            return await call_next(request)
+
+    async def warmup(self, delay: float = WARMUP_DELAY_SECONDS) -> None:
+        """Import remaining deferred packs in the background once the app is serving."""
+        await asyncio.sleep(delay)
+        t0 = time.perf_counter()
+        for e in self.deferred():
+            await run_in_threadpool(self._load, e, "warmup")
+            await asyncio.sleep(0)
+        self.warmup_ms = round((time.perf_counter() - t0) * 1000.0, 3)
+        self.save_manifest()
+
+    def on_ready(self) -> None:
+        """Call from the lifespan once startup finished."""
+        self.ready_ms = round((time.perf_counter() - self.t0) * 1000.0, 3)
+        self.save_manifest()
+        if WARMUP and self.deferred():
+            asyncio.get_running_loop().create_task(self.warmup())
+
+    # ---- report ----
+
+    def report(self) -> Dict[str, Any]:
+        entries = sorted(self.entries.values(), key=lambda e: -(e.import_ms or 0.0))
+        by_status: Dict[str, int] = {}
+        for e in entries:
+            by_status[e.status] = by_status.get(e.status, 0) + 1
+        startup = [e for e in entries if e.trigger == "startup"]
+        return {
+            "mode": self.mode,
+            "routers": len(entries),
+            "by_status": by_status,
+            "startup_import_ms": round(sum(e.import_ms or 0.0 for e in startup), 3),
+            "startup_rss_kb": sum(e.rss_kb or 0 for e in startup),
+            "registry_to_ready_ms": self.ready_ms,
+            "warmup_ms": self.warmup_ms,
+            "tracemalloc": tracemalloc.is_tracing(),
+            "entries": [
+                {k: v for k, v in asdict(e).items() if k != "include_kwargs"} for e in entries
+            ],
+        }
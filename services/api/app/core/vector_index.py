@@ -0,0 +1,330 @@
+"""
+Contiguous float32 embedding matrix for cosine search.
+
+All vectors are L2-normalized once on insert and kept as rows of a single
+(n, dim) float32 matrix, so a query is one matmul + argpartition instead of a
+json.loads / np.dot per row. The matrix and its row ids are persisted as
+``.npy`` sidecars that are memory-mapped on load; the database stays the
+source of truth and the sidecar is reconciled against it (see ``sync_ids``);
+a small ``.meta.json`` marker records which DB state the sidecar reflects.
+
+For large corpora an IVF mode (k-means coarse quantizer) restricts each query
+to the ``nprobe`` closest clusters.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_DIR = os.getenv("EMBEDDING_INDEX_DIR", os.path.join("data", "embeddings"))
+
+
+def _normalize_rows(m: np.ndarray) -> np.ndarray:
+    n = np.linalg.norm(m, axis=1, keepdims=True)
+    n[n == 0] = 1.0
+    return (m / n).astype(np.float32, copy=False)
+
+
+class VectorIndex:
+    """Row-per-doc normalized embedding matrix with optional IVF probing."""
+
+    def __init__(
+        self,
+        name: str,
+        directory: str = DEFAULT_DIR,
+        ivf_min_rows: int = 20000,
+        nprobe: int = 8,
+        flush_every: int = 500,
+    ):
+        self.name = name
+        self.directory = directory
+        self.ivf_min_rows = ivf_min_rows
+        self.nprobe = nprobe
+        self.flush_every = flush_every
+        self._lock = threading.RLock()
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._mat = np.zeros((0, 0), dtype=np.float32)
+        self._n = 0
+        self._pos: Dict[int, int] = {}
+        self._loaded = False
+        self._dirty = 0
+        self._ivf: Optional[Tuple[np.ndarray, List[np.ndarray]]] = None
+        self._ivf_n = 0
+        self.rejected = 0
+        # caller-defined version of the source rows (persisted with the sidecar)
+        self.marker: Optional[dict] = None
+        self.stats_data: Dict[str, float] = {
+            "build_ms": 0.0,
+            "ivf_build_ms": 0.0,
+            "last_query_ms": 0.0,
+            "total_query_ms": 0.0,
+            "queries": 0,
+        }
+
+    # ---- paths / persistence ----
+
+    @property
+    def matrix_path(self) -> str:
+        return os.path.join(self.directory, f"{self.name}.npy")
+
+    @property
+    def ids_path(self) -> str:
+        return os.path.join(self.directory, f"{self.name}.ids.npy")
+
+    @property
+    def meta_path(self) -> str:
+        return os.path.join(self.directory, f"{self.name}.meta.json")
+
+    def load(self) -> bool:
+        """Memory-map the sidecar if present. Returns True when something was loaded."""
+        with self._lock:
+            self._loaded = True
+            try:
+                mat = np.load(self.matrix_path, mmap_mode="r")
+                ids = np.load(self.ids_path)
+            except (FileNotFoundError, ValueError, OSError):
+                return False
+            if mat.ndim != 2 or len(ids) != mat.shape[0]:
+                return False
+            self._mat, self._ids, self._n = mat, ids.astype(np.int64), len(ids)
+            self._pos = {int(i): r for r, i in enumerate(self._ids)}
+            self._ivf = None
+            try:
+                with open(self.meta_path, encoding="utf-8") as f:
+                    self.marker = json.load(f)
+            except (FileNotFoundError, ValueError, OSError):
+                self.marker = None
+            return True
+
+    def flush(self) -> None:
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            for path, arr in ((self.matrix_path, self._mat[: self._n]), (self.ids_path, self._ids[: self._n])):
+                tmp = path + ".tmp.npy"
+                np.save(tmp, np.ascontiguousarray(arr))
+                os.replace(tmp, path)
+            self._write_marker()
+            self._dirty = 0
+
+    def _write_marker(self) -> None:
+        tmp = self.meta_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.marker, f)
+        os.replace(tmp, self.meta_path)
+
+    def set_marker(self, marker: Optional[dict]) -> None:
+        """Record the source version the matrix now reflects (flushing pending rows first)."""
+        with self._lock:
+            self.marker = marker
+            if self._dirty:
+                self.flush()
+            else:
+                os.makedirs(self.directory, exist_ok=True)
+                self._write_marker()
+
+    # ---- building / updating ----
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def dim(self) -> int:
+        return int(self._mat.shape[1]) if self._n else 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def ids(self) -> np.ndarray:
+        return self._ids[: self._n]
+
+    def build(self, rows: Iterable[Tuple[int, Sequence[float]]]) -> int:
+        """Replace the whole matrix from (doc_id, vector) pairs."""
+        t0 = time.perf_counter()
+        ids: List[int] = []
+        vecs: List[Sequence[float]] = []
+        dim = 0
+        rejected = 0
+        for doc_id, vec in rows:
+            if not vec:
+                continue
+            if not dim:
+                dim = len(vec)
+            if len(vec) != dim:
+                rejected += 1
+                continue
+            ids.append(int(doc_id))
+            vecs.append(vec)
+        with self._lock:
+            self._loaded = True
+            self._mat = _normalize_rows(np.asarray(vecs, dtype=np.float32).reshape(len(vecs), dim))
+            self._ids = np.asarray(ids, dtype=np.int64)
+            self._n = len(ids)
+            self._pos = {i: r for r, i in enumerate(ids)}
+            self._ivf = None
+            self.rejected = rejected
+            self.stats_data["build_ms"] = (time.perf_counter() - t0) * 1000.0
+            self.flush()
+        return self._n
+
+    def _writable(self, extra: int) -> None:
+        need = self._n + extra
+        cap = self._mat.shape[0]
+        if isinstance(self._mat, np.memmap) or need > cap:
+            new_cap = max(need, cap * 2 if need > cap else cap, 64)
+            m = np.zeros((new_cap, self._mat.shape[1]), dtype=np.float32)
+            m[: self._n] = self._mat[: self._n]
+            ids = np.zeros(new_cap, dtype=np.int64)
+            ids[: self._n] = self._ids[: self._n]
+            self._mat, self._ids = m, ids
+
+    def upsert(self, doc_id: int, vector: Sequence[float]) -> bool:
+        """Insert or overwrite one row. Returns False if the dimension does not match."""
+        with self._lock:
+            v = np.asarray(vector, dtype=np.float32)
+            if v.ndim != 1 or not v.size:
+                return False
+            if not self._n:
+                self._mat = np.zeros((0, v.size), dtype=np.float32)
+                self._ids = np.zeros(0, dtype=np.int64)
+            elif v.size != self.dim:
+                self.rejected += 1
+                return False
+            n = np.linalg.norm(v)
+            v = v / n if n else v
+            doc_id = int(doc_id)
+            self._writable(1)
+            r = self._pos.get(doc_id)
+            if r is None:
+                r = self._n
+                self._ids[r] = doc_id
+                self._pos[doc_id] = r
+                self._n += 1
+                if self._ivf is not None and self._n > 2 * self._ivf_n:
+                    self._ivf = None  # retrained lazily on the next IVF query
+                elif self._ivf is not None:
+                    c = int(np.argmax(self._ivf[0] @ v))
+                    self._ivf[1][c] = np.append(self._ivf[1][c], r)
+            self._mat[r] = v
+            self._dirty += 1
+            if self._dirty >= self.flush_every:
+                self.flush()
+            return True
+
+    def remove(self, doc_ids: Iterable[int]) -> int:
+        with self._lock:
+            drop = {int(i) for i in doc_ids if int(i) in self._pos}
+            if not drop:
+                return 0
+            keep = np.array([int(i) not in drop for i in self._ids[: self._n]], dtype=bool)
+            self._mat = np.ascontiguousarray(self._mat[: self._n][keep])
+            self._ids = self._ids[: self._n][keep]
+            self._n = len(self._ids)
+            self._pos = {int(i): r for r, i in enumerate(self._ids)}
+            self._ivf = None
+            self.flush()
+            return len(drop)
+
+    def sync_ids(self, db_ids: Iterable[int], fetch: Callable[[List[int]], Iterable[Tuple[int, Sequence[float]]]]) -> Dict[str, int]:
+        """Reconcile with the authoritative id set: drop stale rows, fetch and add missing ones."""
+        with self._lock:
+            want = {int(i) for i in db_ids}
+            have = set(self._pos)
+            removed = self.remove(have - want)
+            missing = sorted(want - have)
+            added = 0
+            for doc_id, vec in fetch(missing) if missing else ():
+                added += int(self.upsert(doc_id, vec))
+            if added:
+                self.flush()
+            return {"added": added, "removed": removed}
+
+    # ---- IVF ----
+
+    def build_ivf(self, nlist: Optional[int] = None, iters: int = 8, seed: int = 0) -> None:
+        """Train a k-means coarse quantizer (cosine / spherical k-means) and bucket rows by centroid."""
+        with self._lock:
+            t0 = time.perf_counter()
+            X = np.asarray(self._mat[: self._n])
+            if not len(X):
+                self._ivf = None
+                return
+            nlist = int(nlist or max(1, int(np.sqrt(len(X)))))
+            rng = np.random.default_rng(seed)
+            sample = X[rng.choice(len(X), size=min(len(X), nlist * 64), replace=False)]
+            cents = sample[rng.choice(len(sample), size=min(nlist, len(sample)), replace=False)].copy()
+            for _ in range(iters):
+                assign = np.argmax(sample @ cents.T, axis=1)
+                for c in range(len(cents)):
+                    members = sample[assign == c]
+                    if len(members):
+                        cents[c] = members.mean(axis=0)
+                cents = _normalize_rows(cents)
+            assign = np.argmax(X @ cents.T, axis=1)
+            lists = [np.flatnonzero(assign == c) for c in range(len(cents))]
+            self._ivf = (cents, lists)
+            self._ivf_n = self._n
+            self.stats_data["ivf_build_ms"] = (time.perf_counter() - t0) * 1000.0
+
+    # ---- query ----
+
+    def search(self, vector: Sequence[float], top_k: int = 5, min_score: float = -1.0, mode: str = "auto") -> List[Tuple[int, float]]:
+        """Top-k (doc_id, cosine) pairs. mode: "exact" | "ivf" | "auto" (ivf past ivf_min_rows)."""
+        t0 = time.perf_counter()
+        with self._lock:
+            q = np.asarray(vector, dtype=np.float32)
+            if not self._n or q.ndim != 1 or q.size != self.dim:
+                return []
+            n = np.linalg.norm(q)
+            q = q / n if n else q
+            use_ivf = mode == "ivf" or (mode == "auto" and self._n >= self.ivf_min_rows)
+            if use_ivf and self._ivf is None:
+                self.build_ivf()
+            if use_ivf and self._ivf is not None:
+                cents, lists = self._ivf
+                probe = np.argsort(-(cents @ q))[: self.nprobe]
+                rows = np.concatenate([lists[c] for c in probe]) if len(probe) else np.zeros(0, dtype=np.int64)
+                scores = self._mat[rows] @ q
+            else:
+                rows = None
+                scores = self._mat[: self._n] @ q
+            k = min(max(1, int(top_k)), len(scores))
+            if not k:
+                return []
+            part = np.argpartition(-scores, k - 1)[:k]
+            part = part[np.argsort(-scores[part])]
+            out = []
+            for p in part:
+                s = float(scores[p])
+                if s < min_score:
+                    break
+                r = int(rows[p]) if rows is not None else int(p)
+                out.append((int(self._ids[r]), s))
+        dt = (time.perf_counter() - t0) * 1000.0
+        self.stats_data["last_query_ms"] = dt
+        self.stats_data["total_query_ms"] += dt
+        self.stats_data["queries"] += 1
+        return out
+
+    def stats(self) -> Dict[str, object]:
+        q = self.stats_data["queries"]
+        return {
+            "rows": self._n,
+            "dimension": self.dim,
+            "rejected_dimension_mismatch": self.rejected,
+            "mode": "ivf" if self._ivf is not None else "exact",
+            "ivf_lists": len(self._ivf[1]) if self._ivf is not None else 0,
+            "build_ms": round(self.stats_data["build_ms"], 3),
+            "ivf_build_ms": round(self.stats_data["ivf_build_ms"], 3),
+            "last_query_ms": round(self.stats_data["last_query_ms"], 3),
+            "avg_query_ms": round(self.stats_data["total_query_ms"] / q, 3) if q else 0.0,
+            "queries": int(q),
+            "sidecar": self.matrix_path,
+        }
+
+
+research_vectors = VectorIndex("research_docs")
@@ -2,32 +2,53 @@
 Match jobs for sweeping top buyer-deal matches.
 """
 
+import json
+from typing import Dict, List, Optional, Sequence, Tuple
+
 from sqlalchemy.orm import Session
 from app.core.db import SessionLocal
-from app.models.match import Buyer, DealBrief
-from app.core.matcher import score_buyer_vs_deal
+from app.models.match import Buyer, DealBrief, DealTopMatch
+from app.core.matcher import BuyerMatrix, score_buyer_vs_deal, top_n
+
+
+def compute_top_matches(buyers: Sequence, deals: Sequence, limit: int = 10, min_score: float = 0.4) -> Dict[int, List[Tuple[object, float]]]:
+    """Top `limit` (buyer, score) pairs per deal id, scored in batch."""
+    matrix = BuyerMatrix(buyers)
+    out: Dict[int, List[Tuple[object, float]]] = {}
+    for part, scores in matrix.iter_scores(deals):
+        for d, row in zip(part, scores):
+            out[d.id] = [(matrix.buyers[j], s) for j, s in top_n(row, limit, min_score)]
+    return out
+
 
-def sweep_top_matches(limit: int = 10) -> dict:
-    """Compute top matches for all active deals vs active buyers (no persistence, returns counts)."""
-    db: Session = SessionLocal()
+def sweep_top_matches(limit: int = 10, min_score: float = 0.4, db: Optional[Session] = None) -> dict:
+    """Compute top matches for all active deals vs active buyers and persist them to deal_top_matches."""
+    own = db is None
+    db = db or SessionLocal()
     try:
         deals = db.query(DealBrief).filter(DealBrief.status == "active").all()
         buyers = db.query(Buyer).filter(Buyer.active.is_(True)).all()
-        count = 0
-        for d in deals:
-            ranked = []
-            for b in buyers:
-                s, _ = score_buyer_vs_deal(b, d)
-                ranked.append((s, b.id))
-            ranked.sort(reverse=True, key=lambda t: t[0])
-            top = [bid for s, bid in ranked[:limit] if s >= 0.4]
-            if top:
-                count += 1
+        by_id = {d.id: d for d in deals}
+        top = compute_top_matches(buyers, deals, limit=limit, min_score=min_score)
+        rows = []
+        for deal_id, hits in top.items():
+            for rank, (b, s) in enumerate(hits, start=1):
+                _, why = score_buyer_vs_deal(b, by_id[deal_id])  # reasons only for persisted pairs
+                rows.append({"deal_id": deal_id, "buyer_id": b.id, "rank": rank, "score": round(s, 4), "reasons": json.dumps(why)})
+        db.query(DealTopMatch).delete(synchronize_session=False)
+        if rows:
+            db.bulk_insert_mappings(DealTopMatch, rows)
+        db.commit()
         return {
             "ok": True,
             "deals_evaluated": len(deals),
             "buyers_evaluated": len(buyers),
-            "deals_with_top_hits": count
+            "deals_with_top_hits": sum(1 for hits in top.values() if hits),
+            "matches_persisted": len(rows),
         }
+    except Exception:
+        db.rollback()
+        raise
     finally:
-        db.close()
+        if own:
+            db.close()
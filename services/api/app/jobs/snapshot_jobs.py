@@ -0,0 +1,43 @@
+"""
+Background refresh of the materialized aggregate snapshot (aggregate_snapshots).
+
+Only useful with AGGREGATE_SNAPSHOT_MATERIALIZED=1; the API runs
+``refresh_loop`` when AGGREGATE_SNAPSHOT_REFRESH_SECONDS > 0.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.db import SessionLocal
+from app.services.aggregate_snapshot import refresh_materialized
+
+log = logging.getLogger(__name__)
+
+REFRESH_SECONDS = float(os.getenv("AGGREGATE_SNAPSHOT_REFRESH_SECONDS", "0"))
+
+
+def refresh_aggregate_snapshot(db: Optional[Session] = None) -> Dict[str, Any]:
+    """Recompute and store every snapshot part; returns {"ok", "parts", "computed_at", "ms"}."""
+    own = db is None
+    db = db or SessionLocal()
+    try:
+        return refresh_materialized(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        if own:
+            db.close()
+
+
+async def refresh_loop(interval: float = REFRESH_SECONDS) -> None:
+    while True:
+        try:
+            await asyncio.to_thread(refresh_aggregate_snapshot)
+        except Exception as e:
+            log.warning("aggregate snapshot refresh failed: %s", e)
+        await asyncio.sleep(interval)
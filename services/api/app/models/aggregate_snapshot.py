@@ -0,0 +1,16 @@
+"""
+PACK AK: Materialized aggregate snapshot rows (dashboard counters, holdings groups).
+Written by the snapshot refresh job; see app.services.aggregate_snapshot.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, String, Text, DateTime
+from app.models.base import Base
+
+
+class AggregateSnapshot(Base):
+    __tablename__ = "aggregate_snapshots"
+
+    name = Column(String(40), primary_key=True)  # counters, holdings_groups
+    payload = Column(Text, nullable=False)       # JSON
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
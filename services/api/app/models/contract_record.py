@@ -39,7 +39,8 @@ class ContractRecord(Base):
     updated_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now()
+        onupdate=func.now(),
+        index=True,
     )
     signed_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -32,7 +32,7 @@ class DispoAssignment(Base):
 
     id = Column(Integer, primary_key=True, index=True)
 
-    pipeline_id = Column(Integer, nullable=False)  # from WholesalePipeline.id
+    pipeline_id = Column(Integer, nullable=False, index=True)  # from WholesalePipeline.id
     buyer_id = Column(Integer, ForeignKey("dispo_buyer_profiles.id"), nullable=False)
 
     status = Column(
@@ -47,6 +47,6 @@ class DispoAssignment(Base):
     notes = Column(String, nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     buyer = relationship("DispoBuyerProfile", back_populates="assignments")
@@ -0,0 +1,41 @@
+"""
+PACK AN: Integrity Monitor Models
+Persisted integrity issues and per-rule scan high-water marks.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, DateTime, UniqueConstraint
+from app.models.base import Base
+
+
+class IntegrityIssueRecord(Base):
+    """One issue per (rule, entity); reopened/resolved in place as the entity changes."""
+
+    __tablename__ = "integrity_issues"
+    __table_args__ = (UniqueConstraint("rule", "entity_id", name="uq_integrity_issue_rule_entity"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    rule = Column(String(80), nullable=False, index=True)
+    category = Column(String(80), nullable=False)
+    entity_type = Column(String(80), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    message = Column(String(500), nullable=False)
+
+    status = Column(String(20), nullable=False, default="open", index=True)  # open, resolved
+    first_seen = Column(DateTime, default=datetime.utcnow)
+    last_seen = Column(DateTime, default=datetime.utcnow)
+    resolved_at = Column(DateTime, nullable=True)
+
+
+class IntegrityRuleMark(Base):
+    """How far a rule has scanned (max updated_at seen) and what its last run cost."""
+
+    __tablename__ = "integrity_rule_marks"
+
+    rule = Column(String(80), primary_key=True)
+    high_water = Column(DateTime, nullable=True)
+    last_run_at = Column(DateTime, nullable=True)
+    last_mode = Column(String(20), nullable=True)  # full, incremental
+    last_scanned = Column(Integer, nullable=True)
+    last_found = Column(Integer, nullable=True)
+    last_ms = Column(Float, nullable=True)
@@ -2,7 +2,7 @@
 Buyer matching models for deal-to-buyer intelligence.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Numeric, func
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Numeric, Float, func
 from ..core.db import Base
 
 class Buyer(Base):
@@ -33,3 +33,14 @@ class DealBrief(Base):
     notes = Column(Text, nullable=True)
     status = Column(String(40), nullable=False, default="active")  # active, under_contract, sold, archived
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+class DealTopMatch(Base):
+    """Precomputed top-N buyers per active deal, written by the match sweep job."""
+    __tablename__ = "deal_top_matches"
+    id = Column(Integer, primary_key=True)
+    deal_id = Column(Integer, nullable=False, index=True)
+    buyer_id = Column(Integer, nullable=False, index=True)
+    rank = Column(Integer, nullable=False)
+    score = Column(Float, nullable=False)
+    reasons = Column(Text, nullable=True)               # JSON list of strings
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
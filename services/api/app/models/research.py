@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, event
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -35,11 +35,18 @@ class ResearchDoc(Base):
     ingested_at = Column(DateTime, default=datetime.utcnow)
     metadata_json = Column(Text, nullable=True)  # JSON for extra fields
     embedding_json = Column(Text, nullable=True)  # JSON list of floats (vector)
+    embedding_updated_at = Column(DateTime, nullable=True, index=True)  # version of embedding_json
 
     # Relationship
     source = relationship("ResearchSource", back_populates="docs")
 
 
+@event.listens_for(ResearchDoc.embedding_json, "set")
+def _stamp_embedding(target, value, oldvalue, initiator):
+    # the semantic index compares max(embedding_updated_at) to its sidecar marker
+    target.embedding_updated_at = datetime.utcnow()
+
+
 class ResearchQuery(Base):
     """Log of queries Heimdall has made (for analytics/improvement)"""
     __tablename__ = "research_queries"
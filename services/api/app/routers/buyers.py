@@ -9,6 +9,7 @@ from ..core.db import get_db
 from ..core.dependencies import require_builder_key
 from ..models.match import Buyer
 from ..schemas.match import BuyerIn, BuyerOut
+from ..services import buy_box_index  # noqa: F401  (keeps the match index in step with buyer writes)
 
 router = APIRouter(prefix="/buyers", tags=["buyers"])
 
@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.core.db import get_db
 from app.models.deal import Deal
-from app.models.match import DealBrief, Buyer
+from app.models.match import DealBrief
 from app.models.freeze_events import FreezeEvent
 from app.schemas.closing_context import (
     ClosingContext,
@@ -19,7 +19,7 @@ from app.schemas.closing_context import (
     UnderwritingSummary,
 )
 from app.schemas.flows_lead_to_deal import BuyerMatchCandidate
-from app.routers.flow_lead_to_deal import _score_buyer_for_deal  # reuse matcher
+from app.services.buy_box_index import match_buyers
 
 router = APIRouter(
     prefix="/flow",
@@ -181,19 +181,7 @@ def _find_top_buyers(
     if deal_brief is None:
         return []
 
-    buyers = db.query(Buyer).filter(Buyer.active.is_(True)).all()
-    candidates: List[BuyerMatchCandidate] = []
-
-    for buyer in buyers:
-        candidate = _score_buyer_for_deal(buyer, deal_brief)
-        if candidate is None:
-            continue
-        if candidate.score < min_score:
-            continue
-        candidates.append(candidate)
-
-    candidates.sort(key=lambda c: c.score, reverse=True)
-    return candidates[:max_results]
+    return match_buyers(db, deal_brief, min_score=min_score, max_results=max_results)
 
 
 def _build_script(context: ClosingContext) -> Dict[str, Any]:
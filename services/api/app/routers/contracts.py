@@ -10,9 +10,9 @@ from sqlalchemy.orm import Session
 
 from ..core.db import get_db
 from ..core.dependencies import require_builder_key
-from ..core.contract_render import render_text, make_pdf
+from ..core.contract_render import render_text, make_pdf, render_batch
 from ..models.contracts import ContractTemplate, ContractRecord
-from ..schemas.contracts import TemplateIn, TemplateOut, GenerateIn, RecordOut
+from ..schemas.contracts import TemplateIn, TemplateOut, GenerateIn, RecordOut, GenerateBatchIn, BatchOut
 
 router = APIRouter(prefix="/contracts", tags=["contracts"])
 
@@ -64,6 +64,38 @@ def generate_contract(payload: GenerateIn, db: Session = Depends(get_db), _: boo
     return RecordOut(id=rec.id, filename=rec.filename, template_id=rec.template_id)
 
 
+@router.post("/generate_batch", response_model=BatchOut)
+def generate_batch(payload: GenerateBatchIn, db: Session = Depends(get_db), _: bool = Depends(require_builder_key)):
+    """
+    Render one template for many data sets (e.g. mass offer letters) on the PDF
+    process pool; each PDF is written to SAVE_DIR as soon as it is rendered.
+    """
+    tmpl = db.get(ContractTemplate, payload.template_id)
+    if not tmpl:
+        raise HTTPException(status_code=404, detail="template not found")
+
+    os.makedirs(SAVE_DIR, exist_ok=True)
+    recs = []
+
+    def save(doc):
+        path = os.path.join(SAVE_DIR, doc["filename"])
+        tmp = path + ".part"
+        with open(tmp, "wb") as f:
+            f.write(doc["pdf"])
+        os.replace(tmp, path)
+        rec = ContractRecord(template_id=tmpl.id, filename=doc["filename"], context_json=json.dumps(doc["context"]))
+        db.add(rec)
+        recs.append(rec)
+
+    jobs = ({"template": tmpl.body_text, "data": it.data, "filename": it.filename, "context": it.data} for it in payload.items)
+    stats = render_batch(jobs, save)
+    db.commit()
+    return BatchOut(
+        records=[RecordOut(id=r.id, filename=r.filename, template_id=r.template_id) for r in recs],
+        **stats,
+    )
+
+
 @router.get("/records", response_model=List[RecordOut])
 def list_records(db: Session = Depends(get_db), _: bool = Depends(require_builder_key)):
     rows = db.query(ContractRecord).order_by(ContractRecord.id.desc()).limit(200).all()
@@ -9,8 +9,9 @@ from sqlalchemy.orm import Session
 
 from app.core.db import get_db
 from app.models.deal import Deal
-from app.models.match import DealBrief, Buyer
+from app.models.match import DealBrief
 from app.models.freeze_events import FreezeEvent
+from app.services.buy_box_index import count_candidates
 
 router = APIRouter(
     prefix="/workflow",
@@ -65,15 +66,7 @@ def _buyer_match_summary(db: Session, deal_brief: DealBrief) -> Dict[str, Any]:
             "candidate_count": None,
         }
 
-    query = db.query(Buyer).filter(Buyer.active.is_(True))
-
-    if deal_brief.region:
-        query = query.filter(Buyer.regions.ilike(f"%{deal_brief.region}%"))
-
-    if deal_brief.property_type:
-        query = query.filter(Buyer.property_types.ilike(f"%{deal_brief.property_type}%"))
-
-    count = query.count()
+    count = count_candidates(db, deal_brief.region, deal_brief.property_type)
 
     return {
         "status": "ok" if count > 0 else "no_candidates",
@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.core.db import get_db
 from app.leads import service as lead_service  # Pack 31 lead service
-from app.models.match import Buyer, DealBrief
+from app.models.match import DealBrief
 from app.models.deal import Deal  # Backend Deal model
 from app.schemas.flows_lead_to_deal import (
     LeadFlowResult,
@@ -28,7 +28,7 @@ from app.schemas.underwriting_engine import (
 )
 from app.services.freeze_events import log_freeze_event
 from app.services.underwriting_engine import run_underwriting
-from app.routers.flow_lead_to_deal import _score_buyer_for_deal  # reuse matcher
+from app.services.buy_box_index import match_buyers
 
 
 router = APIRouter(
@@ -206,19 +206,12 @@ def run_full_deal_pipeline(
     # --------- 6. Buyer matching ---------
     matched_candidates: List[BuyerMatchCandidate] = []
     if payload.match_settings.match_buyers:
-        buyers_query = db.query(Buyer).filter(Buyer.active.is_(True))
-        buyers = buyers_query.all()
-
-        for buyer in buyers:
-            candidate = _score_buyer_for_deal(buyer, deal_brief_obj)
-            if candidate is None:
-                continue
-            if candidate.score < payload.match_settings.min_match_score:
-                continue
-            matched_candidates.append(candidate)
-
-        matched_candidates.sort(key=lambda c: c.score, reverse=True)
-        matched_candidates = matched_candidates[: payload.match_settings.max_results]
+        matched_candidates = match_buyers(
+            db,
+            deal_brief_obj,
+            min_score=payload.match_settings.min_match_score,
+            max_results=payload.match_settings.max_results,
+        )
 
     # --------- 7. Notes / metadata ---------
     notes_parts: List[str] = []
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -26,6 +25,7 @@ from app.services.kpi import emit_kpi
 from app.services.followup_ladder import create_ladder
 from app.services.buyer_liquidity import liquidity_score, record_feedback
 from app.services.offer_strategy import compute_offer
+from app.services.buy_box_index import BuyBox, match_buyers, score_buy_box
 
 router = APIRouter(
     prefix="/flow",
@@ -36,110 +36,12 @@ router = APIRouter(
 # ---------- Internal helpers ----------
 
 
-def _safe_decimal(value: object | None) -> Decimal | None:
-    if value is None:
-        return None
-    if isinstance(value, Decimal):
-        return value
-    try:
-        return Decimal(str(value))
-    except Exception:
-        return None
-
-
-def _normalize_price_range(
-    min_price: Decimal | None,
-    max_price: Decimal | None,
-) -> tuple[Decimal | None, Decimal | None]:
-    if min_price is not None and max_price is not None and max_price < min_price:
-        return max_price, min_price
-    return min_price, max_price
-
-
-def _split_csv(value: str | None) -> List[str]:
-    if not value:
-        return []
-    return [part.strip().lower() for part in value.split(",") if part.strip()]
-
-
 def _score_buyer_for_deal(
     buyer: Buyer,
     deal: DealBrief,
 ) -> BuyerMatchCandidate | None:
-    """
-    Very simple first-pass matcher based on:
-
-    - region overlap
-    - property_type overlap
-    - price range inclusion
-    - beds/baths minimums
-
-    Returns a BuyerMatchCandidate with score 0–1 or None if no signal.
-    """
-    reasons: List[str] = []
-    score_components: List[float] = []
-
-    # Regions / markets
-    buyer_regions = _split_csv(getattr(buyer, "regions", None))
-    deal_region = (deal.region or "").strip().lower()
-    if buyer_regions and deal_region:
-        if deal_region in buyer_regions:
-            score_components.append(0.25)
-            reasons.append("region_match")
-
-    # Property types
-    buyer_types = _split_csv(getattr(buyer, "property_types", None))
-    deal_type = (deal.property_type or "").strip().lower()
-    if buyer_types and deal_type:
-        if deal_type in buyer_types:
-            score_components.append(0.25)
-            reasons.append("property_type_match")
-
-    # Price range
-    deal_price = _safe_decimal(deal.price)
-    min_price = _safe_decimal(getattr(buyer, "min_price", None))
-    max_price = _safe_decimal(getattr(buyer, "max_price", None))
-    min_price, max_price = _normalize_price_range(min_price, max_price)
-
-    if deal_price is not None and (min_price is not None or max_price is not None):
-        in_range = True
-        if min_price is not None and deal_price < min_price:
-            in_range = False
-        if max_price is not None and deal_price > max_price:
-            in_range = False
-
-        if in_range:
-            score_components.append(0.3)
-            reasons.append("price_match")
-
-    # Beds / baths
-    if deal.beds is not None:
-        min_beds = getattr(buyer, "min_beds", None)
-        if min_beds is not None and deal.beds >= min_beds:
-            score_components.append(0.1)
-            reasons.append("beds_ok")
-
-    if deal.baths is not None:
-        min_baths = getattr(buyer, "min_baths", None)
-        if min_baths is not None and deal.baths >= min_baths:
-            score_components.append(0.1)
-            reasons.append("baths_ok")
-
-    if not score_components:
-        return None
-
-    score = sum(score_components)
-    if score > 1.0:
-        score = 1.0
-
-    return BuyerMatchCandidate(
-        buyer_id=buyer.id,
-        name=buyer.name,
-        email=getattr(buyer, "email", None),
-        phone=getattr(buyer, "phone", None),
-        score=score,
-        reasons=reasons,
-    )
+    """Score one buyer against a deal (see services.buy_box_index.score_buy_box)."""
+    return score_buy_box(BuyBox.from_buyer(buyer), deal)
 
 
 # ---------- Main flow endpoint ----------
@@ -333,20 +235,12 @@ def create_lead_and_deal_flow(
 
     matched_candidates: List[BuyerMatchCandidate] = []
     if payload.match_settings.match_buyers:
-        buyers_query = db.query(Buyer).filter(Buyer.active.is_(True))
-        buyers = buyers_query.all()
-
-        for buyer in buyers:
-            candidate = _score_buyer_for_deal(buyer, deal_brief_obj)
-            if candidate is None:
-                continue
-            if candidate.score < payload.match_settings.min_match_score:
-                continue
-            matched_candidates.append(candidate)
-
-        # Sort by score descending and trim to max_results
-        matched_candidates.sort(key=lambda c: c.score, reverse=True)
-        matched_candidates = matched_candidates[: payload.match_settings.max_results]
+        matched_candidates = match_buyers(
+            db,
+            deal_brief_obj,
+            min_score=payload.match_settings.min_match_score,
+            max_results=payload.match_settings.max_results,
+        )
 
     # --- Record buyer feedback if match found (liquidity signal) ---
     if province and matched_candidates:
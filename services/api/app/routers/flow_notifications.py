@@ -10,14 +10,14 @@ from sqlalchemy.orm import Session
 from app.core.db import get_db
 from app.core.geo import infer_province_market
 from app.models.deal import Deal
-from app.models.match import Buyer, DealBrief
+from app.models.match import DealBrief
 from app.schemas.notifications_flow import (
     BuyerNotification,
     NotifyDealPartiesRequest,
     NotifyDealPartiesResponse,
     SellerNotification,
 )
-from app.routers.flow_lead_to_deal import _score_buyer_for_deal  # reuse matcher
+from app.services.buy_box_index import match_buyers
 from app.services.buyer_liquidity import liquidity_score
 from app.services.kpi import emit_kpi
 
@@ -165,27 +165,14 @@ def _build_buyer_notifications(
         # Non-blocking: geo/liquidity fetch failed
         pass
 
-    buyers = db.query(Buyer).filter(Buyer.active.is_(True)).all()
-    candidates = []
-
-    for buyer in buyers:
-        candidate = _score_buyer_for_deal(buyer, deal_brief)
-        if candidate is None:
-            continue
-        if candidate.score < min_score:
-            continue
-        candidates.append((buyer, candidate))
-
-    # Sort by score descending
-    candidates.sort(key=lambda pair: pair[1].score, reverse=True)
-    candidates = candidates[:max_buyers]
+    candidates = match_buyers(db, deal_brief, min_score=min_score, max_results=max_buyers)
 
     notifications: List[BuyerNotification] = []
 
-    for buyer, match in candidates:
-        buyer_name = getattr(buyer, "name", "Investor")
-        to_email = getattr(buyer, "email", None)
-        to_phone = getattr(buyer, "phone", None)
+    for match in candidates:
+        buyer_name = match.name or "Investor"
+        to_email = match.email
+        to_phone = match.phone
 
         headline = getattr(deal_brief, "headline", None) or "New deal opportunity"
         region_display = getattr(deal_brief, "region", "your target markets")
@@ -222,7 +209,7 @@ def _build_buyer_notifications(
 
         notifications.append(
             BuyerNotification(
-                buyer_id=buyer.id,
+                buyer_id=match.buyer_id,
                 buyer_name=buyer_name,
                 to_email=to_email,
                 to_phone=to_phone,
@@ -3,19 +3,32 @@ PACK AN: Integrity Monitor Router
 Prefix: /integrity
 """
 
+from typing import Any, Dict, List
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
 from app.schemas.integrity_monitor import IntegrityReport
-from app.services.integrity_monitor import generate_integrity_report
+from app.services.integrity_monitor import generate_integrity_report, rule_status
 
 router = APIRouter(prefix="/integrity", tags=["Integrity"])
 
 
 @router.get("/report", response_model=IntegrityReport)
 def integrity_report_endpoint(
+    full: bool = False,
     db: Session = Depends(get_db),
 ):
-    """Generate a comprehensive integrity report of the system."""
-    return generate_integrity_report(db)
+    """
+    Generate a comprehensive integrity report of the system.
+
+    Rules re-check only rows changed since their last scan; full=true re-checks everything.
+    """
+    return generate_integrity_report(db, full=full)
+
+
+@router.get("/rules", response_model=List[Dict[str, Any]])
+def integrity_rules_endpoint(db: Session = Depends(get_db)):
+    """Each rule's scan mark and the cost of its last run."""
+    return rule_status(db)
@@ -4,12 +4,13 @@ from sqlalchemy.orm import Session
 from ..core.db import get_db
 from ..core.dependencies import require_builder_key
 from ..jobs.research_jobs import ingest_all_enabled
-from ..jobs.embed_jobs import embed_missing_docs
+from ..jobs.embed_jobs import embed_backfill, embed_missing_docs
 from ..jobs.forecast_jobs import forecast_month_ahead
 from ..jobs.freeze_jobs import check_drawdown
 from ..jobs.grant_jobs import refresh_from_sources
 from ..jobs.match_jobs import sweep_top_matches
 from ..jobs.notification_jobs import dispatch_pending
+from ..jobs.snapshot_jobs import refresh_aggregate_snapshot
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -68,6 +69,40 @@ def run_embed_missing(
     return {"ok": True, "embedded": n}
 
 
+@router.post("/research/embed_backfill")
+def run_embed_backfill(
+    all_docs: bool = False,
+    _: bool = Depends(require_builder_key)
+):
+    """
+    Embed every research doc without an embedding (or every doc with all_docs=true,
+    e.g. after changing EMBEDDING_PROVIDER) in batches. Unchanged docs are
+    served from the embedding cache.
+    Requires X-API-Key authentication.
+
+    Returns:
+        {"ok": true, "docs": <count>, "seconds": ..., "docs_per_sec": ..., "cache_hits": ..., "cache_misses": ...}
+    """
+    return {"ok": True, **embed_backfill(only_missing=not all_docs)}
+
+
+@router.post("/analytics/refresh_snapshot")
+def run_refresh_snapshot(
+    _: bool = Depends(require_builder_key),
+    db: Session = Depends(get_db)
+):
+    """
+    Recompute the materialized aggregate snapshot (dashboard counters and holdings
+    groups) read by /analytics, /empire and /holdings when
+    AGGREGATE_SNAPSHOT_MATERIALIZED=1.
+    Requires X-API-Key authentication.
+
+    Returns:
+        {"ok": true, "parts": [...], "computed_at": ..., "ms": ...}
+    """
+    return refresh_aggregate_snapshot(db)
+
+
 @router.get("/forecast/month")
 def run_forecast_month(
     _: bool = Depends(require_builder_key),
@@ -125,11 +160,11 @@ def run_grants_refresh(_: bool = Depends(require_builder_key)):
 def run_match_sweep(_: bool = Depends(require_builder_key)):
     """
     Sweep all active deals vs active buyers and compute top matches.
-    No persistence - just returns counts and stats.
+    Persists the top-N buyers per deal to deal_top_matches (read by GET /match/deal/{id}/top).
     Requires X-API-Key authentication.
     
     Returns:
-        {"ok": true, "deals_evaluated": <int>, "buyers_evaluated": <int>, "deals_with_top_hits": <int>}
+        {"ok": true, "deals_evaluated": <int>, "buyers_evaluated": <int>, "deals_with_top_hits": <int>, "matches_persisted": <int>}
     """
     return sweep_top_matches()
 
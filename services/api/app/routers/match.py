@@ -2,14 +2,15 @@
 Match router for computing buyer-deal matches with intelligent scoring.
 """
 
+import json
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from ..core.db import get_db
 from ..core.dependencies import require_builder_key
-from ..models.match import Buyer, DealBrief
+from ..models.match import Buyer, DealBrief, DealTopMatch
 from ..schemas.match import MatchComputeIn, MatchComputeOut, MatchHit, DealHit
-from ..core.matcher import score_buyer_vs_deal
+from ..core.matcher import BuyerMatrix, score_buyer_vs_deal, top_n
 
 router = APIRouter(prefix="/match", tags=["match"])
 
@@ -23,14 +24,15 @@ def compute(payload: MatchComputeIn, db: Session = Depends(get_db), _: bool = De
                 raise HTTPException(status_code=404, detail="deal not found")
         else:
             deal = DealBrief(**payload.deal.model_dump())  # transient
-        rows = db.query(Buyer).filter(Buyer.active.is_(True)).all()
+        matrix = BuyerMatrix(db.query(Buyer).filter(Buyer.active.is_(True)).all())
+        scores = matrix.score([deal])[0]
+        total = int((scores >= payload.min_score).sum())
         hits: List[MatchHit] = []
-        for b in rows:
-            s, why = score_buyer_vs_deal(b, deal)
-            if s >= payload.min_score:
-                hits.append(MatchHit(buyer_id=b.id, buyer_name=b.name, score=round(s,4), reasons=why))
-        hits.sort(key=lambda x: x.score, reverse=True)
-        return MatchComputeOut(mode="deal->buyers", total=len(hits), hits=hits[:payload.limit])
+        for j, s in top_n(scores, payload.limit, payload.min_score):
+            b = matrix.buyers[j]
+            _, why = score_buyer_vs_deal(b, deal)
+            hits.append(MatchHit(buyer_id=b.id, buyer_name=b.name, score=round(s,4), reasons=why))
+        return MatchComputeOut(mode="deal->buyers", total=total, hits=hits)
 
     # Mode B: buyer -> deals
     if payload.buyer_id:
@@ -38,14 +40,28 @@ def compute(payload: MatchComputeIn, db: Session = Depends(get_db), _: bool = De
         if not b:
             raise HTTPException(status_code=404, detail="buyer not found")
         deals = db.query(DealBrief).filter(DealBrief.status == "active").all()
+        scores = BuyerMatrix([b]).score(deals)[:, 0]
+        total = int((scores >= payload.min_score).sum())
         hits: List[DealHit] = []
-        for d in deals:
-            s, why = score_buyer_vs_deal(b, d)
-            if s >= payload.min_score:
-                hits.append(DealHit(deal_id=d.id, headline=d.headline, score=round(s,4), reasons=why))
-        hits.sort(key=lambda x: x.score, reverse=True)
-        return MatchComputeOut(mode="buyer->deals", total=len(hits), hits=hits[:payload.limit])
+        for i, s in top_n(scores, payload.limit, payload.min_score):
+            _, why = score_buyer_vs_deal(b, deals[i])
+            hits.append(DealHit(deal_id=deals[i].id, headline=deals[i].headline, score=round(s,4), reasons=why))
+        return MatchComputeOut(mode="buyer->deals", total=total, hits=hits)
 
     raise HTTPException(status_code=400, detail="provide deal_id or deal payload, or buyer_id")
+
+@router.get("/deal/{deal_id}/top", response_model=MatchComputeOut)
+def precomputed_top(deal_id: int, limit: int = 20, db: Session = Depends(get_db), _: bool = Depends(require_builder_key)):
+    """Top buyers for a deal as persisted by the last match sweep (see /jobs/match/sweep)."""
+    rows = (
+        db.query(DealTopMatch, Buyer.name)
+        .join(Buyer, Buyer.id == DealTopMatch.buyer_id)
+        .filter(DealTopMatch.deal_id == deal_id)
+        .order_by(DealTopMatch.rank)
+        .limit(limit)
+        .all()
+    )
+    hits = [MatchHit(buyer_id=m.buyer_id, buyer_name=name, score=m.score, reasons=json.loads(m.reasons or "[]")) for m, name in rows]
+    return MatchComputeOut(mode="deal->buyers (precomputed)", total=len(hits), hits=hits)
     ranked.sort(key=lambda x: x["score"], reverse=True)
     return {"lead_id": lead_id, "results": ranked[:10]}
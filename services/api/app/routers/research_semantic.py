@@ -4,12 +4,15 @@ Supports upsert of embeddings and cosine similarity search.
 """
 import json
 import numpy as np
+from datetime import datetime
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..core.db import get_db
 from ..core.dependencies import require_builder_key
+from ..core.vector_index import research_vectors
 from ..models.research import ResearchDoc
 from ..schemas.research import (
     EmbeddingUpsertIn,
@@ -27,6 +30,61 @@ def _norm(v: np.ndarray) -> np.ndarray:
     return v if n == 0 else v / n
 
 
+def _fetch_embeddings(db: Session, ids: List[int] = None):
+    """Yield (doc_id, vector) for docs with embeddings, optionally restricted to ids."""
+    q = db.query(ResearchDoc.id, ResearchDoc.embedding_json).filter(ResearchDoc.embedding_json.isnot(None))
+    batches = [ids[i:i + 1000] for i in range(0, len(ids), 1000)] if ids is not None else [None]
+    for batch in batches:
+        rows = q.filter(ResearchDoc.id.in_(batch)) if batch is not None else q
+        for doc_id, raw in rows.yield_per(1000):
+            try:
+                yield doc_id, json.loads(raw)
+            except Exception:
+                # Skip docs with invalid embeddings
+                continue
+
+
+def _embedding_marker(db: Session) -> dict:
+    """Version of the embedded rows: their count and the latest embedding write."""
+    n, last = (
+        db.query(func.count(ResearchDoc.id), func.max(ResearchDoc.embedding_updated_at))
+        .filter(ResearchDoc.embedding_json.isnot(None))
+        .one()
+    )
+    return {"rows": int(n or 0), "last_write": last.isoformat() if last else None}
+
+
+def _ensure_index(db: Session) -> None:
+    """
+    Load the mmap sidecar once per process and reconcile it with the DB whenever
+    the stored marker differs: rows embedded or rewritten since the marker's
+    last write are re-upserted, then added / deleted ids are synced.
+    """
+    if not research_vectors.loaded:
+        research_vectors.load()
+    marker = _embedding_marker(db)
+    seen = research_vectors.marker
+    if seen == marker and marker["rows"] == len(research_vectors) + research_vectors.rejected:
+        return
+    since = (seen or {}).get("last_write")
+    if not len(research_vectors) or not since:
+        research_vectors.build(_fetch_embeddings(db))
+    else:
+        if since != marker["last_write"]:
+            changed = [
+                i
+                for (i,) in db.query(ResearchDoc.id).filter(
+                    ResearchDoc.embedding_json.isnot(None),
+                    ResearchDoc.embedding_updated_at >= datetime.fromisoformat(since),
+                )
+            ]
+            for doc_id, vec in _fetch_embeddings(db, changed):
+                research_vectors.upsert(doc_id, vec)
+        ids = [i for (i,) in db.query(ResearchDoc.id).filter(ResearchDoc.embedding_json.isnot(None))]
+        research_vectors.sync_ids(ids, lambda missing: _fetch_embeddings(db, missing))
+    research_vectors.set_marker(marker)
+
+
 @router.post("/embeddings/upsert")
 def embeddings_upsert(
     payload: EmbeddingUpsertIn,
@@ -51,6 +109,8 @@ def embeddings_upsert(
     # Persist as JSON text
     doc.embedding_json = json.dumps(payload.vector, ensure_ascii=False)
     db.commit()
+    if research_vectors.loaded:
+        research_vectors.upsert(doc.id, payload.vector)
     
     return {
         "ok": True,
@@ -76,47 +136,35 @@ def semantic_query(
             detail="vector is required for semantic search"
         )
     
-    # Normalize query vector
-    qv = _norm(np.array(payload.vector, dtype=float))
-    
-    # Fetch all docs with embeddings
-    rows: List[ResearchDoc] = (
-        db.query(ResearchDoc)
-        .filter(ResearchDoc.embedding_json.isnot(None))
-        .all()
+    _ensure_index(db)
+    ranked = research_vectors.search(
+        payload.vector,
+        top_k=max(1, min(payload.top_k, 50)),
+        min_score=payload.min_score,
+        mode=payload.mode or "auto",
     )
-    
-    hits: List[SemanticHit] = []
-    
-    for r in rows:
-        try:
-            # Parse stored embedding
-            ev = np.array(json.loads(r.embedding_json), dtype=float)
-            ev = _norm(ev)
-            
-            # Compute cosine similarity (dot product of normalized vectors)
-            score = float(np.dot(qv, ev))
-        except Exception as e:
-            # Skip docs with invalid embeddings
+    docs = {}
+    if ranked:
+        docs = {
+            r.id: r
+            for r in db.query(ResearchDoc).filter(ResearchDoc.id.in_([doc_id for doc_id, _ in ranked]))
+        }
+
+    top: List[SemanticHit] = []
+    for doc_id, score in ranked:
+        r = docs.get(doc_id)
+        if r is None:
             continue
-        
-        if score >= payload.min_score:
-            # Create preview snippet from content
-            preview = (r.content or "")[:220]
-            
-            hits.append(
-                SemanticHit(
-                    doc_id=r.id,
-                    url=r.url or "",
-                    title=r.title,
-                    score=score,
-                    preview=preview,
-                )
+        top.append(
+            SemanticHit(
+                doc_id=r.id,
+                url=r.url or "",
+                title=r.title,
+                score=score,
+                # Create preview snippet from content
+                preview=(r.content or "")[:220],
             )
-    
-    # Sort by score descending and trim to top_k
-    hits.sort(key=lambda h: h.score, reverse=True)
-    top = hits[: max(1, min(payload.top_k, 50))]
+        )
     
     return SemanticQueryOut(hits=top)
 
@@ -128,7 +176,8 @@ def embeddings_stats(
 ):
     """
     Get statistics about stored embeddings.
-    Returns count of docs with/without embeddings and sample dimensions.
+    Returns count of docs with/without embeddings and sample dimensions,
+    plus matrix index size, build time and query latency.
     """
     total_docs = db.query(ResearchDoc).count()
     docs_with_embeddings = (
@@ -158,4 +207,5 @@ def embeddings_stats(
         "docs_without_embeddings": total_docs - docs_with_embeddings,
         "coverage_pct": round(100 * docs_with_embeddings / total_docs, 1) if total_docs > 0 else 0,
         "sample_dimension": sample_dimension,
+        "index": research_vectors.stats(),
     }
@@ -3,7 +3,7 @@ Pydantic schemas for contract templates and generated records.
 """
 
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class TemplateIn(BaseModel):
@@ -29,3 +29,23 @@ class RecordOut(BaseModel):
     filename: str
     template_id: Optional[int] = None
     model_config = ConfigDict(from_attributes=True)
+
+
+class BatchItemIn(BaseModel):
+    filename: str = Field(..., max_length=200)
+    data: Dict[str, Any] = {}
+
+
+class GenerateBatchIn(BaseModel):
+    template_id: int
+    items: List[BatchItemIn] = Field(..., min_length=1, max_length=5000)
+
+
+class BatchOut(BaseModel):
+    records: List[RecordOut]
+    documents: int
+    pages: int
+    bytes: int
+    seconds: float
+    pages_per_sec: float
+    errors: List[Dict[str, Any]] = []
@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Literal, Optional
 
 
 # Research Sources
@@ -107,6 +107,7 @@ class SemanticQueryIn(BaseModel):
     top_k: int = Field(default=5, ge=1, le=50)
     min_score: float = Field(default=0.0, ge=0.0, le=1.0)
     vector: Optional[list[float]] = None  # Either provide a fresh vector, or the server will error if none provided
+    mode: Literal["exact", "ivf", "auto"] = "auto"  # auto: ivf for large corpora
 
 
 class SemanticHit(BaseModel):
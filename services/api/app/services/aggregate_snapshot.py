@@ -0,0 +1,302 @@
+"""
+PACK AK: Aggregate Snapshot Service
+
+Every counter the analytics snapshot, the empire dashboard and the holdings
+summary need, computed in one round trip: a single SELECT that cross-joins one
+single-row aggregate subquery per table (``count(*) FILTER (WHERE ...)``,
+filtered sums), plus one grouped statement for holdings by type/jurisdiction.
+Cost is one index/table scan per source inside the database, and no ORM rows
+are materialized however many holdings or pipelines there are.
+
+Results are cached per engine until a watched table is written: ORM flushes,
+bulk updates/deletes and Core writes through a Session bump a generation on
+commit, and schema create/drop does too. AGGREGATE_SNAPSHOT_TTL_SECONDS bounds
+staleness for writes made by other processes.
+
+With AGGREGATE_SNAPSHOT_MATERIALIZED=1 a cache miss first reads the
+``aggregate_snapshots`` table kept fresh by the refresh job (see
+app.jobs.snapshot_jobs); it is used when it is newer than this process's last
+write and younger than AGGREGATE_SNAPSHOT_MAX_AGE_SECONDS.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, func, select, true
+from sqlalchemy.orm import Session
+
+from app.core.db import Base
+
+log = logging.getLogger(__name__)
+
+TTL_SECONDS = float(os.getenv("AGGREGATE_SNAPSHOT_TTL_SECONDS", "30"))
+MATERIALIZED = os.getenv("AGGREGATE_SNAPSHOT_MATERIALIZED", "0").lower() in {"1", "true", "yes", "on"}
+MAX_AGE = timedelta(seconds=float(os.getenv("AGGREGATE_SNAPSHOT_MAX_AGE_SECONDS", "300")))
+
+WHOLESALE_ACTIVE_STAGES = ("lead", "offer_made", "under_contract")
+
+
+def _models() -> Dict[str, Any]:
+    """Source models by key; a pack whose model cannot be imported is left out."""
+    out: Dict[str, Any] = {}
+    for key, module, name in (
+        ("holdings", "app.models.holdings", "Holding"),
+        ("wholesale", "app.models.wholesale", "WholesalePipeline"),
+        ("dispo", "app.models.dispo", "DispoAssignment"),
+        ("retainers", "app.models.pro_retainer", "Retainer"),
+        ("pro_tasks", "app.models.pro_task_link", "ProfessionalTaskLink"),
+        ("children", "app.models.children", "ChildrenHub"),
+        ("enrollments", "app.models.education_engine", "Enrollment"),
+        ("audit", "app.models.audit_event", "AuditEvent"),
+        ("governance", "app.models.governance_decision", "GovernanceDecision"),
+        ("system", "app.models.system_metadata", "SystemMetadata"),
+    ):
+        try:
+            out[key] = getattr(__import__(module, fromlist=[name]), name)
+        except Exception:
+            pass
+    return out
+
+
+def _sources(m: Dict[str, Any]) -> List[Tuple[str, Any, Dict[str, Any]]]:
+    """(key, model, {counter name: aggregate expression}) per source table."""
+    count = func.count()
+    src: List[Tuple[str, Any, Dict[str, Any]]] = []
+    if "holdings" in m:
+        H = m["holdings"]
+        active = H.is_active.is_(True)
+        src.append(("holdings", H, {
+            "holdings_active": count.filter(active),
+            "holdings_value": func.coalesce(func.sum(H.value_estimate).filter(active), 0.0),
+        }))
+    if "wholesale" in m:
+        W = m["wholesale"]
+        src.append(("wholesale", W, {
+            "wholesale_total": count,
+            "wholesale_under_contract": count.filter(W.stage == "under_contract"),
+            "wholesale_active": count.filter(W.stage.in_(WHOLESALE_ACTIVE_STAGES)),
+        }))
+    if "audit" in m:
+        A = m["audit"]
+        src.append(("audit", A, {"audit_open": count.filter(A.is_resolved.is_(False))}))
+    for key, counter in (
+        ("dispo", "dispo_total"),
+        ("retainers", "retainers_total"),
+        ("pro_tasks", "pro_tasks_total"),
+        ("children", "hubs_total"),
+        ("enrollments", "enrollments_total"),
+        ("governance", "decisions_total"),
+    ):
+        if key in m:
+            src.append((key, m[key], {counter: count}))
+    return src
+
+
+COUNTERS = (
+    "holdings_active", "holdings_value", "wholesale_total", "wholesale_under_contract", "wholesale_active",
+    "dispo_total", "retainers_total", "pro_tasks_total", "hubs_total", "enrollments_total",
+    "audit_open", "decisions_total",
+)
+
+
+def _defaults() -> Dict[str, Any]:
+    out: Dict[str, Any] = {k: 0 for k in COUNTERS}
+    out.update(holdings_value=0.0, system_version="0.0.0", system_backend_complete=False)
+    return out
+
+
+def _system_columns(S: Any) -> List[Any]:
+    first = select(S.id).order_by(S.id).limit(1).scalar_subquery()
+    return [
+        select(S.version).where(S.id == first).scalar_subquery().label("system_version"),
+        select(S.backend_complete).where(S.id == first).scalar_subquery().label("system_backend_complete"),
+    ]
+
+
+def _normalize(out: Dict[str, Any]) -> Dict[str, Any]:
+    for k in COUNTERS:
+        out[k] = int(out[k] or 0) if k != "holdings_value" else float(out[k] or 0.0)
+    out["system_version"] = out.get("system_version") or "0.0.0"
+    out["system_backend_complete"] = bool(out.get("system_backend_complete"))
+    return out
+
+
+def compute_counters(db: Session) -> Dict[str, Any]:
+    """All dashboard counters in one statement (per-source fallback if a table is missing)."""
+    m = _models()
+    sources = _sources(m)
+    out = _defaults()
+    subs = [select(*(expr.label(name) for name, expr in aggs.items())).select_from(model).subquery(key)
+            for key, model, aggs in sources]
+    cols = [c for sub in subs for c in sub.c]
+    if "system" in m:
+        cols += _system_columns(m["system"])
+    if not cols:
+        return out
+    stmt = select(*cols)
+    if subs:
+        stmt = stmt.select_from(subs[0])
+        for sub in subs[1:]:
+            stmt = stmt.join(sub, true())
+    try:
+        row = db.execute(stmt).mappings().one()
+        out.update(row)
+        return _normalize(out)
+    except Exception as e:
+        log.warning("combined snapshot query failed (%s); falling back per source", type(e).__name__)
+        db.rollback()
+    # a source table may be missing in this database: isolate each one
+    for key, model, aggs in sources:
+        try:
+            out.update(db.execute(select(*(expr.label(n) for n, expr in aggs.items())).select_from(model)).mappings().one())
+        except Exception:
+            db.rollback()
+    if "system" in m:
+        try:
+            out.update(db.execute(select(*_system_columns(m["system"]))).mappings().one())
+        except Exception:
+            db.rollback()
+    return _normalize(out)
+
+
+def compute_holdings_groups(db: Session) -> Dict[str, Any]:
+    """Active holdings value totals by asset type and jurisdiction, from one GROUP BY."""
+    H = _models().get("holdings")
+    out: Dict[str, Any] = {"total_value": 0.0, "by_asset_type": {}, "by_jurisdiction": {}}
+    if H is None:
+        return out
+    rows = db.execute(
+        select(H.asset_type, H.jurisdiction, func.sum(H.value_estimate))
+        .where(H.is_active.is_(True), H.value_estimate.isnot(None))
+        .group_by(H.asset_type, H.jurisdiction)
+    ).all()
+    for asset_type, jurisdiction, total in rows:
+        total = float(total or 0.0)
+        out["total_value"] += total
+        out["by_asset_type"][asset_type] = out["by_asset_type"].get(asset_type, 0.0) + total
+        if jurisdiction:
+            out["by_jurisdiction"][jurisdiction] = out["by_jurisdiction"].get(jurisdiction, 0.0) + total
+    return out
+
+
+COMPUTE: Dict[str, Callable[[Session], Dict[str, Any]]] = {
+    "counters": compute_counters,
+    "holdings_groups": compute_holdings_groups,
+}
+
+
+# ---- cache + write-triggered invalidation ----
+
+_lock = threading.Lock()
+_generation = 0
+_last_write: Optional[datetime] = None
+_cache: "weakref.WeakKeyDictionary[Any, Dict[str, Tuple[int, float, Dict[str, Any]]]]" = weakref.WeakKeyDictionary()
+_watched_tables: Optional[set] = None
+
+
+def watched_tables() -> set:
+    global _watched_tables
+    if _watched_tables is None:
+        m = _models()
+        _watched_tables = {model.__tablename__ for model in m.values()}
+    return _watched_tables
+
+
+def invalidate() -> None:
+    """Drop every cached snapshot (and ignore materialized rows computed before now)."""
+    global _generation, _last_write
+    with _lock:
+        _generation += 1
+        _last_write = datetime.utcnow()
+
+
+def _touches(objs) -> bool:
+    tables = watched_tables()
+    return any(getattr(o, "__tablename__", None) in tables for o in objs)
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    if _touches(session.new) or _touches(session.dirty) or _touches(session.deleted):
+        session.info["aggregate_snapshot_dirty"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_execute(state):
+    if state.is_update or state.is_delete or state.is_insert:
+        table = getattr(state.statement, "table", None)
+        if getattr(table, "name", None) in watched_tables():
+            state.session.info["aggregate_snapshot_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    if session.info.pop("aggregate_snapshot_dirty", False):
+        invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop("aggregate_snapshot_dirty", None)
+
+
+@event.listens_for(Base.metadata, "after_create")
+@event.listens_for(Base.metadata, "after_drop")
+def _on_ddl(target, connection, **kw):
+    invalidate()
+
+
+def _read_materialized(db: Session, name: str) -> Optional[Dict[str, Any]]:
+    from app.models.aggregate_snapshot import AggregateSnapshot
+
+    try:
+        row = db.get(AggregateSnapshot, name)
+    except Exception:
+        db.rollback()
+        return None
+    if row is None or datetime.utcnow() - row.computed_at > MAX_AGE:
+        return None
+    if _last_write is not None and row.computed_at < _last_write:
+        return None
+    return json.loads(row.payload)
+
+
+def get(db: Session, name: str, use_cache: bool = True) -> Dict[str, Any]:
+    """Cached snapshot part ("counters" or "holdings_groups") for this session's database."""
+    engine = db.get_bind()
+    now = time.monotonic()
+    with _lock:
+        gen = _generation
+        hit = _cache.get(engine, {}).get(name)
+    if use_cache and hit is not None and hit[0] == gen and now - hit[1] < TTL_SECONDS:
+        return hit[2]
+    value = _read_materialized(db, name) if (use_cache and MATERIALIZED) else None
+    if value is None:
+        value = COMPUTE[name](db)
+    with _lock:
+        if _generation == gen:  # a write landed while computing: don't cache a maybe-stale value
+            _cache.setdefault(engine, {})[name] = (gen, now, value)
+    return value
+
+
+def refresh_materialized(db: Session) -> Dict[str, Any]:
+    """Recompute every part and upsert it into aggregate_snapshots (commits)."""
+    from app.models.aggregate_snapshot import AggregateSnapshot
+
+    t0 = time.perf_counter()
+    now = datetime.utcnow()
+    for name, compute in COMPUTE.items():
+        payload = json.dumps(compute(db), sort_keys=True)
+        row = db.get(AggregateSnapshot, name)
+        if row is None:
+            db.add(AggregateSnapshot(name=name, payload=payload, computed_at=now))
+        else:
+            row.payload, row.computed_at = payload, now
+    db.commit()
+    return {"ok": True, "parts": list(COMPUTE), "computed_at": now.isoformat(), "ms": round((time.perf_counter() - t0) * 1000.0, 3)}
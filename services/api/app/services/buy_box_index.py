@@ -0,0 +1,429 @@
+"""
+Buy-box index for buyer matching.
+
+Every deal flow (lead_to_deal, full_pipeline, prepare_closing, notifications,
+closing_playbook, deal_workflow_status) matches a deal against active buyers'
+buy boxes. Instead of loading the whole buyers table and scoring each row, the
+index keeps active buyers pre-parsed in memory:
+
+- region and property-type posting lists (lower-cased CSV tokens -> buyer ids)
+- a centered interval tree over [min_price, max_price]
+- min_beds / min_baths sorted for the small beds/baths-only bonus
+
+A lookup scores only buyers that can reach ``min_score``: a buyer with no
+region, type or price hit scores at most 0.2 (beds + baths), so above that
+only the union of the three posting lists is touched. Results are identical
+to scoring every buyer.
+
+One index is kept per database engine. Buyer inserts/updates/deletes flushed
+in this process mark the row dirty (SQLAlchemy mapper events) and the next
+lookup reloads just those ids. A cheap ``count(id), max(id)`` check per lookup
+and a periodic full rebuild (``BUY_BOX_MAX_AGE_SECONDS``, default 300) catch
+writes from other processes.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session, object_session
+
+from app.models.match import Buyer, DealBrief
+from app.schemas.flows_lead_to_deal import BuyerMatchCandidate
+
+MAX_AGE_SECONDS = float(os.getenv("BUY_BOX_MAX_AGE_SECONDS", "300"))
+
+W_REGION = 0.25
+W_TYPE = 0.25
+W_PRICE = 0.3
+W_BEDS = 0.1
+W_BATHS = 0.1
+
+
+def _safe_decimal(value: object | None) -> Decimal | None:
+    if value is None:
+        return None
+    if isinstance(value, Decimal):
+        return value
+    try:
+        return Decimal(str(value))
+    except Exception:
+        return None
+
+
+def _normalize_price_range(
+    min_price: Decimal | None,
+    max_price: Decimal | None,
+) -> tuple[Decimal | None, Decimal | None]:
+    if min_price is not None and max_price is not None and max_price < min_price:
+        return max_price, min_price
+    return min_price, max_price
+
+
+def _split_csv(value: str | None) -> List[str]:
+    if not value:
+        return []
+    return [part.strip().lower() for part in value.split(",") if part.strip()]
+
+
+@dataclass(frozen=True)
+class BuyBox:
+    """A buyer's matching criteria, parsed once."""
+
+    id: int
+    name: str
+    email: Optional[str]
+    phone: Optional[str]
+    regions: FrozenSet[str]
+    types: FrozenSet[str]
+    min_price: Optional[Decimal]
+    max_price: Optional[Decimal]
+    min_beds: Optional[int]
+    min_baths: Optional[int]
+
+    @classmethod
+    def from_buyer(cls, buyer: Buyer) -> "BuyBox":
+        lo, hi = _normalize_price_range(
+            _safe_decimal(getattr(buyer, "min_price", None)),
+            _safe_decimal(getattr(buyer, "max_price", None)),
+        )
+        return cls(
+            id=buyer.id,
+            name=buyer.name,
+            email=getattr(buyer, "email", None),
+            phone=getattr(buyer, "phone", None),
+            regions=frozenset(_split_csv(getattr(buyer, "regions", None))),
+            types=frozenset(_split_csv(getattr(buyer, "property_types", None))),
+            min_price=lo,
+            max_price=hi,
+            min_beds=getattr(buyer, "min_beds", None),
+            min_baths=getattr(buyer, "min_baths", None),
+        )
+
+    @property
+    def has_price(self) -> bool:
+        return self.min_price is not None or self.max_price is not None
+
+
+def score_buy_box(box: BuyBox, deal: DealBrief) -> BuyerMatchCandidate | None:
+    """
+    Very simple first-pass matcher based on:
+
+    - region overlap
+    - property_type overlap
+    - price range inclusion
+    - beds/baths minimums
+
+    Returns a BuyerMatchCandidate with score 0–1 or None if no signal.
+    """
+    reasons: List[str] = []
+    score_components: List[float] = []
+
+    deal_region = (deal.region or "").strip().lower()
+    if box.regions and deal_region and deal_region in box.regions:
+        score_components.append(W_REGION)
+        reasons.append("region_match")
+
+    deal_type = (deal.property_type or "").strip().lower()
+    if box.types and deal_type and deal_type in box.types:
+        score_components.append(W_TYPE)
+        reasons.append("property_type_match")
+
+    deal_price = _safe_decimal(deal.price)
+    if deal_price is not None and box.has_price:
+        in_range = True
+        if box.min_price is not None and deal_price < box.min_price:
+            in_range = False
+        if box.max_price is not None and deal_price > box.max_price:
+            in_range = False
+        if in_range:
+            score_components.append(W_PRICE)
+            reasons.append("price_match")
+
+    if deal.beds is not None and box.min_beds is not None and deal.beds >= box.min_beds:
+        score_components.append(W_BEDS)
+        reasons.append("beds_ok")
+
+    if deal.baths is not None and box.min_baths is not None and deal.baths >= box.min_baths:
+        score_components.append(W_BATHS)
+        reasons.append("baths_ok")
+
+    if not score_components:
+        return None
+
+    return BuyerMatchCandidate(
+        buyer_id=box.id,
+        name=box.name,
+        email=box.email,
+        phone=box.phone,
+        score=min(1.0, sum(score_components)),
+        reasons=reasons,
+    )
+
+
+class _IntervalTree:
+    """Static centered interval tree; ``stab(p)`` yields ids whose [lo, hi] contains p."""
+
+    __slots__ = ("center", "by_lo", "by_hi", "left", "right")
+
+    def __init__(self, items: List[Tuple[float, float, int]]):
+        points = sorted(p for lo, hi, _ in items for p in (lo, hi))
+        self.center = points[len(points) // 2]
+        here = [it for it in items if it[0] <= self.center <= it[1]]
+        self.by_lo = sorted(here, key=lambda it: it[0])
+        self.by_hi = sorted(here, key=lambda it: it[1], reverse=True)
+        left = [it for it in items if it[1] < self.center]
+        right = [it for it in items if it[0] > self.center]
+        self.left = _IntervalTree(left) if left else None
+        self.right = _IntervalTree(right) if right else None
+
+    def stab(self, p: float, out: List[int]) -> None:
+        node: Optional[_IntervalTree] = self
+        while node is not None:
+            if p < node.center:
+                for lo, _, bid in node.by_lo:
+                    if lo > p:
+                        break
+                    out.append(bid)
+                node = node.left
+            elif p > node.center:
+                for _, hi, bid in node.by_hi:
+                    if hi < p:
+                        break
+                    out.append(bid)
+                node = node.right
+            else:
+                out.extend(bid for _, _, bid in node.by_lo)
+                return
+
+
+class BuyBoxIndex:
+    """In-memory posting lists over active buyers' buy boxes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self.boxes: Dict[int, BuyBox] = {}
+        self.seen: Set[int] = set()  # every buyer id in the table, active or not
+        self.by_region: Dict[str, Set[int]] = {}
+        self.by_type: Dict[str, Set[int]] = {}
+        self._tree: Optional[_IntervalTree] = None
+        self._tree_dirty = True
+        self._beds: Optional[List[Tuple[int, int]]] = None
+        self._baths: Optional[List[Tuple[int, int]]] = None
+        self.built_at = 0.0
+
+    # ---- maintenance ----
+
+    def clear(self) -> None:
+        with self._lock:
+            self.boxes.clear()
+            self.seen.clear()
+            self.by_region.clear()
+            self.by_type.clear()
+            self._invalidate_derived()
+
+    def _invalidate_derived(self) -> None:
+        self._tree = None
+        self._tree_dirty = True
+        self._beds = None
+        self._baths = None
+
+    def remove(self, buyer_id: int) -> None:
+        with self._lock:
+            old = self.boxes.pop(buyer_id, None)
+            if old is None:
+                return
+            for key in old.regions:
+                ids = self.by_region.get(key)
+                if ids is not None:
+                    ids.discard(buyer_id)
+                    if not ids:
+                        del self.by_region[key]
+            for key in old.types:
+                ids = self.by_type.get(key)
+                if ids is not None:
+                    ids.discard(buyer_id)
+                    if not ids:
+                        del self.by_type[key]
+            self._invalidate_derived()
+
+    def upsert(self, buyer: Buyer) -> None:
+        """Index (or re-index) one buyer row; inactive buyers are dropped."""
+        with self._lock:
+            self.seen.add(buyer.id)
+            self.remove(buyer.id)
+            if not buyer.active:
+                return
+            box = BuyBox.from_buyer(buyer)
+            self.boxes[box.id] = box
+            for r in box.regions:
+                self.by_region.setdefault(r, set()).add(box.id)
+            for t in box.types:
+                self.by_type.setdefault(t, set()).add(box.id)
+            self._invalidate_derived()
+
+    def rebuild(self, buyers: Iterable[Buyer]) -> None:
+        with self._lock:
+            self.clear()
+            for b in buyers:
+                self.upsert(b)
+            self.built_at = time.monotonic()
+
+    def _price_tree(self) -> Optional[_IntervalTree]:
+        if self._tree_dirty:
+            items = [
+                (
+                    float(b.min_price) if b.min_price is not None else float("-inf"),
+                    float(b.max_price) if b.max_price is not None else float("inf"),
+                    b.id,
+                )
+                for b in self.boxes.values()
+                if b.has_price
+            ]
+            self._tree = _IntervalTree(items) if items else None
+            self._tree_dirty = False
+        return self._tree
+
+    def _minimums(self) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        if self._beds is None or self._baths is None:
+            self._beds = sorted((b.min_beds, b.id) for b in self.boxes.values() if b.min_beds is not None)
+            self._baths = sorted((b.min_baths, b.id) for b in self.boxes.values() if b.min_baths is not None)
+        return self._beds, self._baths
+
+    # ---- lookups ----
+
+    def candidates(self, deal: DealBrief, min_score: float = 0.0) -> Set[int]:
+        """Ids of every buyer that could score >= min_score against the deal."""
+        with self._lock:
+            out: Set[int] = set()
+            region = (deal.region or "").strip().lower()
+            if region:
+                out |= self.by_region.get(region, set())
+            ptype = (deal.property_type or "").strip().lower()
+            if ptype:
+                out |= self.by_type.get(ptype, set())
+            price = _safe_decimal(deal.price)
+            if price is not None:
+                tree = self._price_tree()
+                if tree is not None:
+                    hits: List[int] = []
+                    tree.stab(float(price), hits)
+                    out.update(hits)
+            if min_score <= W_BEDS + W_BATHS + 1e-9:
+                beds, baths = self._minimums()
+                if deal.beds is not None:
+                    out.update(bid for _, bid in beds[: bisect.bisect_right(beds, (deal.beds, float("inf")))])
+                if deal.baths is not None:
+                    out.update(bid for _, bid in baths[: bisect.bisect_right(baths, (deal.baths, float("inf")))])
+            return out
+
+    def match(self, deal: DealBrief, min_score: float = 0.5, max_results: Optional[int] = 10) -> List[BuyerMatchCandidate]:
+        """Candidates with score >= min_score, best first (ties by buyer id)."""
+        with self._lock:
+            boxes = [self.boxes[i] for i in self.candidates(deal, min_score)]
+        scored = []
+        for box in boxes:
+            cand = score_buy_box(box, deal)
+            if cand is not None and cand.score >= min_score:
+                scored.append(cand)
+        scored.sort(key=lambda c: (-c.score, c.buyer_id))
+        return scored if max_results is None else scored[:max_results]
+
+    def count(self, region: Optional[str], property_type: Optional[str]) -> int:
+        """Active buyers whose buy box lists both the region and the type (either may be omitted)."""
+        with self._lock:
+            sets = []
+            if region:
+                sets.append(self.by_region.get(region.strip().lower(), set()))
+            if property_type:
+                sets.append(self.by_type.get(property_type.strip().lower(), set()))
+            if not sets:
+                return len(self.boxes)
+            return len(set.intersection(*sets))
+
+
+# ---- per-engine registry and freshness ----
+
+_REG_LOCK = threading.Lock()
+_INDEXES: "weakref.WeakKeyDictionary[object, BuyBoxIndex]" = weakref.WeakKeyDictionary()
+_DIRTY: "weakref.WeakKeyDictionary[object, Set[int]]" = weakref.WeakKeyDictionary()
+
+
+def _engine_of(bind: object) -> object:
+    return getattr(bind, "engine", bind)
+
+
+@event.listens_for(Buyer, "after_insert")
+@event.listens_for(Buyer, "after_update")
+@event.listens_for(Buyer, "after_delete")
+def _mark_dirty(mapper, connection, target) -> None:
+    # flush time: held on the session until commit, so a concurrent get_index
+    # never reloads (and clears) a row whose change is not visible yet
+    session = object_session(target)
+    if target.id is None or session is None:
+        return
+    pending = session.info.setdefault("buy_box_dirty", {})
+    pending.setdefault(_engine_of(connection), set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_dirty(session) -> None:
+    pending = session.info.pop("buy_box_dirty", None)
+    if not pending:
+        return
+    with _REG_LOCK:
+        for engine, ids in pending.items():
+            _DIRTY.setdefault(engine, set()).update(ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_dirty(session) -> None:
+    session.info.pop("buy_box_dirty", None)
+
+
+def get_index(db: Session) -> BuyBoxIndex:
+    """The buy-box index for this session's database, brought up to date."""
+    engine = _engine_of(db.get_bind())
+    with _REG_LOCK:
+        idx = _INDEXES.get(engine)
+        if idx is None:
+            idx = _INDEXES[engine] = BuyBoxIndex()
+        dirty = _DIRTY.pop(engine, set())
+
+    total, max_id = db.query(func.count(Buyer.id), func.max(Buyer.id)).one()
+    with idx._lock:
+        stale = not idx.built_at or time.monotonic() - idx.built_at > MAX_AGE_SECONDS
+        if not stale and dirty:
+            rows = {b.id: b for b in db.query(Buyer).filter(Buyer.id.in_(dirty)).all()}
+            for bid in dirty:
+                row = rows.get(bid)
+                if row is None:
+                    idx.seen.discard(bid)
+                    idx.remove(bid)
+                else:
+                    idx.upsert(row)
+        if stale or (len(idx.seen), max(idx.seen, default=None)) != (int(total or 0), max_id):
+            idx.rebuild(db.query(Buyer).all())
+    return idx
+
+
+def match_buyers(
+    db: Session,
+    deal: DealBrief,
+    min_score: float = 0.5,
+    max_results: Optional[int] = 10,
+) -> List[BuyerMatchCandidate]:
+    """Active buyers matching the deal, best first; the single entry point for deal flows."""
+    return get_index(db).match(deal, min_score=min_score, max_results=max_results)
+
+
+def count_candidates(db: Session, region: Optional[str], property_type: Optional[str]) -> int:
+    return get_index(db).count(region, property_type)
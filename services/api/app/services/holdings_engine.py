@@ -3,11 +3,11 @@ PACK Z: Global Holdings Engine Service
 """
 
 from typing import List, Optional, Dict
-from collections import defaultdict
 from sqlalchemy.orm import Session
 
 from app.models.holdings import Holding
 from app.schemas.holdings import HoldingCreate, HoldingUpdate
+from app.services import aggregate_snapshot
 
 
 def create_holding(db: Session, payload: HoldingCreate) -> Holding:
@@ -57,22 +57,10 @@ def list_holdings(
 
 
 def summarize_holdings(db: Session) -> Dict:
-    q = db.query(Holding).filter(Holding.is_active.is_(True)).all()
-
-    total = 0.0
-    by_type = defaultdict(float)
-    by_jurisdiction = defaultdict(float)
-
-    for h in q:
-        if h.value_estimate is None:
-            continue
-        total += h.value_estimate
-        by_type[h.asset_type] += h.value_estimate
-        if h.jurisdiction:
-            by_jurisdiction[h.jurisdiction] += h.value_estimate
-
+    # one GROUP BY over active holdings, cached until holdings change
+    g = aggregate_snapshot.get(db, "holdings_groups")
     return {
-        "total_value": total,
-        "by_asset_type": dict(by_type),
-        "by_jurisdiction": dict(by_jurisdiction),
+        "total_value": g["total_value"],
+        "by_asset_type": dict(g["by_asset_type"]),
+        "by_jurisdiction": dict(g["by_jurisdiction"]),
     }
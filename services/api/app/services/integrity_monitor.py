@@ -1,73 +1,252 @@
 """
 PACK AN: Integrity Monitor Service
+
+Integrity checks are declarative ``Rule``s: a model plus a SQL predicate that
+selects the violating rows (e.g. ``stage = 'under_contract' AND NOT EXISTS
+(<live dispo assignment>)``), so the database does the filtering.
+
+Rules scan incrementally. Each one lists the ``updated_at`` columns that can
+change its outcome, with the entity id each maps to; only entities touched
+since the rule's high-water mark (``integrity_rule_marks``) are re-checked.
+Issues are persisted in ``integrity_issues`` and reopened/resolved in place,
+so a report costs the changed rows plus the open issues. Rules without
+watch columns re-run their (filtered) query in full every time, and a deleted
+watched row (e.g. a dispo assignment) is only noticed by a full scan.
+
+Rules run concurrently, each on its own session (INTEGRITY_RULE_WORKERS),
+except on in-memory SQLite where every connection is a separate database.
 """
 
-from typing import List
-from sqlalchemy.orm import Session
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, exists, func, or_, select, union
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.schemas.integrity_monitor import IntegrityIssue, IntegrityReport
 from app.models.wholesale import WholesalePipeline
+from app.models.dispo import DispoAssignment
 from app.models.pro_retainer import Retainer
-from app.models.contracts import Contract
-
-
-def check_wholesale_integrity(db: Session) -> List[IntegrityIssue]:
-    issues = []
-    rows = db.query(WholesalePipeline).all()
-
-    for r in rows:
-        # Example: deal under contract but missing assigned dispo
-        if r.stage == "under_contract" and not r.dispo_assigned:
-            issues.append(
-                IntegrityIssue(
-                    category="pipeline_mismatch",
-                    entity_type="wholesale_pipeline",
-                    entity_id=r.id,
-                    message="Under contract but no dispo assignment",
-                )
-            )
-    return issues
-
-
-def check_retainer_integrity(db: Session) -> List[IntegrityIssue]:
-    issues = []
-    rows = db.query(Retainer).all()
-
-    for r in rows:
-        if r.is_active and r.expiration_date and r.expiration_date < r.created_at:
-            issues.append(
-                IntegrityIssue(
-                    category="retainer_invalid",
-                    entity_type="professional_retainer",
-                    entity_id=r.id,
-                    message="Retainer expiration date precedes creation date",
-                )
-            )
-    return issues
-
-
-def check_contract_integrity(db: Session) -> List[IntegrityIssue]:
-    issues = []
-    rows = db.query(Contract).all()
-
-    for c in rows:
-        if not c.document_url:
-            issues.append(
-                IntegrityIssue(
-                    category="missing_document",
-                    entity_type="contract",
-                    entity_id=c.id,
-                    message="Contract missing document_url",
-                )
+from app.models.contract_record import ContractRecord
+from app.models.integrity_issue import IntegrityIssueRecord, IntegrityRuleMark
+
+RULE_WORKERS = int(os.getenv("INTEGRITY_RULE_WORKERS", "4"))
+# re-scan this far behind the mark, for rows committed late with an older updated_at
+SCAN_OVERLAP = timedelta(seconds=float(os.getenv("INTEGRITY_SCAN_OVERLAP_SECONDS", "5")))
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    category: str
+    entity_type: str
+    model: Any
+    condition: Any  # SQL predicate over model selecting violating rows
+    message: str
+    watch: Tuple[Tuple[Any, Any], ...] = ()  # (updated_at column, entity id expression)
+
+
+RULES: List[Rule] = [
+    Rule(
+        name="wholesale_under_contract_unassigned",
+        category="pipeline_mismatch",
+        entity_type="wholesale_pipeline",
+        model=WholesalePipeline,
+        condition=and_(
+            WholesalePipeline.stage == "under_contract",
+            ~exists().where(
+                DispoAssignment.pipeline_id == WholesalePipeline.id,
+                DispoAssignment.status != "fallout",
+            ),
+        ),
+        message="Under contract but no dispo assignment",
+        watch=(
+            (WholesalePipeline.updated_at, WholesalePipeline.id),
+            (DispoAssignment.updated_at, DispoAssignment.pipeline_id),
+        ),
+    ),
+    Rule(
+        name="retainer_renewal_before_creation",
+        category="retainer_invalid",
+        entity_type="professional_retainer",
+        model=Retainer,
+        condition=and_(Retainer.is_active.is_(True), Retainer.renewal_date < func.date(Retainer.created_at)),
+        message="Retainer renewal date precedes creation date",
+        # retainers carry no updated_at: full (filtered) scan every run
+    ),
+    Rule(
+        name="contract_missing_document",
+        category="missing_document",
+        entity_type="contract",
+        model=ContractRecord,
+        condition=or_(ContractRecord.storage_url.is_(None), ContractRecord.storage_url == ""),
+        message="Contract missing document (storage_url)",
+        watch=((ContractRecord.updated_at, ContractRecord.id),),
+    ),
+]
+
+
+def _naive_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    if dt is not None and dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def run_rule(db: Session, rule: Rule, full: bool = False) -> Dict[str, Any]:
+    """
+    Scan one rule (incrementally unless ``full`` or no mark yet), upsert its issues
+    and commit. Returns {"rule", "mode", "scanned", "found", "resolved", "ms"}.
+    """
+    t0 = time.perf_counter()
+    now = datetime.utcnow()
+    mark = db.get(IntegrityRuleMark, rule.name)
+    since = None if (full or not rule.watch or mark is None or mark.high_water is None) else mark.high_water
+    pk = rule.model.id
+
+    if rule.watch:
+        lower = since - SCAN_OVERLAP if since is not None else None
+        tops = [
+            db.scalar(select(func.max(col)).where(col >= lower) if lower is not None else select(func.max(col)))
+            for col, _ in rule.watch
+        ]
+        tops = [_naive_utc(t) for t in tops if t is not None] + ([since] if since is not None else [])
+        high_water = max(tops) if tops else None
+    else:
+        lower, high_water = None, None
+
+    q = select(pk).where(rule.condition)
+    checked: Optional[set] = None
+    if lower is not None:
+        changed = union(*[select(ent.label("eid")).where(col >= lower) for col, ent in rule.watch]).subquery()
+        checked = {x for x in db.scalars(select(changed.c.eid)) if x is not None}
+        q = q.where(pk.in_(select(changed.c.eid)))
+    violating = set(db.scalars(q))
+
+    # issues for the entities we looked at (all of the rule's issues on a full scan)
+    iq = select(IntegrityIssueRecord).where(IntegrityIssueRecord.rule == rule.name)
+    if checked is not None:
+        iq = iq.where(IntegrityIssueRecord.entity_id.in_(checked | violating))
+    existing = {r.entity_id: r for r in db.scalars(iq)}
+    found = resolved = 0
+    for eid in violating:
+        row = existing.get(eid)
+        if row is None:
+            db.add(IntegrityIssueRecord(
+                rule=rule.name, category=rule.category, entity_type=rule.entity_type,
+                entity_id=eid, message=rule.message, status="open", first_seen=now, last_seen=now,
+            ))
+        else:
+            if row.status != "open":
+                row.first_seen = now
+            row.status, row.last_seen, row.resolved_at, row.message = "open", now, None, rule.message
+        found += 1
+    for eid, row in existing.items():
+        if row.status == "open" and eid not in violating:
+            row.status, row.resolved_at = "resolved", now
+            resolved += 1
+
+    # entities deleted since they were flagged
+    if checked is not None:
+        gone = db.scalars(
+            select(IntegrityIssueRecord).where(
+                IntegrityIssueRecord.rule == rule.name,
+                IntegrityIssueRecord.status == "open",
+                ~exists().where(pk == IntegrityIssueRecord.entity_id),
             )
-    return issues
+        ).all()
+        for row in gone:
+            row.status, row.resolved_at = "resolved", now
+            resolved += 1
+
+    ms = round((time.perf_counter() - t0) * 1000.0, 3)
+    stats = {
+        "rule": rule.name,
+        "mode": "full" if checked is None else "incremental",
+        "scanned": len(checked) if checked is not None else None,
+        "found": found,
+        "resolved": resolved,
+        "ms": ms,
+    }
+    if mark is None:
+        mark = IntegrityRuleMark(rule=rule.name)
+        db.add(mark)
+    mark.high_water = high_water if high_water is not None else mark.high_water
+    mark.last_run_at, mark.last_mode, mark.last_found, mark.last_ms = now, stats["mode"], found, ms
+    mark.last_scanned = stats["scanned"]
+    db.commit()
+    return stats
+
 
+def _session_factory(db: Session) -> Optional[Callable[[], Session]]:
+    bind = db.get_bind()
+    if bind.dialect.name == "sqlite" and (bind.url.database or ":memory:") == ":memory:":
+        return None  # every connection would see its own empty database
+    return sessionmaker(bind=bind, autoflush=False)
 
-def generate_integrity_report(db: Session) -> IntegrityReport:
-    issues: List[IntegrityIssue] = []
 
-    issues.extend(check_wholesale_integrity(db))
-    issues.extend(check_retainer_integrity(db))
-    issues.extend(check_contract_integrity(db))
+def run_rules(
+    db: Session,
+    rules: Sequence[Rule] = RULES,
+    full: bool = False,
+    session_factory: Optional[Callable[[], Session]] = None,
+    workers: int = RULE_WORKERS,
+) -> List[Dict[str, Any]]:
+    """Run every rule, concurrently on separate sessions when the database allows it."""
+    factory = session_factory or _session_factory(db)
+    if factory is None or workers <= 1 or len(rules) <= 1:
+        return [run_rule(db, r, full) for r in rules]
 
+    def _one(rule: Rule) -> Dict[str, Any]:
+        s = factory()
+        try:
+            return run_rule(s, rule, full)
+        except Exception:
+            s.rollback()
+            raise
+        finally:
+            s.close()
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(rules)), thread_name_prefix="integrity") as pool:
+        return list(pool.map(_one, rules))
+
+
+def open_issues(db: Session) -> List[IntegrityIssue]:
+    rows = db.scalars(
+        select(IntegrityIssueRecord)
+        .where(IntegrityIssueRecord.status == "open")
+        .order_by(IntegrityIssueRecord.rule, IntegrityIssueRecord.entity_id)
+    )
+    return [
+        IntegrityIssue(category=r.category, entity_type=r.entity_type, entity_id=r.entity_id, message=r.message)
+        for r in rows
+    ]
+
+
+def generate_integrity_report(db: Session, full: bool = False) -> IntegrityReport:
+    run_rules(db, full=full)
+    db.expire_all()  # see what the rule sessions committed
+    issues = open_issues(db)
     return IntegrityReport(total_issues=len(issues), issues=issues)
+
+
+def rule_status(db: Session) -> List[Dict[str, Any]]:
+    marks = {m.rule: m for m in db.scalars(select(IntegrityRuleMark))}
+    out = []
+    for r in RULES:
+        m = marks.get(r.name)
+        out.append({
+            "rule": r.name,
+            "category": r.category,
+            "incremental": bool(r.watch),
+            "high_water": m.high_water.isoformat() if m and m.high_water else None,
+            "last_run_at": m.last_run_at.isoformat() if m and m.last_run_at else None,
+            "last_mode": m.last_mode if m else None,
+            "last_scanned": m.last_scanned if m else None,
+            "last_found": m.last_found if m else None,
+            "last_ms": m.last_ms if m else None,
+        })
+    return out
@@ -0,0 +1,115 @@
+import random
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.match import Buyer, DealBrief
+from app.services import buy_box_index
+from app.services.buy_box_index import BuyBox, count_candidates, get_index, match_buyers, score_buy_box
+
+REGIONS = ["Winnipeg", "Brandon", "CA-MB", "Transcona", "Selkirk"]
+TYPES = ["SFH", "Duplex", "Triplex", "Condo"]
+
+
+def _csv(rng, pool, k):
+    return ", ".join(rng.sample(pool, k)) if k else None
+
+
+def _buyer(rng, i):
+    return Buyer(
+        id=i, name=f"b{i}", email=f"b{i}@example.com", active=rng.random() > 0.15,
+        regions=_csv(rng, REGIONS, rng.randint(0, 2)),
+        property_types=_csv(rng, TYPES, rng.randint(0, 2)),
+        min_price=rng.choice([None, Decimal(100000), Decimal(250000), Decimal(400000)]),
+        max_price=rng.choice([None, Decimal(200000), Decimal(300000), Decimal(500000)]),
+        min_beds=rng.choice([None, 2, 3]), min_baths=rng.choice([None, 1, 2]),
+    )
+
+
+def _deal(rng):
+    return DealBrief(
+        headline="deal", region=rng.choice(REGIONS + [None, " winnipeg "]),
+        property_type=rng.choice(TYPES + [None]),
+        price=rng.choice([None, Decimal(100000), Decimal(240000), Decimal(300000), Decimal(450000)]),
+        beds=rng.choice([None, 2, 3, 4]), baths=rng.choice([None, 1, 2]),
+    )
+
+
+def _brute(buyers, deal, min_score, limit):
+    out = [c for c in (score_buy_box(BuyBox.from_buyer(b), deal) for b in buyers if b.active) if c and c.score >= min_score]
+    out.sort(key=lambda c: (-c.score, c.buyer_id))
+    return [(c.buyer_id, c.score, c.reasons) for c in out[:limit]]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Buyer.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.mark.unit
+def test_index_matches_full_scan(db):
+    rng = random.Random(11)
+    buyers = [_buyer(rng, i) for i in range(1, 301)]
+    db.add_all(buyers)
+    db.commit()
+    for _ in range(200):
+        deal = _deal(rng)
+        min_score = rng.choice([0.0, 0.1, 0.2, 0.25, 0.5, 0.7])
+        got = [(c.buyer_id, c.score, c.reasons) for c in match_buyers(db, deal, min_score=min_score, max_results=15)]
+        assert got == _brute(buyers, deal, min_score, 15)
+
+    idx = get_index(db)
+    deal = DealBrief(headline="x", region="Selkirk", property_type="Condo", price=Decimal(450000), beds=1, baths=0)
+    assert len(idx.candidates(deal, 0.5)) < len([b for b in buyers if b.active])
+
+
+@pytest.mark.unit
+def test_index_follows_buyer_writes(db):
+    deal = DealBrief(headline="x", region="Brandon", property_type="SFH", price=Decimal(250000), beds=3, baths=2)
+    assert match_buyers(db, deal) == []
+
+    b = Buyer(name="new", regions="Brandon", property_types="SFH", active=True)
+    db.add(b)
+    db.commit()
+    assert [c.buyer_id for c in match_buyers(db, deal)] == [b.id]
+    assert count_candidates(db, "brandon", "sfh") == 1
+
+    b.regions = "Winnipeg"
+    db.commit()
+    assert [c.score for c in match_buyers(db, deal, min_score=0.0)] == [0.25]
+    assert count_candidates(db, "Brandon", None) == 0
+
+    b.active = False
+    db.commit()
+    assert match_buyers(db, deal, min_score=0.0) == []
+
+    db.delete(b)
+    db.commit()
+    assert get_index(db).seen == set()
+
+
+@pytest.mark.unit
+def test_dirty_ids_are_published_on_commit_only(db):
+    engine = db.get_bind()
+    deal = DealBrief(headline="x", region="Brandon", property_type="SFH", price=Decimal(250000), beds=3, baths=2)
+    b = Buyer(name="b", regions="Brandon", property_types="SFH", active=True)
+    db.add(b)
+    db.commit()
+    assert [c.buyer_id for c in match_buyers(db, deal)] == [b.id]
+
+    b.regions = "Winnipeg"
+    db.flush()  # written but not committed: nothing for other sessions to pick up yet
+    assert not buy_box_index._DIRTY.get(engine)
+    db.rollback()
+    assert not buy_box_index._DIRTY.get(engine)
+
+    b.regions = "Winnipeg"
+    db.commit()
+    assert buy_box_index._DIRTY.get(engine) == {b.id}
+    assert count_candidates(db, "Brandon", None) == 0
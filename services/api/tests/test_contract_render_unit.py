@@ -0,0 +1,62 @@
+import pytest
+
+from app.core import contract_render
+from app.core.contract_render import (
+    compile_template,
+    make_pdf,
+    render_batch,
+    render_text,
+    text_width,
+    wrap_lines,
+)
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+
+@pytest.mark.unit
+def test_templates_are_compiled_once_per_source(monkeypatch):
+    monkeypatch.setattr(contract_render, "_templates", contract_render.OrderedDict())
+    monkeypatch.setattr(contract_render, "TEMPLATE_CACHE_SIZE", 2)
+    a = compile_template("Seller: {{ seller }}")
+    assert compile_template("Seller: {{ seller }}") is a
+    assert render_text("Seller: {{ seller }}", {"seller": "Jane"}) == "Seller: Jane"
+    compile_template("B {{ x }}")
+    compile_template("C {{ x }}")  # evicts the least recently used source
+    assert len(contract_render._templates) == 2
+    assert compile_template("Seller: {{ seller }}") is not a
+
+
+@pytest.mark.unit
+def test_wrap_uses_font_metrics():
+    text = "Assignment of contract " * 20 + "W" * 200
+    assert text_width("Hello, World") == pytest.approx(stringWidth("Hello, World", "Helvetica", 10))
+    lines = wrap_lines(text, 300)
+    assert all(stringWidth(line, "Helvetica", 10) <= 300 for line in lines)
+    assert "".join(lines).replace(" ", "") == text.replace(" ", "")
+    assert wrap_lines("", 300) == []
+    # narrow glyphs fit more per line than the old fixed 90-char slice allowed
+    assert len(wrap_lines("i" * 400, 468)[0]) > 90
+
+
+@pytest.mark.unit
+def test_batch_streams_every_document_to_the_sink(tmp_path):
+    template = "Offer for {{ address }}\n" + "Terms and conditions apply. " * 400
+    jobs = [{"template": template, "data": {"address": f"{i} Main St", "n": i}, "filename": "offer_{{ n }}", "id": i} for i in range(6)]
+    jobs.append({"template": "{{ missing.attr }}", "data": {}, "filename": "bad"})
+    seen = {}
+
+    def sink(doc):
+        seen[doc["filename"]] = doc
+        (tmp_path / doc["filename"]).write_bytes(doc["pdf"])
+
+    stats = render_batch(jobs, sink, workers=2)
+    assert stats["documents"] == 6 and sorted(seen) == [f"offer_{i}.pdf" for i in range(6)]
+    assert seen["offer_3.pdf"]["id"] == 3 and seen["offer_3.pdf"]["pdf"].startswith(b"%PDF")
+    assert stats["pages"] == sum(d["pages"] for d in seen.values()) and seen["offer_0.pdf"]["pages"] >= 2
+    assert stats["pages_per_sec"] > 0 and [e["index"] for e in stats["errors"]] == [6]
+    pool = contract_render.get_pool(2)  # reused across batches, never forked from the server
+    assert render_batch(jobs[:1], lambda d: None, workers=2)["documents"] == 1 and contract_render.get_pool(2) is pool
+    assert pool._mp_context.get_start_method() == "spawn"
+
+    serial = render_batch(jobs[:2], lambda d: None, workers=1)
+    assert serial["documents"] == 2 and serial["pages"] == seen["offer_0.pdf"]["pages"] * 2
+    assert make_pdf("hi").startswith(b"%PDF")
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import embedding_utils
+from app.core.embedding_utils import EmbeddingCache, EmbeddingProvider, embed_batch, get_provider, local_embed
+
+
+class _CountingProvider(EmbeddingProvider):
+    name = "counting"
+
+    def __init__(self, dim):
+        super().__init__(dim)
+        self.calls = []
+
+    def embed_batch(self, texts):
+        self.calls.append(list(texts))
+        m = np.array([[len(t), 1.0] + [0.0] * (self.dim - 2) for t in texts])
+        return m / np.linalg.norm(m, axis=1, keepdims=True)
+
+
+@pytest.mark.unit
+def test_batch_matches_single_text_embedding():
+    texts = ["", "a", "hello world", "x" * 255, "abc" * 700]
+    got = np.array(embed_batch(texts, provider=get_provider("local", 64), cache=EmbeddingCache(path=None)))
+    want = np.array([local_embed(t, 64) for t in texts])
+    assert got.shape == (5, 64)
+    assert np.allclose(got, want, atol=1e-6)
+    assert np.allclose(np.linalg.norm(got[1:], axis=1), 1.0, atol=1e-6)
+
+
+@pytest.mark.unit
+def test_cache_hits_survive_restart_and_dedupe_misses(tmp_path):
+    path = str(tmp_path / "emb.sqlite3")
+    provider = _CountingProvider(4)
+    cache = EmbeddingCache(path=path, mem_items=2)
+    first = embed_batch(["a", "bb", "a", "ccc"], provider=provider, cache=cache)
+    assert provider.calls == [["a", "bb", "ccc"]]  # one provider call, duplicates embedded once
+    assert first[0] == first[2]
+
+    assert embed_batch(["bb", "dddd"], provider=provider, cache=cache)[0] == first[1]
+    assert provider.calls[-1] == ["dddd"]
+    cache.close()
+
+    reopened = EmbeddingCache(path=path)
+    assert embed_batch(["ccc", "a"], provider=provider, cache=reopened) == [first[3], first[0]]
+    assert len(provider.calls) == 2
+    assert reopened.stats()["hits"] == 2 and reopened.stats()["misses"] == 0
+
+    provider.version = "2"  # new model output: old entries must not be reused
+    embed_batch(["a"], provider=provider, cache=reopened)
+    assert provider.calls[-1] == ["a"]
+    reopened.close()
+
+
+@pytest.mark.unit
+def test_registered_provider_is_used_by_embed_text(monkeypatch):
+    monkeypatch.setenv("EMBEDDING_PROVIDER", "counting")
+    monkeypatch.setenv("EMBEDDING_DIM", "3")
+    monkeypatch.setattr(embedding_utils, "CACHE_ENABLED", False)
+    embedding_utils.register_provider("counting", _CountingProvider)
+    try:
+        assert embedding_utils.embed_text("xyz") == pytest.approx([3 / np.sqrt(10), 1 / np.sqrt(10), 0.0])
+    finally:
+        embedding_utils._PROVIDERS.pop("counting")
+        embedding_utils._instances.pop(("counting", 3), None)
+
+
+@pytest.mark.unit
+def test_backfill_reports_throughput_and_reembeds_from_cache(tmp_path, monkeypatch):
+    from app.core.db import Base
+    from app.jobs import embed_jobs
+    from app.models.research import ResearchDoc, ResearchSource
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'research.db'}")
+    Base.metadata.create_all(engine, tables=[ResearchSource.__table__, ResearchDoc.__table__])
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    db.add(ResearchSource(id=1, name="src", url="http://example.com", kind="web"))
+    db.add_all([ResearchDoc(source_id=1, title=f"d{i}", content=f"doc body {i % 7}") for i in range(30)])
+    db.commit()
+    db.close()
+    monkeypatch.setattr(embedding_utils, "_cache", EmbeddingCache(path=str(tmp_path / "emb.sqlite3")))
+    monkeypatch.setattr(embedding_utils, "CACHE_ENABLED", True)
+
+    first = embed_jobs.embed_backfill(batch_size=7, session_factory=factory)
+    assert first["docs"] == 30 and first["docs_per_sec"] > 0
+    assert first["cache_misses"] == 7  # 7 distinct bodies, all in the first batch; the rest are hits
+    again = embed_jobs.embed_backfill(only_missing=False, batch_size=8, session_factory=factory)
+    assert again["docs"] == 30 and again["cache_hits"] == 30 and again["cache_misses"] == 0
+    assert embed_jobs.embed_backfill(session_factory=factory)["docs"] == 0
+    engine.dispose()
@@ -0,0 +1,104 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.db import Base
+from app.models.contract_record import ContractRecord
+from app.models.dispo import DispoAssignment, DispoBuyerProfile
+from app.models.integrity_issue import IntegrityIssueRecord, IntegrityRuleMark
+from app.models.pro_retainer import Retainer
+from app.models.pro_scorecard import Professional
+from app.models.wholesale import WholesaleActivityLog, WholesalePipeline
+from app.services import integrity_monitor as im
+
+TABLES = [
+    WholesalePipeline, WholesaleActivityLog, DispoBuyerProfile, DispoAssignment, Professional, Retainer, ContractRecord,
+    IntegrityIssueRecord, IntegrityRuleMark,
+]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(im, "SCAN_OVERLAP", timedelta(0))
+    engine = create_engine(f"sqlite:///{tmp_path / 'integrity.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine, tables=[m.__table__ for m in TABLES])
+    factory = sessionmaker(bind=engine)
+    s = factory()
+    yield s, factory, engine
+    s.close()
+    engine.dispose()
+
+
+def _pipeline(s, stage, at):
+    p = WholesalePipeline(stage=stage, created_at=at, updated_at=at)
+    s.add(p)
+    s.flush()
+    return p
+
+
+def _open(s):
+    s.expire_all()
+    return sorted((r.rule, r.entity_id) for r in s.query(IntegrityIssueRecord).filter_by(status="open"))
+
+
+@pytest.mark.unit
+def test_rules_compile_to_filters_and_report_matches_violations(db):
+    s, factory, _ = db
+    t = datetime(2026, 1, 1)
+    bad = _pipeline(s, "under_contract", t)
+    _pipeline(s, "lead", t)
+    ok = _pipeline(s, "under_contract", t)
+    s.add(DispoBuyerProfile(id=1, name="b"))
+    s.add(DispoAssignment(pipeline_id=ok.id, buyer_id=1, status="assigned", updated_at=t))
+    s.add(Professional(id=1, name="p", role="lawyer"))
+    s.add(Retainer(professional_id=1, name="r", monthly_hours_included=5, renewal_date=date(2025, 1, 1), created_at=t))
+    s.add(ContractRecord(deal_id=1, title="c", storage_url=None))
+    s.add(ContractRecord(deal_id=2, title="d", storage_url="s3://x"))
+    s.commit()
+
+    sql = str(im.RULES[0].condition.compile(compile_kwargs={"literal_binds": True}))
+    assert "under_contract" in sql and "NOT (EXISTS" in sql
+
+    report = im.generate_integrity_report(s)
+    assert report.total_issues == 3
+    assert {(i.category, i.entity_id) for i in report.issues} == {
+        ("pipeline_mismatch", bad.id), ("retainer_invalid", 1), ("missing_document", 1),
+    }
+    stats = im.run_rules(s, session_factory=factory)  # concurrent, separate sessions
+    assert {x["mode"] for x in stats if x["rule"] != "retainer_renewal_before_creation"} == {"incremental"}
+
+
+@pytest.mark.unit
+def test_incremental_scan_only_touches_changed_rows_and_resolves_in_place(db):
+    s, _, _ = db
+    t = datetime(2026, 1, 1)
+    rows = [_pipeline(s, "under_contract" if i % 2 else "lead", t + timedelta(seconds=i)) for i in range(40)]
+    s.commit()
+    im.run_rule(s, im.RULES[0])
+    assert len(_open(s)) == 20
+
+    stats = im.run_rule(s, im.RULES[0])
+    assert stats["mode"] == "incremental" and stats["scanned"] == 1  # only the row at the mark itself
+    later = t + timedelta(hours=1)
+    s.add(DispoBuyerProfile(id=1, name="b"))
+    s.add(DispoAssignment(pipeline_id=rows[1].id, buyer_id=1, status="offered", updated_at=later))
+    rows[2].stage, rows[2].updated_at = "under_contract", later
+    s.commit()
+
+    stats = im.run_rule(s, im.RULES[0])
+    assert stats["scanned"] == 3 and stats["found"] == 2 and stats["resolved"] == 1  # rows 1, 2 and 39
+    issues = _open(s)
+    assert ("wholesale_under_contract_unassigned", rows[1].id) not in issues
+    assert ("wholesale_under_contract_unassigned", rows[2].id) in issues and len(issues) == 20
+
+    s.query(DispoAssignment).update({"status": "fallout", "updated_at": later + timedelta(minutes=1)})
+    s.delete(rows[3])
+    s.commit()
+    im.run_rule(s, im.RULES[0])
+    issues = _open(s)
+    assert ("wholesale_under_contract_unassigned", rows[1].id) in issues  # reopened, same row
+    assert ("wholesale_under_contract_unassigned", rows[3].id) not in issues  # entity deleted
+    assert s.query(IntegrityIssueRecord).filter_by(entity_id=rows[1].id).count() == 1
+    assert im.rule_status(s)[0]["last_mode"] == "incremental"
@@ -0,0 +1,90 @@
+import json
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.matcher import BuyerMatrix, score_buyer_vs_deal, top_n
+from app.jobs.match_jobs import sweep_top_matches
+from app.models.match import Buyer, DealBrief, DealTopMatch
+
+REGIONS = ["Winnipeg", "Brandon", "CA-MB", "Transcona", "St. Vital", "Selkirk"]
+TYPES = ["SFH", "Duplex", "Triplex", "Condo"]
+TAGS = ["garage", "corner lot", "basement suite", "fixer", "solid bones"]
+
+
+def _csv(rng, pool, k):
+    return ",".join(rng.sample(pool, k)) if k else None
+
+
+def _buyers(rng, n):
+    out = []
+    for i in range(n):
+        lo = rng.choice([None, 0, 100000, 200000])
+        out.append(Buyer(
+            id=i + 1, name=f"b{i}", active=True,
+            regions=_csv(rng, REGIONS, rng.randint(0, 3)),
+            property_types=_csv(rng, TYPES, rng.randint(0, 2)),
+            min_price=None if lo is None else Decimal(lo),
+            max_price=rng.choice([None, Decimal(250000), Decimal(400000)]),
+            min_beds=rng.choice([None, 1, 3]), min_baths=rng.choice([None, 1, 2]),
+            tags=_csv(rng, TAGS, rng.randint(0, 2)),
+        ))
+    return out
+
+
+def _deals(rng, n):
+    return [DealBrief(
+        id=i + 1, status="active",
+        headline=rng.choice(["SFH in Transcona with garage", "Duplex fixer near Selkirk", "Condo"]),
+        region=rng.choice(REGIONS + [None, "winnipeg east"]),
+        property_type=rng.choice(TYPES + [None]),
+        price=rng.choice([None, Decimal(95000), Decimal(240000), Decimal(260000), Decimal(430000)]),
+        beds=rng.choice([None, 2, 3, 4]), baths=rng.choice([None, 1, 2]),
+    ) for i in range(n)]
+
+
+@pytest.mark.unit
+def test_batch_scores_equal_pairwise_scorer():
+    rng = random.Random(7)
+    buyers, deals = _buyers(rng, 60), _deals(rng, 40)
+    S = BuyerMatrix(buyers).score(deals)
+    want = np.array([[score_buyer_vs_deal(b, d)[0] for b in buyers] for d in deals])
+    assert np.allclose(S, want, atol=1e-12)
+
+
+@pytest.mark.unit
+def test_top_n_orders_by_score_then_column():
+    row = np.array([0.5, 0.9, 0.5, 0.2, 0.9, 0.5])
+    assert top_n(row, 3) == [(1, 0.9), (4, 0.9), (0, 0.5)]
+    assert top_n(row, 10, min_score=0.5) == [(1, 0.9), (4, 0.9), (0, 0.5), (2, 0.5), (5, 0.5)]
+    assert top_n(row, 0) == []
+
+
+@pytest.mark.unit
+def test_sweep_persists_top_matches():
+    engine = create_engine("sqlite:///:memory:")
+    for t in (Buyer.__table__, DealBrief.__table__, DealTopMatch.__table__):
+        t.create(engine)
+    db = sessionmaker(bind=engine)()
+    rng = random.Random(3)
+    db.add_all(_buyers(rng, 25) + _deals(rng, 8))
+    db.commit()
+
+    res = sweep_top_matches(limit=3, min_score=0.4, db=db)
+    assert res["deals_evaluated"] == 8 and res["buyers_evaluated"] == 25
+    rows = db.query(DealTopMatch).order_by(DealTopMatch.deal_id, DealTopMatch.rank).all()
+    assert len(rows) == res["matches_persisted"] > 0
+
+    d = db.get(DealBrief, rows[0].deal_id)
+    ranked = sorted(((score_buyer_vs_deal(b, d)[0], b.id) for b in db.query(Buyer).all()), key=lambda t: t[0], reverse=True)
+    got = [r for r in rows if r.deal_id == d.id]
+    assert [r.buyer_id for r in got] == [bid for s, bid in ranked[:3] if s >= 0.4]
+    assert json.loads(got[0].reasons)
+
+    # re-running replaces rather than accumulates
+    sweep_top_matches(limit=3, min_score=0.4, db=db)
+    assert db.query(DealTopMatch).count() == len(rows)
@@ -0,0 +1,59 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.db import Base
+from app.core.vector_index import VectorIndex
+from app.models.research import ResearchDoc, ResearchSource
+from app.routers import research_semantic
+from app.schemas.research import SemanticQueryIn
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'research.db'}")
+    Base.metadata.create_all(engine, tables=[ResearchSource.__table__, ResearchDoc.__table__])
+    s = sessionmaker(bind=engine)()
+    yield s
+    s.close()
+    engine.dispose()
+
+
+def _use_index(monkeypatch, tmp_path):
+    idx = VectorIndex("research_docs", directory=str(tmp_path / "idx"))
+    monkeypatch.setattr(research_semantic, "research_vectors", idx)
+    return idx
+
+
+@pytest.mark.unit
+def test_in_place_rewrite_resyncs_the_sidecar(db, tmp_path, monkeypatch):
+    src = ResearchSource(name="s", url="https://example.com")
+    db.add(src)
+    db.flush()
+    docs = [ResearchDoc(source_id=src.id, content=f"d{i}") for i in range(3)]
+    for doc, vec in zip(docs, ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0])):
+        doc.embedding_json = str(vec)
+    db.add_all(docs)
+    db.commit()
+
+    idx = _use_index(monkeypatch, tmp_path)
+    research_semantic._ensure_index(db)
+    assert idx.search([1.0, 0.0, 0.0], top_k=1)[0][0] == docs[0].id
+
+    # another worker rewrites an embedding: same row count, no in-process upsert
+    docs[0].embedding_json = "[0.0, 0.0, 1.0]"
+    db.commit()
+
+    restarted = _use_index(monkeypatch, tmp_path)
+    research_semantic._ensure_index(db)
+    assert restarted.marker["rows"] == 3
+    assert sorted(d for d, _ in restarted.search([0.0, 0.0, 1.0], top_k=2)) == [docs[0].id, docs[2].id]
+    assert restarted.search([1.0, 0.0, 0.0], top_k=1, min_score=0.5) == []
+
+
+@pytest.mark.unit
+def test_semantic_query_rejects_unknown_mode():
+    assert SemanticQueryIn(vector=[1.0], mode="ivf").mode == "ivf"
+    with pytest.raises(ValidationError):
+        SemanticQueryIn(vector=[1.0], mode="bogus")
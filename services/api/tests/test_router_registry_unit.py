@@ -0,0 +1,89 @@
+import asyncio
+import json
+import sys
+import types
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.router_registry import RouterRegistry
+
+
+def _fake_pack(name, prefix):
+    mod = types.ModuleType(name)
+    mod.router = APIRouter(prefix=prefix)
+
+    @mod.router.get("/ping")
+    def ping():
+        return {"pack": name}
+
+    @mod.router.get("/items/{item_id}")
+    def item(item_id: int):
+        return {"id": item_id}
+
+    sys.modules[name] = mod
+    return mod
+
+
+@pytest.fixture
+def packs():
+    names = [_fake_pack(f"_rr_pack_{i}", f"/pack{i}").__name__ for i in range(3)]
+    yield names
+    for n in names:
+        sys.modules.pop(n, None)
+
+
+@pytest.mark.unit
+def test_eager_mount_profiles_and_writes_manifest(tmp_path, packs):
+    app = FastAPI()
+    manifest = tmp_path / "m.json"
+    reg = RouterRegistry(app, mode="eager", manifest_path=str(manifest))
+    for n in packs:
+        reg.mount(n, n)
+    bad = reg.mount("broken", "_rr_pack_missing")
+    assert bad.status == "failed" and "ModuleNotFoundError" in bad.error
+
+    e = reg.entries[packs[0]]
+    assert e.status == "mounted" and e.trigger == "startup" and e.routes == 2
+    assert e.prefixes == ["/pack0/items/", "/pack0/ping"]
+    assert e.import_ms is not None
+    assert TestClient(app).get("/pack1/ping").json() == {"pack": packs[1]}
+
+    reg.save_manifest()
+    data = json.loads(manifest.read_text())["routers"]
+    assert set(data) == set(packs)
+    rep = reg.report()
+    assert rep["by_status"] == {"mounted": 3, "failed": 1}
+
+
+@pytest.mark.unit
+def test_lazy_mount_on_first_request_and_warmup(tmp_path, packs, monkeypatch):
+    manifest = tmp_path / "m.json"
+    routers = {n: {"module": n, "attr": "router", "prefixes": [f"/pack{i}/"], "import_ms": 100.0} for i, n in enumerate(packs)}
+    manifest.write_text(json.dumps({"routers": routers}))
+
+    app = FastAPI()
+    reg = RouterRegistry(app, mode="lazy", manifest_path=str(manifest))
+    for n in packs:
+        reg.mount(n, n)
+    reg.install()
+    assert [e.status for e in reg.entries.values()] == ["deferred"] * 3
+
+    client = TestClient(app)
+    assert client.get("/pack1/items/7").json() == {"id": 7}
+    assert reg.entries[packs[1]].status == "mounted"
+    assert reg.entries[packs[1]].trigger == "request"
+    assert reg.entries[packs[0]].status == "deferred"
+
+    asyncio.run(reg.warmup(delay=0))
+    assert {e.trigger for e in reg.entries.values()} == {"request", "warmup"}
+    assert client.get("/pack2/ping").status_code == 200
+
+
+@pytest.mark.unit
+def test_cheap_packs_stay_eager_in_lazy_mode(tmp_path, packs):
+    manifest = tmp_path / "m.json"
+    manifest.write_text(json.dumps({"routers": {packs[0]: {"module": packs[0], "prefixes": ["/pack0/"], "import_ms": 0.1}}}))
+    reg = RouterRegistry(FastAPI(), mode="lazy", manifest_path=str(manifest))
+    assert reg.mount(packs[0], packs[0]).status == "mounted"
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from app.core.vector_index import VectorIndex
+
+
+def _index(tmp_path, **kw):
+    return VectorIndex("docs", directory=str(tmp_path), **kw)
+
+
+@pytest.mark.unit
+def test_exact_search_matches_brute_force(tmp_path):
+    rng = np.random.default_rng(1)
+    vecs = rng.normal(size=(300, 16))
+    idx = _index(tmp_path)
+    idx.build((i + 1, v.tolist()) for i, v in enumerate(vecs))
+    q = rng.normal(size=16)
+    got = idx.search(q.tolist(), top_k=5, mode="exact")
+    norm = vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+    want = np.argsort(-(norm @ (q / np.linalg.norm(q))))[:5] + 1
+    assert [d for d, _ in got] == want.tolist()
+    assert idx.search(q.tolist(), top_k=5, min_score=1.01) == []
+
+
+@pytest.mark.unit
+def test_upsert_persist_and_mmap_reload(tmp_path):
+    idx = _index(tmp_path)
+    idx.upsert(7, [1.0, 0.0])
+    idx.upsert(8, [0.0, 2.0])
+    assert idx.upsert(9, [1.0, 0.0, 0.0]) is False  # wrong dimension
+    idx.upsert(7, [0.0, -1.0])
+    idx.flush()
+    fresh = _index(tmp_path)
+    assert fresh.load()
+    assert fresh.search([0.0, -1.0], top_k=1)[0][0] == 7
+    fresh.upsert(10, [1.0, 1.0])  # copy-on-write out of the mmap
+    assert len(fresh) == 3
+
+
+@pytest.mark.unit
+def test_ivf_finds_exact_neighbour_and_sync_ids(tmp_path):
+    rng = np.random.default_rng(2)
+    vecs = rng.normal(size=(500, 8))
+    idx = _index(tmp_path, nprobe=4)
+    idx.build((i, v.tolist()) for i, v in enumerate(vecs))
+    assert idx.search(vecs[42].tolist(), top_k=1, mode="ivf")[0][0] == 42
+    assert idx.stats()["mode"] == "ivf"
+    res = idx.sync_ids(range(1, 501), lambda missing: [(m, vecs[0].tolist()) for m in missing])
+    assert res == {"added": 1, "removed": 1}
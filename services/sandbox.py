@@ -3,10 +3,15 @@ Sandbox Service Module - Batch 1 Stability & Activation
 Provides isolated testing environment with safety mechanisms and monitoring.
 """
 
+import heapq
+import itertools
 import logging
+import queue
 import uuid
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
 from typing import Any, Callable, Dict, Optional, Set
 from datetime import datetime, timedelta
 import random
@@ -166,24 +171,128 @@ class DryRunLock:
 # 3. WORKER PROCESS ENABLED
 # ============================================================================
 
+class JobQueue:
+    """
+    Bounded priority queue with condition-variable wakeups.
+
+    Lower priority values run first; equal priorities run in submission order.
+    ``put`` blocks (or raises queue.Full after ``timeout``) while the queue is at
+    ``maxsize``, which gives submitters backpressure instead of unbounded growth.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def put(self, item: Any, priority: int = 0, block: bool = True, timeout: Optional[float] = None) -> None:
+        with self._not_full:
+            if self.maxsize > 0:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while len(self._heap) >= self.maxsize:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if not block or (remaining is not None and remaining <= 0):
+                        raise queue.Full
+                    self._not_full.wait(remaining)
+            heapq.heappush(self._heap, (priority, next(self._seq), item))
+            self._not_empty.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """Next item, or None once closed (or when ``timeout`` elapses with nothing queued)."""
+        with self._not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._heap:
+                if self._closed:
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._not_empty.wait(remaining)
+            item = heapq.heappop(self._heap)[2]
+            self._not_full.notify()
+            return item
+
+    def close(self) -> None:
+        """Wake every waiting consumer; get() returns None once the queue is empty."""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+
+    def reopen(self) -> None:
+        with self._lock:
+            self._closed = False
+
+
+class _JobTimeout(Exception):
+    """A pool job outlived WorkerProcess.job_timeout."""
+
+
 class WorkerProcess:
-    """Background worker process for sandbox task handling."""
+    """
+    Background worker pool for sandbox task handling.
+
+    Jobs go into a bounded priority ``JobQueue``; ``max_workers`` threads block on
+    it and are woken as soon as a job arrives, so throughput scales with the pool
+    instead of being capped at one job per poll. With ``executor="process"`` the
+    threads hand each job to a ProcessPoolExecutor (job functions and arguments
+    must then be picklable), which is the option for CPU-bound work.
+    """
     
-    def __init__(self, poll_interval: float = 5.0, max_workers: int = 1):
+    def __init__(
+        self,
+        poll_interval: float = 5.0,
+        max_workers: int = 1,
+        executor: str = "thread",
+        max_queue_size: int = 0,
+        job_timeout: Optional[float] = None,
+        max_completed: int = 10000,
+    ):
         """
         Initialize worker process.
         
         Args:
-            poll_interval: Seconds between job polls
+            poll_interval: Max seconds an idle worker waits before re-checking shutdown
+                (jobs wake workers immediately; this is only a safety net)
             max_workers: Number of concurrent workers
+            executor: "thread" to run jobs on the worker threads, "process" for a process pool
+            max_queue_size: Pending-job bound; submit blocks when full (0 = unbounded)
+            job_timeout: Seconds before a process-pool job is reported as timed out
+            max_completed: How many finished job records to keep for get_job_status
         """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', not {executor!r}")
         self.poll_interval = poll_interval
         self.max_workers = max_workers
+        self.executor = executor
+        self.job_timeout = job_timeout
+        self.max_completed = max_completed
         self.is_running = False
         self.threads: list = []
-        self.job_queue: list = []
-        self.completed_jobs: Dict[str, Any] = {}
-        logger.info(f"Worker initialized - interval={poll_interval}s, workers={max_workers}")
+        self.job_queue = JobQueue(maxsize=max_queue_size)
+        self.completed_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._unfinished = 0
+        self._metrics = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'total_wait_ms': 0.0,
+            'total_run_ms': 0.0,
+            'max_run_ms': 0.0,
+        }
+        self._started_at: Optional[float] = None
+        logger.info(f"Worker initialized - executor={executor}, workers={max_workers}, queue_max={max_queue_size or 'unbounded'}")
     
     def start(self):
         """Start worker process."""
@@ -192,6 +301,11 @@ class WorkerProcess:
             return
         
         self.is_running = True
+        self._started_at = time.monotonic()
+        self.job_queue.reopen()
+        if self.executor == "process":
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        self.threads = []
         for i in range(self.max_workers):
             thread = threading.Thread(
                 target=self._worker_loop,
@@ -202,24 +316,46 @@ class WorkerProcess:
             self.threads.append(thread)
         logger.info(f"Worker process started with {self.max_workers} workers")
     
-    def stop(self):
-        """Stop worker process."""
+    def stop(self, drain: bool = False, timeout: Optional[float] = None):
+        """
+        Stop worker process.
+
+        Jobs still queued stay queued (they run after the next start()) unless
+        ``drain`` is set, in which case stop waits for the queue to empty first.
+        """
+        if drain and self.is_running:
+            self.wait_idle(timeout)
         self.is_running = False
+        self.job_queue.close()
         for thread in self.threads:
             thread.join(timeout=2)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
         logger.info("Worker process stopped")
     
     def _worker_loop(self):
-        """Main worker loop."""
+        """Main worker loop: block on the queue, run, repeat."""
         while self.is_running:
+            job = self.job_queue.get(timeout=self.poll_interval)
+            if job is None:
+                continue
+            if not self.is_running:
+                # stopped while waiting: leave the job for the next start()
+                self.job_queue.put(job, priority=job['priority'])
+                break
+            with self._lock:
+                self._in_flight += 1
             try:
-                if self.job_queue:
-                    job = self.job_queue.pop(0)
-                    self._process_job(job)
-                time.sleep(self.poll_interval)
+                self._process_job(job)
             except Exception as e:
                 logger.error(f"Worker error: {e}")
-                time.sleep(self.poll_interval)
+            finally:
+                with self._idle:
+                    self._in_flight -= 1
+                    self._unfinished -= 1
+                    if not self._unfinished:
+                        self._idle.notify_all()
     
     def _process_job(self, job: Dict[str, Any]):
         """Process a single job."""
@@ -228,43 +364,124 @@ class WorkerProcess:
         job_func = job.get('func')
         job_args = job.get('args', ())
         job_kwargs = job.get('kwargs', {})
+        started = time.monotonic()
+        wait_ms = (started - job.get('queued_at', started)) * 1000.0
+        record: Dict[str, Any] = {'name': job_name}
         
         try:
-            logger.info(f"Processing job {job_id}: {job_name}")
-            result = job_func(*job_args, **job_kwargs)
-            self.completed_jobs[job_id] = {
-                'name': job_name,
-                'status': 'completed',
-                'result': result,
-                'timestamp': datetime.now().isoformat()
-            }
-            logger.info(f"Job {job_id} completed successfully")
+            logger.debug(f"Processing job {job_id}: {job_name}")
+            if self._pool is not None:
+                future = self._pool.submit(job_func, *job_args, **job_kwargs)
+                try:
+                    result = future.result(timeout=self.job_timeout)
+                except FutureTimeout:
+                    # only the pool wait: a TimeoutError raised by the job itself is a failure
+                    if not future.done():
+                        future.cancel()
+                        raise _JobTimeout() from None
+                    raise
+            else:
+                result = job_func(*job_args, **job_kwargs)
+            record.update(status='completed', result=result)
+            logger.debug(f"Job {job_id} completed successfully")
+        except _JobTimeout:
+            record.update(status='timed_out', error=f"timed out after {self.job_timeout}s")
+            logger.error(f"Job {job_id} timed out")
         except Exception as e:
-            self.completed_jobs[job_id] = {
-                'name': job_name,
-                'status': 'failed',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
+            record.update(status='failed', error=str(e))
             logger.error(f"Job {job_id} failed: {e}")
+        
+        run_ms = (time.monotonic() - started) * 1000.0
+        record.update(
+            timestamp=datetime.now().isoformat(),
+            wait_ms=round(wait_ms, 3),
+            run_ms=round(run_ms, 3),
+        )
+        with self._lock:
+            m = self._metrics
+            m[record['status']] += 1
+            m['total_wait_ms'] += wait_ms
+            m['total_run_ms'] += run_ms
+            m['max_run_ms'] = max(m['max_run_ms'], run_ms)
+            self.completed_jobs[job_id] = record
+            while len(self.completed_jobs) > self.max_completed:
+                self.completed_jobs.popitem(last=False)
     
-    def submit_job(self, job_name: str, func: Callable, *args, **kwargs) -> str:
-        """Submit a job to the worker queue."""
+    def submit(
+        self,
+        job_name: str,
+        func: Callable,
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Submit a job with scheduling options (lower priority runs first).
+
+        Raises queue.Full if the queue is bounded and stays full past ``timeout``
+        (or immediately with ``block=False``).
+        """
         job_id = str(uuid.uuid4())
         job = {
             'id': job_id,
             'name': job_name,
             'func': func,
             'args': args,
-            'kwargs': kwargs
+            'kwargs': kwargs or {},
+            'priority': priority,
+            'queued_at': time.monotonic(),
         }
-        self.job_queue.append(job)
-        logger.info(f"Job submitted: {job_id} ({job_name})")
+        with self._lock:
+            self._unfinished += 1
+        try:
+            self.job_queue.put(job, priority=priority, block=block, timeout=timeout)
+        except queue.Full:
+            with self._idle:
+                self._unfinished -= 1
+                if not self._unfinished:
+                    self._idle.notify_all()
+            raise
+        with self._lock:
+            self._metrics['submitted'] += 1
+        logger.debug(f"Job submitted: {job_id} ({job_name})")
         return job_id
     
+    def submit_job(self, job_name: str, func: Callable, *args, **kwargs) -> str:
+        """Submit a job to the worker queue."""
+        return self.submit(job_name, func, args=args, kwargs=kwargs)
+    
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until the queue is empty and no job is running. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._unfinished, timeout)
+    
     def get_job_status(self, job_id: str) -> Optional[Dict]:
         """Get status of a completed job."""
         return self.completed_jobs.get(job_id)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth, outcome counts and per-job timing averages."""
+        with self._lock:
+            m = dict(self._metrics)
+            in_flight = self._in_flight
+        done = m['completed'] + m['failed'] + m['timed_out']
+        elapsed = (time.monotonic() - self._started_at) if self._started_at else 0.0
+        return {
+            'executor': self.executor,
+            'workers': self.max_workers,
+            'queue_depth': len(self.job_queue),
+            'in_flight': in_flight,
+            'submitted': m['submitted'],
+            'completed': m['completed'],
+            'failed': m['failed'],
+            'timed_out': m['timed_out'],
+            'avg_wait_ms': round(m['total_wait_ms'] / done, 3) if done else 0.0,
+            'avg_run_ms': round(m['total_run_ms'] / done, 3) if done else 0.0,
+            'max_run_ms': round(m['max_run_ms'], 3),
+            'jobs_per_sec': round(done / elapsed, 1) if elapsed else 0.0,
+        }
 
 
 # ============================================================================
@@ -148,6 +148,76 @@ class TestWorkerProcess(unittest.TestCase):
         self.assertEqual(status['status'], 'completed')
         
         self.worker.stop()
+    
+    def test_jobs_do_not_wait_for_poll_interval(self):
+        """Test a backlog drains at pool speed, not one job per poll."""
+        worker = WorkerProcess(poll_interval=5.0, max_workers=4)
+        worker.start()
+        try:
+            ids = [worker.submit_job('inc', lambda i=i: i + 1) for i in range(2000)]
+            self.assertTrue(worker.wait_idle(timeout=10))
+            self.assertEqual(worker.get_job_status(ids[-1])['result'], 2000)
+            metrics = worker.get_metrics()
+            self.assertEqual(metrics['completed'], 2000)
+            self.assertEqual(metrics['queue_depth'], 0)
+        finally:
+            worker.stop()
+    
+    def test_priority_order_and_timing(self):
+        """Test lower priority values run first and timings are recorded."""
+        seen = []
+        self.worker.submit('low', seen.append, args=('low',), priority=5)
+        self.worker.submit('high', seen.append, args=('high',), priority=0)
+        job_id = self.worker.submit('mid', seen.append, args=('mid',), priority=1)
+        self.worker.start()
+        self.assertTrue(self.worker.wait_idle(timeout=5))
+        self.assertEqual(seen, ['high', 'mid', 'low'])
+        status = self.worker.get_job_status(job_id)
+        self.assertIn('wait_ms', status)
+        self.assertIn('run_ms', status)
+    
+    def test_bounded_queue_backpressure(self):
+        """Test submit fails fast when the bounded queue is full."""
+        import queue
+        worker = WorkerProcess(max_queue_size=2)
+        worker.submit_job('a', int)
+        worker.submit_job('b', int)
+        with self.assertRaises(queue.Full):
+            worker.submit('c', int, block=False)
+        with self.assertRaises(queue.Full):
+            worker.submit('c', int, timeout=0.05)
+        self.assertEqual(len(worker.job_queue), 2)
+    
+    def test_failed_job_and_process_executor(self):
+        """Test failures are recorded and process pools run picklable jobs."""
+        worker = WorkerProcess(max_workers=2, executor='process')
+        worker.start()
+        try:
+            ok = worker.submit_job('abs', abs, -3)
+            bad = worker.submit_job('int', int, 'not a number')
+            self.assertTrue(worker.wait_idle(timeout=30))
+            self.assertEqual(worker.get_job_status(ok)['result'], 3)
+            self.assertEqual(worker.get_job_status(bad)['status'], 'failed')
+            self.assertEqual(worker.get_metrics()['failed'], 1)
+        finally:
+            worker.stop()
+    
+    def test_thread_job_raising_timeout_error_is_a_failure(self):
+        """Test a TimeoutError raised by a thread-mode job is recorded, not lost."""
+        def slow():
+            raise TimeoutError("upstream timed out")
+        
+        worker = WorkerProcess(max_workers=1)
+        worker.start()
+        try:
+            job_id = worker.submit_job('slow', slow)
+            self.assertTrue(worker.wait_idle(timeout=5))
+            status = worker.get_job_status(job_id)
+            self.assertEqual(status['status'], 'failed')
+            self.assertIn('upstream timed out', status['error'])
+            self.assertEqual(worker.get_metrics()['failed'], 1)
+        finally:
+            worker.stop()
 
 
 class TestSchedulerHeartbeat(unittest.TestCase):
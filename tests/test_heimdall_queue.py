@@ -0,0 +1,88 @@
+"""
+Tests for the Heimdall queue claim/lease protocol.
+"""
+
+import threading
+import time
+
+import pytest
+
+from backend.heimdall_queue import ClaimQueue, DirWatcher
+
+
+def _fill(qdir, n):
+    for i in range(n):
+        (qdir / f"task_{i:04d}.yaml").write_text(f"type: job\nname: t{i}\n", encoding="utf-8")
+
+
+def test_each_task_is_claimed_by_exactly_one_worker(tmp_path):
+    _fill(tmp_path, 300)
+    (tmp_path / "old.done.yaml").write_text("x", encoding="utf-8")
+    claims = ClaimQueue(tmp_path)
+    pending = claims.pending()
+    assert len(pending) == 300 and pending[0].name == "task_0000.yaml"
+
+    won = []
+    lock = threading.Lock()
+
+    def race(worker_id):
+        for p in pending:  # every worker tries every file
+            c = claims.claim(p, worker_id)
+            if c is not None:
+                with lock:
+                    won.append(c.name)
+
+    threads = [threading.Thread(target=race, args=(f"w{i}",)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(won) == sorted(p.name for p in pending)
+    assert claims.pending() == []
+    assert len(claims.inflight()) == 300
+
+
+def test_expired_lease_is_requeued_then_failed(tmp_path):
+    _fill(tmp_path, 1)
+    claims = ClaimQueue(tmp_path, lease_seconds=60, max_attempts=2)
+    task = claims.pending()[0]
+
+    first = claims.claim(task, "dead-worker")
+    assert first.attempts == 1 and first.path.parent.name == "dead-worker"
+    assert claims.reclaim_expired() == {"requeued": 0, "failed": 0}  # lease still valid
+    assert claims.reclaim_expired(now=time.time() + 61) == {"requeued": 1, "failed": 0}
+    assert [p.name for p in claims.pending()] == [task.name]
+    assert not (tmp_path / "inflight" / "dead-worker").exists()
+
+    second = claims.claim(task, "w2")
+    assert second.attempts == 2
+    assert claims.reclaim_expired(now=time.time() + 61) == {"requeued": 0, "failed": 1}
+    assert (tmp_path / "failed" / task.name).exists()
+    assert claims.pending() == []
+
+
+def test_renew_and_done(tmp_path):
+    _fill(tmp_path, 1)
+    claims = ClaimQueue(tmp_path, lease_seconds=60)
+    c = claims.claim(claims.pending()[0], "w1")
+    c.expires_at = 0
+    claims.renew(c)
+    assert claims.reclaim_expired(now=time.time() + 30)["requeued"] == 0
+    c.path.rename(tmp_path / "task_0000.done.yaml")
+    claims.done(c)
+    assert claims.reclaim_expired(now=time.time() + 3600) == {"requeued": 0, "failed": 0}
+    assert claims.pending() == []
+
+
+def test_dir_watcher_reports_new_files(tmp_path):
+    watcher = DirWatcher(tmp_path)
+    if not watcher.uses_inotify:
+        pytest.skip("inotify not available")
+    try:
+        tmp = tmp_path / ".job.tmp"
+        tmp.write_text("type: job\n", encoding="utf-8")
+        tmp.replace(tmp_path / "job.yaml")
+        names = watcher.wait(2.0)
+        assert "job.yaml" in names
+    finally:
+        watcher.close()
@@ -0,0 +1,156 @@
+"""
+Tests for concurrent / pipelined engine execution in the integrated sandbox.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+
+# services/api puts a regular `security` package on sys.path, which shadows the repo-root
+# namespace package; load the Phase 3 guard from its file so the orchestrator can import it
+if "security.phase3_guard" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location("security.phase3_guard", os.path.join(ROOT, "security", "phase3_guard.py"))
+    sys.modules["security.phase3_guard"] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(sys.modules["security.phase3_guard"])
+
+from sandbox_integrated.engine_profile import EngineItem
+from sandbox_integrated.orchestrator import run_integrated
+
+EVENTS = []
+_LOCK = threading.Lock()
+
+
+class _SlowEngine:
+    def __init__(self, name, delay):
+        self.name = name
+        self.delay = delay
+        self.cycle = 0
+
+    def _log(self, stage, cycle, edge):
+        with _LOCK:
+            EVENTS.append((time.perf_counter(), self.name, stage, cycle, edge))
+
+    def ingest(self, *, max_items):
+        self.cycle += 1
+        c = self.cycle
+        self._log("ingest", c, "start")
+        time.sleep(self.delay)
+        self._log("ingest", c, "end")
+        return [EngineItem(item_id=f"{self.name}-{c}-{i}", payload={"cycle": c}) for i in range(3)]
+
+    def analyze(self, items):
+        return items
+
+    def propose_actions(self, items, *, max_actions):
+        return []
+
+    def export(self, items, intents):
+        c = items[0].payload["cycle"]
+        self._log("export", c, "start")
+        time.sleep(self.delay)
+        self._log("export", c, "end")
+        return {"exported_cycle": c}
+
+    def cost_model(self):
+        return {}
+
+
+def _module(name, delay):
+    mod = types.ModuleType(name)
+    mod.get_engine = lambda: _SlowEngine(name, delay)
+    sys.modules[name] = mod
+    return name
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch):
+    for k in ("VALHALLA_PHASE", "VALHALLA_REAL_DATA_INGEST"):
+        monkeypatch.delenv(k, raising=False)
+    EVENTS.clear()
+    yield
+    for k in [k for k in sys.modules if k.startswith("_sbx_eng_")]:
+        del sys.modules[k]
+
+
+def _config(tmp_path, engines, execution, cycle_seconds):
+    cfg = {
+        "cycle_seconds": cycle_seconds,
+        "resources": {"max_items_per_cycle_global": 100, "max_actions_per_cycle_global": 0},
+        "execution": execution,
+        "engines": [
+            {"name": n, "module": m, "enabled": True, "min_budget_pct": 0.5, "max_items_per_cycle": 10}
+            for n, m in engines
+        ],
+    }
+    path = tmp_path / "cfg.json"
+    path.write_text(json.dumps(cfg), encoding="utf-8")
+    return str(path)
+
+
+def _reports(out_dir):
+    return [json.loads(p.read_text(encoding="utf-8")) for p in sorted(out_dir.glob("INTEGRATED_*.json"))]
+
+
+def test_concurrent_engines_overlap_and_report_stage_timings(tmp_path):
+    engines = [("a", _module("_sbx_eng_a", 0.15)), ("b", _module("_sbx_eng_b", 0.15))]
+    cfg = _config(tmp_path, engines, {"mode": "concurrent", "schedule": "fixed_rate"}, 0.01)
+    out = tmp_path / "out"
+    t0 = time.perf_counter()
+    run_integrated(config_path=cfg, out_dir=str(out), max_cycles=1)
+    assert time.perf_counter() - t0 < 0.55  # sequential would be ~0.6s
+
+    (rep,) = _reports(out)
+    assert [r["engine_name"] for r in rep["results"]] == ["_sbx_eng_a", "_sbx_eng_b"]
+    timings = rep["results"][0]["timings"]
+    assert set(timings) == {"ingest", "analyze", "propose_actions", "export"}
+    assert timings["ingest"]["wall_ms"] >= 140
+    assert timings["ingest"]["cpu_ms"] < timings["ingest"]["wall_ms"]  # sleeping, not computing
+    assert rep["schedule"]["mode"] == "concurrent" and rep["schedule"]["overrun"] is True
+    assert rep["stage_totals"]["export"]["wall_ms"] >= 280
+
+
+def test_pipelined_cycles_overlap_but_keep_stage_order(tmp_path):
+    engines = [("a", _module("_sbx_eng_p", 0.1))]
+    cfg = _config(tmp_path, engines, {"mode": "pipelined", "pipeline_depth": 2, "schedule": "fixed_rate"}, 0.12)
+    out = tmp_path / "out"
+    run_integrated(config_path=cfg, out_dir=str(out), max_cycles=4)
+
+    reps = _reports(out)
+    assert sorted(r["schedule"]["cycle"] for r in reps) == [1, 2, 3, 4]
+    exports = [e for e in EVENTS if e[2] == "export" and e[4] == "start"]
+    assert [e[3] for e in exports] == [1, 2, 3, 4]
+    # cycle 2 ingested while cycle 1 was still exporting
+    ingest2 = next(e[0] for e in EVENTS if e[2] == "ingest" and e[3] == 2 and e[4] == "start")
+    export1_end = next(e[0] for e in EVENTS if e[2] == "export" and e[3] == 1 and e[4] == "end")
+    assert ingest2 < export1_end
+
+
+def test_fixed_rate_skips_overrun_ticks(tmp_path):
+    engines = [("a", _module("_sbx_eng_o", 0.1))]
+    cfg = _config(tmp_path, engines, {"mode": "concurrent", "schedule": "fixed_rate"}, 0.05)
+    out = tmp_path / "out"
+    run_integrated(config_path=cfg, out_dir=str(out), max_cycles=3)
+    reps = sorted(_reports(out), key=lambda r: r["schedule"]["cycle"])
+    assert reps[0]["schedule"]["missed_ticks"] == 0
+    assert all(r["schedule"]["missed_ticks"] >= 1 for r in reps[1:])
+    assert all(r["schedule"]["start_lag_ms"] < 50 for r in reps)
+
+
+def test_process_executor_runs_engine_stages(tmp_path):
+    engines = [("noop_secondary", "sandbox_profiles.noop_engine")]
+    cfg = _config(tmp_path, engines, {"mode": "concurrent", "executor": "process", "max_workers": 2}, 0.01)
+    out = tmp_path / "out"
+    run_integrated(config_path=cfg, out_dir=str(out), max_cycles=2)
+    reps = _reports(out)
+    assert len(reps) == 2
+    assert reps[0]["results"][0]["metrics"] == {"exported_items": 0, "exported_intents": 0}
+    assert "wall_ms" in reps[0]["results"][0]["timings"]["export"]